@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Memory and FIFO queue throughput of collections.deque, linkedlist
+# (one node per item) and chunkedlist (62 items per 512-byte chunk).
+
+from recordclass._linkedlist import linkedlist, chunkedlist
+from collections import deque
+from time import perf_counter
+import tracemalloc
+import sys
+
+def make(cls, n):
+    lst = cls()
+    append = lst.append
+    for i in range(n):
+        append(None)
+    return lst
+
+def memory(cls, n):
+    tracemalloc.start()
+    lst = make(cls, n)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del lst
+    return size
+
+def queue(cls, n, depth=1000):
+    lst = make(cls, depth)
+    append = lst.append
+    if cls is linkedlist:
+        popleft = lst.pop
+    else:
+        popleft = lst.popleft
+    t0 = perf_counter()
+    for i in range(n):
+        append(i)
+        popleft()
+    return perf_counter() - t0
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n} items:")
+    for cls in (deque, linkedlist, chunkedlist):
+        size = memory(cls, n)
+        print(f"{cls.__name__:<12} {size/n:6.1f} bytes/item   "
+              f"append+popleft {queue(cls, n):.3f} sec")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# Timings of teardown of large linked structures of dataobjects
+# with deep_dealloc=True: a chain, a binary tree and a tree with wide fanout
+# which stores children in litelist, litetuple or linkedlist.
+
+from recordclass import dataobject, litelist, litetuple
+from recordclass._linkedlist import linkedlist
+from time import perf_counter
+import sys
+import gc
+
+class Node(dataobject, deep_dealloc=True):
+    val: object
+    next: object
+
+class TreeNode(dataobject, deep_dealloc=True):
+    left: object
+    right: object
+
+class WideNode(dataobject, deep_dealloc=True):
+    children: object
+
+def make_chain(n, container=None):
+    head = None
+    for i in range(n):
+        if container is None:
+            head = Node(i, head)
+        else:
+            head = Node(i, container((head,)))
+    return head
+
+def make_tree(depth):
+    if depth == 0:
+        return None
+    return TreeNode(make_tree(depth-1), make_tree(depth-1))
+
+def make_linkedlist(items):
+    lst = linkedlist()
+    for item in items:
+        lst.append(item)
+    return lst
+
+def make_wide(n, fanout, container):
+    level = [WideNode(container(())) for i in range(n)]
+    while len(level) > 1:
+        level = [WideNode(container(level[i:i+fanout]))
+                 for i in range(0, len(level), fanout)]
+    return level[0]
+
+def teardown(name, make, *args):
+    ob = make(*args)
+    t0 = perf_counter()
+    del ob
+    t1 = perf_counter()
+    print(f"{name:<28} {t1-t0:.3f} sec")
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    gc.disable()
+    print(f"teardown of structures of {n} nodes:")
+    teardown("chain", make_chain, n)
+    teardown("binary tree", make_tree, max(n.bit_length() - 1, 1))
+    teardown("fanout 16 (litelist)", make_wide, n, 16, litelist)
+    teardown("fanout 16 (litetuple)", make_wide, n, 16, lambda items: litetuple(*items))
+    teardown("fanout 16 (linkedlist)", make_wide, n, 16, make_linkedlist)
+    teardown("chain (litelist)", make_chain, n, litelist)
+    teardown("chain (linkedlist)", make_chain, n, make_linkedlist)
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+
+# Timings of building of composite keys field by field:
+# a mutabletuple copied into litetuple / tuple and mutabletuple frozen in place.
+
+from recordclass import litetuple, mutabletuple
+from timeit import timeit
+import sys
+
+fields = ('GET', '/index.html', 200, 'text/html')
+
+def build_copy():
+    t = mutabletuple.with_capacity(4)
+    for i, v in enumerate(fields):
+        t[i] = v
+    return litetuple(*t)
+
+def build_tuple():
+    t = [None] * 4
+    for i, v in enumerate(fields):
+        t[i] = v
+    return tuple(t)
+
+def build_freeze():
+    t = mutabletuple.with_capacity(4)
+    for i, v in enumerate(fields):
+        t[i] = v
+    return t.freeze()
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for name, func in [("list -> tuple", build_tuple),
+                       ("mutabletuple -> litetuple(*t)", build_copy),
+                       ("mutabletuple.freeze()", build_freeze)]:
+        t = timeit(func, number=n)
+        print(f"{name:<32} {t:.3f} sec")
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Import time of recordclass measured by `python -X importtime` in fresh processes.
+# Usage: import_time_benchmark.py [--repeat N] [--max-ms MS] [statement]
+# With --max-ms the script exits with an error if the best total time exceeds MS,
+# so it can be used to catch regressions.
+
+import subprocess
+import sys
+import os
+
+def import_times(statement):
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                          capture_output=True, text=True, env=os.environ, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        try:
+            times[name.strip()] = int(self_us), int(cumulative_us)
+        except ValueError:
+            pass
+    return times
+
+def main(args):
+    repeat = 5
+    max_ms = None
+    statement = "import recordclass"
+    while args:
+        arg = args.pop(0)
+        if arg == "--repeat":
+            repeat = int(args.pop(0))
+        elif arg == "--max-ms":
+            max_ms = float(args.pop(0))
+        else:
+            statement = arg
+
+    runs = [import_times(statement) for i in range(repeat)]
+    best = min(runs, key=lambda times: times.get("recordclass", (0, 0))[1])
+    total_ms = best.get("recordclass", (0, 0))[1] / 1000
+
+    print(f"{statement!r}: {total_ms:.1f} ms (best of {repeat})")
+    modules = sorted(best.items(), key=lambda item: item[1][0], reverse=True)
+    for name, (self_us, cumulative_us) in modules[:15]:
+        print(f"  {name:<36} {self_us/1000:7.2f} {cumulative_us/1000:7.2f} ms")
+    for name in ("typing", "pickle", "weakref", "recordclass.dataclass"):
+        if name in best:
+            print(f"  note: {name} is imported")
+
+    if max_ms is not None and total_ms > max_ms:
+        print(f"import time {total_ms:.1f} ms exceeds {max_ms} ms")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+
+# Timings of creation of dataobject-based instances by positional
+# and keyword arguments.
+
+from recordclass import dataobject
+from timeit import timeit
+import sys
+
+class Order(dataobject):
+    id: int
+    side: str
+    price: float
+    qty: int
+    venue: str = 'X'
+
+class NOrder(dataobject, native=True):
+    id: int
+    price: float
+    qty: int = 0
+
+def run(name, stmt, number):
+    t = timeit(stmt, globals=globals(), number=number)
+    print(f"{name:<36} {t/number*1e9:8.1f} ns")
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    run("positional", "Order(1, 'B', 101.5, 10, 'Y')", number)
+    run("keywords", "Order(id=1, side='B', price=101.5, qty=10, venue='Y')", number)
+    run("keywords (defaults)", "Order(qty=10, price=101.5, side='B', id=1)", number)
+    run("positional + keywords", "Order(1, 'B', qty=10, price=101.5)", number)
+    run("native positional", "NOrder(1, 101.5, 10)", number)
+    run("native keywords", "NOrder(id=1, price=101.5, qty=10)", number)
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# Memory of the posting lists (sorted ids of documents) stored as
+# list, litelist of int objects, array.array('q') and litearray('q'),
+# and timings of appending of postings.
+
+from recordclass import litelist, litearray
+from array import array
+from time import perf_counter
+import random
+import sys
+
+def deep_sizeof(lst):
+    if isinstance(lst, (list, litelist)):
+        return sys.getsizeof(lst) + sum(map(sys.getsizeof, lst))
+    return sys.getsizeof(lst)
+
+def build(factory, postings):
+    lists = []
+    t0 = perf_counter()
+    for ids in postings:
+        lst = factory()
+        for i in ids:
+            lst.append(i)
+        lists.append(lst)
+    t1 = perf_counter()
+    return lists, t1 - t0
+
+if __name__ == '__main__':
+    n_terms = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    random.seed(1)
+    postings = [sorted(random.sample(range(1_000_000_000), random.randint(1, 100)))
+                for i in range(n_terms)]
+    n = sum(map(len, postings))
+    print(f"{n_terms} posting lists, {n} postings")
+
+    for name, factory in [("list", list),
+                          ("litelist", lambda: litelist([])),
+                          ("array('q')", lambda: array('q')),
+                          ("litearray('q')", lambda: litearray('q'))]:
+        lists, t = build(factory, postings)
+        if name.startswith("lite"):
+            for lst in lists:
+                lst.shrink_to_fit()
+        size = sum(map(deep_sizeof, lists))
+        print(f"{name:<16} {size / n:6.1f} bytes per posting   append: {t:.3f} sec")
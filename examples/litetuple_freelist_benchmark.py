@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+
+# Timings of creation and deallocation of small litetuples (as composite keys)
+# with and without free lists, and counting of keys with interned litetuples.
+
+from recordclass import litetuple, litetuple_freelist, litetuple_freelist_info, litetuple_intern_clear
+from timeit import timeit
+import sys
+
+def make_keys(n):
+    for i in range(n):
+        key = litetuple(i, i & 7, 'a')
+    return key
+
+def count_keys(n, intern):
+    counts = {}
+    for i in range(n):
+        key = litetuple(i & 255, i & 7, 'a')
+        if intern:
+            key = key.intern()
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    prev = litetuple_freelist(0)
+    t = timeit(lambda: make_keys(n), number=1)
+    print(f"litetuple(i, j, 'a') without free lists: {t:.3f} sec")
+    litetuple_freelist(prev)
+    t = timeit(lambda: make_keys(n), number=1)
+    print(f"litetuple(i, j, 'a') with free lists:    {t:.3f} sec")
+    print(litetuple_freelist_info(litetuple))
+
+    t = timeit(lambda: count_keys(n, False), number=1)
+    print(f"counting of keys:                        {t:.3f} sec")
+    t = timeit(lambda: count_keys(n, True), number=1)
+    print(f"counting of interned keys:               {t:.3f} sec")
+    print("interned:", litetuple_intern_clear())
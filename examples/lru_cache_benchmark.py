@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+
+# Memory per entry, full GC collection time and call throughput of
+# functools.lru_cache and recordclass.tools.lru_cache with keys of two arguments.
+
+from recordclass.tools import lru_cache
+import functools
+from time import perf_counter
+import tracemalloc
+import sys
+import gc
+
+def fill(decorator, n):
+    @decorator(maxsize=n)
+    def f(x, y):
+        return None
+    for i in range(n):
+        f(i, 'a')
+    return f
+
+def memory(decorator, n):
+    tracemalloc.start()
+    f = fill(decorator, n)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return f, size
+
+def collect_time():
+    t0 = perf_counter()
+    gc.collect()
+    return perf_counter() - t0
+
+def calls(f, n):
+    t0 = perf_counter()
+    for i in range(n):
+        f(i, 'a')
+    return perf_counter() - t0
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n} entries:")
+    for name, decorator in (("functools", functools.lru_cache), ("recordclass", lru_cache)):
+        gc.collect()
+        f, size = memory(decorator, n)
+        t_gc = collect_time()
+        t_hit = calls(f, n)
+        f.cache_clear()
+        t_miss = calls(f, n)
+        print(f"{name:<12} {size/n:6.1f} bytes/entry   gc.collect {t_gc:.3f} sec   "
+              f"hits {t_hit:.3f} sec   misses {t_miss:.3f} sec")
+        del f
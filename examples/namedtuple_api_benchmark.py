@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+# Timings of _make, _replace and _asdict of recordclass-based classes
+# in comparison with namedtuple.
+
+from collections import namedtuple
+from recordclass import recordclass
+from timeit import timeit
+import sys
+
+fields = 'id kind price qty venue ts'
+
+Event = recordclass('Event', fields, readonly=True)
+MEvent = recordclass('MEvent', fields)
+EventNT = namedtuple('EventNT', fields)
+
+values = (1, 'trade', 101.5, 10, 'X', 1700000000)
+
+def run(name, stmt, number):
+    t = timeit(stmt, globals=globals(), number=number)
+    print(f"{name:<36} {t/number*1e9:8.1f} ns")
+
+if __name__ == '__main__':
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    e = Event(*values)
+    m = MEvent(*values)
+    nt = EventNT(*values)
+    globals().update(e=e, m=m, nt=nt)
+    run("namedtuple._make", "EventNT._make(values)", number)
+    run("recordclass._make (readonly)", "Event._make(values)", number)
+    run("namedtuple._replace", "nt._replace(price=102.0, qty=5)", number)
+    run("recordclass._replace (readonly)", "e._replace(price=102.0, qty=5)", number)
+    run("recordclass._replace (mutable)", "m._replace(price=102.0, qty=5)", number)
+    run("namedtuple._asdict", "nt._asdict()", number)
+    run("recordclass._asdict", "e._asdict()", number)
@@ -23,15 +23,52 @@
 
 from recordclass.datatype import datatype, Field, MATCH
 from recordclass._dataobject import dataobject, datastruct, astuple, asdict, clone, update, make, Factory
-from recordclass._litelist import litelist, litelist_fromargs
+from recordclass._dataobject import asdict_many, astuple_many, from_dicts, freelist_info, sort_records
+from recordclass._litelist import litelist, litelist_fromargs, litelist_growth, litearray
 from recordclass._litetuple import litetuple, mutabletuple
+from recordclass._litetuple import litetuple_freelist, litetuple_freelist_info, litetuple_intern_clear
 from recordclass.recordclass import recordclass
-from recordclass.typing import RecordClass
-from recordclass.dataclass import make_dataclass, make_structclass, make_class, join_dataclasses
-from recordclass.dictclass import make_dictclass
-from recordclass.arrayclass import make_arrayclass
-from recordclass.adapter import as_dataclass, as_record
-
-structclass = make_structclass
 
 from recordclass.about import __version__
+
+# other public names are imported on the first access
+_lazy_names = {
+    'RecordClass': ('recordclass.typing', 'RecordClass'),
+    'make_dataclass': ('recordclass.dataclass', 'make_dataclass'),
+    'make_structclass': ('recordclass.dataclass', 'make_structclass'),
+    'structclass': ('recordclass.dataclass', 'make_structclass'),
+    'make_class': ('recordclass.dataclass', 'make_class'),
+    'join_dataclasses': ('recordclass.dataclass', 'join_dataclasses'),
+    'make_dictclass': ('recordclass.dictclass', 'make_dictclass'),
+    'make_arrayclass': ('recordclass.arrayclass', 'make_arrayclass'),
+    'as_dataclass': ('recordclass.adapter', 'as_dataclass'),
+    'as_record': ('recordclass.adapter', 'as_record'),
+    'RecordTable': ('recordclass.table', 'RecordTable'),
+    'dumps': ('recordclass.serialize', 'dumps'),
+    'loads': ('recordclass.serialize', 'loads'),
+    'dump': ('recordclass.serialize', 'dump'),
+    'load': ('recordclass.serialize', 'load'),
+    'RecordBatch': ('recordclass.serialize', 'RecordBatch'),
+    'InternPool': ('recordclass.intern', 'InternPool'),
+    'memory_report': ('recordclass.memory', 'memory_report'),
+}
+
+__all__ = ('datatype', 'Field', 'MATCH',
+           'dataobject', 'datastruct', 'astuple', 'asdict', 'clone', 'update', 'make', 'Factory',
+           'asdict_many', 'astuple_many', 'from_dicts', 'freelist_info', 'sort_records',
+           'litelist', 'litelist_fromargs', 'litelist_growth', 'litearray', 'litetuple', 'mutabletuple',
+           'litetuple_freelist', 'litetuple_freelist_info', 'litetuple_intern_clear',
+           'recordclass') + tuple(_lazy_names)
+
+def __getattr__(name):
+    try:
+        module_name, attr = _lazy_names[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    from importlib import import_module
+    ob = getattr(import_module(module_name), attr)
+    globals()[name] = ob
+    return ob
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_names))
@@ -56,6 +56,7 @@ static PyObject *__fields__name;
 static PyObject *__dict__name;
 static PyObject *__weakref__name;
 static PyObject *__default_vals__name;
+static PyObject *__fields_index__name;
 static PyObject *__init__name;
 
 static PyObject *fields_dict_name;
@@ -64,7 +65,8 @@ static int dataobjectproperty_set(PyObject *self, PyObject *obj, PyObject *value
 static PyObject* dataobjectproperty_get(PyObject *self, PyObject *obj, PyObject *type);
 
 static int dataobject_ass_item(PyObject *op, Py_ssize_t i, PyObject *val);
-static Py_ssize_t _tuple_index(PyTupleObject *self, PyObject *value);
+static PyObject *_dataobject_fields_index(PyTypeObject *type);
+static Py_ssize_t _dataobject_field_index(PyTypeObject *type, PyObject *fields_index, PyObject *name);
 
 static inline PyObject *
 type_error(const char *msg, PyObject *obj)
@@ -189,6 +191,13 @@ pyobject_get_builtin(const char *attrname_c)
 
 // forward decaration
 static PyObject* _astuple(PyObject *op);
+static PyObject *dataobject_sortkey(PyObject *cls, PyObject *args);
+static int _dataobject_check(PyObject *op);
+static PyObject *_asdict(PyObject *op);
+PyDoc_STRVAR(dataobject_sortkey_doc,
+"T.sortkey(*fields) -- callable which returns the value of the field (or the tuple of values of the fields) of the instance.\n"
+"It can be used as the key function for sorted(), min(), max() etc.");
+static Py_hash_t dataobject_hash_cached(PyObject *op);
 static int _dataobject_update(PyObject *op, PyObject *kw, int flag);
 static PyObject *empty_tuple;
 
@@ -223,6 +232,8 @@ dataobject_alloc(PyTypeObject *type, Py_ssize_t unused)
         PyObject **weakrefsptr = PyDataObject_WEAKLISTPTR(type, op);
         *weakrefsptr = NULL;
     }
+    if (type->tp_hash == dataobject_hash_cached)
+        *PyDataObject_HASHPTR(type, op) = -1;
 
     return op;
 }
@@ -245,1372 +256,2485 @@ dataobject_alloc_gc(PyTypeObject *type, Py_ssize_t unused)
         PyObject **weakrefsptr = PyDataObject_WEAKLISTPTR(type, op);
         *weakrefsptr = NULL;
     }
+    if (type->tp_hash == dataobject_hash_cached)
+        *PyDataObject_HASHPTR(type, op) = -1;
 
     PyObject_GC_Track(op);
 
     return op;
 }
 
-static void
-_fill_items(PyObject **items, PyObject * const*args, const Py_ssize_t n_args) {
-    Py_ssize_t i;
-    for (i = 0; i < n_args; i++) {
-        PyObject *v = args[i];
-        Py_INCREF(v);
-        items[i] = v;
-    }
-}
+/* free list */
 
-static void
-_fill_items_none(PyObject **items, const Py_ssize_t start, const Py_ssize_t n_args) {
-    Py_ssize_t i;
-    for (i = start; i < n_args; i++) {
-        Py_INCREF(Py_None);
-        items[i] = Py_None;
-    }
-}
+static PyObject *__freelist__name;
+static PyObject *__freelist_size__name;
 
-static int
-_fill_items_defaults(PyObject **items, const PyObject *default_vals,
-                    const Py_ssize_t n_args, const Py_ssize_t n_items) {
-    Py_ssize_t i;
-    for(i = n_args; i < n_items; i++) {
-        PyObject *value = PyTuple_GET_ITEM(default_vals, i);
+#define FREELIST_CAPSULE_NAME "recordclass._dataobject.freelist"
+#define FREELIST_ALIGN 16
+#define FREELIST_SLAB_HEADER FREELIST_ALIGN
 
-        if (Py_TYPE(value) == &PyFactory_Type) {
-            PyObject *val = call_factory(value);
-            if (!val)
-                return 0;
-            items[i] = val;
-        } else {
-            Py_INCREF(value);
-            items[i] = value;
-        }
-    }
-    return 1;
-}
+static PyTypeObject *freelist_cache_type = NULL;
+static dataobject_freelist *freelist_cache = NULL;
 
-#if PY_VERSION_HEX >= 0x030A0000
-static PyObject*
-dataobject_vectorcall(PyObject *type0, PyObject * const*args,
-                      size_t nargsf, PyObject *kwnames)
+static dataobject_freelist *
+_dataobject_freelist(PyTypeObject *type)
 {
-    PyTypeObject *type = (PyTypeObject*)type0;
-    PyObject *op = type->tp_alloc(type, 0);
+    if (type == freelist_cache_type)
+        return freelist_cache;
 
-    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
-    const Py_ssize_t n_args = PyVectorcall_NARGS(nargsf);
-    PyObject **items = PyDataObject_ITEMS(op);
-
-    if (n_args > n_items) {
-        PyErr_SetString(PyExc_TypeError,
-            "the number of the arguments greater than the number of fields");
+    PyObject *capsule = PyDict_GetItem(type->tp_dict, __freelist__name);
+    if (capsule == NULL)
         return NULL;
-    }
-
-    _fill_items(items, args, n_args);
-
-    if (n_args < n_items) {
-        PyObject *tp_dict = type->tp_dict;
-        PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
-        PyObject *default_vals = mp->mp_subscript(tp_dict, __default_vals__name);
-
-        if (default_vals == NULL) {
-            PyErr_Clear();
-            _fill_items_none(items, n_args, n_items);
-        } else {
-            int ret = _fill_items_defaults(items, default_vals, n_args, n_items);
-            Py_DECREF(default_vals);
-            if (!ret)
-                return NULL;
-        }
-    }
-
-    if (kwnames) {
-        Py_ssize_t n_kwnames = Py_SIZE(kwnames);
-        if (n_kwnames > 0) {
-            PyObject *val;
-            PyObject *name;
-
-            PyObject *tp_dict = type->tp_dict;
-            PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
-            PyObject *fields = mp->mp_subscript(tp_dict, __fields__name);
-
-            Py_ssize_t i;
-            for(i=0; i<n_kwnames; i++) {
-                name = PyTuple_GET_ITEM(kwnames, i);
-                val = args[n_args + i];
-
-                Py_ssize_t index = _tuple_index((PyTupleObject*)fields, name);
-                if (index >= 0) {
-                    dataobject_ass_item(op, index, val);
-                    continue;
-                } else {
-                    if (!type->tp_dictoffset) {
-                        PyErr_Format(PyExc_TypeError, "Invalid kwarg: %U not in __fields__", name);
-                        Py_DECREF(fields);
-                        return NULL;
-                    }
-                }
 
-                Py_INCREF(val);
-                PyObject_SetAttr(op, name, val);
-            }
-            Py_DECREF(fields);
-        }
+    dataobject_freelist *fl = (dataobject_freelist*)PyCapsule_GetPointer(capsule, FREELIST_CAPSULE_NAME);
+    if (fl == NULL) {
+        PyErr_Clear();
+        return NULL;
     }
-
-    return op;
+    freelist_cache_type = type;
+    freelist_cache = fl;
+    return fl;
 }
-#endif
 
-static PyObject*
-dataobject_new_basic(PyTypeObject *type, PyObject *args, PyObject *kwds)
+static void *
+_freelist_slab_alloc(dataobject_freelist *fl)
 {
-    PyObject *op = type->tp_alloc(type, 0);
+    char *slab = PyMem_RawMalloc(FREELIST_SLAB_HEADER + fl->arena * fl->blocksize);
+    if (slab == NULL)
+        return NULL;
+    *(void**)slab = fl->slabs;
+    fl->slabs = slab;
+    fl->n_slabs++;
+    fl->slab_next = slab + FREELIST_SLAB_HEADER;
+    fl->slab_end = fl->slab_next + fl->arena * fl->blocksize;
+    return slab;
+}
 
-    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
-    const Py_ssize_t n_args = Py_SIZE(args);
+static PyObject *
+dataobject_alloc_freelist(PyTypeObject *type, Py_ssize_t unused)
+{
+    dataobject_freelist *fl = _dataobject_freelist(type);
+    PyObject *op;
 
-    if (n_args > n_items) {
-        PyErr_SetString(PyExc_TypeError,
-            "number of the arguments greater than the number of fields");
-        return NULL;
+    if (fl == NULL)
+        op = (PyObject*)PyObject_Malloc(type->tp_basicsize);
+    else if (fl->head != NULL) {
+        op = (PyObject*)fl->head;
+        fl->head = *(void**)op;
+        fl->size--;
+        fl->hits++;
     }
+    else if (fl->arena) {
+        if (fl->slab_next == fl->slab_end && _freelist_slab_alloc(fl) == NULL)
+            return PyErr_NoMemory();
+        op = (PyObject*)fl->slab_next;
+        fl->slab_next += fl->blocksize;
+        fl->misses++;
+    }
+    else {
+        op = (PyObject*)PyObject_Malloc(type->tp_basicsize);
+        fl->misses++;
+    }
+    if (op == NULL)
+        return PyErr_NoMemory();
 
-    PyObject **items = PyDataObject_ITEMS(op);
-    const PyTupleObject *tpl = (const PyTupleObject*)args;
-    PyObject *const*tmp = (PyObject*const*)(tpl->ob_item);
-
-    _fill_items(items, tmp, n_args);
+    PyObject_Init(op, type);
 
-    if (n_args < n_items) {
-        PyObject *tp_dict = type->tp_dict;
-        PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
-        PyObject *default_vals = mp->mp_subscript(tp_dict, __default_vals__name);
+#if PY_VERSION_HEX < 0x03080000
+    if (type->tp_flags & Py_TPFLAGS_HEAPTYPE)
+        Py_INCREF(type);
+#endif
 
-        if (default_vals == NULL) {
-            PyErr_Clear();
-            _fill_items_none(items, n_args, n_items);
-        } else {
-            int ret = _fill_items_defaults(items, default_vals, n_args, n_items);
-            Py_DECREF(default_vals);
-            if (!ret)
-                return NULL;
-        }
+    if (type->tp_dictoffset) {
+        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
+        *dictptr = NULL;
     }
-
-    if (kwds) {
-        int retval = _dataobject_update(op, kwds, 1);
-        if (retval < 0)
-            return NULL;
+    if (type->tp_weaklistoffset) {
+        PyObject **weakrefsptr = PyDataObject_WEAKLISTPTR(type, op);
+        *weakrefsptr = NULL;
     }
+    if (type->tp_hash == dataobject_hash_cached)
+        *PyDataObject_HASHPTR(type, op) = -1;
 
     return op;
 }
 
-static PyObject*
-dataobject_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+static void
+dataobject_free_freelist(void *op)
 {
-    PyObject *op = type->tp_alloc(type, 0);
-
-    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
-    const Py_ssize_t n_args = Py_SIZE(args);
-    PyObject **items = PyDataObject_ITEMS(op);
+    dataobject_freelist *fl = _dataobject_freelist(Py_TYPE((PyObject*)op));
 
-    if (n_args > n_items) {
-        PyErr_SetString(PyExc_TypeError,
-            "number of the arguments greater than the number of fields");
-        return NULL;
+    if (fl != NULL && (fl->arena || fl->size < fl->maxsize)) {
+        *(void**)op = fl->head;
+        fl->head = op;
+        fl->size++;
+        return;
     }
+    PyObject_Free(op);
+}
 
-    _fill_items_none(items, 0, n_args);
-
-    if (n_args < n_items) {
-        PyObject *tp_dict = type->tp_dict;
-        PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
-        PyObject *default_vals = mp->mp_subscript(tp_dict, __default_vals__name);
+static void
+_freelist_release_blocks(dataobject_freelist *fl, Py_ssize_t maxsize)
+{
+    while (fl->size > maxsize) {
+        void *op = fl->head;
+        fl->head = *(void**)op;
+        fl->size--;
+        PyObject_Free(op);
+    }
+}
 
-        if (default_vals == NULL) {
-            PyErr_Clear();
-            _fill_items_none(items, n_args, n_items);
-        } else {
-            int ret = _fill_items_defaults(items, default_vals, n_args, n_items);
-            Py_DECREF(default_vals);
-            if (!ret)
-                return NULL;
+static void
+freelist_capsule_destructor(PyObject *capsule)
+{
+    dataobject_freelist *fl = (dataobject_freelist*)PyCapsule_GetPointer(capsule, FREELIST_CAPSULE_NAME);
+    if (fl == NULL) {
+        PyErr_Clear();
+        return;
+    }
+    if (fl == freelist_cache) {
+        freelist_cache_type = NULL;
+        freelist_cache = NULL;
+    }
+    if (fl->arena) {
+        void *slab = fl->slabs;
+        while (slab != NULL) {
+            void *next = *(void**)slab;
+            PyMem_RawFree(slab);
+            slab = next;
         }
     }
-
-    return op;
+    else
+        _freelist_release_blocks(fl, 0);
+    PyMem_Free(fl);
 }
 
-static PyObject*
-dataobject_new_copy_default(PyTypeObject *type, PyObject *args, PyObject *kwds)
-{
-    PyObject *op = type->tp_alloc(type, 0);
+// Caches of the classes are kept in the private table keyed by the class,
+// so they can't be replaced or shared from Python. The slot is released by
+// the callback of the weak reference to the class, before its address could
+// be reused by another class.
 
-    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
-    const Py_ssize_t n_args = Py_SIZE(args);
-    PyObject **items = PyDataObject_ITEMS(op);
+typedef struct {
+    PyTypeObject *type;
+    dataobject_kwnames_cache *cache;
+} kwnames_cache_slot;
 
-    if (n_args > n_items) {
-        PyErr_SetString(PyExc_TypeError,
-            "number of the arguments greater than the number of fields");
-        return NULL;
-    }
+#define KWNAMES_SLOT_DELETED ((PyTypeObject*)1)
 
-    _fill_items_none(items, 0, n_args);
+static kwnames_cache_slot *kwnames_caches = NULL;
+static size_t kwnames_caches_mask = 0;
+static size_t kwnames_caches_fill = 0;  // used and deleted slots
+static size_t kwnames_caches_used = 0;
 
-    if (n_args < n_items) {
-        PyObject *tp_dict = type->tp_dict;
-        PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
-        PyObject *default_vals = mp->mp_subscript(tp_dict, __default_vals__name);
+#define KWNAMES_SLOT_INDEX(type) ((((size_t)(type)) >> 4) & kwnames_caches_mask)
 
-        if (default_vals == NULL) {
-            PyErr_Clear();
-            _fill_items_none(items, n_args, n_items);
-        } else {
-            Py_ssize_t i;
-            for(i = n_args; i < n_items; i++) {
-                PyObject *value = PyTuple_GET_ITEM(default_vals, i);
-                if (value == Py_None) {
-                    Py_INCREF(Py_None);
-                    items[i] = Py_None;
-                }
-                else {
-                    PyObject *val;
-                    PyTypeObject *tp = Py_TYPE(value);
-
-                    if (tp == &PyList_Type)
-                        val = PyList_GetSlice(value, 0, Py_SIZE(value));
-                    else if (tp == &PyDict_Type || tp == &PySet_Type)
-                        val = PyObject_CallMethod(value, "copy", NULL);
-                    else if (tp == &PyFactory_Type) {
-                        val = call_factory(value);
-                        if (!val) {
-                            Py_DECREF(default_vals);
-                            return NULL;
-                        }
-                    }
-                    else if (PyObject_HasAttrString(value, "__copy__"))
-                        val = PyObject_CallMethod(value, "__copy__", NULL);
-                    else {
-                        val = value;
-                        Py_INCREF(val);
-                    }
-                    items[i] = val;
-                }
-            }
-            Py_DECREF(default_vals);
-        }
-    }
+static dataobject_kwnames_cache *
+_dataobject_kwnames_cache(PyTypeObject *type)
+{
+    if (kwnames_caches == NULL)
+        return NULL;
 
-    return op;
+    size_t i = KWNAMES_SLOT_INDEX(type);
+    for (;;) {
+        kwnames_cache_slot *slot = kwnames_caches + i;
+        if (slot->type == type)
+            return slot->cache;
+        if (slot->type == NULL)
+            return NULL;
+        i = (i + 1) & kwnames_caches_mask;
+    }
 }
 
-static PyObject*
-dataobject_new_empty(PyTypeObject *type)
+static void
+_kwnames_cache_free(dataobject_kwnames_cache *kc)
 {
-    PyObject *op = type->tp_alloc(type, 0);
-
-    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
-    PyObject **items = PyDataObject_ITEMS(op);
-
-    _fill_items_none(items, 0, n_items);
+    Py_ssize_t i;
 
-    return op;
+    for (i = 0; i < KWNAMES_CACHE_SIZE; i++) {
+        Py_XDECREF(kc->entries[i].kwnames);
+        PyMem_Free(kc->entries[i].indices);
+    }
+    Py_XDECREF(kc->weakref);
+    PyMem_Free(kc);
 }
 
-static int
-dataobject_init_basic(PyObject *op, PyObject *args, PyObject *kwds)
+static kwnames_cache_slot *
+_kwnames_cache_slot(PyTypeObject *type)
 {
-    return 0;
+    size_t i = KWNAMES_SLOT_INDEX(type);
+    kwnames_cache_slot *free_slot = NULL;
+
+    for (;;) {
+        kwnames_cache_slot *slot = kwnames_caches + i;
+        if (slot->type == type)
+            return slot;
+        if (slot->type == KWNAMES_SLOT_DELETED) {
+            if (free_slot == NULL)
+                free_slot = slot;
+        }
+        else if (slot->type == NULL)
+            return free_slot ? free_slot : slot;
+        i = (i + 1) & kwnames_caches_mask;
+    }
 }
 
 static int
-dataobject_init(PyObject *op, PyObject *args0, PyObject *kwds)
+_kwnames_caches_resize(void)
 {
-    PyTupleObject *tmp = (PyTupleObject*)args0;
-    PyObject *const*args = (PyObject**)(tmp->ob_item);
-    const Py_ssize_t n_args = Py_SIZE(tmp);
+    size_t size = 64, i;
+    kwnames_cache_slot *old = kwnames_caches;
+    size_t old_size = old ? kwnames_caches_mask + 1 : 0;
 
-    PyObject **items = PyDataObject_ITEMS(op);
+    while (size < 4 * (kwnames_caches_used + 1))
+        size *= 2;
 
-    Py_ssize_t i;
-    for (i = 0; i < n_args; i++) {
-        PyObject *v = *(args++);
-        Py_DECREF(*items);
-        Py_INCREF(v);
-        *(items++) = v;
+    kwnames_cache_slot *slots = PyMem_Calloc(size, sizeof(kwnames_cache_slot));
+    if (slots == NULL) {
+        PyErr_NoMemory();
+        return -1;
     }
-
-    if (kwds) {
-        int retval = _dataobject_update(op, kwds, 1);
-        if (retval < 0)
-            return retval;
+    kwnames_caches = slots;
+    kwnames_caches_mask = size - 1;
+    kwnames_caches_fill = kwnames_caches_used;
+    for (i = 0; i < old_size; i++) {
+        PyTypeObject *type = old[i].type;
+        if (type != NULL && type != KWNAMES_SLOT_DELETED)
+            *_kwnames_cache_slot(type) = old[i];
     }
-
+    PyMem_Free(old);
     return 0;
 }
 
-static Py_ssize_t
-_tuple_index(PyTupleObject *self, PyObject *value)
+static PyObject *
+_kwnames_cache_release(PyObject *type_address, PyObject *weakref)
 {
-    Py_ssize_t i, n = Py_SIZE(self);
+    PyTypeObject *type = (PyTypeObject*)PyLong_AsVoidPtr(type_address);
+    if (type == NULL)
+        return NULL;
 
-    for (i = 0; i < n; i++) {
-        PyObject *cmp = PyUnicode_RichCompare(self->ob_item[i], value, Py_EQ);
-        if (cmp == Py_True)
-            return i;
-        else if (cmp == NULL)
-            return -1;
+    kwnames_cache_slot *slot = _kwnames_cache_slot(type);
+    if (slot->type == type) {
+        dataobject_kwnames_cache *kc = slot->cache;
+        slot->type = KWNAMES_SLOT_DELETED;
+        slot->cache = NULL;
+        kwnames_caches_used--;
+        _kwnames_cache_free(kc);
     }
-    return -1;
+    Py_RETURN_NONE;
 }
 
+static PyMethodDef kwnames_cache_release_def =
+    {"_kwnames_cache_release", (PyCFunction)_kwnames_cache_release, METH_O, NULL};
+
 static int
-_dataobject_update(PyObject *op, PyObject *kwds, int flag)
+_dataobject_kwnames_cache_new(PyTypeObject *type)
 {
-    PyObject *iter, *key, *val;
+    if ((kwnames_caches_fill + 1) * 3 >= (kwnames_caches_mask + 1) * 2) {
+        if (_kwnames_caches_resize() < 0)
+            return -1;
+    }
 
-    PyTypeObject *type = Py_TYPE(op);
-    Py_ssize_t has___dict___ = type->tp_dictoffset;
-    PyObject *tp_dict = type->tp_dict;
-    PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
-    PyObject *fields = mp->mp_subscript(type->tp_dict, __fields__name);
+    dataobject_kwnames_cache *kc = PyMem_Calloc(1, sizeof(dataobject_kwnames_cache));
+    if (kc == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
 
-    iter = PyObject_GetIter(kwds);
-    while ((key = PyIter_Next(iter))) {
-        val = PyObject_GetItem(kwds, key);
+    PyObject *type_address = PyLong_FromVoidPtr(type);
+    if (type_address == NULL) {
+        PyMem_Free(kc);
+        return -1;
+    }
+    PyObject *callback = PyCFunction_New(&kwnames_cache_release_def, type_address);
+    Py_DECREF(type_address);
+    if (callback == NULL) {
+        PyMem_Free(kc);
+        return -1;
+    }
+    kc->weakref = PyWeakref_NewRef((PyObject*)type, callback);
+    Py_DECREF(callback);
+    if (kc->weakref == NULL) {
+        PyMem_Free(kc);
+        return -1;
+    }
 
-        if (flag) {
-            Py_ssize_t index = _tuple_index((PyTupleObject*)fields, key);
-            if (index >= 0) {
-                dataobject_ass_item(op, index, val);
-                Py_DECREF(val);
-                Py_DECREF(key);
-                continue;
-            }
-            else {
-                if (!has___dict___) {
-                    PyErr_Format(
-                        PyExc_TypeError,
-                        "Invalid kwarg: %U not in __fields__ and has not __dict__", key);
-                    Py_DECREF(val);
-                    Py_DECREF(key);
-                    Py_DECREF(iter);
-                    Py_DECREF(fields);
-                    return -1;
-                }
-            }
-        }
-
-        if (PyObject_SetAttr(op, key, val) < 0) {
-            PyErr_Format(
-                PyExc_TypeError,
-                "Invalid kwarg: %U not in __fields__", key);
-            Py_DECREF(val);
-            Py_DECREF(key);
-            Py_DECREF(iter);
-            Py_DECREF(fields);
-            return -1;
-        }
-        Py_DECREF(val);
-        Py_DECREF(key);
+    kwnames_cache_slot *slot = _kwnames_cache_slot(type);
+    if (slot->type == type) {
+        // the cache is always new: the class could be initialized again
+        _kwnames_cache_free(slot->cache);
     }
-    Py_DECREF(iter);
-    Py_DECREF(fields);
+    else {
+        if (slot->type == NULL)
+            kwnames_caches_fill++;
+        kwnames_caches_used++;
+        slot->type = type;
+    }
+    slot->cache = kc;
     return 0;
 }
 
-
-static int
-dataobject_clear(PyObject *op)
+// Entry of the cache with the slot indices of the names from kwnames.
+// NULL (without an exception set) if the class has no cache or some name
+// is not a field (it is processed by the generic path then).
+static dataobject_kwnames_entry *
+_dataobject_kwnames_entry(PyTypeObject *type, PyObject *kwnames)
 {
-    PyTypeObject *type = Py_TYPE(op);
+    dataobject_kwnames_cache *kc = _dataobject_kwnames_cache(type);
+    if (kc == NULL)
+        return NULL;
 
-    if (type->tp_dictoffset) {
-        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
-        if (dictptr && *dictptr) {
-            Py_CLEAR(*dictptr);
-            *dictptr = NULL;
-        }
-    }
+    dataobject_kwnames_entry *entry =
+        kc->entries + ((size_t)kwnames >> 4) % KWNAMES_CACHE_SIZE;
 
-    PyObject **items = PyDataObject_ITEMS(op);
-    Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
-    while (n_items-- > 0) {
-        Py_CLEAR(*items);
-        items++;
+    if (entry->kwnames == kwnames) {
+        if (entry->max_index >= PyDataObject_NUMITEMS(type)) {
+            PyErr_SetString(PyExc_IndexError, "index of the field out of range");
+            return NULL;
+        }
+        return entry;
     }
 
-    return 0;
-}
-
-static int
-dataobject_xdecref(PyObject *op)
-{
-    PyTypeObject *type = Py_TYPE(op);
+    PyObject *fields_index = _dataobject_fields_index(type);
+    if (fields_index == NULL)
+        return NULL;
 
-    if (type->tp_weaklistoffset)
-        PyObject_ClearWeakRefs(op);
+    const Py_ssize_t n_kwnames = PyTuple_GET_SIZE(kwnames);
+    Py_ssize_t *indices = PyMem_New(Py_ssize_t, n_kwnames);
+    if (indices == NULL) {
+        PyErr_NoMemory();
+        return NULL;
+    }
 
-    if (type->tp_dictoffset) {
-        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
-        if (dictptr && *dictptr) {
-            Py_DECREF(*dictptr);
-            *dictptr = NULL;
+    Py_ssize_t i, min_index = PY_SSIZE_T_MAX, max_index = -1;
+    for (i = 0; i < n_kwnames; i++) {
+        Py_ssize_t index = _dataobject_field_index(type, fields_index, PyTuple_GET_ITEM(kwnames, i));
+        if (index < 0) {
+            PyMem_Free(indices);
+            return NULL;
         }
+        indices[i] = index;
+        if (index < min_index)
+            min_index = index;
+        if (index > max_index)
+            max_index = index;
+    }
+    if (max_index >= PyDataObject_NUMITEMS(type)) {
+        PyMem_Free(indices);
+        PyErr_SetString(PyExc_IndexError, "index of the field out of range");
+        return NULL;
     }
 
-    PyObject **items = PyDataObject_ITEMS(op);
-    Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    Py_XDECREF(entry->kwnames);
+    PyMem_Free(entry->indices);
+    Py_INCREF(kwnames);
+    entry->kwnames = kwnames;
+    entry->indices = indices;
+    entry->min_index = min_index;
+    entry->max_index = max_index;
+    return entry;
+}
 
-    while (n_items--) {
-        Py_XDECREF(*items);
-        *items = NULL;
-        items++;
+static void
+_fill_items(PyObject **items, PyObject * const*args, const Py_ssize_t n_args) {
+    Py_ssize_t i;
+    for (i = 0; i < n_args; i++) {
+        PyObject *v = args[i];
+        Py_INCREF(v);
+        items[i] = v;
     }
-    return 0;
 }
 
 static void
-dataobject_dealloc(PyObject *op)
-{
-    PyTypeObject *type = Py_TYPE(op);
-
-    if (type->tp_finalize != NULL) {
-        if(PyObject_CallFinalizerFromDealloc(op) < 0)
-            return;
+_fill_items_none(PyObject **items, const Py_ssize_t start, const Py_ssize_t n_args) {
+    Py_ssize_t i;
+    for (i = start; i < n_args; i++) {
+        Py_INCREF(Py_None);
+        items[i] = Py_None;
     }
-
-    dataobject_xdecref(op);
-
-#if PY_VERSION_HEX < 0x03080000
-    if (type->tp_flags & Py_TPFLAGS_HEAPTYPE)
-        Py_DECREF(type);
-#endif
-
-    type->tp_free((PyObject *)op);
 }
 
-static void
-dataobject_dealloc_gc(PyObject *op)
-{
-    PyTypeObject *type = Py_TYPE(op);
+static int
+_fill_items_defaults(PyObject **items, const PyObject *default_vals,
+                    const Py_ssize_t n_args, const Py_ssize_t n_items) {
+    Py_ssize_t i;
+    for(i = n_args; i < n_items; i++) {
+        PyObject *value = PyTuple_GET_ITEM(default_vals, i);
 
-    if (type->tp_finalize != NULL) {
-        if(PyObject_CallFinalizerFromDealloc(op) < 0)
-            return;
+        if (Py_TYPE(value) == &PyFactory_Type) {
+            PyObject *val = call_factory(value);
+            if (!val) {
+                for(; i < n_items; i++)
+                    items[i] = NULL;
+                return 0;
+            }
+            items[i] = val;
+        } else {
+            Py_INCREF(value);
+            items[i] = value;
+        }
     }
+    return 1;
+}
 
-    PyObject_GC_UnTrack(op);
+static PyObject *
+_copy_default_value(PyObject *value) {
+    PyTypeObject *tp = Py_TYPE(value);
 
-    dataobject_xdecref(op);
+    if (value == Py_None) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
+    if (tp == &PyList_Type)
+        return PyList_GetSlice(value, 0, Py_SIZE(value));
+    if (tp == &PyDict_Type || tp == &PySet_Type)
+        return PyObject_CallMethod(value, "copy", NULL);
+    if (tp == &PyFactory_Type)
+        return call_factory(value);
+    if (PyObject_HasAttrString(value, "__copy__"))
+        return PyObject_CallMethod(value, "__copy__", NULL);
 
-    if (type->tp_flags & Py_TPFLAGS_HEAPTYPE)
-        Py_DECREF(type);
+    Py_INCREF(value);
+    return value;
+}
 
-    type->tp_free((PyObject *)op);
+static int
+_fill_items_copy_defaults(PyObject **items, const PyObject *default_vals,
+                          const Py_ssize_t n_args, const Py_ssize_t n_items) {
+    Py_ssize_t i;
+    for(i = n_args; i < n_items; i++) {
+        PyObject *val = _copy_default_value(PyTuple_GET_ITEM(default_vals, i));
+        if (!val) {
+            for(; i < n_items; i++)
+                items[i] = NULL;
+            return 0;
+        }
+        items[i] = val;
+    }
+    return 1;
 }
 
-static void
-dataobject_finalize_step(PyObject *op, PyObject *stack)
+static PyObject *
+_default_value(PyObject *default_vals, Py_ssize_t i, int copy_default)
 {
-    Py_ssize_t n_items = PyDataObject_LEN(op);
-    PyObject **items = PyDataObject_ITEMS(op);
+    PyObject *value;
 
-    while (n_items--) {
-        PyObject *o = *items;
+    if (default_vals == NULL) {
+        Py_INCREF(Py_None);
+        return Py_None;
+    }
 
-        if (py_refcnt(o) == 1 && Py_METATYPE(o) == datatype) {
-            PyList_Append(stack, o);
-        } else
-            Py_DECREF(o);
+    value = PyTuple_GET_ITEM(default_vals, i);
+    if (copy_default)
+        return _copy_default_value(value);
+    if (Py_TYPE(value) == &PyFactory_Type)
+        return call_factory(value);
 
-        *(items++) = NULL;
-    }
+    Py_INCREF(value);
+    return value;
 }
 
-static PyObject* stack = NULL;
-
-static void
-dataobject_finalize(PyObject *ob) {
-    Py_ssize_t j;
+/////////////////////////// native fields ///////////////////////////
 
-    if (!stack)
-        stack = PyList_New(0);
+static PyObject *__native_kinds__name;
 
-    dataobject_finalize_step(ob, stack);
+static void dataobject_dealloc_native(PyObject *op);
 
-    Py_ssize_t n_stack = PyList_GET_SIZE(stack);
-    while (n_stack) {
-        PyObject *op = PyList_GET_ITEM(stack, 0);
+/* classes with native fields have their own tp_dealloc */
+#define PyDataObject_IS_NATIVE(type) ((type)->tp_dealloc == dataobject_dealloc_native)
 
-        if (py_refcnt(op) == 1)
-            dataobject_finalize_step(op, stack);
+static const char *
+_dataobject_native_kinds(PyTypeObject *type)
+{
+    PyObject *kinds = PyDict_GetItemWithError(type->tp_dict, __native_kinds__name);
 
-        Py_DECREF(op);
+    if (kinds == NULL) {
+        if (!PyErr_Occurred())
+            PyErr_Format(PyExc_TypeError, "%s has not __native_kinds__", type->tp_name);
+        return NULL;
+    }
+    return PyBytes_AS_STRING(kinds);
+}
 
-        {   PyList_SET_ITEM(stack, 0, NULL);
-            for(j=1; j<n_stack; j++) {
-                PyList_SET_ITEM(stack, j-1, PyList_GET_ITEM(stack, j));
+static PyObject *
+_native_get(PyObject **item, const char kind)
+{
+    PyObject *v;
+
+    switch (kind) {
+        case NATIVE_INT64:
+            return PyLong_FromLongLong(*(int64_t*)item);
+        case NATIVE_DOUBLE:
+            return PyFloat_FromDouble(*(double*)item);
+        default:
+            v = *item;
+            if (v == NULL) {
+                PyErr_SetString(PyExc_AttributeError, "the field has no value");
+                return NULL;
             }
-            n_stack--;
-            PyList_SET_ITEM(stack, n_stack, NULL);
-            Py_SET_SIZE(stack, n_stack);
-        }
+            Py_INCREF(v);
+            return v;
     }
 }
 
-PyDoc_STRVAR(dataobject_len_doc,
-"T.__len__() -- len of T");
-
-static Py_ssize_t
-dataobject_len(PyObject *op)
+static int
+_native_set(PyObject **item, const char kind, PyObject *val)
 {
-    Py_ssize_t n = PyDataObject_LEN(op);
-    PyTypeObject *type = Py_TYPE(op);
-    if (type->tp_dictoffset) {
-        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
-        if (dictptr && *dictptr) {
-            n += PyDict_Size(*dictptr);
+    switch (kind) {
+        case NATIVE_INT64: {
+            long long v = PyLong_AsLongLong(val);
+            if (v == -1 && PyErr_Occurred())
+                return -1;
+            *(int64_t*)item = (int64_t)v;
+            return 0;
+        }
+        case NATIVE_DOUBLE: {
+            double v = PyFloat_AsDouble(val);
+            if (v == -1.0 && PyErr_Occurred())
+                return -1;
+            *(double*)item = v;
+            return 0;
+        }
+        default: {
+            PyObject *old = *item;
+            Py_INCREF(val);
+            *item = val;
+            Py_XDECREF(old);
+            return 0;
         }
     }
-    return n;
 }
 
-static int
-dataobject_traverse(PyObject *op, visitproc visit, void *arg)
+static PyObject *
+dataobject_get_native_item(PyObject *op, Py_ssize_t i)
 {
-    PyTypeObject *type = Py_TYPE(op);
-    Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    const char *kinds = _dataobject_native_kinds(Py_TYPE(op));
+    if (kinds == NULL)
+        return NULL;
 
-    if (n_items) {
-        PyObject **items = PyDataObject_ITEMS(op);
-        while (n_items--) {
-            Py_VISIT(*items);
-            items++;
-        }
-    }
+    return _native_get(PyDataObject_ITEMS(op) + i, kinds[i]);
+}
 
-    if (type->tp_dictoffset) {
-        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
-        if (dictptr && *dictptr)
-            Py_VISIT(*dictptr);
-    }
+static int
+dataobject_set_native_item(PyObject *op, Py_ssize_t i, PyObject *val)
+{
+    const char *kinds = _dataobject_native_kinds(Py_TYPE(op));
+    if (kinds == NULL)
+        return -1;
 
-    return 0;
+    return _native_set(PyDataObject_ITEMS(op) + i, kinds[i], val);
 }
 
+/* if args == NULL then first n_args fields are filled by None (or zero) and
+   should be initialized later */
 static PyObject *
-dataobject_sq_item(PyObject *op, Py_ssize_t i)
+_dataobject_new_native(PyTypeObject *type, PyObject *const *args,
+                       const Py_ssize_t n_args, int copy_default)
 {
-    const Py_ssize_t n = PyDataObject_LEN(op);
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    PyObject *default_vals, *op;
+    const char *kinds;
+    Py_ssize_t i;
 
-    if (i < 0)
-        i += n;
-    if (i < 0 || i >= n) {
-        PyErr_Format(PyExc_IndexError, "index %d out of range", i);
+    if (n_args > n_items) {
+        PyErr_SetString(PyExc_TypeError,
+            "number of the arguments greater than the number of fields");
         return NULL;
     }
 
-    PyObject *v = PyDataObject_GET_ITEM(op, i);
-    // if (v == NULL) {
-    //     PyErr_SetString(PyExc_IndexError, "item has no value");
-    //     return NULL;
-    // }
+    kinds = _dataobject_native_kinds(type);
+    if (kinds == NULL)
+        return NULL;
 
-    Py_INCREF(v);
-    return v;
-}
+    default_vals = PyDict_GetItemWithError(type->tp_dict, __default_vals__name);
+    if (default_vals == NULL && PyErr_Occurred())
+        return NULL;
+    Py_XINCREF(default_vals);
 
-static int
-dataobject_sq_ass_item(PyObject *op, Py_ssize_t i, PyObject *val)
-{
-    const Py_ssize_t n = PyDataObject_LEN(op);
+    op = type->tp_alloc(type, 0);
+    if (op == NULL)
+        goto error;
 
-    if (i < 0)
-        i += n;
-    if (i < 0 || i >= n) {
-        PyErr_Format(PyExc_IndexError, "index %d out of range", i);
-        return -1;
+    PyObject **items = PyDataObject_ITEMS(op);
+    memset(items, 0, n_items * sizeof(PyObject*));
+
+    for (i = 0; i < n_args; i++) {
+        if (args == NULL) {
+            if (kinds[i] == NATIVE_OBJECT) {
+                Py_INCREF(Py_None);
+                items[i] = Py_None;
+            }
+        }
+        else if (_native_set(items + i, kinds[i], args[i]) < 0)
+            goto error;
     }
 
-    PyObject **item = PyDataObject_ITEMS(op) + i;
+    for (; i < n_items; i++) {
+        PyObject *val = _default_value(default_vals, i, copy_default);
+        if (val == NULL)
+            goto error;
+        int ret = _native_set(items + i, kinds[i], val);
+        Py_DECREF(val);
+        if (ret < 0)
+            goto error;
+    }
 
-    Py_DECREF(*item);
-    Py_INCREF(val);
-    *item = val;
+    Py_XDECREF(default_vals);
+    return op;
 
-    return 0;
+error:
+    Py_XDECREF(op);
+    Py_XDECREF(default_vals);
+    return NULL;
 }
 
+#if PY_VERSION_HEX >= 0x030A0000
 static PyObject*
-dataobject_mp_subscript(PyObject* op, PyObject* name)
+dataobject_vectorcall_native(PyTypeObject *type, PyObject * const*args,
+                             const Py_ssize_t n_args, PyObject *kwnames)
 {
-    return Py_TYPE(op)->tp_getattro(op, name);
-}
+    const Py_ssize_t n_kwnames = kwnames ? Py_SIZE(kwnames) : 0;
+    dataobject_kwnames_entry *entry = NULL;
 
-static int
-dataobject_mp_ass_subscript(PyObject* op, PyObject* name, PyObject *val)
-{
-    return Py_TYPE(op)->tp_setattro(op, name, val);
-}
+    if (n_kwnames > 0) {
+        entry = _dataobject_kwnames_entry(type, kwnames);
+        if (entry == NULL && PyErr_Occurred())
+            return NULL;
+    }
 
-static int
-dataobject_mp_ass_subscript2(PyObject* op, PyObject* item, PyObject *val)
-{
-    PyNumberMethods *tp_as_number = Py_TYPE(item)->tp_as_number;
-    if (tp_as_number != NULL && tp_as_number->nb_index != NULL) {
-        Py_ssize_t i = PyLong_AsSsize_t(item);
-        if (i == -1 && PyErr_Occurred())
-            return -1;
-        return dataobject_sq_ass_item(op, i, val);
-    } else
-        return Py_TYPE(op)->tp_setattro(op, item, val);
-}
+    PyObject *op = _dataobject_new_native(type, args, n_args, 0);
+    if (op == NULL)
+        return NULL;
 
-static PyObject*
-dataobject_mp_subscript2(PyObject* op, PyObject* item)
-{
-    PyNumberMethods *tp_as_number = Py_TYPE(item)->tp_as_number;
-    if (tp_as_number != NULL && tp_as_number->nb_index != NULL) {
-        Py_ssize_t i = PyLong_AsSsize_t(item);
-        if (i == -1 && PyErr_Occurred())
-            return NULL;
-        return dataobject_sq_item(op, i);
-    } else
-        return Py_TYPE(op)->tp_getattro(op, item);
-}
+    if (entry) {
+        const Py_ssize_t *indices = entry->indices;
+        Py_ssize_t i;
 
-static int
-dataobject_mp_ass_subscript_sq(PyObject* op, PyObject* item, PyObject *val)
-{
-    PyNumberMethods *tp_as_number = Py_TYPE(item)->tp_as_number;
-    if (tp_as_number != NULL && tp_as_number->nb_index != NULL) {
-        Py_ssize_t i = PyLong_AsSsize_t(item);
-        if (i == -1 && PyErr_Occurred())
-            return -1;
-        return dataobject_sq_ass_item(op, i, val);
-    } else {
-        type_error("object %s support only assignment by index", op);
-        return -1;
+        for(i=0; i<n_kwnames; i++) {
+            if (dataobject_set_native_item(op, indices[i], args[n_args + i]) < 0)
+                goto error;
+        }
+    }
+    else if (n_kwnames > 0) {
+        Py_ssize_t i;
+
+        PyObject *fields_index = _dataobject_fields_index(type);
+        if (fields_index == NULL)
+            goto error;
+
+        for(i=0; i<n_kwnames; i++) {
+            PyObject *name = PyTuple_GET_ITEM(kwnames, i);
+            PyObject *val = args[n_args + i];
+            Py_ssize_t index = _dataobject_field_index(type, fields_index, name);
+
+            if (index >= 0) {
+                if (dataobject_set_native_item(op, index, val) < 0)
+                    goto error;
+            }
+            else if (PyErr_Occurred())
+                goto error;
+            else if (!type->tp_dictoffset) {
+                PyErr_Format(PyExc_TypeError, "Invalid kwarg: %U not in __fields__", name);
+                goto error;
+            }
+            else if (PyObject_SetAttr(op, name, val) < 0)
+                goto error;
+        }
     }
+
+    return op;
+
+error:
+    Py_DECREF(op);
+    return NULL;
 }
+#endif
 
+#if PY_VERSION_HEX >= 0x030A0000
 static PyObject*
-dataobject_mp_subscript_sq(PyObject* op, PyObject* item)
+dataobject_vectorcall(PyObject *type0, PyObject * const*args,
+                      size_t nargsf, PyObject *kwnames)
 {
-    PyNumberMethods *tp_as_number = Py_TYPE(item)->tp_as_number;
-    if (tp_as_number != NULL && tp_as_number->nb_index != NULL) {
-        Py_ssize_t i = PyLong_AsSsize_t(item);
-        if (i == -1 && PyErr_Occurred())
-            return NULL;
-        return dataobject_sq_item(op, i);
-    } else {
-        type_error("object %s get item only by index", op);
+    PyTypeObject *type = (PyTypeObject*)type0;
+    const Py_ssize_t n_args = PyVectorcall_NARGS(nargsf);
+
+    if (PyDataObject_IS_NATIVE(type))
+        return dataobject_vectorcall_native(type, args, n_args, kwnames);
+
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+
+    if (n_args > n_items) {
+        PyErr_SetString(PyExc_TypeError,
+            "the number of the arguments greater than the number of fields");
         return NULL;
     }
-}
-
-static void copy_sequence_methods(PySequenceMethods *out, PySequenceMethods *in) {
-    out->sq_length = in->sq_length;
-    out->sq_concat = in->sq_concat;
-    out->sq_repeat = in->sq_repeat;
-    out->sq_item = in->sq_item;
-    out->was_sq_slice = in->was_sq_slice;
-    out->sq_ass_item = in->sq_ass_item;
-    out->was_sq_ass_slice = in->was_sq_ass_slice;
-    out->sq_contains = in->sq_contains;
-}
 
+    const Py_ssize_t n_kwnames = kwnames ? Py_SIZE(kwnames) : 0;
+    dataobject_kwnames_entry *entry = NULL;
 
-static PySequenceMethods dataobject_as_sequence = {
-    (lenfunc)dataobject_len,                  /* sq_length */
-    0,                                        /* sq_concat */
-    0,                                        /* sq_repeat */
-    (ssizeargfunc)dataobject_sq_item,         /* sq_item */
-    0,                                        /* sq_slice */
-    (ssizeobjargproc)dataobject_sq_ass_item,  /* sq_ass_item */
-    0,                                        /* sq_ass_slice */
-    0,                                        /* sq_contains */
-};
+    if (n_kwnames > 0) {
+        entry = _dataobject_kwnames_entry(type, kwnames);
+        if (entry == NULL && PyErr_Occurred())
+            return NULL;
+    }
 
-static PySequenceMethods dataobject_as_sequence0 = {
-    (lenfunc)dataobject_len,                /* sq_length */
-    0,                                      /* sq_concat */
-    0,                                      /* sq_repeat */
-    0,                                      /* sq_item */
-    0,                                      /* sq_slice */
-    0,                                      /* sq_ass_item */
-    0,                                      /* sq_ass_slice */
-    0,                                      /* sq_contains */
-};
+    PyObject *op = type->tp_alloc(type, 0);
+    if (op == NULL)
+        return NULL;
 
-static PySequenceMethods dataobject_as_sequence_ro = {
-    (lenfunc)dataobject_len,           /* sq_length */
-    0,                                 /* sq_concat */
-    0,                                 /* sq_repeat */
-    (ssizeargfunc)dataobject_sq_item,  /* sq_item */
-    0,                                 /* sq_slice */
-    0,                                 /* sq_ass_item */
-    0,                                 /* sq_ass_slice */
-    0,                                 /* sq_contains */
-};
+    PyObject **items = PyDataObject_ITEMS(op);
 
-static void copy_mapping_methods(PyMappingMethods *out, PyMappingMethods *in) {
-    out->mp_length = in->mp_length;
-    out->mp_subscript = in->mp_subscript;
-    out->mp_ass_subscript = in->mp_ass_subscript;
-}
+    _fill_items(items, args, n_args);
 
-static PyMappingMethods dataobject_as_mapping = {
-    (lenfunc)dataobject_len,                  /* mp_len */
-    (binaryfunc)dataobject_mp_subscript,         /* mp_subscr */
-    (objobjargproc)dataobject_mp_ass_subscript,  /* mp_ass_subscr */
-};
+    if (entry && entry->min_index >= n_args && n_args + n_kwnames == n_items) {
+        // keyword arguments fill the rest of the fields
+        const Py_ssize_t *indices = entry->indices;
+        Py_ssize_t i;
 
-static PyMappingMethods dataobject_as_mapping0 = {
-    (lenfunc)dataobject_len,                  /* mp_len */
-    0,                                        /* mp_subscr */
-    0,                                        /* mp_ass_subscr */
-};
+        for(i=0; i<n_kwnames; i++) {
+            PyObject *val = args[n_args + i];
+            Py_INCREF(val);
+            items[indices[i]] = val;
+        }
+        return op;
+    }
 
-static PyMappingMethods dataobject_as_mapping_ro = {
-    (lenfunc)dataobject_len,              /* mp_len */
-    (binaryfunc)dataobject_mp_subscript,   /* mp_subscr */
-    0,                                     /* mp_ass_subscr */
-};
+    if (n_args < n_items) {
+        PyObject *tp_dict = type->tp_dict;
+        PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
+        PyObject *default_vals = mp->mp_subscript(tp_dict, __default_vals__name);
 
-static PyMappingMethods dataobject_as_mapping2 = {
-    (lenfunc)dataobject_len,                   /* mp_len */
-    (binaryfunc)dataobject_mp_subscript2,         /* mp_subscr */
-    (objobjargproc)dataobject_mp_ass_subscript2,  /* mp_ass_subscr */
-};
+        if (default_vals == NULL) {
+            PyErr_Clear();
+            _fill_items_none(items, n_args, n_items);
+        } else {
+            int ret = _fill_items_defaults(items, default_vals, n_args, n_items);
+            Py_DECREF(default_vals);
+            if (!ret)
+                return NULL;
+        }
+    }
 
-static PyMappingMethods dataobject_as_mapping2_ro = {
-    (lenfunc)dataobject_len,               /* mp_len */
-    (binaryfunc)dataobject_mp_subscript2,  /* mp_subscr */
-    0,                                     /* mp_ass_subscr */
-};
+    if (entry) {
+        const Py_ssize_t *indices = entry->indices;
+        Py_ssize_t i;
 
-static PyMappingMethods dataobject_as_mapping_sq = {
-    (lenfunc)dataobject_len,                   /* mp_len */
-    (binaryfunc)dataobject_mp_subscript_sq,         /* mp_subscr */
-    (objobjargproc)dataobject_mp_ass_subscript_sq,  /* mp_ass_subscr */
-};
+        for(i=0; i<n_kwnames; i++) {
+            PyObject *val = args[n_args + i];
+            PyObject **item = items + indices[i];
+            PyObject *old = *item;
 
-static PyMappingMethods dataobject_as_mapping_sq_ro = {
-    (lenfunc)dataobject_len,                 /* mp_len */
-    (binaryfunc)dataobject_mp_subscript_sq,  /* mp_subscr */
-    0,                                       /* mp_ass_subscr */
-};
+            Py_INCREF(val);
+            *item = val;
+            Py_DECREF(old);
+        }
+    }
+    else if (n_kwnames > 0) {
+        Py_ssize_t i;
 
-#ifndef _PyHASH_MULTIPLIER
-#define _PyHASH_MULTIPLIER 1000003UL
-#endif
+        PyObject *fields_index = _dataobject_fields_index(type);
+        if (fields_index == NULL)
+            goto error;
 
-static Py_hash_t
-dataobject_hash(PyObject *op)
-{
-    const Py_ssize_t len = PyDataObject_LEN(op);
-    Py_hash_t mult = _PyHASH_MULTIPLIER;
-    Py_ssize_t i;
+        for(i=0; i<n_kwnames; i++) {
+            PyObject *name = PyTuple_GET_ITEM(kwnames, i);
+            PyObject *val = args[n_args + i];
+            Py_ssize_t index = _dataobject_field_index(type, fields_index, name);
 
-    Py_uhash_t x = 0x345678L;
-    for(i=0; i<len; i++) {
-        PyObject *o = PyDataObject_GET_ITEM(op, i);
-        Py_hash_t y = PyObject_Hash(o);
-//         Py_DECREF(o);
-        if (y == -1)
-            return -1;
-        x = (x ^ y) * mult;
-        mult += (Py_hash_t)(82520L + len + len);
+            if (index >= 0) {
+                if (dataobject_ass_item(op, index, val) < 0)
+                    goto error;
+            }
+            else if (PyErr_Occurred())
+                goto error;
+            else if (!type->tp_dictoffset) {
+                PyErr_Format(PyExc_TypeError, "Invalid kwarg: %U not in __fields__", name);
+                goto error;
+            }
+            else if (PyObject_SetAttr(op, name, val) < 0)
+                goto error;
+        }
     }
 
-    x += 97531L;
-    if (x == (Py_uhash_t)-1)
-        x = -2;
-    return x;
+    return op;
+
+error:
+    Py_DECREF(op);
+    return NULL;
 }
+#endif
 
-static Py_hash_t
-dataobject_hash_byref(PyObject *op)
+static PyObject*
+dataobject_new_basic(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    return (Py_hash_t)op;
-}
+    if (PyDataObject_IS_NATIVE(type)) {
+        PyObject *op = _dataobject_new_native(type, ((PyTupleObject*)args)->ob_item, Py_SIZE(args), 0);
+        if (op && kwds && _dataobject_update(op, kwds, 1) < 0) {
+            Py_DECREF(op);
+            return NULL;
+        }
+        return op;
+    }
 
-// static Py_hash_t
-// dataobject_hash_ni(PyObject *op)
-// {
-//         type_error("__hash__ is not implemented for %s", op);
-//         return -1;
-// }
+    PyObject *op = type->tp_alloc(type, 0);
 
-// PyDoc_STRVAR(dataobject_hash_doc,
-// "T.__hash__() -- __hash__ for T");
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    const Py_ssize_t n_args = Py_SIZE(args);
 
-// static PyObject*
-// dataobject_hash2(PyObject *op)
-// {
-//     return PyLong_FromSsize_t(dataobject_hash(op));
-// }
+    if (n_args > n_items) {
+        PyErr_SetString(PyExc_TypeError,
+            "number of the arguments greater than the number of fields");
+        return NULL;
+    }
 
+    PyObject **items = PyDataObject_ITEMS(op);
+    const PyTupleObject *tpl = (const PyTupleObject*)args;
+    PyObject *const*tmp = (PyObject*const*)(tpl->ob_item);
 
-static PyObject *
-dataobject_richcompare(PyObject *v, PyObject *w, int op)
-{
-    Py_ssize_t i, k;
-    Py_ssize_t vlen = PyDataObject_LEN(v), wlen = PyDataObject_LEN(w);
-    PyObject *vv;
-    PyObject *ww;
-    PyObject *ret;
+    _fill_items(items, tmp, n_args);
 
-    if (!(Py_TYPE(v) == Py_TYPE(w)) ||
-        (!PyObject_IsSubclass((PyObject*)Py_TYPE(w), (PyObject*)Py_TYPE(v))))
-                  Py_RETURN_NOTIMPLEMENTED;
-
-    if ((vlen != wlen) && (op == Py_EQ || op == Py_NE)) {
-        PyObject *res;
-        if (op == Py_EQ)
-            res = Py_False;
-        else
-            res = Py_True;
-        Py_INCREF(res);
-        return res;
-    }
-
-    for (i = 0; i < vlen && i < wlen; i++) {
-        vv = PyDataObject_GET_ITEM(v, i);
-        ww = PyDataObject_GET_ITEM(w, i);
-        k = PyObject_RichCompareBool(vv, ww, Py_EQ);
-//         Py_DECREF(vv);
-//         Py_DECREF(ww);
-        if (k < 0)
-            return NULL;
-        if (!k)
-            break;
-    }
+    if (n_args < n_items) {
+        PyObject *tp_dict = type->tp_dict;
+        PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
+        PyObject *default_vals = mp->mp_subscript(tp_dict, __default_vals__name);
 
-    if (i >= vlen || i >= wlen) {
-        /* No more items to compare -- compare sizes */
-        int cmp;
-        PyObject *res;
-        switch (op) {
-        case Py_LT: cmp = vlen <  wlen; break;
-        case Py_LE: cmp = vlen <= wlen; break;
-        case Py_EQ: cmp = vlen == wlen; break;
-        case Py_NE: cmp = vlen != wlen; break;
-        case Py_GT: cmp = vlen >  wlen; break;
-        case Py_GE: cmp = vlen >= wlen; break;
-        default: return NULL; /* cannot happen */
+        if (default_vals == NULL) {
+            PyErr_Clear();
+            _fill_items_none(items, n_args, n_items);
+        } else {
+            int ret = _fill_items_defaults(items, default_vals, n_args, n_items);
+            Py_DECREF(default_vals);
+            if (!ret)
+                return NULL;
         }
-        if (cmp)
-            res = Py_True;
-        else
-            res = Py_False;
-        Py_INCREF(res);
-        return res;
     }
 
-    /* We have an item that differs -- shortcuts for EQ/NE */
-    if (op == Py_EQ) {
-        Py_INCREF(Py_False);
-        return Py_False;
-    }
-    if (op == Py_NE) {
-        Py_INCREF(Py_True);
-        return Py_True;
+    if (kwds) {
+        int retval = _dataobject_update(op, kwds, 1);
+        if (retval < 0)
+            return NULL;
     }
 
-    /* Compare the final item again using the proper operator */
-    vv = PyDataObject_GET_ITEM(v, i);
-    ww = PyDataObject_GET_ITEM(w, i);
-    ret = PyObject_RichCompare(vv, ww, op);
-//     Py_DECREF(vv);
-//     Py_DECREF(ww);
-
-    return ret;
+    return op;
 }
 
-PyDoc_STRVAR(dataobject_sizeof_doc,
-"T.__sizeof__() -- size of T");
-
-static PyObject *
-dataobject_sizeof(PyObject *self)
+static PyObject*
+dataobject_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    return PyLong_FromSsize_t(Py_TYPE(self)->tp_basicsize);
-}
-
-PyDoc_STRVAR(dataobject_copy_doc,
-"T.__copy__() -- copy of T");
+    if (PyDataObject_IS_NATIVE(type))
+        return _dataobject_new_native(type, NULL, Py_SIZE(args), 0);
 
-static PyObject *
-dataobject_copy(PyObject* op)
-{
-    PyTypeObject *type = Py_TYPE(op);
+    PyObject *op = type->tp_alloc(type, 0);
 
     const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    const Py_ssize_t n_args = Py_SIZE(args);
+    PyObject **items = PyDataObject_ITEMS(op);
 
-    PyObject *new_op = type->tp_alloc(type, 0);
-
-    PyObject **items = PyDataObject_ITEMS(new_op);
-    PyObject **args = (PyObject**)PyDataObject_ITEMS(op);
-
-    _fill_items(items, args, n_items);
-
-    if (type->tp_dictoffset) {
-        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
-        PyObject* dict = NULL;
-
-        if (*dictptr)
-            dict = *dictptr;
+    if (n_args > n_items) {
+        PyErr_SetString(PyExc_TypeError,
+            "number of the arguments greater than the number of fields");
+        return NULL;
+    }
 
-        if (dict != NULL) {
-            int retval;
+    _fill_items_none(items, 0, n_args);
 
-            Py_INCREF(dict);
-            retval = _dataobject_update(new_op, dict, 1);
-            Py_DECREF(dict);
+    if (n_args < n_items) {
+        PyObject *tp_dict = type->tp_dict;
+        PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
+        PyObject *default_vals = mp->mp_subscript(tp_dict, __default_vals__name);
 
-            if (retval < 0)
+        if (default_vals == NULL) {
+            PyErr_Clear();
+            _fill_items_none(items, n_args, n_items);
+        } else {
+            int ret = _fill_items_defaults(items, default_vals, n_args, n_items);
+            Py_DECREF(default_vals);
+            if (!ret)
                 return NULL;
         }
     }
 
-    return new_op;
+    return op;
 }
 
-static PyObject *
-dataobject_item(PyObject *op, Py_ssize_t i)
+static PyObject*
+dataobject_new_copy_default(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
-    const Py_ssize_t n = PyDataObject_LEN(op);
+    if (PyDataObject_IS_NATIVE(type))
+        return _dataobject_new_native(type, NULL, Py_SIZE(args), 1);
 
-    if (i < 0)
-        i += n;
-    if (i < 0 || i >= n) {
-        PyErr_Format(PyExc_IndexError, "index %d out of range", i);
+    PyObject *op = type->tp_alloc(type, 0);
+
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    const Py_ssize_t n_args = Py_SIZE(args);
+    PyObject **items = PyDataObject_ITEMS(op);
+
+    if (n_args > n_items) {
+        PyErr_SetString(PyExc_TypeError,
+            "number of the arguments greater than the number of fields");
         return NULL;
     }
 
-    PyObject *v = ((PyDataStruct*)op)->ob_items[i];
-    Py_INCREF(v);
-    return v;
+    _fill_items_none(items, 0, n_args);
+
+    if (n_args < n_items) {
+        PyObject *tp_dict = type->tp_dict;
+        PyMappingMethods *mp = Py_TYPE(tp_dict)->tp_as_mapping;
+        PyObject *default_vals = mp->mp_subscript(tp_dict, __default_vals__name);
+
+        if (default_vals == NULL) {
+            PyErr_Clear();
+            _fill_items_none(items, n_args, n_items);
+        } else {
+            int ret = _fill_items_copy_defaults(items, default_vals, n_args, n_items);
+            Py_DECREF(default_vals);
+            if (!ret)
+                return NULL;
+        }
+    }
+
+    return op;
 }
 
-static int dataobject_ass_item(PyObject *op, Py_ssize_t i, PyObject *val)
+static PyObject*
+dataobject_new_empty(PyTypeObject *type)
 {
-    const Py_ssize_t n = PyDataObject_LEN(op);
+    if (PyDataObject_IS_NATIVE(type))
+        return _dataobject_new_native(type, NULL, PyDataObject_NUMITEMS(type), 0);
 
-    if (i < 0)
-        i += n;
-    if (i < 0 || i >= n) {
-        PyErr_Format(PyExc_IndexError, "index %d out of range", i);
-        return -1;
-    }
+    PyObject *op = type->tp_alloc(type, 0);
 
-    PyObject **items = PyDataObject_ITEMS(op) + i;
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    PyObject **items = PyDataObject_ITEMS(op);
 
-    Py_XDECREF(*items);
-    Py_INCREF(val);
-    *items = val;
-    return 0;
+    _fill_items_none(items, 0, n_items);
+
+    return op;
 }
 
-PyDoc_STRVAR(dataobject_repr_doc,
-"T.__repr__() -- representation of T");
+static int
+dataobject_init_basic(PyObject *op, PyObject *args, PyObject *kwds)
+{
+    return 0;
+}
 
-static PyObject *
-dataobject_repr(PyObject *self)
+static int
+dataobject_init(PyObject *op, PyObject *args0, PyObject *kwds)
 {
+    PyTupleObject *tmp = (PyTupleObject*)args0;
+    PyObject *const*args = (PyObject**)(tmp->ob_item);
+    const Py_ssize_t n_args = Py_SIZE(tmp);
+
+    PyObject **items = PyDataObject_ITEMS(op);
     Py_ssize_t i;
-    PyObject *fs;
-    PyTypeObject *tp = Py_TYPE(self);
-    PyObject *tp_name = PyObject_GetAttrString((PyObject*)tp, "__name__");
-    PyObject *tmp;
-    PyObject *sep = PyUnicode_FromString(", ");
-    PyObject *eq = PyUnicode_FromString("=");
 
-    fs = PyObject_GetAttrString(self, "__fields__");
-    if (fs) {
-        Py_ssize_t n_fs = 0;
-        if (Py_TYPE(fs) == &PyTuple_Type) {
-            n_fs = PyObject_Length(fs);
-        } else {
-            n_fs = (Py_ssize_t)PyNumber_AsSsize_t(fs, PyExc_IndexError);
-            if (n_fs < 0) {
-                Py_DECREF(fs);
-                Py_DECREF(tp_name);
-                return NULL;
-            }
-            n_fs = 0;
-        }
-    } else
-        PyErr_Clear();
+    if (n_args > PyDataObject_LEN(op)) {
+        PyErr_SetString(PyExc_TypeError,
+            "number of the arguments greater than the number of fields");
+        return -1;
+    }
 
-    Py_ssize_t n = PyDataObject_LEN(self);
-    if (n == 0) {
-        PyObject *s = PyUnicode_FromString("()");
-        PyObject *text = PyUnicode_Concat(tp_name, s);
-        Py_DECREF(s);
-        Py_DECREF(tp_name);
-        return text;
+    if (PyDataObject_IS_NATIVE(Py_TYPE(op))) {
+        const char *kinds = _dataobject_native_kinds(Py_TYPE(op));
+        if (kinds == NULL)
+            return -1;
+        for (i = 0; i < n_args; i++) {
+            if (_native_set(items + i, kinds[i], args[i]) < 0)
+                return -1;
+        }
+    }
+    else {
+        for (i = 0; i < n_args; i++) {
+            PyObject *v = *(args++);
+            Py_DECREF(*items);
+            Py_INCREF(v);
+            *(items++) = v;
+        }
     }
 
-    i = Py_ReprEnter((PyObject *)self);
-    if (i != 0) {
-        Py_DECREF(tp_name);
-        return i > 0 ? PyUnicode_FromString("(...)") : NULL;
+    if (kwds) {
+        int retval = _dataobject_update(op, kwds, 1);
+        if (retval < 0)
+            return retval;
     }
 
-    PyObject *items = PyList_New(0);
+    return 0;
+}
 
-    PyList_Append(items, tp_name);
-    Py_DECREF(tp_name);
+// Index of the field with the given name in the per-type table __fields_index__
+// or -1 (with or without an exception set). Names of the fields are interned,
+// so lookups by the interned names (keyword arguments, attribute names) are
+// resolved by the pointer equality. The index is checked against the number
+// of the fields, so the table can't refer outside of the instance.
+static Py_ssize_t
+_dataobject_field_index(PyTypeObject *type, PyObject *fields_index, PyObject *name)
+{
+    PyObject *ob = PyDict_GetItemWithError(fields_index, name);
 
-    tmp = PyUnicode_FromString("(");
-    PyList_Append(items, tmp);
-    Py_DECREF(tmp);
+    if (ob == NULL)
+        return -1;
 
-    /* Do repr() on each element. */
-    for (i = 0; i < n; ++i) {
-        PyObject *fn = PyTuple_GET_ITEM(fs, i);
-        PyList_Append(items, fn);
+    Py_ssize_t index = PyLong_AsSsize_t(ob);
+    if (index == -1 && PyErr_Occurred())
+        return -1;
+    if (index < 0 || index >= PyDataObject_NUMITEMS(type)) {
+        PyErr_SetString(PyExc_IndexError, "index of the field out of range");
+        return -1;
+    }
+    return index;
+}
 
-        PyList_Append(items, eq);
+static int
+_dataobject_update_item(PyObject *op, PyObject *fields_index, Py_ssize_t has___dict___,
+                        PyObject *key, PyObject *val)
+{
+    if (fields_index) {
+        Py_ssize_t index = _dataobject_field_index(Py_TYPE(op), fields_index, key);
+        if (index >= 0)
+            return dataobject_ass_item(op, index, val);
+        if (PyErr_Occurred())
+            return -1;
+        if (!has___dict___) {
+            PyErr_Format(
+                PyExc_TypeError,
+                "Invalid kwarg: %U not in __fields__ and has not __dict__", key);
+            return -1;
+        }
+    }
 
-        PyObject *ob = dataobject_item(self, i);
-        if (ob == NULL)
-            goto error;
+    if (PyObject_SetAttr(op, key, val) < 0) {
+        PyErr_Format(
+            PyExc_TypeError,
+            "Invalid kwarg: %U not in __fields__", key);
+        return -1;
+    }
+    return 0;
+}
 
-        PyObject *s = PyObject_Repr(ob);
-        if (s == NULL) {
-            Py_DECREF(ob);
-            goto error;
-        }
-        PyList_Append(items, s);
-        Py_DECREF(s);
-        Py_DECREF(ob);
+static int
+_dataobject_update(PyObject *op, PyObject *kwds, int flag)
+{
+    PyObject *iter, *key, *val;
 
-        if (i < n-1) {
-            PyList_Append(items, sep);
-        }
+    PyTypeObject *type = Py_TYPE(op);
+    Py_ssize_t has___dict___ = type->tp_dictoffset;
+    PyObject *fields_index = NULL;
+
+    if (flag) {
+        fields_index = _dataobject_fields_index(type);
+        if (fields_index == NULL)
+            return -1;
     }
 
-    Py_XDECREF(fs);
-    Py_DECREF(sep);
-    Py_DECREF(eq);
+    if (PyDict_CheckExact(kwds)) {
+        Py_ssize_t pos = 0;
 
-    if (tp->tp_dictoffset) {
-        PyObject *dict = PyObject_GetAttrString(self, "__dict__");
+        while (PyDict_Next(kwds, &pos, &key, &val)) {
+            if (_dataobject_update_item(op, fields_index, has___dict___, key, val) < 0)
+                return -1;
+        }
+        return 0;
+    }
 
-        if (dict) {
-            if (PyObject_IsTrue(dict)) {
-                tmp = PyUnicode_FromString(", **");
-                PyList_Append(items, tmp);
-                Py_DECREF(tmp);
+    iter = PyObject_GetIter(kwds);
+    if (iter == NULL)
+        return -1;
+    while ((key = PyIter_Next(iter))) {
+        val = PyObject_GetItem(kwds, key);
+        if (val == NULL) {
+            Py_DECREF(key);
+            Py_DECREF(iter);
+            return -1;
+        }
 
-                PyObject *s = PyObject_Repr(dict);
-                PyList_Append(items, s);
-                Py_DECREF(s);
-            }
-            Py_DECREF(dict);
+        int retval = _dataobject_update_item(op, fields_index, has___dict___, key, val);
+        Py_DECREF(val);
+        Py_DECREF(key);
+        if (retval < 0) {
+            Py_DECREF(iter);
+            return -1;
         }
     }
+    Py_DECREF(iter);
+    if (PyErr_Occurred())
+        return -1;
+    return 0;
+}
 
-    tmp = PyUnicode_FromString(")");
-    PyList_Append(items, tmp);
-    Py_DECREF(tmp);
 
-    Py_ReprLeave((PyObject *)self);
-    tmp = PyUnicode_FromString("");
-    PyObject *ret = PyUnicode_Join(tmp, items);
-    Py_DECREF(tmp);
+static int
+dataobject_clear(PyObject *op)
+{
+    PyTypeObject *type = Py_TYPE(op);
 
-    return ret;
+    if (type->tp_dictoffset) {
+        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
+        if (dictptr && *dictptr) {
+            Py_CLEAR(*dictptr);
+            *dictptr = NULL;
+        }
+    }
 
-error:
-    Py_XDECREF(fs);
+    PyObject **items = PyDataObject_ITEMS(op);
+    Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    while (n_items-- > 0) {
+        Py_CLEAR(*items);
+        items++;
+    }
 
-    Py_ReprLeave((PyObject *)self);
-    return NULL;
+    return 0;
 }
 
-// PyDoc_STRVAR(dataobject_subscript_doc,
-// "T.__getitem__(ob, key)");
-
-// static PyObject *
-// dataobject_subscript(PyObject *ob, PyObject *key)
-// {
-//     PyMappingMethods *m = Py_TYPE(ob)->tp_as_mapping;
+static int
+dataobject_xdecref(PyObject *op)
+{
+    PyTypeObject *type = Py_TYPE(op);
 
-//     if (m->mp_subscript) {
-//         return m->mp_subscript(ob, key);
-//     }
+    if (type->tp_weaklistoffset)
+        PyObject_ClearWeakRefs(op);
 
-//     return type_error("instances of %s are not subsciptable",
-//                       (PyObject*)Py_TYPE(ob));
-// }
+    if (type->tp_dictoffset) {
+        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
+        if (dictptr && *dictptr) {
+            Py_DECREF(*dictptr);
+            *dictptr = NULL;
+        }
+    }
 
-// PyDoc_STRVAR(dataobject_ass_subscript_doc,
-// "T.__setitem__(ob, key, val)");
+    PyObject **items = PyDataObject_ITEMS(op);
+    Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
 
-// static PyObject*
-// dataobject_ass_subscript(PyObject *ob, PyObject *args)
-// {
-//     if (Py_SIZE(args) != 2) {
-//         type_error("__setitem__ need 2 args", ob);
-//         return NULL;
-//     }
+    while (n_items--) {
+        Py_XDECREF(*items);
+        *items = NULL;
+        items++;
+    }
+    return 0;
+}
 
-//     // PyObject *key = PyTuple_GET_ITEM(args, 0);
-//     // PyObject *val = PyTuple_GET_ITEM(args, 1);
+static void
+dataobject_dealloc(PyObject *op)
+{
+    PyTypeObject *type = Py_TYPE(op);
 
-//     PyMappingMethods *m = Py_TYPE(ob)->tp_as_mapping;
+    if (type->tp_finalize != NULL) {
+        if(PyObject_CallFinalizerFromDealloc(op) < 0)
+            return;
+    }
 
-//     if (m->mp_ass_subscript) {
-//         if (m->mp_ass_subscript(ob,
-//                                 PyTuple_GET_ITEM(args, 0),
-//                                 PyTuple_GET_ITEM(args, 1)))
-//             return NULL;
-//         else
-//             Py_RETURN_NONE;
-//     }
+    dataobject_xdecref(op);
 
-//     type_error("instances of %s does not support item assignment",
-//                (PyObject*)Py_TYPE(ob));
-//     return NULL;
-// }
+#if PY_VERSION_HEX < 0x03080000
+    if (type->tp_flags & Py_TPFLAGS_HEAPTYPE)
+        Py_DECREF(type);
+#endif
 
-PyDoc_STRVAR(dataobject_reduce_doc,
-"T.__reduce__()");
+    type->tp_free((PyObject *)op);
+}
 
-static PyObject *
-dataobject_reduce(PyObject *ob, PyObject *Py_UNUSED(ignore))
+static void
+dataobject_dealloc_gc(PyObject *op)
 {
-    PyObject *result;
-    PyTypeObject *tp = Py_TYPE(ob);
-    PyObject *kw = NULL;
-    PyObject **dictptr;
-
-    PyObject *args = _astuple(ob);
-    if (args == NULL)
-        return NULL;
+    PyTypeObject *type = Py_TYPE(op);
 
-    if (tp->tp_dictoffset) {
-        dictptr = PyObject_GetDictPtr(ob);
-        if (dictptr) {
-            PyObject *d = *dictptr;
-            if (d)
-                kw = PyDict_Copy(d);
-        }
+    if (type->tp_finalize != NULL) {
+        if(PyObject_CallFinalizerFromDealloc(op) < 0)
+            return;
     }
 
-    if (kw)
-        result = PyTuple_Pack(3, tp, args, kw);
-    else
-        result = PyTuple_Pack(2, tp, args);
+    PyObject_GC_UnTrack(op);
 
-    // printf("reduce: %s\n", tp->tp_name);
+    dataobject_xdecref(op);
 
-    Py_DECREF(args);
-    Py_XDECREF(kw);
-    return result;
+    if (type->tp_flags & Py_TPFLAGS_HEAPTYPE)
+        Py_DECREF(type);
+
+    type->tp_free((PyObject *)op);
 }
 
-PyDoc_STRVAR(dataobject_getstate_doc,
-"T.__getstate__()");
+static void
+dataobject_dealloc_native(PyObject *op)
+{
+    PyTypeObject *type = Py_TYPE(op);
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    PyObject **items = PyDataObject_ITEMS(op);
+    PyObject *kinds;
+    Py_ssize_t i;
 
-static PyObject *
-dataobject_getstate(PyObject *ob) {
-    PyTypeObject *tp = Py_TYPE(ob);
-    PyObject **dictptr;
+    if (type->tp_weaklistoffset)
+        PyObject_ClearWeakRefs(op);
 
-    if (tp->tp_dictoffset) {
-        dictptr = PyObject_GetDictPtr(ob);
-        if (dictptr && *dictptr) {
-            return PyDict_Copy(*dictptr);
+    if (type->tp_dictoffset) {
+        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
+        Py_CLEAR(*dictptr);
+    }
+
+    kinds = PyDict_GetItem(type->tp_dict, __native_kinds__name);
+    if (kinds != NULL) {
+        const char *k = PyBytes_AS_STRING(kinds);
+        for (i = 0; i < n_items; i++) {
+            if (k[i] == NATIVE_OBJECT)
+                Py_CLEAR(items[i]);
         }
     }
-    Py_RETURN_NONE;
+
+    type->tp_free((PyObject *)op);
 }
 
-PyDoc_STRVAR(dataobject_setstate_doc,
-"T.__setstate__()");
+/* deep dealloc: the uniquely owned children of the instance are not
+   deallocated recursively, but are moved to the stack and deallocated
+   one by one; nested calls (from the deallocation of the children) only
+   push to the stack, so the depth of the C stack is bounded */
 
-static PyObject*
-dataobject_setstate(PyObject *ob, PyObject *state) {
-    PyTypeObject *tp = Py_TYPE(ob);
-    PyObject *dict;
+typedef struct {
+    PyObject_HEAD
+    PyObject *val;
+    PyObject *next;
+} _LinkedItem;
 
-    if (!state || state == Py_None)
+typedef struct {
+    PyObject_HEAD
+    void *vtab;
+    _LinkedItem *start;
+    _LinkedItem *end;
+} _LinkedList;
+
+#define DEEP_DEALLOC_STACK_KEEP 4096
+
+static PyObject **deep_dealloc_stack = NULL;
+static Py_ssize_t deep_dealloc_size = 0;
+static Py_ssize_t deep_dealloc_allocated = 0;
+static int deep_dealloc_active = 0;
+
+static PyTypeObject *litelist_type = NULL;
+static PyTypeObject *litetuple_type = NULL;
+static PyTypeObject *mutabletuple_type = NULL;
+static PyTypeObject *linkedlist_type = NULL;
+
+static PyTypeObject *
+_deep_dealloc_get_type(const char *modname, const char *name)
+{
+    PyObject *tp = _PyObject_GetObject(modname, name);
+
+    if (tp == NULL || !PyType_Check(tp)) {
+        PyErr_Clear();
+        Py_XDECREF(tp);
         return NULL;
+    }
+    return (PyTypeObject*)tp;
+}
 
-    if (tp->tp_dictoffset) {
-        dict = PyDataObject_GetDict(ob);
+static void
+_deep_dealloc_init_types(void)
+{
+    if (litelist_type == NULL)
+        litelist_type = _deep_dealloc_get_type("recordclass._litelist", "litelist");
+    if (litetuple_type == NULL)
+        litetuple_type = _deep_dealloc_get_type("recordclass._litetuple", "litetuple");
+    if (mutabletuple_type == NULL)
+        mutabletuple_type = _deep_dealloc_get_type("recordclass._litetuple", "mutabletuple");
+    if (linkedlist_type == NULL)
+        linkedlist_type = _deep_dealloc_get_type("recordclass._linkedlist", "linkedlist");
+}
 
-        if (!dict) {
-            // PyErr_SetString(PyExc_TypeError, "failed to create new dict");
-            return NULL;
+static void dataobject_finalize(PyObject *ob);
+
+static int
+_deep_dealloc_is_node(PyObject *o)
+{
+    PyTypeObject *tp = Py_TYPE(o);
+
+    if (tp == litelist_type || tp == litetuple_type || tp == mutabletuple_type ||
+            tp == linkedlist_type)
+        return 1;
+
+    if (!PyType_IsSubtype(tp, &PyDataObject_Type) && !PyType_IsSubtype(tp, &PyDataStruct_Type))
+        return 0;
+
+    /* the instance with a finalizer (__del__) should see its fields
+       and can be resurrected, so it is deallocated in the usual way */
+    if (tp->tp_del != NULL ||
+            (tp->tp_finalize != NULL && tp->tp_finalize != dataobject_finalize))
+        return 0;
+
+    return tp->tp_dealloc == dataobject_dealloc || tp->tp_dealloc == dataobject_dealloc_gc ||
+           tp->tp_dealloc == dataobject_dealloc_native;
+}
+
+static int
+_deep_dealloc_push(PyObject *o)
+{
+    if (deep_dealloc_size == deep_dealloc_allocated) {
+        Py_ssize_t allocated = deep_dealloc_allocated ? 2 * deep_dealloc_allocated : 256;
+        PyObject **stack = PyMem_Realloc(deep_dealloc_stack, allocated * sizeof(PyObject*));
+        if (stack == NULL)
+            return -1;
+        deep_dealloc_stack = stack;
+        deep_dealloc_allocated = allocated;
+    }
+    deep_dealloc_stack[deep_dealloc_size++] = o;
+    return 0;
+}
+
+/* release the reference: uniquely owned nodes are postponed */
+static void
+_deep_dealloc_release(PyObject *o)
+{
+    if (py_refcnt(o) == 1 && _deep_dealloc_is_node(o) && _deep_dealloc_push(o) == 0)
+        return;
+    Py_DECREF(o);
+}
+
+static void
+_deep_dealloc_take_items(PyObject **items, Py_ssize_t n)
+{
+    while (n--) {
+        PyObject *o = *items;
+        if (o != NULL) {
+            *items = NULL;
+            _deep_dealloc_release(o);
         }
+        items++;
+    }
+}
 
-        if (PyDict_Update(dict, state) < 0) {
-            PyErr_SetString(PyExc_TypeError, "dict update failed");
-            Py_DECREF(dict);
-            return NULL;
+/* take the children of the node which is owned only by the caller */
+static void
+_deep_dealloc_take_children(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+
+    if (tp == litelist_type)
+        _deep_dealloc_take_items(((PyListObject*)op)->ob_item, Py_SIZE(op));
+    else if (tp == litetuple_type || tp == mutabletuple_type)
+        _deep_dealloc_take_items(((PyTupleObject*)op)->ob_item, Py_SIZE(op));
+    else if (tp == linkedlist_type) {
+        PyObject *item = (PyObject*)((_LinkedList*)op)->start;
+        /* linkedlist deallocates the chain of items itself */
+        while (item != NULL && item != Py_None && py_refcnt(item) == 1) {
+            PyObject *o = ((_LinkedItem*)item)->val;
+            Py_INCREF(Py_None);
+            ((_LinkedItem*)item)->val = Py_None;
+            _deep_dealloc_release(o);
+            item = ((_LinkedItem*)item)->next;
         }
-        Py_DECREF(dict);
-    } else {
-        PyErr_SetString(PyExc_TypeError, "object has no __dict__");
-        return NULL;
     }
+    else if (!PyDataObject_IS_NATIVE(tp))
+        _deep_dealloc_take_items(PyDataObject_ITEMS(op), PyDataObject_NUMITEMS(tp));
+}
 
-    Py_RETURN_NONE;
+static void
+dataobject_finalize(PyObject *ob) {
+    PyObject *error_type, *error_value, *error_traceback;
+
+    PyErr_Fetch(&error_type, &error_value, &error_traceback);
+
+    _deep_dealloc_take_children(ob);
+
+    if (!deep_dealloc_active) {
+        deep_dealloc_active = 1;
+        while (deep_dealloc_size) {
+            PyObject *op = deep_dealloc_stack[--deep_dealloc_size];
+            if (py_refcnt(op) == 1)
+                _deep_dealloc_take_children(op);
+            Py_DECREF(op);
+        }
+        deep_dealloc_active = 0;
+
+        if (deep_dealloc_allocated > DEEP_DEALLOC_STACK_KEEP) {
+            PyMem_Free(deep_dealloc_stack);
+            deep_dealloc_stack = NULL;
+            deep_dealloc_allocated = 0;
+        }
+    }
+
+    PyErr_Restore(error_type, error_value, error_traceback);
 }
 
-static PyMethodDef dataobject_methods[] = {
-    // {"__getitem__",  (PyCFunction)(void(*)(void))dataobject_subscript, METH_O|METH_COEXIST, dataobject_subscript_doc},
-    // {"__setitem__",  (PyCFunction)dataobject_ass_subscript, METH_VARARGS|METH_COEXIST, dataobject_ass_subscript_doc},
-    {"__copy__",      (PyCFunction)dataobject_copy, METH_NOARGS, dataobject_copy_doc},
-    {"__len__",       (PyCFunction)dataobject_len, METH_NOARGS, dataobject_len_doc},
-    {"__repr__",      (PyCFunction)dataobject_repr, METH_NOARGS, dataobject_repr_doc},
-    {"__sizeof__",    (PyCFunction)dataobject_sizeof, METH_NOARGS, dataobject_sizeof_doc},
-    {"__reduce__",    (PyCFunction)dataobject_reduce, METH_NOARGS, dataobject_reduce_doc},
-    {"__getstate__",  (PyCFunction)dataobject_getstate, METH_NOARGS, dataobject_getstate_doc},
-    {"__setstate__",  (PyCFunction)dataobject_setstate, METH_O, dataobject_setstate_doc},
-    // {"__hash__",     (PyCFunction)dataobject_hash2_ni, METH_O, dataobject_hash_doc},
-    {NULL}
-};
+PyDoc_STRVAR(dataobject_len_doc,
+"T.__len__() -- len of T");
 
-static PyObject *dataobject_iter(PyObject *seq);
+static Py_ssize_t
+dataobject_len(PyObject *op)
+{
+    Py_ssize_t n = PyDataObject_LEN(op);
+    PyTypeObject *type = Py_TYPE(op);
+    if (type->tp_dictoffset) {
+        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
+        if (dictptr && *dictptr) {
+            n += PyDict_Size(*dictptr);
+        }
+    }
+    return n;
+}
 
-// static PyObject* __dict__get(PyObject *ob, void *unused) {
-//     if (!Py_TYPE(ob)->tp_dictoffset) {
-//             PyErr_SetString(PyExc_AttributeError, "the instance hasn't __dict__");
-//             return NULL;
-//     } else {
-//         PyObject** dictptr = (PyObject**)((char*)ob + Py_TYPE(ob)->tp_dictoffset);
-//         PyObject *dict;
-//         if (*dictptr) {
-//             dict = *dictptr;
-//         } else {
-//             *dictptr = dict = PyDict_New();
-//         }
-//         Py_INCREF(dict);
-//         return dict;
-//     }
-// }
+static int
+dataobject_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    PyTypeObject *type = Py_TYPE(op);
+    Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
 
-// static PyGetSetDef dataobject_getset[] = {
-//     {"__dict__", __dict__get, NULL, "__dict__ property", NULL},
-//     {NULL, NULL, NULL, NULL, NULL}
-// };
+    if (n_items) {
+        PyObject **items = PyDataObject_ITEMS(op);
+        while (n_items--) {
+            Py_VISIT(*items);
+            items++;
+        }
+    }
 
+    if (type->tp_dictoffset) {
+        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
+        if (dictptr && *dictptr)
+            Py_VISIT(*dictptr);
+    }
 
-// static PyGetSetDef subtype_getsets_full[] = {
-//     {"__dict__", subtype_dict, subtype_setdict,
-//      PyDoc_STR("dictionary for instance variables (if defined)")},
-//     {"__weakref__", subtype_getweakref, NULL,
-//      PyDoc_STR("list of weak references to the object (if defined)")},
-//     {0}
-// };
+    return 0;
+}
 
+static PyObject *
+dataobject_sq_item(PyObject *op, Py_ssize_t i)
+{
+    const Py_ssize_t n = PyDataObject_LEN(op);
 
-PyDoc_STRVAR(dataobject_doc,
-"dataobject(...) --> dataobject\n\n\
-");
+    if (i < 0)
+        i += n;
+    if (i < 0 || i >= n) {
+        PyErr_Format(PyExc_IndexError, "index %d out of range", i);
+        return NULL;
+    }
 
-static PyTypeObject PyDataObject_Type = {
-    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
-    "recordclass._dataobject.dataobject",   /* tp_name */
-    sizeof(PyObject),                       /* tp_basicsize */
-    0,                                      /* tp_itemsize */
-    /* methods */
-    (destructor)dataobject_dealloc,         /* tp_dealloc */
-    0,                                      /* tp_print */
-    0,                                      /* tp_getattr */
-    0,                                      /* tp_setattr */
-    0,                                      /* tp_reserved */
-    0,                                      /* tp_repr */
-    0,                                      /* tp_as_number */
-    &dataobject_as_sequence0,               /* tp_as_sequence */
-    &dataobject_as_mapping0,                /* tp_as_mapping */
-    dataobject_hash_byref,                  /* tp_hash */
-    0,                                      /* tp_call */
-    0,                                      /* tp_str */
-    0,                                      /* tp_getattro */
-    0,                                      /* tp_setattro */
-    0,                                      /* tp_as_buffer */
-    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
-                                            /* tp_flags */
-    dataobject_doc,                         /* tp_doc */
-    0,                                      /* tp_traverse */
-    0,                                      /* tp_clear */
-    dataobject_richcompare,                 /* tp_richcompare */
-    0,                                      /* tp_weaklistoffset*/
-    0,                                      /* tp_iter */
-    0,                                      /* tp_iternext */
-    dataobject_methods,                     /* tp_methods */
-    0,                                      /* tp_members */
-    0,                                      /* tp_getset */
-    0,                                      /* tp_base */
-    0,                                      /* tp_dict */
-    0,                                      /* tp_descr_get */
-    0,                                      /* tp_descr_set */
-    0,                                      /* tp_dictoffset */
-    dataobject_init,                                      /* tp_init */
-    dataobject_alloc,                       /* tp_alloc */
-    dataobject_new,                                      /* tp_new */
-    PyObject_Del,                        /* tp_free */
-    0,                                       /* tp_is_gc */
-};
+    if (PyDataObject_IS_NATIVE(Py_TYPE(op)))
+        return dataobject_get_native_item(op, i);
 
-PyDoc_STRVAR(datastruct_doc,
-"datastruct(...) --> datastruct\n\n\
-");
+    PyObject *v = PyDataObject_GET_ITEM(op, i);
+    // if (v == NULL) {
+    //     PyErr_SetString(PyExc_IndexError, "item has no value");
+    //     return NULL;
+    // }
 
-static PyTypeObject PyDataStruct_Type = {
-    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
-    "recordclass._dataobject.datastruct",   /* tp_name */
-    sizeof(PyObject),                       /* tp_basicsize */
-    0,                                      /* tp_itemsize */
-    /* methods */
-    (destructor)dataobject_dealloc,         /* tp_dealloc */
-#if PY_VERSION_HEX >= 0x030A0000
-    offsetof(PyTypeObject, tp_vectorcall),
-#else
-    0,                                      /* tp_print */
-#endif
-    0,                                      /* tp_getattr */
-    0,                                      /* tp_setattr */
-    0,                                      /* tp_reserved */
-    0,                                      /* tp_repr */
-    0,                                      /* tp_as_number */
-    &dataobject_as_sequence0,               /* tp_as_sequence */
-    &dataobject_as_mapping0,                /* tp_as_mapping */
-    dataobject_hash_byref,                  /* tp_hash */
-    0,                                      /* tp_call */
-    0,                                      /* tp_str */
-    0,                                      /* tp_getattro */
-    0,                                      /* tp_setattro */
-    0,                                      /* tp_as_buffer */
-#if PY_VERSION_HEX >= 0x030A0000
-    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|
-    Py_TPFLAGS_HAVE_VECTORCALL,
-#else
-    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
-#endif
-                                            /* tp_flags */
-    datastruct_doc,                         /* tp_doc */
-    0,                                      /* tp_traverse */
-    0,                                      /* tp_clear */
-    dataobject_richcompare,                 /* tp_richcompare */
-    0,                                      /* tp_weaklistoffset*/
-    0,                                      /* tp_iter */
-    0,                                      /* tp_iternext */
-    dataobject_methods,                     /* tp_methods */
+    Py_INCREF(v);
+    return v;
+}
+
+static int
+dataobject_sq_ass_item(PyObject *op, Py_ssize_t i, PyObject *val)
+{
+    const Py_ssize_t n = PyDataObject_LEN(op);
+
+    if (i < 0)
+        i += n;
+    if (i < 0 || i >= n) {
+        PyErr_Format(PyExc_IndexError, "index %d out of range", i);
+        return -1;
+    }
+
+    if (PyDataObject_IS_NATIVE(Py_TYPE(op)))
+        return dataobject_set_native_item(op, i, val);
+
+    PyObject **item = PyDataObject_ITEMS(op) + i;
+
+    Py_DECREF(*item);
+    Py_INCREF(val);
+    *item = val;
+
+    return 0;
+}
+
+static PyObject*
+dataobject_mp_subscript(PyObject* op, PyObject* name)
+{
+    return Py_TYPE(op)->tp_getattro(op, name);
+}
+
+static int
+dataobject_mp_ass_subscript(PyObject* op, PyObject* name, PyObject *val)
+{
+    return Py_TYPE(op)->tp_setattro(op, name, val);
+}
+
+static int
+dataobject_mp_ass_subscript2(PyObject* op, PyObject* item, PyObject *val)
+{
+    PyNumberMethods *tp_as_number = Py_TYPE(item)->tp_as_number;
+    if (tp_as_number != NULL && tp_as_number->nb_index != NULL) {
+        Py_ssize_t i = PyLong_AsSsize_t(item);
+        if (i == -1 && PyErr_Occurred())
+            return -1;
+        return dataobject_sq_ass_item(op, i, val);
+    } else
+        return Py_TYPE(op)->tp_setattro(op, item, val);
+}
+
+static PyObject*
+dataobject_mp_subscript2(PyObject* op, PyObject* item)
+{
+    PyNumberMethods *tp_as_number = Py_TYPE(item)->tp_as_number;
+    if (tp_as_number != NULL && tp_as_number->nb_index != NULL) {
+        Py_ssize_t i = PyLong_AsSsize_t(item);
+        if (i == -1 && PyErr_Occurred())
+            return NULL;
+        return dataobject_sq_item(op, i);
+    } else
+        return Py_TYPE(op)->tp_getattro(op, item);
+}
+
+static int
+dataobject_mp_ass_subscript_sq(PyObject* op, PyObject* item, PyObject *val)
+{
+    PyNumberMethods *tp_as_number = Py_TYPE(item)->tp_as_number;
+    if (tp_as_number != NULL && tp_as_number->nb_index != NULL) {
+        Py_ssize_t i = PyLong_AsSsize_t(item);
+        if (i == -1 && PyErr_Occurred())
+            return -1;
+        return dataobject_sq_ass_item(op, i, val);
+    } else {
+        type_error("object %s support only assignment by index", op);
+        return -1;
+    }
+}
+
+static PyObject*
+dataobject_mp_subscript_sq(PyObject* op, PyObject* item)
+{
+    PyNumberMethods *tp_as_number = Py_TYPE(item)->tp_as_number;
+    if (tp_as_number != NULL && tp_as_number->nb_index != NULL) {
+        Py_ssize_t i = PyLong_AsSsize_t(item);
+        if (i == -1 && PyErr_Occurred())
+            return NULL;
+        return dataobject_sq_item(op, i);
+    } else {
+        type_error("object %s get item only by index", op);
+        return NULL;
+    }
+}
+
+static void copy_sequence_methods(PySequenceMethods *out, PySequenceMethods *in) {
+    out->sq_length = in->sq_length;
+    out->sq_concat = in->sq_concat;
+    out->sq_repeat = in->sq_repeat;
+    out->sq_item = in->sq_item;
+    out->was_sq_slice = in->was_sq_slice;
+    out->sq_ass_item = in->sq_ass_item;
+    out->was_sq_ass_slice = in->was_sq_ass_slice;
+    out->sq_contains = in->sq_contains;
+}
+
+
+static PySequenceMethods dataobject_as_sequence = {
+    (lenfunc)dataobject_len,                  /* sq_length */
+    0,                                        /* sq_concat */
+    0,                                        /* sq_repeat */
+    (ssizeargfunc)dataobject_sq_item,         /* sq_item */
+    0,                                        /* sq_slice */
+    (ssizeobjargproc)dataobject_sq_ass_item,  /* sq_ass_item */
+    0,                                        /* sq_ass_slice */
+    0,                                        /* sq_contains */
+};
+
+static PySequenceMethods dataobject_as_sequence0 = {
+    (lenfunc)dataobject_len,                /* sq_length */
+    0,                                      /* sq_concat */
+    0,                                      /* sq_repeat */
+    0,                                      /* sq_item */
+    0,                                      /* sq_slice */
+    0,                                      /* sq_ass_item */
+    0,                                      /* sq_ass_slice */
+    0,                                      /* sq_contains */
+};
+
+static PySequenceMethods dataobject_as_sequence_ro = {
+    (lenfunc)dataobject_len,           /* sq_length */
+    0,                                 /* sq_concat */
+    0,                                 /* sq_repeat */
+    (ssizeargfunc)dataobject_sq_item,  /* sq_item */
+    0,                                 /* sq_slice */
+    0,                                 /* sq_ass_item */
+    0,                                 /* sq_ass_slice */
+    0,                                 /* sq_contains */
+};
+
+static void copy_mapping_methods(PyMappingMethods *out, PyMappingMethods *in) {
+    out->mp_length = in->mp_length;
+    out->mp_subscript = in->mp_subscript;
+    out->mp_ass_subscript = in->mp_ass_subscript;
+}
+
+static PyMappingMethods dataobject_as_mapping = {
+    (lenfunc)dataobject_len,                  /* mp_len */
+    (binaryfunc)dataobject_mp_subscript,         /* mp_subscr */
+    (objobjargproc)dataobject_mp_ass_subscript,  /* mp_ass_subscr */
+};
+
+static PyMappingMethods dataobject_as_mapping0 = {
+    (lenfunc)dataobject_len,                  /* mp_len */
+    0,                                        /* mp_subscr */
+    0,                                        /* mp_ass_subscr */
+};
+
+static PyMappingMethods dataobject_as_mapping_ro = {
+    (lenfunc)dataobject_len,              /* mp_len */
+    (binaryfunc)dataobject_mp_subscript,   /* mp_subscr */
+    0,                                     /* mp_ass_subscr */
+};
+
+static PyMappingMethods dataobject_as_mapping2 = {
+    (lenfunc)dataobject_len,                   /* mp_len */
+    (binaryfunc)dataobject_mp_subscript2,         /* mp_subscr */
+    (objobjargproc)dataobject_mp_ass_subscript2,  /* mp_ass_subscr */
+};
+
+static PyMappingMethods dataobject_as_mapping2_ro = {
+    (lenfunc)dataobject_len,               /* mp_len */
+    (binaryfunc)dataobject_mp_subscript2,  /* mp_subscr */
+    0,                                     /* mp_ass_subscr */
+};
+
+static PyMappingMethods dataobject_as_mapping_sq = {
+    (lenfunc)dataobject_len,                   /* mp_len */
+    (binaryfunc)dataobject_mp_subscript_sq,         /* mp_subscr */
+    (objobjargproc)dataobject_mp_ass_subscript_sq,  /* mp_ass_subscr */
+};
+
+static PyMappingMethods dataobject_as_mapping_sq_ro = {
+    (lenfunc)dataobject_len,                 /* mp_len */
+    (binaryfunc)dataobject_mp_subscript_sq,  /* mp_subscr */
+    0,                                       /* mp_ass_subscr */
+};
+
+#ifndef _PyHASH_MULTIPLIER
+#define _PyHASH_MULTIPLIER 1000003UL
+#endif
+
+static Py_hash_t
+dataobject_hash_native(PyObject *op)
+{
+    const Py_ssize_t len = PyDataObject_LEN(op);
+    Py_hash_t mult = _PyHASH_MULTIPLIER;
+    Py_ssize_t i;
+
+    const char *kinds = _dataobject_native_kinds(Py_TYPE(op));
+    if (kinds == NULL)
+        return -1;
+
+    PyObject **items = PyDataObject_ITEMS(op);
+    Py_uhash_t x = 0x345678L;
+    for(i=0; i<len; i++) {
+        PyObject *o = _native_get(items + i, kinds[i]);
+        if (o == NULL)
+            return -1;
+        Py_hash_t y = PyObject_Hash(o);
+        Py_DECREF(o);
+        if (y == -1)
+            return -1;
+        x = (x ^ y) * mult;
+        mult += (Py_hash_t)(82520L + len + len);
+    }
+
+    x += 97531L;
+    if (x == (Py_uhash_t)-1)
+        x = -2;
+    return x;
+}
+
+static Py_hash_t
+dataobject_hash(PyObject *op)
+{
+    const Py_ssize_t len = PyDataObject_LEN(op);
+    Py_hash_t mult = _PyHASH_MULTIPLIER;
+    Py_ssize_t i;
+
+    if (PyDataObject_IS_NATIVE(Py_TYPE(op)))
+        return dataobject_hash_native(op);
+
+    Py_uhash_t x = 0x345678L;
+    for(i=0; i<len; i++) {
+        PyObject *o = PyDataObject_GET_ITEM(op, i);
+        Py_hash_t y = PyObject_Hash(o);
+//         Py_DECREF(o);
+        if (y == -1)
+            return -1;
+        x = (x ^ y) * mult;
+        mult += (Py_hash_t)(82520L + len + len);
+    }
+
+    x += 97531L;
+    if (x == (Py_uhash_t)-1)
+        x = -2;
+    return x;
+}
+
+static Py_hash_t
+dataobject_hash_cached(PyObject *op)
+{
+    Py_hash_t *hashptr = PyDataObject_HASHPTR(Py_TYPE(op), op);
+    Py_hash_t x = *hashptr;
+
+    if (x == -1) {
+        x = dataobject_hash(op);
+        *hashptr = x;
+    }
+    return x;
+}
+
+static Py_hash_t
+dataobject_hash_byref(PyObject *op)
+{
+    return (Py_hash_t)op;
+}
+
+// static Py_hash_t
+// dataobject_hash_ni(PyObject *op)
+// {
+//         type_error("__hash__ is not implemented for %s", op);
+//         return -1;
+// }
+
+// PyDoc_STRVAR(dataobject_hash_doc,
+// "T.__hash__() -- __hash__ for T");
+
+// static PyObject*
+// dataobject_hash2(PyObject *op)
+// {
+//     return PyLong_FromSsize_t(dataobject_hash(op));
+// }
+
+
+static PyObject *
+dataobject_richcompare(PyObject *v, PyObject *w, int op)
+{
+    Py_ssize_t i, k;
+    Py_ssize_t vlen = PyDataObject_LEN(v), wlen = PyDataObject_LEN(w);
+    PyObject *vv;
+    PyObject *ww;
+    PyObject *ret;
+
+    if (!(Py_TYPE(v) == Py_TYPE(w)) ||
+        (!PyObject_IsSubclass((PyObject*)Py_TYPE(w), (PyObject*)Py_TYPE(v))))
+                  Py_RETURN_NOTIMPLEMENTED;
+
+    if (PyDataObject_IS_NATIVE(Py_TYPE(v))) {
+        PyObject *vt = _astuple(v), *wt;
+        if (vt == NULL)
+            return NULL;
+        wt = _astuple(w);
+        if (wt == NULL) {
+            Py_DECREF(vt);
+            return NULL;
+        }
+        ret = PyObject_RichCompare(vt, wt, op);
+        Py_DECREF(vt);
+        Py_DECREF(wt);
+        return ret;
+    }
+
+    if ((vlen != wlen) && (op == Py_EQ || op == Py_NE)) {
+        PyObject *res;
+        if (op == Py_EQ)
+            res = Py_False;
+        else
+            res = Py_True;
+        Py_INCREF(res);
+        return res;
+    }
+
+    for (i = 0; i < vlen && i < wlen; i++) {
+        vv = PyDataObject_GET_ITEM(v, i);
+        ww = PyDataObject_GET_ITEM(w, i);
+        k = PyObject_RichCompareBool(vv, ww, Py_EQ);
+//         Py_DECREF(vv);
+//         Py_DECREF(ww);
+        if (k < 0)
+            return NULL;
+        if (!k)
+            break;
+    }
+
+    if (i >= vlen || i >= wlen) {
+        /* No more items to compare -- compare sizes */
+        int cmp;
+        PyObject *res;
+        switch (op) {
+        case Py_LT: cmp = vlen <  wlen; break;
+        case Py_LE: cmp = vlen <= wlen; break;
+        case Py_EQ: cmp = vlen == wlen; break;
+        case Py_NE: cmp = vlen != wlen; break;
+        case Py_GT: cmp = vlen >  wlen; break;
+        case Py_GE: cmp = vlen >= wlen; break;
+        default: return NULL; /* cannot happen */
+        }
+        if (cmp)
+            res = Py_True;
+        else
+            res = Py_False;
+        Py_INCREF(res);
+        return res;
+    }
+
+    /* We have an item that differs -- shortcuts for EQ/NE */
+    if (op == Py_EQ) {
+        Py_INCREF(Py_False);
+        return Py_False;
+    }
+    if (op == Py_NE) {
+        Py_INCREF(Py_True);
+        return Py_True;
+    }
+
+    /* Compare the final item again using the proper operator */
+    vv = PyDataObject_GET_ITEM(v, i);
+    ww = PyDataObject_GET_ITEM(w, i);
+    ret = PyObject_RichCompare(vv, ww, op);
+//     Py_DECREF(vv);
+//     Py_DECREF(ww);
+
+    return ret;
+}
+
+PyDoc_STRVAR(dataobject_sizeof_doc,
+"T.__sizeof__() -- size of T");
+
+static PyObject *
+dataobject_sizeof(PyObject *self)
+{
+    return PyLong_FromSsize_t(Py_TYPE(self)->tp_basicsize);
+}
+
+PyDoc_STRVAR(dataobject_copy_doc,
+"T.__copy__() -- copy of T");
+
+static PyObject *
+dataobject_copy(PyObject* op)
+{
+    PyTypeObject *type = Py_TYPE(op);
+
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+
+    PyObject *new_op = type->tp_alloc(type, 0);
+
+    PyObject **items = PyDataObject_ITEMS(new_op);
+    PyObject **args = (PyObject**)PyDataObject_ITEMS(op);
+
+    if (PyDataObject_IS_NATIVE(type)) {
+        const char *kinds = _dataobject_native_kinds(type);
+        Py_ssize_t i;
+
+        if (kinds == NULL) {
+            memset(items, 0, n_items * sizeof(PyObject*));
+            Py_DECREF(new_op);
+            return NULL;
+        }
+        for (i = 0; i < n_items; i++) {
+            items[i] = args[i];
+            if (kinds[i] == NATIVE_OBJECT)
+                Py_XINCREF(args[i]);
+        }
+    }
+    else
+        _fill_items(items, args, n_items);
+
+    if (type->tp_dictoffset) {
+        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
+        PyObject* dict = NULL;
+
+        if (*dictptr)
+            dict = *dictptr;
+
+        if (dict != NULL) {
+            int retval;
+
+            Py_INCREF(dict);
+            retval = _dataobject_update(new_op, dict, 1);
+            Py_DECREF(dict);
+
+            if (retval < 0)
+                return NULL;
+        }
+    }
+
+    return new_op;
+}
+
+static PyObject *
+dataobject_item(PyObject *op, Py_ssize_t i)
+{
+    const Py_ssize_t n = PyDataObject_LEN(op);
+
+    if (i < 0)
+        i += n;
+    if (i < 0 || i >= n) {
+        PyErr_Format(PyExc_IndexError, "index %d out of range", i);
+        return NULL;
+    }
+
+    if (PyDataObject_IS_NATIVE(Py_TYPE(op)))
+        return dataobject_get_native_item(op, i);
+
+    PyObject *v = ((PyDataStruct*)op)->ob_items[i];
+    Py_INCREF(v);
+    return v;
+}
+
+static int dataobject_ass_item(PyObject *op, Py_ssize_t i, PyObject *val)
+{
+    const Py_ssize_t n = PyDataObject_LEN(op);
+
+    if (i < 0)
+        i += n;
+    if (i < 0 || i >= n) {
+        PyErr_Format(PyExc_IndexError, "index %d out of range", i);
+        return -1;
+    }
+
+    if (PyDataObject_IS_NATIVE(Py_TYPE(op)))
+        return dataobject_set_native_item(op, i, val);
+
+    PyObject **items = PyDataObject_ITEMS(op) + i;
+
+    Py_XDECREF(*items);
+    Py_INCREF(val);
+    *items = val;
+    return 0;
+}
+
+PyDoc_STRVAR(dataobject_repr_doc,
+"T.__repr__() -- representation of T");
+
+static PyObject *
+dataobject_repr(PyObject *self)
+{
+    Py_ssize_t i;
+    PyObject *fs;
+    PyTypeObject *tp = Py_TYPE(self);
+    PyObject *tp_name = PyObject_GetAttrString((PyObject*)tp, "__name__");
+    PyObject *tmp;
+    PyObject *sep = PyUnicode_FromString(", ");
+    PyObject *eq = PyUnicode_FromString("=");
+
+    fs = PyObject_GetAttrString(self, "__fields__");
+    if (fs) {
+        Py_ssize_t n_fs = 0;
+        if (Py_TYPE(fs) == &PyTuple_Type) {
+            n_fs = PyObject_Length(fs);
+        } else {
+            n_fs = (Py_ssize_t)PyNumber_AsSsize_t(fs, PyExc_IndexError);
+            if (n_fs < 0) {
+                Py_DECREF(fs);
+                Py_DECREF(tp_name);
+                return NULL;
+            }
+            n_fs = 0;
+        }
+    } else
+        PyErr_Clear();
+
+    Py_ssize_t n = PyDataObject_LEN(self);
+    if (n == 0) {
+        PyObject *s = PyUnicode_FromString("()");
+        PyObject *text = PyUnicode_Concat(tp_name, s);
+        Py_DECREF(s);
+        Py_DECREF(tp_name);
+        return text;
+    }
+
+    i = Py_ReprEnter((PyObject *)self);
+    if (i != 0) {
+        Py_DECREF(tp_name);
+        return i > 0 ? PyUnicode_FromString("(...)") : NULL;
+    }
+
+    PyObject *items = PyList_New(0);
+
+    PyList_Append(items, tp_name);
+    Py_DECREF(tp_name);
+
+    tmp = PyUnicode_FromString("(");
+    PyList_Append(items, tmp);
+    Py_DECREF(tmp);
+
+    /* Do repr() on each element. */
+    for (i = 0; i < n; ++i) {
+        PyObject *fn = PyTuple_GET_ITEM(fs, i);
+        PyList_Append(items, fn);
+
+        PyList_Append(items, eq);
+
+        PyObject *ob = dataobject_item(self, i);
+        if (ob == NULL)
+            goto error;
+
+        PyObject *s = PyObject_Repr(ob);
+        if (s == NULL) {
+            Py_DECREF(ob);
+            goto error;
+        }
+        PyList_Append(items, s);
+        Py_DECREF(s);
+        Py_DECREF(ob);
+
+        if (i < n-1) {
+            PyList_Append(items, sep);
+        }
+    }
+
+    Py_XDECREF(fs);
+    Py_DECREF(sep);
+    Py_DECREF(eq);
+
+    if (tp->tp_dictoffset) {
+        PyObject *dict = PyObject_GetAttrString(self, "__dict__");
+
+        if (dict) {
+            if (PyObject_IsTrue(dict)) {
+                tmp = PyUnicode_FromString(", **");
+                PyList_Append(items, tmp);
+                Py_DECREF(tmp);
+
+                PyObject *s = PyObject_Repr(dict);
+                PyList_Append(items, s);
+                Py_DECREF(s);
+            }
+            Py_DECREF(dict);
+        }
+    }
+
+    tmp = PyUnicode_FromString(")");
+    PyList_Append(items, tmp);
+    Py_DECREF(tmp);
+
+    Py_ReprLeave((PyObject *)self);
+    tmp = PyUnicode_FromString("");
+    PyObject *ret = PyUnicode_Join(tmp, items);
+    Py_DECREF(tmp);
+
+    return ret;
+
+error:
+    Py_XDECREF(fs);
+
+    Py_ReprLeave((PyObject *)self);
+    return NULL;
+}
+
+// PyDoc_STRVAR(dataobject_subscript_doc,
+// "T.__getitem__(ob, key)");
+
+// static PyObject *
+// dataobject_subscript(PyObject *ob, PyObject *key)
+// {
+//     PyMappingMethods *m = Py_TYPE(ob)->tp_as_mapping;
+
+//     if (m->mp_subscript) {
+//         return m->mp_subscript(ob, key);
+//     }
+
+//     return type_error("instances of %s are not subsciptable",
+//                       (PyObject*)Py_TYPE(ob));
+// }
+
+// PyDoc_STRVAR(dataobject_ass_subscript_doc,
+// "T.__setitem__(ob, key, val)");
+
+// static PyObject*
+// dataobject_ass_subscript(PyObject *ob, PyObject *args)
+// {
+//     if (Py_SIZE(args) != 2) {
+//         type_error("__setitem__ need 2 args", ob);
+//         return NULL;
+//     }
+
+//     // PyObject *key = PyTuple_GET_ITEM(args, 0);
+//     // PyObject *val = PyTuple_GET_ITEM(args, 1);
+
+//     PyMappingMethods *m = Py_TYPE(ob)->tp_as_mapping;
+
+//     if (m->mp_ass_subscript) {
+//         if (m->mp_ass_subscript(ob,
+//                                 PyTuple_GET_ITEM(args, 0),
+//                                 PyTuple_GET_ITEM(args, 1)))
+//             return NULL;
+//         else
+//             Py_RETURN_NONE;
+//     }
+
+//     type_error("instances of %s does not support item assignment",
+//                (PyObject*)Py_TYPE(ob));
+//     return NULL;
+// }
+
+PyDoc_STRVAR(dataobject_reduce_doc,
+"T.__reduce__()");
+
+static PyObject *
+dataobject_reduce(PyObject *ob, PyObject *Py_UNUSED(ignore))
+{
+    PyObject *result;
+    PyTypeObject *tp = Py_TYPE(ob);
+    PyObject *kw = NULL;
+    PyObject **dictptr;
+
+    PyObject *args = _astuple(ob);
+    if (args == NULL)
+        return NULL;
+
+    if (tp->tp_dictoffset) {
+        dictptr = PyObject_GetDictPtr(ob);
+        if (dictptr) {
+            PyObject *d = *dictptr;
+            if (d)
+                kw = PyDict_Copy(d);
+        }
+    }
+
+    if (kw)
+        result = PyTuple_Pack(3, tp, args, kw);
+    else
+        result = PyTuple_Pack(2, tp, args);
+
+    // printf("reduce: %s\n", tp->tp_name);
+
+    Py_DECREF(args);
+    Py_XDECREF(kw);
+    return result;
+}
+
+PyDoc_STRVAR(dataobject_getstate_doc,
+"T.__getstate__()");
+
+static PyObject *
+dataobject_getstate(PyObject *ob) {
+    PyTypeObject *tp = Py_TYPE(ob);
+    PyObject **dictptr;
+
+    if (tp->tp_dictoffset) {
+        dictptr = PyObject_GetDictPtr(ob);
+        if (dictptr && *dictptr) {
+            return PyDict_Copy(*dictptr);
+        }
+    }
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(dataobject_setstate_doc,
+"T.__setstate__(state) -- state is the dict of the attributes or the tuple of values of the fields");
+
+static PyObject*
+dataobject_setstate(PyObject *ob, PyObject *state) {
+    PyTypeObject *tp = Py_TYPE(ob);
+    PyObject *dict;
+
+    if (!state || state == Py_None)
+        return NULL;
+
+    if (PyTuple_Check(state)) {
+        const Py_ssize_t n = PyDataObject_LEN(ob);
+        Py_ssize_t i;
+
+        if (PyTuple_GET_SIZE(state) != n) {
+            PyErr_SetString(PyExc_ValueError, "length of the state is not equal to the number of fields");
+            return NULL;
+        }
+        for (i = 0; i < n; i++) {
+            if (dataobject_ass_item(ob, i, PyTuple_GET_ITEM(state, i)) < 0)
+                return NULL;
+        }
+        if (tp->tp_hash == dataobject_hash_cached)
+            *PyDataObject_HASHPTR(tp, ob) = -1;
+        Py_RETURN_NONE;
+    }
+
+    if (tp->tp_dictoffset) {
+        dict = PyDataObject_GetDict(ob);
+
+        if (!dict) {
+            // PyErr_SetString(PyExc_TypeError, "failed to create new dict");
+            return NULL;
+        }
+
+        if (PyDict_Update(dict, state) < 0) {
+            PyErr_SetString(PyExc_TypeError, "dict update failed");
+            Py_DECREF(dict);
+            return NULL;
+        }
+        Py_DECREF(dict);
+    } else {
+        PyErr_SetString(PyExc_TypeError, "object has no __dict__");
+        return NULL;
+    }
+
+    Py_RETURN_NONE;
+}
+
+static int
+_dataobject_fast_new(PyTypeObject *type, int *copy_default)
+{
+    *copy_default = 0;
+    if (PyDataObject_IS_NATIVE(type))
+        return 0;
+    if (type->tp_new == dataobject_new_basic && type->tp_init == dataobject_init_basic)
+        return 1;
+    if (type->tp_new == dataobject_new_copy_default && type->tp_init == dataobject_init) {
+        *copy_default = 1;
+        return 1;
+    }
+    return 0;
+}
+
+/* the limit of the preallocation by __length_hint__, which can be wrong */
+#define DATAOBJECT_MAXPREALLOC (1 << 16)
+
+PyDoc_STRVAR(dataobject_from_rows_doc,
+"T.from_rows(rows) -- list of new instances of T created from the iterable of sequences of the field values");
+
+static PyObject *
+dataobject_from_rows(PyObject *cls, PyObject *rows)
+{
+    PyTypeObject *type = (PyTypeObject*)cls;
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    PyObject *default_vals = NULL;
+    PyObject *iter, *row, *result;
+    int copy_default;
+    const int fast_new = _dataobject_fast_new(type, &copy_default);
+
+    Py_ssize_t n_hint = PyObject_LengthHint(rows, 0);
+    if (n_hint < 0)
+        return NULL;
+    if (n_hint > DATAOBJECT_MAXPREALLOC)
+        n_hint = DATAOBJECT_MAXPREALLOC;
+
+    /* preallocate the space for n_hint items */
+    result = PyList_New(n_hint);
+    if (result == NULL)
+        return NULL;
+    Py_SET_SIZE(result, 0);
+
+    iter = PyObject_GetIter(rows);
+    if (iter == NULL)
+        goto error;
+
+    if (fast_new && n_items > 0) {
+        default_vals = PyDict_GetItemWithError(type->tp_dict, __default_vals__name);
+        if (default_vals == NULL && PyErr_Occurred())
+            goto error;
+        Py_XINCREF(default_vals);
+    }
+
+    while ((row = PyIter_Next(iter))) {
+        PyObject *op;
+
+        if (fast_new) {
+            PyObject *seq = PySequence_Fast(row, "each row should be a sequence");
+            Py_DECREF(row);
+            if (seq == NULL)
+                goto error;
+
+            const Py_ssize_t n_args = PySequence_Fast_GET_SIZE(seq);
+            if (n_args > n_items) {
+                Py_DECREF(seq);
+                PyErr_SetString(PyExc_TypeError,
+                    "number of the arguments greater than the number of fields");
+                goto error;
+            }
+
+            op = type->tp_alloc(type, 0);
+            if (op == NULL) {
+                Py_DECREF(seq);
+                goto error;
+            }
+
+            PyObject **items = PyDataObject_ITEMS(op);
+            _fill_items(items, (PyObject * const*)PySequence_Fast_ITEMS(seq), n_args);
+            Py_DECREF(seq);
+
+            if (n_args < n_items) {
+                int ret;
+                if (default_vals == NULL) {
+                    _fill_items_none(items, n_args, n_items);
+                    ret = 1;
+                }
+                else if (copy_default)
+                    ret = _fill_items_copy_defaults(items, default_vals, n_args, n_items);
+                else
+                    ret = _fill_items_defaults(items, default_vals, n_args, n_items);
+                if (!ret) {
+                    Py_DECREF(op);
+                    goto error;
+                }
+            }
+        }
+        else {
+            PyObject *args = PySequence_Tuple(row);
+            Py_DECREF(row);
+            if (args == NULL)
+                goto error;
+            op = PyObject_Call(cls, args, NULL);
+            Py_DECREF(args);
+            if (op == NULL)
+                goto error;
+        }
+
+        if (PyList_Append(result, op) < 0) {
+            Py_DECREF(op);
+            goto error;
+        }
+        Py_DECREF(op);
+    }
+
+    if (PyErr_Occurred())
+        goto error;
+
+    Py_DECREF(iter);
+    Py_XDECREF(default_vals);
+    return result;
+
+error:
+    Py_XDECREF(iter);
+    Py_XDECREF(default_vals);
+    Py_DECREF(result);
+    return NULL;
+}
+
+static PyMethodDef dataobject_methods[] = {
+    // {"__getitem__",  (PyCFunction)(void(*)(void))dataobject_subscript, METH_O|METH_COEXIST, dataobject_subscript_doc},
+    // {"__setitem__",  (PyCFunction)dataobject_ass_subscript, METH_VARARGS|METH_COEXIST, dataobject_ass_subscript_doc},
+    {"__copy__",      (PyCFunction)dataobject_copy, METH_NOARGS, dataobject_copy_doc},
+    {"__len__",       (PyCFunction)dataobject_len, METH_NOARGS, dataobject_len_doc},
+    {"__repr__",      (PyCFunction)dataobject_repr, METH_NOARGS, dataobject_repr_doc},
+    {"__sizeof__",    (PyCFunction)dataobject_sizeof, METH_NOARGS, dataobject_sizeof_doc},
+    {"__reduce__",    (PyCFunction)dataobject_reduce, METH_NOARGS, dataobject_reduce_doc},
+    {"__getstate__",  (PyCFunction)dataobject_getstate, METH_NOARGS, dataobject_getstate_doc},
+    {"__setstate__",  (PyCFunction)dataobject_setstate, METH_O, dataobject_setstate_doc},
+    {"from_rows",     (PyCFunction)dataobject_from_rows, METH_O|METH_CLASS, dataobject_from_rows_doc},
+    {"sortkey",       (PyCFunction)dataobject_sortkey, METH_VARARGS|METH_CLASS, dataobject_sortkey_doc},
+    // {"__hash__",     (PyCFunction)dataobject_hash2_ni, METH_O, dataobject_hash_doc},
+    {NULL}
+};
+
+static PyObject *dataobject_iter(PyObject *seq);
+
+// static PyObject* __dict__get(PyObject *ob, void *unused) {
+//     if (!Py_TYPE(ob)->tp_dictoffset) {
+//             PyErr_SetString(PyExc_AttributeError, "the instance hasn't __dict__");
+//             return NULL;
+//     } else {
+//         PyObject** dictptr = (PyObject**)((char*)ob + Py_TYPE(ob)->tp_dictoffset);
+//         PyObject *dict;
+//         if (*dictptr) {
+//             dict = *dictptr;
+//         } else {
+//             *dictptr = dict = PyDict_New();
+//         }
+//         Py_INCREF(dict);
+//         return dict;
+//     }
+// }
+
+// static PyGetSetDef dataobject_getset[] = {
+//     {"__dict__", __dict__get, NULL, "__dict__ property", NULL},
+//     {NULL, NULL, NULL, NULL, NULL}
+// };
+
+
+// static PyGetSetDef subtype_getsets_full[] = {
+//     {"__dict__", subtype_dict, subtype_setdict,
+//      PyDoc_STR("dictionary for instance variables (if defined)")},
+//     {"__weakref__", subtype_getweakref, NULL,
+//      PyDoc_STR("list of weak references to the object (if defined)")},
+//     {0}
+// };
+
+
+PyDoc_STRVAR(dataobject_doc,
+"dataobject(...) --> dataobject\n\n\
+");
+
+static PyTypeObject PyDataObject_Type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "recordclass._dataobject.dataobject",   /* tp_name */
+    sizeof(PyObject),                       /* tp_basicsize */
+    0,                                      /* tp_itemsize */
+    /* methods */
+    (destructor)dataobject_dealloc,         /* tp_dealloc */
+    0,                                      /* tp_print */
+    0,                                      /* tp_getattr */
+    0,                                      /* tp_setattr */
+    0,                                      /* tp_reserved */
+    0,                                      /* tp_repr */
+    0,                                      /* tp_as_number */
+    &dataobject_as_sequence0,               /* tp_as_sequence */
+    &dataobject_as_mapping0,                /* tp_as_mapping */
+    dataobject_hash_byref,                  /* tp_hash */
+    0,                                      /* tp_call */
+    0,                                      /* tp_str */
+    0,                                      /* tp_getattro */
+    0,                                      /* tp_setattro */
+    0,                                      /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
+                                            /* tp_flags */
+    dataobject_doc,                         /* tp_doc */
+    0,                                      /* tp_traverse */
+    0,                                      /* tp_clear */
+    dataobject_richcompare,                 /* tp_richcompare */
+    0,                                      /* tp_weaklistoffset*/
+    0,                                      /* tp_iter */
+    0,                                      /* tp_iternext */
+    dataobject_methods,                     /* tp_methods */
+    0,                                      /* tp_members */
+    0,                                      /* tp_getset */
+    0,                                      /* tp_base */
+    0,                                      /* tp_dict */
+    0,                                      /* tp_descr_get */
+    0,                                      /* tp_descr_set */
+    0,                                      /* tp_dictoffset */
+    dataobject_init,                                      /* tp_init */
+    dataobject_alloc,                       /* tp_alloc */
+    dataobject_new,                                      /* tp_new */
+    PyObject_Del,                        /* tp_free */
+    0,                                       /* tp_is_gc */
+};
+
+PyDoc_STRVAR(datastruct_doc,
+"datastruct(...) --> datastruct\n\n\
+");
+
+static PyTypeObject PyDataStruct_Type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "recordclass._dataobject.datastruct",   /* tp_name */
+    sizeof(PyObject),                       /* tp_basicsize */
+    0,                                      /* tp_itemsize */
+    /* methods */
+    (destructor)dataobject_dealloc,         /* tp_dealloc */
+#if PY_VERSION_HEX >= 0x030A0000
+    offsetof(PyTypeObject, tp_vectorcall),
+#else
+    0,                                      /* tp_print */
+#endif
+    0,                                      /* tp_getattr */
+    0,                                      /* tp_setattr */
+    0,                                      /* tp_reserved */
+    0,                                      /* tp_repr */
+    0,                                      /* tp_as_number */
+    &dataobject_as_sequence0,               /* tp_as_sequence */
+    &dataobject_as_mapping0,                /* tp_as_mapping */
+    dataobject_hash_byref,                  /* tp_hash */
+    0,                                      /* tp_call */
+    0,                                      /* tp_str */
+    0,                                      /* tp_getattro */
+    0,                                      /* tp_setattro */
+    0,                                      /* tp_as_buffer */
+#if PY_VERSION_HEX >= 0x030A0000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE|
+    Py_TPFLAGS_HAVE_VECTORCALL,
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
+#endif
+                                            /* tp_flags */
+    datastruct_doc,                         /* tp_doc */
+    0,                                      /* tp_traverse */
+    0,                                      /* tp_clear */
+    dataobject_richcompare,                 /* tp_richcompare */
+    0,                                      /* tp_weaklistoffset*/
+    0,                                      /* tp_iter */
+    0,                                      /* tp_iternext */
+    dataobject_methods,                     /* tp_methods */
     0,                                      /* tp_members */
     0,                                      /* tp_getset */
     0,                                      /* tp_base */
@@ -1624,435 +2748,1330 @@ static PyTypeObject PyDataStruct_Type = {
     PyObject_Del,                        /* tp_free */
     0,                                       /* tp_is_gc */
 #if PY_VERSION_HEX >= 0x030A0000
-    .tp_vectorcall = dataobject_vectorcall,                                      /* tp_vectorcall */
+    .tp_vectorcall = dataobject_vectorcall,                                      /* tp_vectorcall */
+#endif
+};
+
+//////////////////////////////////////////////////////////////////////////
+
+static PyObject* dataobject_iter(PyObject *seq);
+
+//////////////////////////////////////////////////////////////////////////
+
+/*********************** DataObject Iterator **************************/
+
+static PyObject* dataobject_iter(PyObject *seq);
+
+typedef struct {
+    PyObject_HEAD
+    Py_ssize_t it_index, it_len;
+    PyObject *it_seq; /* Set to NULL when iterator is exhausted */
+} dataobjectiterobject;
+
+static void
+dataobjectiter_dealloc(dataobjectiterobject *it)
+{
+    PyTypeObject *tp = Py_TYPE(it);
+
+#if PY_VERSION_HEX < 0x03080000
+    if (tp->tp_flags & Py_TPFLAGS_HEAPTYPE)
+    Py_DECREF(tp);
+#endif
+
+    Py_XDECREF(it->it_seq);
+    it->it_seq = NULL;
+    tp->tp_free((PyObject *)it);
+}
+
+// static int
+// dataobjectiter_clear(PyObject *op)
+// {
+//     dataobjectiterobject *it = (dataobjectiterobject*)op;
+//     Py_CLEAR(it->it_seq);
+//     return 0;
+// }
+
+// static int
+// dataobjectiter_traverse(PyObject *op, visitproc visit, void *arg)
+// {
+//     dataobjectiterobject *it = (dataobjectiterobject*)op;
+//     Py_VISIT(it->it_seq);
+//     return 0;
+// }
+
+static PyObject *
+dataobjectiter_next(dataobjectiterobject *it)
+{
+    PyObject *item;
+    PyObject *op = it->it_seq;
+
+    if (it->it_index < it->it_len) {
+        if (PyDataObject_IS_NATIVE(Py_TYPE(op))) {
+            item = dataobject_get_native_item(op, it->it_index);
+        } else {
+            item = PyDataObject_GET_ITEM(op, it->it_index);
+            Py_INCREF(item);
+        }
+        it->it_index++;
+        return item;
+    }
+    return NULL;
+}
+
+static PyObject *
+dataobjectiter_len(dataobjectiterobject *it)
+{
+    Py_ssize_t len = 0;
+    if (it->it_seq)
+        len = it->it_len - it->it_index;
+    return PyLong_FromSsize_t(len);
+}
+
+PyDoc_STRVAR(length_hint_doc, "Private method returning an estimate of len(list(it)).");
+
+static PyObject *
+dataobjectiter_reduce(dataobjectiterobject *it) //, PyObject *Py_UNUSED(ignore))
+{
+    if (it->it_seq)
+        return Py_BuildValue("N(O)n", pyobject_get_builtin("iter"),
+                             it->it_seq, it->it_index);
+    else
+        return Py_BuildValue("N(())", pyobject_get_builtin("iter"));
+}
+
+PyDoc_STRVAR(dataobjectiter_reduce_doc, "D.__reduce__()");
+
+static PyObject *
+dataobjectiter_setstate(dataobjectiterobject *it, PyObject *state)
+{
+    Py_ssize_t index;
+
+    index = PyLong_AsSsize_t(state);
+    if (index == -1 && PyErr_Occurred())
+        return NULL;
+    if (it->it_seq != NULL) {
+        if (index < 0)
+            index = 0;
+        else if (index > it->it_len)
+            index = it->it_len; /* exhausted iterator */
+        it->it_index = index;
+    }
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(setstate_doc, "Set state information for unpickling.");
+
+static PyMethodDef dataobjectiter_methods[] = {
+    {"__length_hint__", (PyCFunction)dataobjectiter_len, METH_NOARGS, length_hint_doc},
+    {"__reduce__",      (PyCFunction)dataobjectiter_reduce, METH_NOARGS, dataobjectiter_reduce_doc},
+    {"__setstate__",    (PyCFunction)dataobjectiter_setstate, METH_O, setstate_doc},
+    {NULL,              NULL}           /* sentinel */
+};
+
+PyTypeObject PyDataObjectIter_Type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "recordclass._dataobject.dataobject_iterator",  /* tp_name */
+    sizeof(dataobjectiterobject),               /* tp_basicsize */
+    0,                                          /* tp_itemsize */
+    /* methods */
+    (destructor)dataobjectiter_dealloc,         /* tp_dealloc */
+    0,                                          /* tp_print */
+    0,                                          /* tp_getattr */
+    0,                                          /* tp_setattr */
+    0,                                          /* tp_reserved */
+    0,                                          /* tp_repr */
+    0,                                          /* tp_as_number */
+    0,                                          /* tp_as_sequence */
+    0,                                          /* tp_as_mapping */
+    0,                                          /* tp_hash */
+    0,                                          /* tp_call */
+    0,                                          /* tp_str */
+    PyObject_GenericGetAttr,                    /* tp_getattro */
+    0,                                          /* tp_setattro */
+    0,                                          /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
+                                                /* tp_flags */
+    0,                                          /* tp_doc */
+    0,                    /* tp_traverse */
+    0,                        /* tp_clear */
+    0,                                          /* tp_richcompare */
+    0,                                          /* tp_weaklistoffset */
+    PyObject_SelfIter,                          /* tp_iter */
+    (iternextfunc)dataobjectiter_next,          /* tp_iternext */
+    dataobjectiter_methods,                     /* tp_methods */
+    0,
+};
+
+static PyObject *
+dataobject_iter(PyObject *seq)
+{
+    dataobjectiterobject *it;
+
+    if (!seq)
+        return NULL;
+
+    // if (Py_TYPE(seq)->tp_base != &PyDataObject_Type && !PyType_IsSubtype(Py_TYPE(seq), &PyDataObject_Type)) {
+    //     PyErr_SetString(PyExc_TypeError, "the object is not instance of dataobject");
+    //     return NULL;
+    // }
+
+    it = PyObject_New(dataobjectiterobject, &PyDataObjectIter_Type);
+    if (it == NULL)
+        return NULL;
+
+#if PY_VERSION_HEX < 0x03080000
+    {
+        PyTypeObject *t = Py_TYPE(it);
+        if (t->tp_flags & Py_TPFLAGS_HEAPTYPE)
+            Py_INCREF(t);
+    }
+#endif
+
+    it->it_index = 0;
+    it->it_seq = seq;
+    Py_INCREF(seq);
+    it->it_len = PyDataObject_LEN(seq);
+
+    return (PyObject *)it;
+}
+
+////////////////////////////////////////////////////////////////////////
+
+static PyMethodDef dataobjectproperty_methods[] = {
+  {0, 0, 0, 0}
+};
+
+static PyObject*
+dataobjectproperty_new(PyTypeObject *t, PyObject *args, PyObject *k)
+{
+    dataobjectproperty_object *ob = NULL;
+    PyObject *item;
+    Py_ssize_t len, index;
+    int readonly;
+
+    char kind = NATIVE_OBJECT;
+
+    len = Py_SIZE(args);
+    if (len == 0 || len > 3) {
+        PyErr_SetString(PyExc_TypeError, "number of args is 1, 2 or 3");
+        return NULL;
+    }
+
+    item = PyTuple_GET_ITEM(args, 0);
+    index = PyNumber_AsSsize_t(item, PyExc_IndexError);
+    if (index == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+
+    if (len == 2) {
+        item = PyTuple_GET_ITEM(args, 1);
+        readonly = PyObject_IsTrue(item);
+    } else
+        readonly = 0;
+
+    if (len == 3) {
+        const char *s;
+        item = PyTuple_GET_ITEM(args, 2);
+        s = PyUnicode_AsUTF8(item);
+        if (s == NULL)
+            return NULL;
+        kind = s[0];
+        if (strlen(s) != 1 ||
+            (kind != NATIVE_OBJECT && kind != NATIVE_INT64 && kind != NATIVE_DOUBLE)) {
+            PyErr_Format(PyExc_ValueError, "invalid kind of the field: %R", item);
+            return NULL;
+        }
+    }
+
+    ob = PyObject_New(dataobjectproperty_object, t);
+    if (ob == NULL)
+        return NULL;
+
+#if PY_VERSION_HEX < 0x03080000
+        if (t->tp_flags & Py_TPFLAGS_HEAPTYPE)
+            Py_INCREF(t);
+#endif
+    ob->readonly = readonly;
+    ob->index = index;
+    ob->kind = kind;
+    return (PyObject*)ob;
+}
+
+static void
+dataobjectproperty_dealloc(PyObject *o)
+{
+    PyTypeObject *t = Py_TYPE(o);
+
+    t->tp_free(o);
+
+#if PY_VERSION_HEX >= 0x03080000
+    if (t->tp_flags & Py_TPFLAGS_HEAPTYPE)
+        Py_DECREF(t);
+#endif
+}
+
+static PyObject*
+dataobjectproperty_get(PyObject *self, PyObject *obj, PyObject *type)
+{
+    if (obj == Py_None || obj == NULL) {
+        Py_INCREF(self);
+        return self;
+    }
+
+    dataobjectproperty_object *d = (dataobjectproperty_object *)self;
+    if (d->kind != NATIVE_OBJECT)
+        return _native_get(PyDataObject_ITEMS(obj) + d->index, d->kind);
+
+    PyObject *v = PyDataObject_GET_ITEM(obj, d->index);
+
+    Py_INCREF(v);
+    return v;
+}
+
+static int
+dataobjectproperty_set(PyObject *self, PyObject *obj, PyObject *value)
+{
+    if (!value) {
+        PyErr_SetString(PyExc_AttributeError, "The field and it's value can't be deleted");
+        return -1;
+    }
+
+    if (obj == Py_None || obj == NULL)
+        return 0;
+
+    if (((dataobjectproperty_object *)self)->readonly) {
+        PyErr_SetString(PyExc_AttributeError, "the field is readonly");
+        return -1;
+    }
+
+    PyObject **ptr = PyDataObject_ITEMS(obj) + ((dataobjectproperty_object *)self)->index;
+
+    if (((dataobjectproperty_object *)self)->kind != NATIVE_OBJECT)
+        return _native_set(ptr, ((dataobjectproperty_object *)self)->kind, value);
+
+    Py_DECREF(*ptr);
+
+    Py_INCREF(value);
+    *ptr = value;
+
+    return 0;
+}
+
+static PyObject*
+dataobjectproperty_index(PyObject *self)
+{
+    return PyLong_FromSsize_t(((dataobjectproperty_object*)self)->index);
+}
+
+static PyObject*
+dataobjectproperty_readonly(PyObject *self)
+{
+    return PyBool_FromLong((long)(((dataobjectproperty_object*)self)->readonly));
+}
+
+// static int
+// dataobjectproperty_readonly_set(PyObject *self, PyObject *val)
+// {
+//     ((dataobjectproperty_object*)self)->readonly = PyObject_IsTrue(val);
+//     return 0;
+// }
+
+static PyObject*
+dataobjectproperty_kind(PyObject *self)
+{
+    return PyUnicode_FromOrdinal(((dataobjectproperty_object*)self)->kind);
+}
+
+static PyGetSetDef dataobjectproperty_getsets[] = {
+    {"index", (getter)dataobjectproperty_index, NULL, NULL},
+    {"readonly", (getter)dataobjectproperty_readonly, NULL, NULL},
+    {"kind", (getter)dataobjectproperty_kind, NULL, NULL},
+    {0}
+};
+
+static PyTypeObject PyDataObjectProperty_Type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "recordclass._dataobject.dataobjectproperty", /*tp_name*/
+    sizeof(dataobjectproperty_object), /*tp_basicsize*/
+    0, /*tp_itemsize*/
+    dataobjectproperty_dealloc, /*tp_dealloc*/
+    0, /*tp_print*/
+    0, /*tp_getattr*/
+    0, /*tp_setattr*/
+    0, /*reserved*/
+    0, /*tp_repr*/
+    0, /*tp_as_number*/
+    0, /*tp_as_sequence*/
+    0, /*tp_as_mapping*/
+    0, /*tp_hash*/
+    0, /*tp_call*/
+    0, /*tp_str*/
+    0, /*tp_getattro*/
+    0, /*tp_setattro*/
+    0, /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+    0, /*tp_doc*/
+    0, /*tp_traverse*/
+    0, /*tp_clear*/
+    0, /*tp_richcompare*/
+    0, /*tp_weaklistoffset*/
+    0, /*tp_iter*/
+    0, /*tp_iternext*/
+    dataobjectproperty_methods, /*tp_methods*/
+    0, /*tp_members*/
+    dataobjectproperty_getsets, /*tp_getset*/
+    0, /*tp_base*/
+    0, /*tp_dict*/
+    dataobjectproperty_get, /*tp_descr_get*/
+    dataobjectproperty_set, /*tp_descr_set*/
+    0, /*tp_dictoffset*/
+    0, /*tp_init*/
+    0, /*tp_alloc*/
+    dataobjectproperty_new, /*tp_new*/
+    0, /*tp_free*/
+    0, /*tp_is_gc*/
+};
+
+///////////////////////// Factory ////////////////////////////////////////
+
+static PyObject *Factory_new(PyTypeObject *tp, PyObject *args, PyObject *kw) {
+    struct PyFactoryObject *p;
+    Py_ssize_t n_args = Py_SIZE(args);
+    PyObject *o;
+
+    o = (*tp->tp_alloc)(tp, 0);
+    if (!o) return NULL;
+
+    p = ((struct PyFactoryObject *)o);
+    if (n_args != 1) {
+        PyErr_SetString(PyExc_TypeError, "number of arguments != 1");
+        return NULL;
+    }
+
+    PyObject *f = PyTuple_GET_ITEM(args, 0);
+    p->factory = f; Py_INCREF(f);
+
+    return o;
+}
+
+static void Factory_dealloc(PyObject *o) {
+    struct PyFactoryObject *p = (struct PyFactoryObject *)o;
+    PyTypeObject *t = Py_TYPE(o);
+
+    Py_CLEAR(p->factory);
+    t->tp_free(o);
+}
+
+static PyMethodDef Factory_methods[] = {
+  {0, 0, 0, 0}
+};
+
+static PyGetSetDef Factory_getsets[] = {
+    {0}
+};
+
+static PyTypeObject PyFactory_Type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "recordclass._dataobject.Factory", /*tp_name*/
+    sizeof(struct PyFactoryObject), /*tp_basicsize*/
+    0, /*tp_itemsize*/
+    Factory_dealloc, /*tp_dealloc*/
+    0, /*tp_print*/
+    0, /*tp_getattr*/
+    0, /*tp_setattr*/
+    0, /*reserved*/
+    0, /*tp_repr*/
+    0, /*tp_as_number*/
+    0, /*tp_as_sequence*/
+    0, /*tp_as_mapping*/
+    0, /*tp_hash*/
+    0, /*tp_call*/
+    0, /*tp_str*/
+    0, /*tp_getattro*/
+    0, /*tp_setattro*/
+    0, /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE, /*tp_flags*/
+    0, /*tp_doc*/
+    0, /*tp_traverse*/
+    0, /*tp_clear*/
+    0, /*tp_richcompare*/
+    0, /*tp_weaklistoffset*/
+    0, /*tp_iter*/
+    0, /*tp_iternext*/
+    Factory_methods, /*tp_methods*/
+    0, /*tp_members*/
+    Factory_getsets, /*tp_getset*/
+    0, /*tp_base*/
+    0, /*tp_dict*/
+    0, /*tp_descr_get*/
+    0, /*tp_descr_set*/
+    0, /*tp_dictoffset*/
+    0, /*tp_init*/
+    0, /*tp_alloc*/
+    Factory_new, /*tp_new*/
+    0, /*tp_free*/
+    0, /*tp_is_gc*/
+};
+
+
+///////////////////////// sort keys ////////////////////////////////////////
+
+typedef struct {
+    PyObject_VAR_HEAD
+    PyTypeObject *cls;
+    PyObject *fields;
+    const char *kinds;
+#if PY_VERSION_HEX >= 0x030A0000
+    vectorcallfunc vectorcall;
+#endif
+    Py_ssize_t indices[1];
+} dataobject_sortkey_object;
+
+static PyTypeObject PyDataObjectSortKey_Type;
+
+static int
+_dataobject_field_indices(PyTypeObject *type, PyObject *fields, Py_ssize_t *indices)
+{
+    const Py_ssize_t n_fields = PyTuple_GET_SIZE(fields);
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    PyObject *fields_index = NULL;
+    Py_ssize_t i;
+
+    if (n_fields == 0) {
+        PyErr_SetString(PyExc_TypeError, "at least one field is required");
+        return -1;
+    }
+
+    for (i = 0; i < n_fields; i++) {
+        PyObject *fn = PyTuple_GET_ITEM(fields, i);
+        Py_ssize_t index;
+
+        if (PyLong_Check(fn)) {
+            index = PyLong_AsSsize_t(fn);
+            if (index == -1 && PyErr_Occurred())
+                return -1;
+            if (index < 0)
+                index += n_items;
+            if (index < 0 || index >= n_items) {
+                PyErr_SetString(PyExc_IndexError, "index of the field out of range");
+                return -1;
+            }
+        }
+        else {
+            if (fields_index == NULL) {
+                fields_index = _dataobject_fields_index(type);
+                if (fields_index == NULL)
+                    return -1;
+            }
+            index = _dataobject_field_index(type, fields_index, fn);
+            if (index < 0) {
+                if (!PyErr_Occurred())
+                    PyErr_Format(PyExc_AttributeError, "%s has no field %R", type->tp_name, fn);
+                return -1;
+            }
+        }
+        indices[i] = index;
+    }
+
+    return 0;
+}
+
+static PyObject *
+_dataobject_fields_tuple(PyObject *fields)
+{
+    if (PyUnicode_Check(fields) || PyLong_Check(fields))
+        return PyTuple_Pack(1, fields);
+
+    return PySequence_Tuple(fields);
+}
+
+static const char *
+_dataobject_sort_kinds(PyTypeObject *type)
+{
+    if (PyDataObject_IS_NATIVE(type))
+        return _dataobject_native_kinds(type);
+    return "";
+}
+
+static PyObject *
+_sortkey_item(PyObject *op, Py_ssize_t index, const char *kinds)
+{
+    if (*kinds)
+        return _native_get(PyDataObject_ITEMS(op) + index, kinds[index]);
+
+    PyObject *v = PyDataObject_GET_ITEM(op, index);
+    Py_INCREF(v);
+    return v;
+}
+
+static PyObject *
+_sortkey_call(dataobject_sortkey_object *key, PyObject *op)
+{
+    const Py_ssize_t n = Py_SIZE(key);
+    Py_ssize_t i;
+
+    if (!PyObject_TypeCheck(op, key->cls)) {
+        PyErr_Format(PyExc_TypeError, "expected an instance of %s, got %s",
+                     key->cls->tp_name, Py_TYPE(op)->tp_name);
+        return NULL;
+    }
+
+    if (n == 1)
+        return _sortkey_item(op, key->indices[0], key->kinds);
+
+    PyObject *tpl = PyTuple_New(n);
+    if (tpl == NULL)
+        return NULL;
+
+    for (i = 0; i < n; i++) {
+        PyObject *v = _sortkey_item(op, key->indices[i], key->kinds);
+        if (v == NULL) {
+            Py_DECREF(tpl);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(tpl, i, v);
+    }
+
+    return tpl;
+}
+
+static PyObject *
+dataobject_sortkey_call(PyObject *self, PyObject *args, PyObject *kw)
+{
+    if (PyTuple_GET_SIZE(args) != 1 || (kw != NULL && PyDict_GET_SIZE(kw) != 0)) {
+        PyErr_SetString(PyExc_TypeError, "sortkey takes exactly one positional argument");
+        return NULL;
+    }
+
+    return _sortkey_call((dataobject_sortkey_object*)self, PyTuple_GET_ITEM(args, 0));
+}
+
+#if PY_VERSION_HEX >= 0x030A0000
+static PyObject *
+dataobject_sortkey_vectorcall(PyObject *self, PyObject * const*args,
+                              size_t nargsf, PyObject *kwnames)
+{
+    if (PyVectorcall_NARGS(nargsf) != 1 || (kwnames != NULL && PyTuple_GET_SIZE(kwnames) != 0)) {
+        PyErr_SetString(PyExc_TypeError, "sortkey takes exactly one positional argument");
+        return NULL;
+    }
+
+    return _sortkey_call((dataobject_sortkey_object*)self, args[0]);
+}
 #endif
-};
 
-//////////////////////////////////////////////////////////////////////////
+static PyObject *
+dataobject_sortkey(PyObject *cls, PyObject *args)
+{
+    PyTypeObject *type = (PyTypeObject*)cls;
+    const Py_ssize_t n = PyTuple_GET_SIZE(args);
+    dataobject_sortkey_object *key;
 
-static PyObject* dataobject_iter(PyObject *seq);
+    const char *kinds = _dataobject_sort_kinds(type);
+    if (kinds == NULL)
+        return NULL;
 
-//////////////////////////////////////////////////////////////////////////
+    key = PyObject_GC_NewVar(dataobject_sortkey_object, &PyDataObjectSortKey_Type, n);
+    if (key == NULL)
+        return NULL;
 
-/*********************** DataObject Iterator **************************/
+    Py_INCREF(cls);
+    key->cls = type;
+    Py_INCREF(args);
+    key->fields = args;
+    key->kinds = kinds;
+#if PY_VERSION_HEX >= 0x030A0000
+    key->vectorcall = dataobject_sortkey_vectorcall;
+#endif
 
-static PyObject* dataobject_iter(PyObject *seq);
+    if (_dataobject_field_indices(type, args, key->indices) < 0) {
+        Py_DECREF(key);
+        return NULL;
+    }
 
-typedef struct {
-    PyObject_HEAD
-    Py_ssize_t it_index, it_len;
-    PyObject *it_seq; /* Set to NULL when iterator is exhausted */
-} dataobjectiterobject;
+    PyObject_GC_Track(key);
+    return (PyObject*)key;
+}
 
 static void
-dataobjectiter_dealloc(dataobjectiterobject *it)
+dataobject_sortkey_dealloc(PyObject *self)
 {
-    PyTypeObject *tp = Py_TYPE(it);
+    dataobject_sortkey_object *key = (dataobject_sortkey_object*)self;
 
-#if PY_VERSION_HEX < 0x03080000
-    if (tp->tp_flags & Py_TPFLAGS_HEAPTYPE)
-    Py_DECREF(tp);
-#endif
-
-    Py_XDECREF(it->it_seq);
-    it->it_seq = NULL;
-    tp->tp_free((PyObject *)it);
+    PyObject_GC_UnTrack(self);
+    Py_CLEAR(key->cls);
+    Py_CLEAR(key->fields);
+    PyObject_GC_Del(self);
 }
 
-// static int
-// dataobjectiter_clear(PyObject *op)
-// {
-//     dataobjectiterobject *it = (dataobjectiterobject*)op;
-//     Py_CLEAR(it->it_seq);
-//     return 0;
-// }
+static int
+dataobject_sortkey_traverse(PyObject *self, visitproc visit, void *arg)
+{
+    dataobject_sortkey_object *key = (dataobject_sortkey_object*)self;
 
-// static int
-// dataobjectiter_traverse(PyObject *op, visitproc visit, void *arg)
-// {
-//     dataobjectiterobject *it = (dataobjectiterobject*)op;
-//     Py_VISIT(it->it_seq);
-//     return 0;
-// }
+    Py_VISIT(key->cls);
+    Py_VISIT(key->fields);
+    return 0;
+}
 
 static PyObject *
-dataobjectiter_next(dataobjectiterobject *it)
+dataobject_sortkey_repr(PyObject *self)
 {
-    PyObject *item;
-    PyObject *op = it->it_seq;
+    dataobject_sortkey_object *key = (dataobject_sortkey_object*)self;
 
-    if (it->it_index < it->it_len) {
-        item = PyDataObject_GET_ITEM(op, it->it_index);
-        Py_INCREF(item);
-        it->it_index++;
-        return item;
-    }
-    return NULL;
+    return PyUnicode_FromFormat("%s.sortkey%R", key->cls->tp_name, key->fields);
 }
 
-static PyObject *
-dataobjectiter_len(dataobjectiterobject *it)
+static PyTypeObject PyDataObjectSortKey_Type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "recordclass._dataobject.sortkey", /*tp_name*/
+    sizeof(dataobject_sortkey_object) - sizeof(Py_ssize_t), /*tp_basicsize*/
+    sizeof(Py_ssize_t), /*tp_itemsize*/
+    dataobject_sortkey_dealloc, /*tp_dealloc*/
+#if PY_VERSION_HEX >= 0x030A0000
+    offsetof(dataobject_sortkey_object, vectorcall), /*tp_vectorcall_offset*/
+#else
+    0, /*tp_print*/
+#endif
+    0, /*tp_getattr*/
+    0, /*tp_setattr*/
+    0, /*reserved*/
+    dataobject_sortkey_repr, /*tp_repr*/
+    0, /*tp_as_number*/
+    0, /*tp_as_sequence*/
+    0, /*tp_as_mapping*/
+    0, /*tp_hash*/
+    dataobject_sortkey_call, /*tp_call*/
+    0, /*tp_str*/
+    0, /*tp_getattro*/
+    0, /*tp_setattro*/
+    0, /*tp_as_buffer*/
+#if PY_VERSION_HEX >= 0x030A0000
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_GC|Py_TPFLAGS_HAVE_VECTORCALL, /*tp_flags*/
+#else
+    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+#endif
+    0, /*tp_doc*/
+    dataobject_sortkey_traverse, /*tp_traverse*/
+    0, /*tp_clear*/
+};
+
+/* -1 on error, 0 if v == w, 1 if v < w and 2 otherwise */
+static int
+_sort_compare_values(PyObject *v, PyObject *w)
 {
-    Py_ssize_t len = 0;
-    if (it->it_seq)
-        len = it->it_len - it->it_index;
-    return PyLong_FromSsize_t(len);
+    PyTypeObject *tp = Py_TYPE(v);
+    int r;
+
+    if (v == w)
+        return 0;
+
+    if (tp == Py_TYPE(w)) {
+        if (tp == &PyFloat_Type) {
+            const double x = PyFloat_AS_DOUBLE(v), y = PyFloat_AS_DOUBLE(w);
+            if (x == y)
+                return 0;
+            return (x < y) ? 1 : 2;
+        }
+        if (tp == &PyLong_Type) {
+            int overflow_x, overflow_y;
+            const long long x = PyLong_AsLongLongAndOverflow(v, &overflow_x);
+            const long long y = PyLong_AsLongLongAndOverflow(w, &overflow_y);
+            if (!overflow_x && !overflow_y) {
+                if (x == y)
+                    return 0;
+                return (x < y) ? 1 : 2;
+            }
+        }
+        else if (tp == &PyUnicode_Type) {
+            r = PyUnicode_Compare(v, w);
+            if (r == -1 && PyErr_Occurred())
+                return -1;
+            if (r == 0)
+                return 0;
+            return (r < 0) ? 1 : 2;
+        }
+    }
+
+    r = PyObject_RichCompareBool(v, w, Py_EQ);
+    if (r != 0)
+        return (r < 0) ? -1 : 0;
+
+    r = PyObject_RichCompareBool(v, w, Py_LT);
+    if (r < 0)
+        return -1;
+    return r ? 1 : 2;
 }
 
-PyDoc_STRVAR(length_hint_doc, "Private method returning an estimate of len(list(it)).");
+/* the key values of the record and the record itself are copied into the element
+   of the contiguous array, so the comparisons don't touch the records */
+typedef union {
+    int64_t i;
+    double d;
+    PyObject *o;
+} sort_key_value;
 
-static PyObject *
-dataobjectiter_reduce(dataobjectiterobject *it) //, PyObject *Py_UNUSED(ignore))
+typedef struct {
+    Py_ssize_t n;
+    Py_ssize_t elemsize;
+    char *kinds;
+    int reverse;
+} sort_records_state;
+
+#define SORT_ITEM(p, i) ((sort_key_value*)((char*)(p) + (i)*es))
+
+/* 1 if a < b (with reverse=True: if b < a), 0 otherwise and -1 on error */
+static int
+_sort_records_lt(sort_records_state *st, sort_key_value *a, sort_key_value *b)
 {
-    if (it->it_seq)
-        return Py_BuildValue("N(O)n", pyobject_get_builtin("iter"),
-                             it->it_seq, it->it_index);
-    else
-        return Py_BuildValue("N(())", pyobject_get_builtin("iter"));
+    Py_ssize_t k;
+
+    if (st->reverse) {
+        sort_key_value *c = a;
+        a = b;
+        b = c;
+    }
+
+    for (k = 0; k < st->n; k++) {
+        switch (st->kinds[k]) {
+            case NATIVE_INT64:
+                if (a[k].i != b[k].i)
+                    return a[k].i < b[k].i;
+                break;
+            case NATIVE_DOUBLE:
+                if (a[k].d != b[k].d)
+                    return a[k].d < b[k].d;
+                break;
+            default: {
+                const int r = _sort_compare_values(a[k].o, b[k].o);
+                if (r < 0)
+                    return -1;
+                if (r)
+                    return r == 1;
+            }
+        }
+    }
+
+    return 0;
 }
 
-PyDoc_STRVAR(dataobjectiter_reduce_doc, "D.__reduce__()");
+#define SORT_RECORDS_MINRUN 32
 
-static PyObject *
-dataobjectiter_setstate(dataobjectiterobject *it, PyObject *state)
+/* stable merge sort; buf should have room for n/2+1 items */
+static int
+_sort_records(sort_records_state *st, sort_key_value *items, sort_key_value *buf, Py_ssize_t n)
 {
-    Py_ssize_t index;
+    const Py_ssize_t es = st->elemsize;
+    Py_ssize_t lo, i, j, k, width;
+    int r;
+
+    /* insertion sort of the short runs */
+    for (lo = 0; lo < n; lo += SORT_RECORDS_MINRUN) {
+        const Py_ssize_t hi = Py_MIN(lo + SORT_RECORDS_MINRUN, n);
+        for (i = lo + 1; i < hi; i++) {
+            r = _sort_records_lt(st, SORT_ITEM(items, i), SORT_ITEM(items, i-1));
+            if (r <= 0) {
+                if (r < 0)
+                    return -1;
+                continue;
+            }
+            memcpy(buf, SORT_ITEM(items, i), es);
+            j = i;
+            do {
+                memcpy(SORT_ITEM(items, j), SORT_ITEM(items, j-1), es);
+                if (--j == lo)
+                    break;
+                r = _sort_records_lt(st, buf, SORT_ITEM(items, j-1));
+            } while (r > 0);
+            memcpy(SORT_ITEM(items, j), buf, es);
+            if (r < 0)
+                return -1;
+        }
+    }
 
-    index = PyLong_AsSsize_t(state);
-    if (index == -1 && PyErr_Occurred())
-        return NULL;
-    if (it->it_seq != NULL) {
-        if (index < 0)
-            index = 0;
-        else if (index > it->it_len)
-            index = it->it_len; /* exhausted iterator */
-        it->it_index = index;
+    /* merge of the sorted runs */
+    for (width = SORT_RECORDS_MINRUN; width < n; width *= 2) {
+        for (lo = 0; lo < n - width; lo += 2*width) {
+            const Py_ssize_t mid = lo + width;
+            const Py_ssize_t hi = Py_MIN(mid + width, n);
+
+            r = _sort_records_lt(st, SORT_ITEM(items, mid), SORT_ITEM(items, mid-1));
+            if (r <= 0) {
+                if (r < 0)
+                    return -1;
+                continue;
+            }
+
+            if (width <= hi - mid) {
+                /* merge from the start with the copy of the left run */
+                memcpy(buf, SORT_ITEM(items, lo), width * es);
+                i = 0; j = mid; k = lo;
+                while (i < width && j < hi) {
+                    r = _sort_records_lt(st, SORT_ITEM(items, j), SORT_ITEM(buf, i));
+                    if (r < 0)
+                        break;
+                    if (r)
+                        memcpy(SORT_ITEM(items, k++), SORT_ITEM(items, j++), es);
+                    else
+                        memcpy(SORT_ITEM(items, k++), SORT_ITEM(buf, i++), es);
+                }
+                memcpy(SORT_ITEM(items, k), SORT_ITEM(buf, i), (width - i) * es);
+            }
+            else {
+                /* merge from the end with the copy of the right run */
+                memcpy(buf, SORT_ITEM(items, mid), (hi - mid) * es);
+                i = hi - mid - 1; j = mid - 1; k = hi - 1;
+                while (i >= 0 && j >= lo) {
+                    r = _sort_records_lt(st, SORT_ITEM(buf, i), SORT_ITEM(items, j));
+                    if (r < 0)
+                        break;
+                    if (r)
+                        memcpy(SORT_ITEM(items, k--), SORT_ITEM(items, j--), es);
+                    else
+                        memcpy(SORT_ITEM(items, k--), SORT_ITEM(buf, i--), es);
+                }
+                memcpy(SORT_ITEM(items, j + 1), buf, (i + 1) * es);
+            }
+            if (r < 0)
+                return -1;
+        }
     }
-    Py_RETURN_NONE;
+
+    return 0;
 }
 
-PyDoc_STRVAR(setstate_doc, "Set state information for unpickling.");
+/* kind of the key values of the object field:
+   int64 or double if all values are exact int (in the range of int64) or float */
+static char
+_sort_records_value_kind(PyObject **records, Py_ssize_t n, Py_ssize_t index)
+{
+    PyTypeObject *tp = Py_TYPE(PyDataObject_GET_ITEM(records[0], index));
+    Py_ssize_t i;
 
-static PyMethodDef dataobjectiter_methods[] = {
-    {"__length_hint__", (PyCFunction)dataobjectiter_len, METH_NOARGS, length_hint_doc},
-    {"__reduce__",      (PyCFunction)dataobjectiter_reduce, METH_NOARGS, dataobjectiter_reduce_doc},
-    {"__setstate__",    (PyCFunction)dataobjectiter_setstate, METH_O, setstate_doc},
-    {NULL,              NULL}           /* sentinel */
-};
+    if (tp == &PyFloat_Type) {
+        for (i = 1; i < n; i++) {
+            if (Py_TYPE(PyDataObject_GET_ITEM(records[i], index)) != &PyFloat_Type)
+                return NATIVE_OBJECT;
+        }
+        return NATIVE_DOUBLE;
+    }
+    if (tp == &PyLong_Type) {
+        for (i = 0; i < n; i++) {
+            PyObject *v = PyDataObject_GET_ITEM(records[i], index);
+            int overflow;
+            if (Py_TYPE(v) != &PyLong_Type)
+                return NATIVE_OBJECT;
+            PyLong_AsLongLongAndOverflow(v, &overflow);
+            if (overflow)
+                return NATIVE_OBJECT;
+        }
+        return NATIVE_INT64;
+    }
+    return NATIVE_OBJECT;
+}
 
-PyTypeObject PyDataObjectIter_Type = {
-    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
-    "recordclass._dataobject.dataobject_iterator",  /* tp_name */
-    sizeof(dataobjectiterobject),               /* tp_basicsize */
-    0,                                          /* tp_itemsize */
-    /* methods */
-    (destructor)dataobjectiter_dealloc,         /* tp_dealloc */
-    0,                                          /* tp_print */
-    0,                                          /* tp_getattr */
-    0,                                          /* tp_setattr */
-    0,                                          /* tp_reserved */
-    0,                                          /* tp_repr */
-    0,                                          /* tp_as_number */
-    0,                                          /* tp_as_sequence */
-    0,                                          /* tp_as_mapping */
-    0,                                          /* tp_hash */
-    0,                                          /* tp_call */
-    0,                                          /* tp_str */
-    PyObject_GenericGetAttr,                    /* tp_getattro */
-    0,                                          /* tp_setattro */
-    0,                                          /* tp_as_buffer */
-    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE,
-                                                /* tp_flags */
-    0,                                          /* tp_doc */
-    0,                    /* tp_traverse */
-    0,                        /* tp_clear */
-    0,                                          /* tp_richcompare */
-    0,                                          /* tp_weaklistoffset */
-    PyObject_SelfIter,                          /* tp_iter */
-    (iternextfunc)dataobjectiter_next,          /* tp_iternext */
-    dataobjectiter_methods,                     /* tp_methods */
-    0,
-};
+PyDoc_STRVAR(sort_records_doc,
+"sort_records(lst, fields, *, reverse=False) -- stable sort in place of the list of instances by the values of the fields.\n"
+"The values of the fields are compared directly without creation of the key tuples.");
 
 static PyObject *
-dataobject_iter(PyObject *seq)
+sort_records(PyObject *module, PyObject *args, PyObject *kw)
 {
-    dataobjectiterobject *it;
-
-    if (!seq)
+    static char *kwlist[] = {"lst", "fields", "reverse", NULL};
+    PyObject *lst_ob, *fields_ob;
+    int reverse = 0;
+    PyListObject *lst;
+    PyObject *fields = NULL;
+    PyObject **saved_ob_item, **final_ob_item;
+    PyObject **refs = NULL;
+    sort_key_value *items = NULL, *buf = NULL;
+    Py_ssize_t *indices = NULL;
+    Py_ssize_t saved_size, saved_allocated, i, k, n, es, n_obj = 0, n_refs = 0;
+    sort_records_state st;
+    int result = -1;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kw, "OO|$p:sort_records", kwlist,
+                                     &lst_ob, &fields_ob, &reverse))
         return NULL;
 
-    // if (Py_TYPE(seq)->tp_base != &PyDataObject_Type && !PyType_IsSubtype(Py_TYPE(seq), &PyDataObject_Type)) {
-    //     PyErr_SetString(PyExc_TypeError, "the object is not instance of dataobject");
-    //     return NULL;
-    // }
+    if (!PyList_Check(lst_ob)) {
+        type_error("%s is not a list", lst_ob);
+        return NULL;
+    }
+    lst = (PyListObject*)lst_ob;
 
-    it = PyObject_New(dataobjectiterobject, &PyDataObjectIter_Type);
-    if (it == NULL)
+    fields = _dataobject_fields_tuple(fields_ob);
+    if (fields == NULL)
         return NULL;
 
-#if PY_VERSION_HEX < 0x03080000
-    {
-        PyTypeObject *t = Py_TYPE(it);
-        if (t->tp_flags & Py_TPFLAGS_HEAPTYPE)
-            Py_INCREF(t);
+    st.kinds = NULL;
+    st.n = PyTuple_GET_SIZE(fields);
+    st.reverse = reverse;
+    st.elemsize = es = (st.n + 1) * sizeof(sort_key_value);
+
+    n = Py_SIZE(lst);
+    if (n == 0) {
+        Py_DECREF(fields);
+        Py_RETURN_NONE;
     }
-#endif
 
-    it->it_index = 0;
-    it->it_seq = seq;
-    Py_INCREF(seq);
-    it->it_len = PyDataObject_LEN(seq);
+    PyObject **records = lst->ob_item;
+    if (!_dataobject_check(records[0]))
+        goto error;
+    PyTypeObject *type = Py_TYPE(records[0]);
 
-    return (PyObject *)it;
-}
+    for (i = 1; i < n; i++) {
+        PyTypeObject *tp = Py_TYPE(records[i]);
+        if (tp != type && !PyType_IsSubtype(tp, type)) {
+            PyErr_Format(PyExc_TypeError, "expected an instance of %s, got %s",
+                         type->tp_name, tp->tp_name);
+            goto error;
+        }
+    }
+
+    indices = PyMem_New(Py_ssize_t, st.n);
+    st.kinds = PyMem_Malloc(st.n);
+    if (indices == NULL || st.kinds == NULL) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    if (_dataobject_field_indices(type, fields, indices) < 0)
+        goto error;
+
+    const char *type_kinds = _dataobject_sort_kinds(type);
+    if (type_kinds == NULL)
+        goto error;
+
+    for (k = 0; k < st.n; k++) {
+        const Py_ssize_t index = indices[k];
+        if (*type_kinds && type_kinds[index] != NATIVE_OBJECT)
+            st.kinds[k] = type_kinds[index];
+        else {
+            for (i = 0; i < n; i++) {
+                if (PyDataObject_GET_ITEM(records[i], index) == NULL) {
+                    PyErr_SetString(PyExc_AttributeError, "the field has no value");
+                    goto error;
+                }
+            }
+            st.kinds[k] = _sort_records_value_kind(records, n, index);
+            if (st.kinds[k] == NATIVE_OBJECT)
+                n_obj++;
+        }
+    }
+
+    items = (sort_key_value*)PyMem_Malloc(n * es);
+    buf = (sort_key_value*)PyMem_Malloc((n / 2 + 1) * es);
+    if (n_obj)
+        refs = PyMem_New(PyObject*, n * n_obj);
+    if (items == NULL || buf == NULL || (n_obj && refs == NULL)) {
+        PyErr_NoMemory();
+        goto error;
+    }
 
-////////////////////////////////////////////////////////////////////////
+    /* the values of the object fields may be replaced during the comparisons */
+    for (i = 0; i < n; i++) {
+        PyObject **record_items = PyDataObject_ITEMS(records[i]);
+        sort_key_value *item = SORT_ITEM(items, i);
+        for (k = 0; k < st.n; k++) {
+            const Py_ssize_t index = indices[k];
+            switch (st.kinds[k]) {
+                case NATIVE_INT64:
+                    if (*type_kinds && type_kinds[index] == NATIVE_INT64)
+                        item[k].i = *(int64_t*)(record_items + index);
+                    else
+                        item[k].i = (int64_t)PyLong_AsLongLong(record_items[index]);
+                    break;
+                case NATIVE_DOUBLE:
+                    if (*type_kinds && type_kinds[index] == NATIVE_DOUBLE)
+                        item[k].d = *(double*)(record_items + index);
+                    else
+                        item[k].d = PyFloat_AS_DOUBLE(record_items[index]);
+                    break;
+                default:
+                    item[k].o = record_items[index];
+                    Py_INCREF(item[k].o);
+                    refs[n_refs++] = item[k].o;
+            }
+        }
+        item[st.n].o = records[i];
+    }
 
-static PyMethodDef dataobjectproperty_methods[] = {
-  {0, 0, 0, 0}
-};
+    /* the list is empty during the sort as in list.sort() */
+    saved_ob_item = lst->ob_item;
+    saved_size = Py_SIZE(lst);
+    saved_allocated = lst->allocated;
+    Py_SET_SIZE(lst, 0);
+    lst->ob_item = NULL;
+    lst->allocated = -1;
 
-static PyObject*
-dataobjectproperty_new(PyTypeObject *t, PyObject *args, PyObject *k)
-{
-    dataobjectproperty_object *ob = NULL;
-    PyObject *item;
-    Py_ssize_t len, index;
-    int readonly;
+    result = _sort_records(&st, items, buf, n);
 
-    len = Py_SIZE(args);
-    if (len == 0 || len > 2) {
-        PyErr_SetString(PyExc_TypeError, "number of args is 1 or 2");
-        return NULL;
+    if (lst->allocated != -1 && result == 0) {
+        PyErr_SetString(PyExc_ValueError, "list modified during sort");
+        result = -1;
     }
 
-    item = PyTuple_GET_ITEM(args, 0);
-    index = PyNumber_AsSsize_t(item, PyExc_IndexError);
-    if (index == -1 && PyErr_Occurred()) {
-        return NULL;
+    /* the order of the list is changed only if the sort is successful */
+    if (result == 0) {
+        for (i = 0; i < n; i++)
+            saved_ob_item[i] = SORT_ITEM(items, i)[st.n].o;
     }
 
-    if (len == 2) {
-        item = PyTuple_GET_ITEM(args, 1);
-        readonly = PyObject_IsTrue(item);
-    } else
-        readonly = 0;
+    final_ob_item = lst->ob_item;
+    i = Py_SIZE(lst);
+    Py_SET_SIZE(lst, saved_size);
+    lst->ob_item = saved_ob_item;
+    lst->allocated = saved_allocated;
+    if (final_ob_item != NULL) {
+        while (--i >= 0)
+            Py_XDECREF(final_ob_item[i]);
+        PyMem_Free(final_ob_item);
+    }
 
-    ob = PyObject_New(dataobjectproperty_object, t);
-    if (ob == NULL)
+error:
+    for (i = 0; i < n_refs; i++)
+        Py_DECREF(refs[i]);
+    PyMem_Free(refs);
+    PyMem_Free(items);
+    PyMem_Free(buf);
+    PyMem_Free(st.kinds);
+    PyMem_Free(indices);
+    Py_DECREF(fields);
+    if (result < 0)
         return NULL;
-
-#if PY_VERSION_HEX < 0x03080000
-        if (t->tp_flags & Py_TPFLAGS_HEAPTYPE)
-            Py_INCREF(t);
-#endif
-    ob->readonly = readonly;
-    ob->index = index;
-    return (PyObject*)ob;
+    Py_RETURN_NONE;
 }
 
-static void
-dataobjectproperty_dealloc(PyObject *o)
-{
-    PyTypeObject *t = Py_TYPE(o);
+#undef SORT_ITEM
 
-    t->tp_free(o);
 
-#if PY_VERSION_HEX >= 0x03080000
-    if (t->tp_flags & Py_TPFLAGS_HEAPTYPE)
-        Py_DECREF(t);
+///////////////////////// namedtuple API ///////////////////////////////////
+
+#if PY_VERSION_HEX >= 0x03090000
+#define _dataobject_vectorcall_func PyObject_Vectorcall
+#else
+#define _dataobject_vectorcall_func _PyObject_Vectorcall
 #endif
-}
 
-static PyObject*
-dataobjectproperty_get(PyObject *self, PyObject *obj, PyObject *type)
+/* the instances of the class are created without python's __new__ and __init__ */
+static int
+_dataobject_has_basic_init(PyTypeObject *type)
 {
-    if (obj == Py_None || obj == NULL) {
-        Py_INCREF(self);
-        return self;
-    }
+    return (type->tp_new == dataobject_new_basic ||
+            type->tp_new == dataobject_new ||
+            type->tp_new == dataobject_new_copy_default) &&
+           (type->tp_init == dataobject_init_basic ||
+            type->tp_init == dataobject_init);
+}
 
-    PyObject *v = PyDataObject_GET_ITEM(obj, ((dataobjectproperty_object *)self)->index);
+PyDoc_STRVAR(dataobject_nt_make_doc,
+"Make a new object from a sequence or iterable");
 
-    Py_INCREF(v);
-    return v;
+static PyObject *
+dataobject_nt_make(PyObject *cls, PyObject *iterable)
+{
+    PyObject *seq = PySequence_Fast(iterable, "argument should be an iterable");
+    if (seq == NULL)
+        return NULL;
+
+    PyObject *op = _dataobject_vectorcall_func(cls, PySequence_Fast_ITEMS(seq),
+                                               PySequence_Fast_GET_SIZE(seq), NULL);
+    Py_DECREF(seq);
+    return op;
 }
 
+/* indexes of the fields for keyword names; AttributeError for unexpected names */
 static int
-dataobjectproperty_set(PyObject *self, PyObject *obj, PyObject *value)
+_dataobject_kwnames_indices(PyTypeObject *type, PyObject *kwnames, Py_ssize_t *indices)
 {
-    if (!value) {
-        PyErr_SetString(PyExc_AttributeError, "The field and it's value can't be deleted");
-        return -1;
-    }
-
-    if (obj == Py_None || obj == NULL)
-        return 0;
+    const Py_ssize_t n_kw = PyTuple_GET_SIZE(kwnames);
+    PyObject *unexpected = NULL;
+    Py_ssize_t i;
 
-    if (((dataobjectproperty_object *)self)->readonly) {
-        PyErr_SetString(PyExc_AttributeError, "the field is readonly");
+    PyObject *fields_index = _dataobject_fields_index(type);
+    if (fields_index == NULL)
         return -1;
-    }
-
-    PyObject **ptr = PyDataObject_ITEMS(obj) + ((dataobjectproperty_object *)self)->index;
 
-    Py_DECREF(*ptr);
+    for (i = 0; i < n_kw; i++) {
+        PyObject *name = PyTuple_GET_ITEM(kwnames, i);
+        Py_ssize_t index = _dataobject_field_index(type, fields_index, name);
+        if (index < 0) {
+            if (PyErr_Occurred())
+                goto error;
+            if (unexpected == NULL) {
+                unexpected = PyList_New(0);
+                if (unexpected == NULL)
+                    return -1;
+            }
+            if (PyList_Append(unexpected, name) < 0)
+                goto error;
+            continue;
+        }
+        indices[i] = index;
+    }
 
-    Py_INCREF(value);
-    *ptr = value;
+    if (unexpected != NULL) {
+        PyObject *names = PyList_AsTuple(unexpected);
+        if (names != NULL) {
+            PyErr_Format(PyExc_AttributeError, "Got unexpected field names: %R", names);
+            Py_DECREF(names);
+        }
+        goto error;
+    }
 
     return 0;
-}
 
-static PyObject*
-dataobjectproperty_index(PyObject *self)
-{
-    return PyLong_FromSsize_t(((dataobjectproperty_object*)self)->index);
+error:
+    Py_XDECREF(unexpected);
+    return -1;
 }
 
-static PyObject*
-dataobjectproperty_readonly(PyObject *self)
+PyDoc_STRVAR(dataobject_nt_replace_readonly_doc,
+"Return a new object replacing specified fields with new values");
+
+static PyObject *
+dataobject_nt_replace_readonly(PyObject *op, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
-    return PyBool_FromLong((long)(((dataobjectproperty_object*)self)->readonly));
-}
+    PyTypeObject *type = Py_TYPE(op);
+    const Py_ssize_t n_kw = (kwnames == NULL) ? 0 : PyTuple_GET_SIZE(kwnames);
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    Py_ssize_t indices_stack[8];
+    Py_ssize_t *indices = indices_stack;
+    PyObject *new_op = NULL;
+    Py_ssize_t i;
 
-// static int
-// dataobjectproperty_readonly_set(PyObject *self, PyObject *val)
-// {
-//     ((dataobjectproperty_object*)self)->readonly = PyObject_IsTrue(val);
-//     return 0;
-// }
+    if (nargs) {
+        PyErr_SetString(PyExc_TypeError, "_replace() takes no positional arguments");
+        return NULL;
+    }
 
-static PyGetSetDef dataobjectproperty_getsets[] = {
-    {"index", (getter)dataobjectproperty_index, NULL, NULL},
-    {"readonly", (getter)dataobjectproperty_readonly, NULL, NULL},
-    {0}
-};
+    if (n_kw > 8) {
+        indices = PyMem_New(Py_ssize_t, n_kw);
+        if (indices == NULL)
+            return PyErr_NoMemory();
+    }
 
-static PyTypeObject PyDataObjectProperty_Type = {
-    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
-    "recordclass._dataobject.dataobjectproperty", /*tp_name*/
-    sizeof(dataobjectproperty_object), /*tp_basicsize*/
-    0, /*tp_itemsize*/
-    dataobjectproperty_dealloc, /*tp_dealloc*/
-    0, /*tp_print*/
-    0, /*tp_getattr*/
-    0, /*tp_setattr*/
-    0, /*reserved*/
-    0, /*tp_repr*/
-    0, /*tp_as_number*/
-    0, /*tp_as_sequence*/
-    0, /*tp_as_mapping*/
-    0, /*tp_hash*/
-    0, /*tp_call*/
-    0, /*tp_str*/
-    0, /*tp_getattro*/
-    0, /*tp_setattro*/
-    0, /*tp_as_buffer*/
-    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-    0, /*tp_doc*/
-    0, /*tp_traverse*/
-    0, /*tp_clear*/
-    0, /*tp_richcompare*/
-    0, /*tp_weaklistoffset*/
-    0, /*tp_iter*/
-    0, /*tp_iternext*/
-    dataobjectproperty_methods, /*tp_methods*/
-    0, /*tp_members*/
-    dataobjectproperty_getsets, /*tp_getset*/
-    0, /*tp_base*/
-    0, /*tp_dict*/
-    dataobjectproperty_get, /*tp_descr_get*/
-    dataobjectproperty_set, /*tp_descr_set*/
-    0, /*tp_dictoffset*/
-    0, /*tp_init*/
-    0, /*tp_alloc*/
-    dataobjectproperty_new, /*tp_new*/
-    0, /*tp_free*/
-    0, /*tp_is_gc*/
-};
+    if (n_kw && _dataobject_kwnames_indices(type, kwnames, indices) < 0)
+        goto done;
+
+    if (!_dataobject_has_basic_init(type)) {
+        /* the class has python's __new__ or __init__ */
+        PyObject *values = _astuple(op);
+        if (values == NULL)
+            goto done;
+        for (i = 0; i < n_kw; i++) {
+            PyObject *val = args[i];
+            Py_INCREF(val);
+            Py_SETREF(PyTuple_GET_ITEM(values, indices[i]), val);
+        }
+        new_op = PyObject_Call((PyObject*)type, values, NULL);
+        Py_DECREF(values);
+        goto done;
+    }
 
-///////////////////////// Factory ////////////////////////////////////////
+    new_op = type->tp_alloc(type, 0);
+    if (new_op == NULL)
+        goto done;
 
-static PyObject *Factory_new(PyTypeObject *tp, PyObject *args, PyObject *kw) {
-    struct PyFactoryObject *p;
-    Py_ssize_t n_args = Py_SIZE(args);
-    PyObject *o;
+    PyObject **items = PyDataObject_ITEMS(new_op);
+    PyObject **src = PyDataObject_ITEMS(op);
+
+    if (PyDataObject_IS_NATIVE(type)) {
+        const char *kinds = _dataobject_native_kinds(type);
+        if (kinds == NULL) {
+            memset(items, 0, n_items * sizeof(PyObject*));
+            Py_CLEAR(new_op);
+            goto done;
+        }
+        for (i = 0; i < n_items; i++) {
+            items[i] = src[i];
+            if (kinds[i] == NATIVE_OBJECT)
+                Py_XINCREF(src[i]);
+        }
+        for (i = 0; i < n_kw; i++) {
+            if (_native_set(items + indices[i], kinds[indices[i]], args[i]) < 0) {
+                Py_CLEAR(new_op);
+                goto done;
+            }
+        }
+    }
+    else {
+        _fill_items(items, src, n_items);
+        for (i = 0; i < n_kw; i++) {
+            PyObject *val = args[i];
+            Py_INCREF(val);
+            Py_SETREF(items[indices[i]], val);
+        }
+    }
 
-    o = (*tp->tp_alloc)(tp, 0);
-    if (!o) return NULL;
+done:
+    if (indices != indices_stack)
+        PyMem_Free(indices);
+    return new_op;
+}
 
-    p = ((struct PyFactoryObject *)o);
-    if (n_args != 1) {
-        PyErr_SetString(PyExc_TypeError, "number of arguments != 1");
-        return NULL;
-    }
+PyDoc_STRVAR(dataobject_nt_replace_doc,
+"Replace specified fields with new values and return the object");
 
-    PyObject *f = PyTuple_GET_ITEM(args, 0);
-    p->factory = f; Py_INCREF(f);
+static PyObject *
+dataobject_nt_replace(PyObject *op, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    const Py_ssize_t n_kw = (kwnames == NULL) ? 0 : PyTuple_GET_SIZE(kwnames);
+    Py_ssize_t i;
 
-    return o;
-}
+    if (nargs) {
+        PyErr_SetString(PyExc_TypeError, "_replace() takes no positional arguments");
+        return NULL;
+    }
 
-static void Factory_dealloc(PyObject *o) {
-    struct PyFactoryObject *p = (struct PyFactoryObject *)o;
-    PyTypeObject *t = Py_TYPE(o);
+    for (i = 0; i < n_kw; i++) {
+        if (PyObject_SetAttr(op, PyTuple_GET_ITEM(kwnames, i), args[i]) < 0)
+            return NULL;
+    }
 
-    Py_CLEAR(p->factory);
-    t->tp_free(o);
+    Py_INCREF(op);
+    return op;
 }
 
-static PyMethodDef Factory_methods[] = {
-  {0, 0, 0, 0}
-};
-
-static PyGetSetDef Factory_getsets[] = {
-    {0}
-};
+PyDoc_STRVAR(dataobject_nt_asdict_doc,
+"Return a new dict which maps field names to their values");
 
-static PyTypeObject PyFactory_Type = {
-    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
-    "recordclass._dataobject.Factory", /*tp_name*/
-    sizeof(struct PyFactoryObject), /*tp_basicsize*/
-    0, /*tp_itemsize*/
-    Factory_dealloc, /*tp_dealloc*/
-    0, /*tp_print*/
-    0, /*tp_getattr*/
-    0, /*tp_setattr*/
-    0, /*reserved*/
-    0, /*tp_repr*/
-    0, /*tp_as_number*/
-    0, /*tp_as_sequence*/
-    0, /*tp_as_mapping*/
-    0, /*tp_hash*/
-    0, /*tp_call*/
-    0, /*tp_str*/
-    0, /*tp_getattro*/
-    0, /*tp_setattro*/
-    0, /*tp_as_buffer*/
-    Py_TPFLAGS_DEFAULT|Py_TPFLAGS_BASETYPE, /*tp_flags*/
-    0, /*tp_doc*/
-    0, /*tp_traverse*/
-    0, /*tp_clear*/
-    0, /*tp_richcompare*/
-    0, /*tp_weaklistoffset*/
-    0, /*tp_iter*/
-    0, /*tp_iternext*/
-    Factory_methods, /*tp_methods*/
-    0, /*tp_members*/
-    Factory_getsets, /*tp_getset*/
-    0, /*tp_base*/
-    0, /*tp_dict*/
-    0, /*tp_descr_get*/
-    0, /*tp_descr_set*/
-    0, /*tp_dictoffset*/
-    0, /*tp_init*/
-    0, /*tp_alloc*/
-    Factory_new, /*tp_new*/
-    0, /*tp_free*/
-    0, /*tp_is_gc*/
-};
+static PyObject *
+dataobject_nt_asdict(PyObject *op, PyObject *unused)
+{
+    return _asdict(op);
+}
+
+static PyMethodDef dataobject_nt_make_def =
+    {"_make", (PyCFunction)dataobject_nt_make, METH_O|METH_CLASS, dataobject_nt_make_doc};
+static PyMethodDef dataobject_nt_replace_readonly_def =
+    {"_replace", (PyCFunction)(void(*)(void))dataobject_nt_replace_readonly, METH_FASTCALL|METH_KEYWORDS, dataobject_nt_replace_readonly_doc};
+static PyMethodDef dataobject_nt_replace_def =
+    {"_replace", (PyCFunction)(void(*)(void))dataobject_nt_replace, METH_FASTCALL|METH_KEYWORDS, dataobject_nt_replace_doc};
+static PyMethodDef dataobject_nt_asdict_def =
+    {"_asdict", (PyCFunction)dataobject_nt_asdict, METH_NOARGS, dataobject_nt_asdict_doc};
+
+/* method descriptors of dataobject which are installed into recordclass-based classes */
+static int
+_dataobject_add_namedtuple_api(PyObject *module)
+{
+    PyObject *descr;
+
+    descr = PyDescr_NewClassMethod(&PyDataObject_Type, &dataobject_nt_make_def);
+    if (descr == NULL || PyModule_AddObject(module, "_nt_make", descr) < 0)
+        return -1;
+    descr = PyDescr_NewMethod(&PyDataObject_Type, &dataobject_nt_replace_readonly_def);
+    if (descr == NULL || PyModule_AddObject(module, "_nt_replace_readonly", descr) < 0)
+        return -1;
+    descr = PyDescr_NewMethod(&PyDataObject_Type, &dataobject_nt_replace_def);
+    if (descr == NULL || PyModule_AddObject(module, "_nt_replace", descr) < 0)
+        return -1;
+    descr = PyDescr_NewMethod(&PyDataObject_Type, &dataobject_nt_asdict_def);
+    if (descr == NULL || PyModule_AddObject(module, "_nt_asdict", descr) < 0)
+        return -1;
+
+    return 0;
+}
 
 
 //////////////////// datatype ////////////////////////////////////////////
@@ -2073,6 +4092,65 @@ static PyTypeObject PyFactory_Type = {
 
 
 
+static PyObject *
+_make_fields_index(PyObject *fields)
+{
+    const Py_ssize_t n_fields = PyTuple_GET_SIZE(fields);
+    Py_ssize_t i;
+
+    PyObject *fields_index = PyDict_New();
+    if (fields_index == NULL)
+        return NULL;
+
+    for (i = 0; i < n_fields; i++) {
+        PyObject *name = PyTuple_GET_ITEM(fields, i);
+        PyObject *index = PyLong_FromSsize_t(i);
+        if (index == NULL) {
+            Py_DECREF(fields_index);
+            return NULL;
+        }
+        Py_INCREF(name);
+        if (PyUnicode_CheckExact(name))
+            PyUnicode_InternInPlace(&name);
+        if (PyDict_SetItem(fields_index, name, index) < 0) {
+            Py_DECREF(name);
+            Py_DECREF(index);
+            Py_DECREF(fields_index);
+            return NULL;
+        }
+        Py_DECREF(name);
+        Py_DECREF(index);
+    }
+
+    return fields_index;
+}
+
+// the layout of types.MappingProxyType
+typedef struct {
+    PyObject_HEAD
+    PyObject *mapping;
+} mappingproxyobject;
+
+// __fields_index__ is the read-only proxy of the dict, which is used by lookups
+static PyObject *
+_dataobject_fields_index(PyTypeObject *type)
+{
+    PyObject *proxy = PyDict_GetItemWithError(type->tp_dict, __fields_index__name);
+
+    if (proxy == NULL) {
+        if (!PyErr_Occurred())
+            PyErr_Format(PyExc_TypeError, "%s has not named fields", type->tp_name);
+        return NULL;
+    }
+    if (Py_TYPE(proxy) != &PyDictProxy_Type ||
+            !PyDict_CheckExact(((mappingproxyobject*)proxy)->mapping)) {
+        PyErr_Format(PyExc_TypeError, "invalid __fields_index__ of %s", type->tp_name);
+        return NULL;
+    }
+
+    return ((mappingproxyobject*)proxy)->mapping;
+}
+
 PyDoc_STRVAR(_dataobject_type_init_doc,
 "Initialize dataobject subclass");
 
@@ -2112,6 +4190,24 @@ _dataobject_type_init(PyObject *module, PyObject *args) {
 
     if (PyTuple_Check(fields)) {
         n_fields = PyTuple_GET_SIZE(fields);
+
+        PyObject *fields_index = _make_fields_index(fields);
+        if (fields_index == NULL) {
+            Py_DECREF(fields);
+            return NULL;
+        }
+        PyObject *proxy = PyDictProxy_New(fields_index);
+        Py_DECREF(fields_index);
+        if (proxy == NULL) {
+            Py_DECREF(fields);
+            return NULL;
+        }
+        if (PyDict_SetItem(dict, __fields_index__name, proxy) < 0) {
+            Py_DECREF(proxy);
+            Py_DECREF(fields);
+            return NULL;
+        }
+        Py_DECREF(proxy);
     } else {
         n_fields = PyNumber_AsSsize_t(fields, PyExc_IndexError);
         if (n_fields == -1 && PyErr_Occurred()) {
@@ -2171,8 +4267,12 @@ _dataobject_type_init(PyObject *module, PyObject *args) {
         tp->tp_flags &= ~Py_TPFLAGS_HAVE_GC;
 
 
-    if (tp_base->tp_hash)
-        tp->tp_hash = tp_base->tp_hash;
+    if (tp_base->tp_hash) {
+        if (tp_base->tp_hash == dataobject_hash_cached)
+            tp->tp_hash = dataobject_hash;
+        else
+            tp->tp_hash = tp_base->tp_hash;
+    }
 
     if (tp_base->tp_iter)
         tp->tp_iter = tp_base->tp_iter;
@@ -2288,7 +4388,10 @@ _datatype_from_basetype_hashable(PyObject *module, PyObject *cls) {
     for (i=0; i<n_bases; i++) {
         PyTypeObject *base = (PyTypeObject*)PyTuple_GetItem(bases, i);
         if (base->tp_hash) {
-                tp->tp_hash = base->tp_hash;
+                if (base->tp_hash == dataobject_hash_cached)
+                    tp->tp_hash = dataobject_hash;
+                else
+                    tp->tp_hash = base->tp_hash;
                 Py_INCREF(Py_True);
                 return Py_True;
         }
@@ -2309,6 +4412,24 @@ _datatype_hashable(PyObject *module, PyObject *cls) {
 }
 
 
+PyDoc_STRVAR(_datatype_cache_hash_doc,
+"Store the hash of the instances in the hidden slot after the first computation");
+
+static PyObject*
+_datatype_cache_hash(PyObject *module, PyObject *cls) {
+    PyTypeObject *tp = (PyTypeObject*)cls;
+
+    if (tp->tp_hash != dataobject_hash) {
+        PyErr_SetString(PyExc_TypeError, "cache_hash=True requires hashable class");
+        return NULL;
+    }
+
+    tp->tp_basicsize += sizeof(Py_hash_t);
+    tp->tp_hash = dataobject_hash_cached;
+
+    Py_RETURN_NONE;
+}
+
 PyDoc_STRVAR(_datatype_from_basetype_iterable_doc,
 "");
 
@@ -2436,63 +4557,450 @@ _datatype_deep_dealloc(PyObject *module, PyObject *cls)
     //     return NULL;
     // }
 
-    have_gc = type->tp_flags & Py_TPFLAGS_HAVE_GC;
+    have_gc = type->tp_flags & Py_TPFLAGS_HAVE_GC;
+
+    if (type->tp_finalize != NULL && type->tp_finalize != dataobject_finalize) {
+        PyErr_SetString(PyExc_TypeError, "deep_dealloc=True is not compatible with __del__");
+        return NULL;
+    }
+
+    if (!have_gc) {
+        _deep_dealloc_init_types();
+        type->tp_finalize = dataobject_finalize;
+    }
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(_datatype_vectorcall_doc,
+"");
+
+static PyObject *
+_datatype_vectorcall(PyObject *module, PyObject *cls)
+{
+    PyTypeObject *tp = (PyTypeObject *)cls;
+
+    tp->tp_new = dataobject_new_basic;
+    tp->tp_init = dataobject_init_basic;
+
+#if PY_VERSION_HEX >= 0x030A0000
+    tp->tp_vectorcall_offset = offsetof(PyTypeObject, tp_vectorcall);
+    tp->tp_vectorcall = dataobject_vectorcall;
+    tp->tp_flags |= Py_TPFLAGS_HAVE_VECTORCALL;
+    // tp->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
+    // printf("vc\n");
+#endif
+
+    if (_dataobject_kwnames_cache_new(tp) < 0)
+        return NULL;
+
+    Py_RETURN_NONE;
+}
+
+
+PyDoc_STRVAR(_datatype_immutable_doc,
+"");
+
+static PyObject *
+_datatype_immutable(PyObject *module, PyObject *cls)
+{
+#if PY_VERSION_HEX >= 0x030A0000
+    PyTypeObject *tp = (PyTypeObject*)cls;
+
+    tp->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
+#endif
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(_datatype_copy_default_doc,
+"");
+
+static PyObject *
+_datatype_copy_default(PyObject *module, PyObject *cls) //, PyObject *kw)
+{
+    PyTypeObject *tp = (PyTypeObject*)cls;
+
+    tp->tp_new = dataobject_new_copy_default;
+    // tp->tp_init = dataobject_init_copy_default;
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(_datatype_freelist_doc,
+"");
+
+static PyObject *
+_datatype_freelist(PyObject *module, PyObject *args)
+{
+    PyTypeObject *tp;
+    Py_ssize_t maxsize, arena = 0;
+    dataobject_freelist *fl;
+    PyObject *capsule, *size_ob;
+
+    if (!PyArg_ParseTuple(args, "On|n:_datatype_freelist", &tp, &maxsize, &arena))
+        return NULL;
+
+    if (!PyType_Check(tp) || !PyType_IsSubtype(tp, &PyDataObject_Type)) {
+        PyErr_SetString(PyExc_TypeError, "argument should be a subclass of dataobject");
+        return NULL;
+    }
+    if (maxsize < 0 || arena < 0) {
+        PyErr_SetString(PyExc_ValueError, "size of the free list and arena should be >= 0");
+        return NULL;
+    }
+#ifdef Py_GIL_DISABLED
+    PyErr_SetString(PyExc_TypeError, "free list is not supported in the free-threaded build");
+    return NULL;
+#endif
+    if (tp->tp_flags & Py_TPFLAGS_HAVE_GC) {
+        PyErr_SetString(PyExc_TypeError, "free list is not compatible with gc=True");
+        return NULL;
+    }
+
+    capsule = PyDict_GetItemWithError(tp->tp_dict, __freelist__name);
+    if (capsule != NULL) {
+        fl = (dataobject_freelist*)PyCapsule_GetPointer(capsule, FREELIST_CAPSULE_NAME);
+        if (fl == NULL)
+            return NULL;
+        if (fl->arena != arena && (arena || fl->arena)) {
+            PyErr_SetString(PyExc_TypeError, "free list of the class with arena can not be changed");
+            return NULL;
+        }
+        if (!fl->arena)
+            _freelist_release_blocks(fl, maxsize);
+        fl->maxsize = maxsize;
+    }
+    else if (PyErr_Occurred())
+        return NULL;
+    else {
+        if (tp->tp_alloc != dataobject_alloc || tp->tp_free != PyObject_Del) {
+            PyErr_SetString(PyExc_TypeError, "free list can not be used with the allocator of the class");
+            return NULL;
+        }
+
+        fl = (dataobject_freelist*)PyMem_Calloc(1, sizeof(dataobject_freelist));
+        if (fl == NULL)
+            return PyErr_NoMemory();
+        fl->maxsize = maxsize;
+        fl->arena = arena;
+        fl->blocksize = (tp->tp_basicsize + FREELIST_ALIGN - 1) & ~(Py_ssize_t)(FREELIST_ALIGN - 1);
+
+        capsule = PyCapsule_New(fl, FREELIST_CAPSULE_NAME, freelist_capsule_destructor);
+        if (capsule == NULL) {
+            PyMem_Free(fl);
+            return NULL;
+        }
+        if (PyDict_SetItem(tp->tp_dict, __freelist__name, capsule) < 0) {
+            Py_DECREF(capsule);
+            return NULL;
+        }
+        Py_DECREF(capsule);
+
+        tp->tp_alloc = dataobject_alloc_freelist;
+        tp->tp_free = dataobject_free_freelist;
+    }
+
+    size_ob = PyLong_FromSsize_t(maxsize);
+    if (size_ob == NULL)
+        return NULL;
+    if (PyDict_SetItem(tp->tp_dict, __freelist_size__name, size_ob) < 0) {
+        Py_DECREF(size_ob);
+        return NULL;
+    }
+    Py_DECREF(size_ob);
+    PyType_Modified(tp);
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(freelist_info_doc,
+"freelist_info(cls) -- dict with the state and counters of the free list of instances of the class");
+
+static PyObject *
+freelist_info(PyObject *module, PyObject *cls)
+{
+    dataobject_freelist *fl;
+
+    if (!PyType_Check(cls)) {
+        PyErr_SetString(PyExc_TypeError, "argument should be a class");
+        return NULL;
+    }
+    fl = _dataobject_freelist((PyTypeObject*)cls);
+    if (fl == NULL) {
+        PyErr_Format(PyExc_TypeError, "class %s has no free list", ((PyTypeObject*)cls)->tp_name);
+        return NULL;
+    }
+
+    return Py_BuildValue("{snsnsnsnsnsn}",
+                         "size", fl->size,
+                         "maxsize", fl->maxsize,
+                         "hits", fl->hits,
+                         "misses", fl->misses,
+                         "arena", fl->arena,
+                         "slabs", fl->n_slabs);
+}
+
+/* buffer protocol of classes with native fields only:
+   homogeneous fields are exported as 1-d array of int64 or double,
+   others as a 0-d struct with the format __native_kinds__ */
+
+static Py_ssize_t native_item_stride = sizeof(PyObject*);
+
+static int
+_dataobject_getbuffer(PyObject *op, Py_buffer *view, int flags, int readonly)
+{
+    PyTypeObject *type = Py_TYPE(op);
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    const char *kinds;
+    int homogeneous = 1;
+    Py_ssize_t i;
+
+    if (view == NULL) {
+        PyErr_SetString(PyExc_BufferError, "view==NULL argument is obsolete");
+        return -1;
+    }
+
+    kinds = PyDataObject_IS_NATIVE(type) ? _dataobject_native_kinds(type) : NULL;
+    if (kinds == NULL) {
+        PyErr_Clear();
+        PyErr_Format(PyExc_BufferError, "%s has not native fields", type->tp_name);
+        return -1;
+    }
+    for (i = 0; i < n_items; i++) {
+        if (kinds[i] == NATIVE_OBJECT) {
+            PyErr_Format(PyExc_BufferError, "%s has not only native fields", type->tp_name);
+            return -1;
+        }
+        if (kinds[i] != kinds[0])
+            homogeneous = 0;
+    }
+    if (readonly && (flags & PyBUF_WRITABLE)) {
+        PyErr_SetString(PyExc_BufferError, "object is not writable");
+        return -1;
+    }
+
+    view->buf = (void*)PyDataObject_ITEMS(op);
+    Py_INCREF(op);
+    view->obj = op;
+    view->len = n_items * sizeof(PyObject*);
+    view->readonly = readonly;
+    view->suboffsets = NULL;
+    view->internal = NULL;
+    if (homogeneous) {
+        view->itemsize = sizeof(PyObject*);
+        view->ndim = 1;
+        view->format = (kinds[0] == NATIVE_INT64) ? "q" : "d";
+        view->shape = (flags & PyBUF_ND) ? &type->tp_itemsize : NULL;
+        view->strides = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? &native_item_stride : NULL;
+    }
+    else {
+        view->itemsize = view->len;
+        view->ndim = 0;
+        view->format = (char*)kinds;
+        view->shape = NULL;
+        view->strides = NULL;
+    }
+    if (!(flags & PyBUF_FORMAT))
+        view->format = NULL;
+
+    return 0;
+}
+
+static int
+dataobject_getbuffer(PyObject *op, Py_buffer *view, int flags)
+{
+    return _dataobject_getbuffer(op, view, flags, 0);
+}
+
+static int
+dataobject_getbuffer_readonly(PyObject *op, Py_buffer *view, int flags)
+{
+    return _dataobject_getbuffer(op, view, flags, 1);
+}
+
+/* check that the class has only native int64/double fields */
+static int
+_dataobject_check_numeric(PyTypeObject *tp)
+{
+    const char *kinds;
+    Py_ssize_t i;
+
+    if (!PyType_Check(tp) || !PyType_IsSubtype(tp, &PyDataObject_Type) || !PyDataObject_IS_NATIVE(tp)) {
+        PyErr_SetString(PyExc_TypeError, "class with native fields is expected");
+        return -1;
+    }
+    kinds = _dataobject_native_kinds(tp);
+    if (kinds == NULL)
+        return -1;
+    for (i = 0; i < PyDataObject_NUMITEMS(tp); i++) {
+        if (kinds[i] == NATIVE_OBJECT) {
+            PyErr_Format(PyExc_TypeError, "%s has not only native fields", tp->tp_name);
+            return -1;
+        }
+    }
+    return 0;
+}
+
+PyDoc_STRVAR(_native_pack_doc,
+"_native_pack(cls, lst) -- bytes with the values of fields of instances of the class with native fields");
+
+static PyObject *
+_native_pack(PyObject *module, PyObject *args)
+{
+    PyTypeObject *tp;
+    PyObject *lst, *result;
+    Py_ssize_t i, n, size;
+    char *buf;
+
+    if (!PyArg_ParseTuple(args, "OO!:_native_pack", &tp, &PyList_Type, &lst))
+        return NULL;
+    if (_dataobject_check_numeric(tp) < 0)
+        return NULL;
+
+    n = PyList_GET_SIZE(lst);
+    size = PyDataObject_NUMITEMS(tp) * sizeof(PyObject*);
+    result = PyBytes_FromStringAndSize(NULL, n * size);
+    if (result == NULL)
+        return NULL;
+
+    buf = PyBytes_AS_STRING(result);
+    for (i = 0; i < n; i++) {
+        PyObject *ob = PyList_GET_ITEM(lst, i);
+        if (Py_TYPE(ob) != tp) {
+            PyErr_Format(PyExc_TypeError, "expected an instance of %s", tp->tp_name);
+            Py_DECREF(result);
+            return NULL;
+        }
+        memcpy(buf, PyDataObject_ITEMS(ob), size);
+        buf += size;
+    }
+
+    return result;
+}
+
+PyDoc_STRVAR(_native_unpack_doc,
+"_native_unpack(cls, buffer) -- list of instances of the class with native fields created from the buffer");
+
+static PyObject *
+_native_unpack(PyObject *module, PyObject *args)
+{
+    PyTypeObject *tp;
+    PyObject *data, *result;
+    Py_buffer view;
+    Py_ssize_t i, n, size;
+    const char *buf;
+
+    if (!PyArg_ParseTuple(args, "OO:_native_unpack", &tp, &data))
+        return NULL;
+    if (_dataobject_check_numeric(tp) < 0)
+        return NULL;
+    if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) < 0)
+        return NULL;
+
+    size = PyDataObject_NUMITEMS(tp) * sizeof(PyObject*);
+    if (view.len % size) {
+        PyErr_SetString(PyExc_ValueError, "size of the buffer is not a multiple of the size of the instance");
+        PyBuffer_Release(&view);
+        return NULL;
+    }
 
-    if (!have_gc) {
-        type->tp_finalize = dataobject_finalize;
+    n = view.len / size;
+    result = PyList_New(n);
+    if (result == NULL) {
+        PyBuffer_Release(&view);
+        return NULL;
     }
 
-    Py_RETURN_NONE;
+    buf = (const char*)view.buf;
+    for (i = 0; i < n; i++) {
+        PyObject *ob = tp->tp_alloc(tp, 0);
+        if (ob == NULL) {
+            Py_DECREF(result);
+            PyBuffer_Release(&view);
+            return NULL;
+        }
+        memcpy(PyDataObject_ITEMS(ob), buf, size);
+        PyList_SET_ITEM(result, i, ob);
+        buf += size;
+    }
+
+    PyBuffer_Release(&view);
+    return result;
 }
 
-PyDoc_STRVAR(_datatype_vectorcall_doc,
+PyDoc_STRVAR(_datatype_buffer_doc,
 "");
 
 static PyObject *
-_datatype_vectorcall(PyObject *module, PyObject *cls)
+_datatype_buffer(PyObject *module, PyObject *args)
 {
-    PyTypeObject *tp = (PyTypeObject *)cls;
+    PyTypeObject *tp;
+    int readonly;
+    const char *kinds;
+    Py_ssize_t i;
 
-    tp->tp_new = dataobject_new_basic;
-    tp->tp_init = dataobject_init_basic;
+    if (!PyArg_ParseTuple(args, "Op:_datatype_buffer", &tp, &readonly))
+        return NULL;
 
-#if PY_VERSION_HEX >= 0x030A0000
-    tp->tp_vectorcall_offset = offsetof(PyTypeObject, tp_vectorcall);
-    tp->tp_vectorcall = dataobject_vectorcall;
-    tp->tp_flags |= Py_TPFLAGS_HAVE_VECTORCALL;
-    // tp->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
-    // printf("vc\n");
-#endif
+    if (!PyDataObject_IS_NATIVE(tp)) {
+        PyErr_SetString(PyExc_TypeError, "buffer protocol is supported only for classes with native fields");
+        return NULL;
+    }
+    kinds = _dataobject_native_kinds(tp);
+    if (kinds == NULL)
+        return NULL;
+    if (tp->tp_as_buffer == NULL) {
+        PyErr_SetString(PyExc_TypeError, "class has not buffer slots");
+        return NULL;
+    }
+
+    tp->tp_as_buffer->bf_getbuffer = readonly ? dataobject_getbuffer_readonly : dataobject_getbuffer;
+    tp->tp_as_buffer->bf_releasebuffer = NULL;
+    for (i = 0; i < PyDataObject_NUMITEMS(tp); i++) {
+        if (kinds[i] == NATIVE_OBJECT) {
+            tp->tp_as_buffer->bf_getbuffer = NULL;
+            break;
+        }
+    }
 
     Py_RETURN_NONE;
 }
 
-
-PyDoc_STRVAR(_datatype_immutable_doc,
+PyDoc_STRVAR(_datatype_native_doc,
 "");
 
 static PyObject *
-_datatype_immutable(PyObject *module, PyObject *cls)
+_datatype_native(PyObject *module, PyObject *cls)
 {
-#if PY_VERSION_HEX >= 0x030A0000
     PyTypeObject *tp = (PyTypeObject*)cls;
 
-    tp->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
-#endif
-
-    Py_RETURN_NONE;
-}
+    if (sizeof(PyObject*) != sizeof(double) || sizeof(PyObject*) != sizeof(int64_t)) {
+        PyErr_SetString(PyExc_TypeError, "native fields are supported only on 64-bit platforms");
+        return NULL;
+    }
 
-PyDoc_STRVAR(_datatype_copy_default_doc,
-"");
+    PyObject *kinds = PyDict_GetItemWithError(tp->tp_dict, __native_kinds__name);
+    if (kinds == NULL) {
+        if (!PyErr_Occurred())
+            PyErr_SetString(PyExc_TypeError, "__native_kinds__ is missing");
+        return NULL;
+    }
+    if (!PyBytes_Check(kinds) || PyBytes_GET_SIZE(kinds) != PyDataObject_NUMITEMS(tp)) {
+        PyErr_SetString(PyExc_TypeError, "__native_kinds__ should be bytes with the kind of each field");
+        return NULL;
+    }
 
-static PyObject *
-_datatype_copy_default(PyObject *module, PyObject *cls) //, PyObject *kw)
-{
-    PyTypeObject *tp = (PyTypeObject*)cls;
+    if (tp->tp_flags & Py_TPFLAGS_HAVE_GC) {
+        PyErr_SetString(PyExc_TypeError, "native fields are not compatible with gc=True");
+        return NULL;
+    }
+    if (tp->tp_finalize) {
+        PyErr_SetString(PyExc_TypeError, "native fields are not compatible with deep_dealloc=True");
+        return NULL;
+    }
 
-    tp->tp_new = dataobject_new_copy_default;
-    // tp->tp_init = dataobject_init_copy_default;
+    tp->tp_dealloc = dataobject_dealloc_native;
 
     Py_RETURN_NONE;
 }
@@ -2505,10 +5013,30 @@ _astuple(PyObject *op)
     Py_ssize_t i;
 
     PyObject *tpl = PyTuple_New(n);
+    if (tpl == NULL)
+        return NULL;
+
+    if (PyDataObject_IS_NATIVE(Py_TYPE(op))) {
+        const char *kinds = _dataobject_native_kinds(Py_TYPE(op));
+        if (kinds == NULL) {
+            Py_DECREF(tpl);
+            return NULL;
+        }
+        for (i=0; i<n; i++) {
+            PyObject *v = _native_get(PyDataObject_ITEMS(op) + i, kinds[i]);
+            if (v == NULL) {
+                Py_DECREF(tpl);
+                return NULL;
+            }
+            PyTuple_SET_ITEM(tpl, i, v);
+        }
+        return tpl;
+    }
+
     for (i=0; i<n; i++) {
         PyObject *v = PyDataObject_GET_ITEM(op, i);
         Py_INCREF(v);
-        PyTuple_SetItem(tpl, i, v);
+        PyTuple_SET_ITEM(tpl, i, v);
     }
 
 //     if (n == nn) goto TOEND;
@@ -2539,38 +5067,82 @@ _astuple(PyObject *op)
     return (PyObject*)tpl;
 }
 
+#if PY_VERSION_HEX < 0x030D0000
+#define _dict_new_presized(n) _PyDict_NewPresized(n)
+#else
+#define _dict_new_presized(n) PyDict_New()
+#endif
+
 static PyObject *
-_asdict(PyObject *op)
+_dataobject_fields(PyTypeObject *type)
 {
-    Py_ssize_t i;
-    PyObject *fn, *v;
+    PyObject *fields = PyDict_GetItemWithError(type->tp_dict, __fields__name);
 
-    PyObject *fields = PyObject_GetAttrString((PyObject*)Py_TYPE(op), "__fields__");
-
-    if (!fields)
-        return NULL;
+    if (fields == NULL) {
+        if (PyErr_Occurred())
+            return NULL;
+        fields = PyObject_GetAttr((PyObject*)type, __fields__name);
+        if (fields == NULL)
+            return NULL;
+    } else
+        Py_INCREF(fields);
 
-    if (!PyObject_IsInstance(fields, (PyObject*)&PyTuple_Type)) {
+    if (!PyTuple_Check(fields)) {
+        Py_DECREF(fields);
         PyErr_SetString(PyExc_TypeError, "__fields__ should be a tuple");
         return NULL;
     }
 
-    const Py_ssize_t n = Py_SIZE(fields);
-    PyObject *dict = PyDict_New();
+    return fields;
+}
 
-    if (n == 0) {
-        Py_DECREF(fields);
+static PyObject *
+_asdict_fields(PyObject *op, PyObject *fields)
+{
+    const Py_ssize_t n = PyTuple_GET_SIZE(fields);
+    Py_ssize_t i;
+
+    PyObject *dict = _dict_new_presized(n);
+    if (dict == NULL)
+        return NULL;
+
+    if (PyDataObject_IS_NATIVE(Py_TYPE(op))) {
+        for (i=0; i<n; i++) {
+            PyObject *v = dataobject_get_native_item(op, i);
+            if (v == NULL) {
+                Py_DECREF(dict);
+                return NULL;
+            }
+            int retval = PyDict_SetItem(dict, PyTuple_GET_ITEM(fields, i), v);
+            Py_DECREF(v);
+            if (retval < 0) {
+                Py_DECREF(dict);
+                return NULL;
+            }
+        }
         return dict;
     }
 
     for (i=0; i<n; i++) {
-        fn = PyTuple_GET_ITEM(fields, i);
-        Py_INCREF(fn);
-        v = PyDataObject_GET_ITEM(op, i);
-        Py_INCREF(v);
-        PyDict_SetItem(dict, fn, v);
+        PyObject *fn = PyTuple_GET_ITEM(fields, i);
+        PyObject *v = PyDataObject_GET_ITEM(op, i);
+        if (PyDict_SetItem(dict, fn, v) < 0) {
+            Py_DECREF(dict);
+            return NULL;
+        }
     }
 
+    return dict;
+}
+
+static PyObject *
+_asdict(PyObject *op)
+{
+    PyObject *fields = _dataobject_fields(Py_TYPE(op));
+    if (fields == NULL)
+        return NULL;
+
+    PyObject *dict = _asdict_fields(op, fields);
     Py_DECREF(fields);
     return dict;
 }
@@ -2618,6 +5190,262 @@ astuple(PyObject *module, PyObject *args)
     return _astuple(op);
 }
 
+static int
+_dataobject_check(PyObject *op)
+{
+    if (!PyObject_TypeCheck(op, &PyDataObject_Type) &&
+        !PyObject_TypeCheck(op, &PyDataStruct_Type)) {
+        type_error("%s is not an instance of dataobject or datastruct", op);
+        return 0;
+    }
+    return 1;
+}
+
+PyDoc_STRVAR(asdict_many_doc,
+"Convert the sequence of objects to the list of dicts");
+
+static PyObject *
+asdict_many(PyObject *module, PyObject *obs)
+{
+    PyTypeObject *last_type = NULL;
+    PyObject *fields = NULL;
+    Py_ssize_t i, n;
+
+    PyObject *seq = PySequence_Fast(obs, "argument should be a sequence");
+    if (seq == NULL)
+        return NULL;
+
+    n = PySequence_Fast_GET_SIZE(seq);
+    PyObject *result = PyList_New(n);
+    if (result == NULL)
+        goto error;
+
+    for (i = 0; i < n; i++) {
+        PyObject *op = PySequence_Fast_GET_ITEM(seq, i);
+        PyTypeObject *type = Py_TYPE(op);
+
+        if (type != last_type) {
+            if (!_dataobject_check(op))
+                goto error;
+            Py_XDECREF(fields);
+            fields = _dataobject_fields(type);
+            if (fields == NULL)
+                goto error;
+            last_type = type;
+        }
+
+        PyObject *dict = _asdict_fields(op, fields);
+        if (dict == NULL)
+            goto error;
+        PyList_SET_ITEM(result, i, dict);
+    }
+
+    Py_XDECREF(fields);
+    Py_DECREF(seq);
+    return result;
+
+error:
+    Py_XDECREF(fields);
+    Py_XDECREF(result);
+    Py_DECREF(seq);
+    return NULL;
+}
+
+PyDoc_STRVAR(astuple_many_doc,
+"Convert the sequence of objects to the list of tuples");
+
+static PyObject *
+astuple_many(PyObject *module, PyObject *obs)
+{
+    PyTypeObject *last_type = NULL;
+    Py_ssize_t i, n;
+
+    PyObject *seq = PySequence_Fast(obs, "argument should be a sequence");
+    if (seq == NULL)
+        return NULL;
+
+    n = PySequence_Fast_GET_SIZE(seq);
+    PyObject *result = PyList_New(n);
+    if (result == NULL)
+        goto error;
+
+    for (i = 0; i < n; i++) {
+        PyObject *op = PySequence_Fast_GET_ITEM(seq, i);
+
+        if (Py_TYPE(op) != last_type) {
+            if (!_dataobject_check(op))
+                goto error;
+            last_type = Py_TYPE(op);
+        }
+
+        PyObject *tpl = _astuple(op);
+        if (tpl == NULL)
+            goto error;
+        PyList_SET_ITEM(result, i, tpl);
+    }
+
+    Py_DECREF(seq);
+    return result;
+
+error:
+    Py_XDECREF(result);
+    Py_DECREF(seq);
+    return NULL;
+}
+
+static PyObject *
+_dataobject_from_dict(PyTypeObject *type, PyObject *dict, PyObject *fields_index,
+                      PyObject *default_vals, int copy_default)
+{
+    const Py_ssize_t n_items = PyDataObject_NUMITEMS(type);
+    PyObject *key, *val;
+    Py_ssize_t i, pos = 0;
+    int has_extra = 0;
+
+    PyObject *op = type->tp_alloc(type, 0);
+    if (op == NULL)
+        return NULL;
+
+    PyObject **items = PyDataObject_ITEMS(op);
+    for (i = 0; i < n_items; i++)
+        items[i] = NULL;
+
+    while (PyDict_Next(dict, &pos, &key, &val)) {
+        i = _dataobject_field_index(type, fields_index, key);
+        if (i < 0) {
+            if (PyErr_Occurred())
+                goto error;
+            if (!type->tp_dictoffset) {
+                PyErr_Format(PyExc_TypeError, "Invalid key: %R not in __fields__", key);
+                goto error;
+            }
+            has_extra = 1;
+            continue;
+        }
+        Py_INCREF(val);
+        Py_XSETREF(items[i], val);
+    }
+
+    for (i = 0; i < n_items; i++) {
+        if (items[i] == NULL) {
+            val = _default_value(default_vals, i, copy_default);
+            if (val == NULL)
+                goto error;
+            items[i] = val;
+        }
+    }
+
+    if (has_extra) {
+        pos = 0;
+        while (PyDict_Next(dict, &pos, &key, &val)) {
+            int is_field = PyDict_Contains(fields_index, key);
+            if (is_field < 0)
+                goto error;
+            if (is_field)
+                continue;
+            if (PyObject_SetAttr(op, key, val) < 0)
+                goto error;
+        }
+    }
+
+    return op;
+
+error:
+    Py_DECREF(op);
+    return NULL;
+}
+
+PyDoc_STRVAR(from_dicts_doc,
+"Create the list of instances of the class from the iterable of dicts");
+
+static PyObject *
+from_dicts(PyObject *module, PyObject *args)
+{
+    PyObject *cls, *dicts, *iter = NULL, *dict;
+    PyObject *fields_index = NULL, *default_vals = NULL;
+    PyTypeObject *type;
+    int copy_default;
+
+    if (!PyArg_UnpackTuple(args, "from_dicts", 2, 2, &cls, &dicts))
+        return NULL;
+
+    if (!PyType_Check(cls) ||
+        (!PyType_IsSubtype((PyTypeObject*)cls, &PyDataObject_Type) &&
+         !PyType_IsSubtype((PyTypeObject*)cls, &PyDataStruct_Type))) {
+        PyErr_SetString(PyExc_TypeError, "1st argument should be subclass of dataobject or datastruct");
+        return NULL;
+    }
+    type = (PyTypeObject*)cls;
+
+    const int fast_new = _dataobject_fast_new(type, &copy_default);
+
+    Py_ssize_t n_hint = PyObject_LengthHint(dicts, 0);
+    if (n_hint < 0)
+        return NULL;
+    if (n_hint > DATAOBJECT_MAXPREALLOC)
+        n_hint = DATAOBJECT_MAXPREALLOC;
+
+    PyObject *result = PyList_New(n_hint);
+    if (result == NULL)
+        return NULL;
+    Py_SET_SIZE(result, 0);
+
+    if (fast_new) {
+        fields_index = _dataobject_fields_index(type);
+        if (fields_index == NULL)
+            goto error;
+        Py_INCREF(fields_index);
+
+        default_vals = PyDict_GetItemWithError(type->tp_dict, __default_vals__name);
+        if (default_vals == NULL && PyErr_Occurred())
+            goto error;
+        Py_XINCREF(default_vals);
+    }
+
+    iter = PyObject_GetIter(dicts);
+    if (iter == NULL)
+        goto error;
+
+    while ((dict = PyIter_Next(iter))) {
+        PyObject *op;
+
+        if (!PyDict_Check(dict)) {
+            PyErr_Format(PyExc_TypeError, "expected dict, got %s", Py_TYPE(dict)->tp_name);
+            Py_DECREF(dict);
+            goto error;
+        }
+
+        if (fast_new)
+            op = _dataobject_from_dict(type, dict, fields_index, default_vals, copy_default);
+        else
+            op = PyObject_Call(cls, empty_tuple, dict);
+        Py_DECREF(dict);
+        if (op == NULL)
+            goto error;
+
+        if (PyList_Append(result, op) < 0) {
+            Py_DECREF(op);
+            goto error;
+        }
+        Py_DECREF(op);
+    }
+
+    if (PyErr_Occurred())
+        goto error;
+
+    Py_DECREF(iter);
+    Py_XDECREF(fields_index);
+    Py_XDECREF(default_vals);
+    return result;
+
+error:
+    Py_XDECREF(iter);
+    Py_XDECREF(fields_index);
+    Py_XDECREF(default_vals);
+    Py_DECREF(result);
+    return NULL;
+}
+
 PyDoc_STRVAR(dataobject_make_doc,
 "Create a new dataobject-based object");
 
@@ -2649,7 +5477,8 @@ dataobject_make(PyObject *module, PyObject *type_args, PyObject *kw)
     Py_INCREF(type);
 
     PyObject *ret =  dataobject_new_empty(type);
-    dataobject_init(ret, args, kw);
+    if (ret && dataobject_init(ret, args, kw) < 0)
+        Py_CLEAR(ret);
 
     Py_XDECREF(args);
     Py_DECREF(type);
@@ -2835,6 +5664,27 @@ _is_readonly_member(PyObject *module, PyObject *args)
 PyDoc_STRVAR(is_readonly_member_doc,
 "Test property for readonly");
 
+PyDoc_STRVAR(_instance_dict_doc,
+"Return __dict__ of the instance or None if it isn't created yet");
+
+static PyObject *
+_instance_dict(PyObject *module, PyObject *op)
+{
+    PyTypeObject *type = Py_TYPE(op);
+
+    if (!_dataobject_check(op))
+        return NULL;
+
+    if (type->tp_dictoffset) {
+        PyObject **dictptr = PyDataObject_DICTPTR(type, op);
+        if (dictptr && *dictptr) {
+            Py_INCREF(*dictptr);
+            return *dictptr;
+        }
+    }
+    Py_RETURN_NONE;
+}
+
 //////////////////////////////////////////////////
 
 PyDoc_STRVAR(dataobjectmodule_doc,
@@ -2843,9 +5693,14 @@ PyDoc_STRVAR(dataobjectmodule_doc,
 static PyMethodDef dataobjectmodule_methods[] = {
     {"asdict", asdict, METH_VARARGS, asdict_doc},
     {"astuple", astuple, METH_VARARGS, astuple_doc},
+    {"asdict_many", asdict_many, METH_O, asdict_many_doc},
+    {"astuple_many", astuple_many, METH_O, astuple_many_doc},
+    {"sort_records", (PyCFunction)(void(*)(void))sort_records, METH_VARARGS|METH_KEYWORDS, sort_records_doc},
+    {"from_dicts", from_dicts, METH_VARARGS, from_dicts_doc},
     {"_datatype_collection_mapping", _datatype_collection_mapping, METH_VARARGS, _datatype_collection_mapping_doc},
     {"_datatype_from_basetype_hashable", _datatype_from_basetype_hashable, METH_O, _datatype_from_basetype_hashable_doc},
     {"_datatype_hashable", _datatype_hashable, METH_O, _datatype_hashable_doc},
+    {"_datatype_cache_hash", _datatype_cache_hash, METH_O, _datatype_cache_hash_doc},
     {"_datatype_from_basetype_iterable", _datatype_from_basetype_iterable, METH_O, _datatype_from_basetype_iterable_doc},
     {"_datatype_iterable", _datatype_iterable, METH_O, _datatype_iterable_doc},
     {"_datatype_use_dict", _datatype_use_dict, METH_O, _datatype_use_dict_doc},
@@ -2855,6 +5710,12 @@ static PyMethodDef dataobjectmodule_methods[] = {
     {"_datatype_vectorcall", _datatype_vectorcall, METH_O, _datatype_vectorcall_doc},
     {"_datatype_immutable", _datatype_immutable, METH_O, _datatype_immutable_doc},
     {"_datatype_copy_default", _datatype_copy_default, METH_O, _datatype_copy_default_doc},
+    {"_datatype_native", _datatype_native, METH_O, _datatype_native_doc},
+    {"_datatype_buffer", _datatype_buffer, METH_VARARGS, _datatype_buffer_doc},
+    {"_native_pack", _native_pack, METH_VARARGS, _native_pack_doc},
+    {"_native_unpack", _native_unpack, METH_VARARGS, _native_unpack_doc},
+    {"_datatype_freelist", _datatype_freelist, METH_VARARGS, _datatype_freelist_doc},
+    {"freelist_info", freelist_info, METH_O, freelist_info_doc},
     // {"new", (PyCFunction)dataobject_new_instance, METH_VARARGS | METH_KEYWORDS, dataobject_new_doc},
     {"make", (PyCFunction)dataobject_make, METH_VARARGS | METH_KEYWORDS, dataobject_make_doc},
     {"clone", (PyCFunction)dataobject_clone, METH_VARARGS | METH_KEYWORDS, dataobject_clone_doc},
@@ -2863,6 +5724,7 @@ static PyMethodDef dataobjectmodule_methods[] = {
     {"_pytype_modified", (PyCFunction)_pytype_modified, METH_VARARGS , _pytype_modified_doc},
     {"member_new", member_new, METH_VARARGS, member_new_doc},
     {"_is_readonly_member", _is_readonly_member, METH_VARARGS, is_readonly_member_doc},
+    {"_instance_dict", _instance_dict, METH_O, _instance_dict_doc},
     {0, 0, 0, 0}
 };
 
@@ -2900,6 +5762,14 @@ PyInit__dataobject(void)
     __fix_type((PyObject*)&PyDataStruct_Type, datatype);
     Py_DECREF(datatype);
 
+#if PY_VERSION_HEX >= 0x030A0000 && PY_VERSION_HEX < 0x030C0000
+    // before 3.12 heap subclasses of type don't inherit vectorcall,
+    // so calls of the classes would never reach their tp_vectorcall
+    if (datatype->tp_call == PyType_Type.tp_call &&
+            datatype->tp_vectorcall_offset == offsetof(PyTypeObject, tp_vectorcall))
+        datatype->tp_flags |= Py_TPFLAGS_HAVE_VECTORCALL;
+#endif
+
     if (PyType_Ready(&PyDataObject_Type) < 0)
         Py_FatalError("Can't initialize dataobject type");
 
@@ -2912,6 +5782,9 @@ PyInit__dataobject(void)
     if (PyType_Ready(&PyDataObjectProperty_Type) < 0)
         Py_FatalError("Can't initialize dataobjectproperty type");
 
+    if (PyType_Ready(&PyDataObjectSortKey_Type) < 0)
+        return NULL;
+
     if (PyType_Ready(&PyFactory_Type) < 0)
         Py_FatalError("Can't initialize Factory type");
 
@@ -2930,6 +5803,9 @@ PyInit__dataobject(void)
     Py_INCREF(&PyFactory_Type);
     PyModule_AddObject(m, "Factory", (PyObject *)&PyFactory_Type);
 
+    if (_dataobject_add_namedtuple_api(m) < 0)
+        return NULL;
+
     // pydataobject_make = PyObject_GetAttrString(m, "make");
     // Py_INCREF(pydataobject_make);
 
@@ -2953,6 +5829,22 @@ PyInit__dataobject(void)
     if (__default_vals__name == NULL)
         return NULL;
 
+    __fields_index__name = PyUnicode_InternFromString("__fields_index__");
+    if (__fields_index__name == NULL)
+        return NULL;
+
+    __freelist__name = PyUnicode_InternFromString("__freelist__");
+    if (__freelist__name == NULL)
+        return NULL;
+
+    __freelist_size__name = PyUnicode_InternFromString("__freelist_size__");
+    if (__freelist_size__name == NULL)
+        return NULL;
+
+    __native_kinds__name = PyUnicode_InternFromString("__native_kinds__");
+    if (__native_kinds__name == NULL)
+        return NULL;
+
     __init__name = PyUnicode_FromString("__init__");
     if (__init__name == NULL)
         return NULL;
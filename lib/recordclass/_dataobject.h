@@ -12,8 +12,47 @@ typedef struct {
     PyObject_HEAD
     Py_ssize_t index;
     int readonly;
+    char kind;
 } dataobjectproperty_object;
 
+/* state of the per-type free list of instances: free blocks are linked
+   through their first word; with arena > 0 new blocks are carved from
+   slabs of `arena` blocks which are released only with the class */
+typedef struct {
+    void *head;
+    Py_ssize_t size;
+    Py_ssize_t maxsize;
+    Py_ssize_t blocksize;
+    Py_ssize_t arena;
+    void *slabs;
+    char *slab_next;
+    char *slab_end;
+    Py_ssize_t n_slabs;
+    Py_ssize_t hits;
+    Py_ssize_t misses;
+} dataobject_freelist;
+
+/* per-type cache of the slot indices of keyword arguments: call sites pass
+   the same kwnames tuple on every call, so entries are keyed by its identity */
+#define KWNAMES_CACHE_SIZE 8
+
+typedef struct {
+    PyObject *kwnames;
+    Py_ssize_t *indices;
+    Py_ssize_t min_index;
+    Py_ssize_t max_index;
+} dataobject_kwnames_entry;
+
+typedef struct {
+    dataobject_kwnames_entry entries[KWNAMES_CACHE_SIZE];
+    PyObject *weakref;  /* to the class: the callback releases the cache */
+} dataobject_kwnames_cache;
+
+/* kinds of the fields of classes with native=True */
+#define NATIVE_OBJECT 'O'
+#define NATIVE_INT64 'q'
+#define NATIVE_DOUBLE 'd'
+
 
 #define PyDataObject_ITEMS(op) (PyObject**)(((PyDataStruct*)op)->ob_items)
 
@@ -27,6 +66,7 @@ typedef struct {
 #define PyDataObject_WEAKLISTPTR(type, op) ((PyObject**)((char*)op + type->tp_weaklistoffset))
 #define PyDataObject_HAS_DICT(type) (type->tp_dictoffset != 0)
 #define PyDataObject_HAS_WEAKLIST(type) (type->tp_weaklistoffset != 0)
+#define PyDataObject_HASHPTR(type, op) ((Py_hash_t*)((char*)(op) + (type)->tp_basicsize - sizeof(Py_hash_t)))
 
 #define Py_TP_BASE(o) (Py_TYPE(o)->tp_base)
 #define Py_METATYPE(o) Py_TYPE(Py_TYPE(o))
@@ -3,6 +3,7 @@
 /* BEGIN: Cython Metadata
 {
     "distutils": {
+        "depends": [],
         "name": "recordclass._linkedlist",
         "sources": [
             "lib/recordclass/_linkedlist.pyx"
@@ -1129,6 +1130,8 @@ static int __Pyx_init_co_variables(void) {
 #define __PYX_HAVE__recordclass___linkedlist
 #define __PYX_HAVE_API__recordclass___linkedlist
 /* Early includes */
+#include <string.h>
+#include <stdio.h>
 #ifdef _OPENMP
 #include <omp.h>
 #endif /* _OPENMP */
@@ -1347,6 +1350,7 @@ static const char *__pyx_filename;
 static const char* const __pyx_f[] = {
   "lib/recordclass/_linkedlist.pyx",
   "<stringsource>",
+  "cpython/type.pxd",
 };
 /* #### Code section: utility_code_proto_before_types ### */
 /* Atomics.proto (used by UnpackUnboundCMethod) */
@@ -1529,9 +1533,36 @@ struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist;
 struct DLinkedItem;
 struct DLinkedList;
 struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist;
+struct ChunkedList;
+struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist;
+struct __pyx_t_11recordclass_11_linkedlist_chunk;
+
+/* "recordclass/_linkedlist.pyx":210
+ * # items is sequential in memory
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     CHUNK_SIZE = 62  # the chunk with links takes 512 bytes
+ * 
+*/
+enum  {
+  __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE = 62
+};
+
+/* "recordclass/_linkedlist.pyx":213
+ *     CHUNK_SIZE = 62  # the chunk with links takes 512 bytes
+ * 
+ * cdef struct chunk:             # <<<<<<<<<<<<<<
+ *     chunk *prev
+ *     chunk *next
+*/
+struct __pyx_t_11recordclass_11_linkedlist_chunk {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *prev;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *next;
+  PyObject *items[__pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE];
+};
 
-/* "recordclass/_linkedlist.pyx":34
- * cimport cython
+/* "recordclass/_linkedlist.pyx":36
+ * from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
  * 
  * @cython.no_gc             # <<<<<<<<<<<<<<
  * @cython.final
@@ -1545,7 +1576,7 @@ struct LinkedItem {
 
 __PYX_EXTERN_C DL_EXPORT(PyTypeObject) LinkedItemType;
 
-/* "recordclass/_linkedlist.pyx":40
+/* "recordclass/_linkedlist.pyx":42
  *     cdef linkeditem next
  * 
  * @cython.final             # <<<<<<<<<<<<<<
@@ -1561,7 +1592,7 @@ struct LinkedList {
 
 __PYX_EXTERN_C DL_EXPORT(PyTypeObject) LinkedListType;
 
-/* "recordclass/_linkedlist.pyx":95
+/* "recordclass/_linkedlist.pyx":97
  *         return iterlinkedlist(self)
  * 
  * @cython.final             # <<<<<<<<<<<<<<
@@ -1574,7 +1605,7 @@ struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist {
 };
 
 
-/* "recordclass/_linkedlist.pyx":113
+/* "recordclass/_linkedlist.pyx":115
  *         return val
  * 
  * @cython.no_gc             # <<<<<<<<<<<<<<
@@ -1590,7 +1621,7 @@ struct DLinkedItem {
 
 __PYX_EXTERN_C DL_EXPORT(PyTypeObject) DLinkedItemType;
 
-/* "recordclass/_linkedlist.pyx":120
+/* "recordclass/_linkedlist.pyx":122
  *     cdef linkeditem prev
  * 
  * @cython.final             # <<<<<<<<<<<<<<
@@ -1606,7 +1637,7 @@ struct DLinkedList {
 
 __PYX_EXTERN_C DL_EXPORT(PyTypeObject) DLinkedListType;
 
-/* "recordclass/_linkedlist.pyx":184
+/* "recordclass/_linkedlist.pyx":186
  *         return iterdlinkedlist(self.start)
  * 
  * @cython.final             # <<<<<<<<<<<<<<
@@ -1619,9 +1650,47 @@ struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist {
 };
 
 
+/* "recordclass/_linkedlist.pyx":218
+ *     PyObject *items[CHUNK_SIZE]
+ * 
+ * @cython.final             # <<<<<<<<<<<<<<
+ * cdef public class chunkedlist[object ChunkedList, type ChunkedListType]:
+ *     cdef chunk *head
+*/
+struct ChunkedList {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_11recordclass_11_linkedlist_chunkedlist *__pyx_vtab;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *head;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *tail;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *spare;
+  Py_ssize_t first;
+  Py_ssize_t last;
+  Py_ssize_t size;
+  Py_ssize_t state;
+};
+
+__PYX_EXTERN_C DL_EXPORT(PyTypeObject) ChunkedListType;
+
+/* "recordclass/_linkedlist.pyx":417
+ *         return "chunkedlist(%r)" % list(self)
+ * 
+ * @cython.final             # <<<<<<<<<<<<<<
+ * cdef class iterchunkedlist:
+ *     cdef chunkedlist lst
+*/
+struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist {
+  PyObject_HEAD
+  struct ChunkedList *lst;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *node;
+  Py_ssize_t index;
+  Py_ssize_t count;
+  Py_ssize_t state;
+};
+
+
 __PYX_EXTERN_C DL_EXPORT(PyTypeObject) LinkedListType;
 
-/* "recordclass/_linkedlist.pyx":40
+/* "recordclass/_linkedlist.pyx":42
  *     cdef linkeditem next
  * 
  * @cython.final             # <<<<<<<<<<<<<<
@@ -1641,7 +1710,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct Lin
 
 __PYX_EXTERN_C DL_EXPORT(PyTypeObject) DLinkedListType;
 
-/* "recordclass/_linkedlist.pyx":120
+/* "recordclass/_linkedlist.pyx":122
  *     cdef linkeditem prev
  * 
  * @cython.final             # <<<<<<<<<<<<<<
@@ -1654,6 +1723,38 @@ struct __pyx_vtabstruct_11recordclass_11_linkedlist_dlinkedlist {
 };
 static struct __pyx_vtabstruct_11recordclass_11_linkedlist_dlinkedlist *__pyx_vtabptr_11recordclass_11_linkedlist_dlinkedlist;
 static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct DLinkedList *, PyObject *, int __pyx_skip_dispatch);
+
+__PYX_EXTERN_C DL_EXPORT(PyTypeObject) ChunkedListType;
+
+/* "recordclass/_linkedlist.pyx":218
+ *     PyObject *items[CHUNK_SIZE]
+ * 
+ * @cython.final             # <<<<<<<<<<<<<<
+ * cdef public class chunkedlist[object ChunkedList, type ChunkedListType]:
+ *     cdef chunk *head
+*/
+
+struct __pyx_vtabstruct_11recordclass_11_linkedlist_chunkedlist {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *(*new_chunk)(struct ChunkedList *);
+  void (*release_chunk)(struct ChunkedList *, struct __pyx_t_11recordclass_11_linkedlist_chunk *);
+  PyObject *(*append)(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*appendleft)(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*extend)(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*pop)(struct ChunkedList *, int __pyx_skip_dispatch);
+  PyObject *(*popleft)(struct ChunkedList *, int __pyx_skip_dispatch);
+  void (*free_chunks)(struct ChunkedList *, struct __pyx_t_11recordclass_11_linkedlist_chunk *, Py_ssize_t, Py_ssize_t);
+  PyObject *(*clear)(struct ChunkedList *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_11recordclass_11_linkedlist_chunkedlist *__pyx_vtabptr_11recordclass_11_linkedlist_chunkedlist;
+static struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_new_chunk(struct ChunkedList *);
+static void __pyx_f_11recordclass_11_linkedlist_11chunkedlist_release_chunk(struct ChunkedList *, struct __pyx_t_11recordclass_11_linkedlist_chunk *);
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_append(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch);
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_appendleft(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch);
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_extend(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch);
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_pop(struct ChunkedList *, int __pyx_skip_dispatch);
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_popleft(struct ChunkedList *, int __pyx_skip_dispatch);
+static void __pyx_f_11recordclass_11_linkedlist_11chunkedlist_free_chunks(struct ChunkedList *, struct __pyx_t_11recordclass_11_linkedlist_chunk *, Py_ssize_t, Py_ssize_t);
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_clear(struct ChunkedList *, int __pyx_skip_dispatch);
 /* #### Code section: utility_code_proto ### */
 
 /* --- Runtime support code (head) --- */
@@ -2072,6 +2173,12 @@ static void __Pyx_WriteUnraisable(const char *name, int clineno,
                                   int lineno, const char *filename,
                                   int full_traceback, int nogil);
 
+/* PyIndexError_Check.proto */
+#define __Pyx_PyExc_IndexError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_IndexError)
+
+/* PyRuntimeError_Check.proto */
+#define __Pyx_PyExc_RuntimeError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_RuntimeError)
+
 /* AllocateExtensionType.proto */
 static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final);
 
@@ -2129,6 +2236,25 @@ static void* __Pyx_GetVtable(PyTypeObject *type);
 /* MergeVTables.proto */
 static int __Pyx_MergeVtables(PyTypeObject *type);
 
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_3_2_3
+#define __PYX_HAVE_RT_ImportType_proto_3_2_3
+#if defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if (defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L) || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_3_2_3(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_3_2_3(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_3_2_3 {
+   __Pyx_ImportType_CheckSize_Error_3_2_3 = 0,
+   __Pyx_ImportType_CheckSize_Warn_3_2_3 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_3_2_3 = 2
+};
+static PyTypeObject *__Pyx_ImportType_3_2_3(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_2_3 check_size);
+#endif
+
 /* dict_setdefault.proto (used by FetchCommonType) */
 static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
 
@@ -2439,9 +2565,34 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
 static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct LinkedList *__pyx_v_self, PyObject *__pyx_v_vals, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
 static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct LinkedList *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
 static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct DLinkedList *__pyx_v_self, PyObject *__pyx_v_val, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
+static struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_new_chunk(struct ChunkedList *__pyx_v_self); /* proto*/
+static void __pyx_f_11recordclass_11_linkedlist_11chunkedlist_release_chunk(struct ChunkedList *__pyx_v_self, struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c); /* proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_append(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_val, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_appendleft(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_val, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_extend(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_vals, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_pop(struct ChunkedList *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_popleft(struct ChunkedList *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
+static void __pyx_f_11recordclass_11_linkedlist_11chunkedlist_free_chunks(CYTHON_UNUSED struct ChunkedList *__pyx_v_self, struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n); /* proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_clear(struct ChunkedList *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch); /* proto*/
 
 /* Module declarations from "cython" */
 
+/* Module declarations from "cpython.mem" */
+
+/* Module declarations from "libc.string" */
+
+/* Module declarations from "libc.stdio" */
+
+/* Module declarations from "__builtin__" */
+
+/* Module declarations from "cpython.type" */
+
+/* Module declarations from "cpython" */
+
+/* Module declarations from "cpython.object" */
+
+/* Module declarations from "cpython.ref" */
+
 /* Module declarations from "recordclass._linkedlist" */
 static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkeditem__set_state(struct LinkedItem *, PyObject *); /*proto*/
 static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkedlist__set_state(struct LinkedList *, PyObject *); /*proto*/
@@ -2499,6 +2650,25 @@ static int __pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist___init__(struc
 static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_2__next__(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_4__reduce_cython__(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_6__setstate_cython__(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *__pyx_v_self, PyObject *__pyx_v___pyx_state); /* proto */
+static int __pyx_pf_11recordclass_11_linkedlist_11chunkedlist___init__(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_vals); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_2append(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_val); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_4appendleft(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_val); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_6extend(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_vals); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_8pop(struct ChunkedList *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_10popleft(struct ChunkedList *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_12clear(struct ChunkedList *__pyx_v_self); /* proto */
+static void __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_14__dealloc__(struct ChunkedList *__pyx_v_self); /* proto */
+static Py_ssize_t __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_16__len__(struct ChunkedList *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_18__getitem__(struct ChunkedList *__pyx_v_self, Py_ssize_t __pyx_v_index); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_20__iter__(struct ChunkedList *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_22__sizeof__(struct ChunkedList *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_24__reduce__(struct ChunkedList *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_26__repr__(struct ChunkedList *__pyx_v_self); /* proto */
+static int __pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist___init__(struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self, struct ChunkedList *__pyx_v_lst); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_2__next__(struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_4__length_hint__(struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_6__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_8__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_11recordclass_11_linkedlist___pyx_unpickle_linkeditem(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
 static PyObject *__pyx_pf_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state); /* proto */
@@ -2511,6 +2681,8 @@ static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_iterlinkedlist(PyTypeO
 static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_dlinkeditem(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_dlinkedlist(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_iterdlinkedlist(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_chunkedlist(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_iterchunkedlist(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
 /* #### Code section: late_includes ### */
 /* #### Code section: module_state ### */
 /* SmallCodeConfig */
@@ -2531,24 +2703,29 @@ typedef struct {
   PyObject *__pyx_empty_tuple;
   PyObject *__pyx_empty_bytes;
   PyObject *__pyx_empty_unicode;
+  PyTypeObject *__pyx_ptype_7cpython_4type_type;
   PyObject *LinkedItemType;
   PyObject *LinkedListType;
   PyObject *__pyx_type_11recordclass_11_linkedlist_iterlinkedlist;
   PyObject *DLinkedItemType;
   PyObject *DLinkedListType;
   PyObject *__pyx_type_11recordclass_11_linkedlist_iterdlinkedlist;
+  PyObject *ChunkedListType;
+  PyObject *__pyx_type_11recordclass_11_linkedlist_iterchunkedlist;
   PyTypeObject *__pyx_ptype_11recordclass_11_linkedlist_linkeditem;
   PyTypeObject *__pyx_ptype_11recordclass_11_linkedlist_linkedlist;
   PyTypeObject *__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist;
   PyTypeObject *__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem;
   PyTypeObject *__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist;
   PyTypeObject *__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist;
+  PyTypeObject *__pyx_ptype_11recordclass_11_linkedlist_chunkedlist;
+  PyTypeObject *__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
   PyObject *__pyx_tuple[4];
-  PyObject *__pyx_codeobj_tab[22];
-  PyObject *__pyx_string_tab[100];
+  PyObject *__pyx_codeobj_tab[33];
+  PyObject *__pyx_string_tab[137];
   PyObject *__pyx_number_tab[4];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
@@ -2593,103 +2770,140 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_kp_u_ __pyx_string_tab[0]
 #define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[1]
 #define __pyx_kp_u_add_note __pyx_string_tab[2]
-#define __pyx_kp_u_disable __pyx_string_tab[3]
-#define __pyx_kp_u_enable __pyx_string_tab[4]
-#define __pyx_kp_u_gc __pyx_string_tab[5]
-#define __pyx_kp_u_isenabled __pyx_string_tab[6]
-#define __pyx_kp_u_lib_recordclass__linkedlist_pyx __pyx_string_tab[7]
-#define __pyx_kp_u_linkedlist_is_empty __pyx_string_tab[8]
-#define __pyx_kp_u_self_end_is_not_None_or_self_sta __pyx_string_tab[9]
-#define __pyx_kp_u_self_next_is_not_None_or_self_pr __pyx_string_tab[10]
-#define __pyx_kp_u_self_next_is_not_None_or_self_va __pyx_string_tab[11]
-#define __pyx_kp_u_self_node_is_not_None __pyx_string_tab[12]
-#define __pyx_kp_u_stringsource __pyx_string_tab[13]
-#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[14]
-#define __pyx_n_u_append __pyx_string_tab[15]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[16]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[17]
-#define __pyx_n_u_dict __pyx_string_tab[18]
-#define __pyx_n_u_dict_2 __pyx_string_tab[19]
-#define __pyx_n_u_dlinkeditem __pyx_string_tab[20]
-#define __pyx_n_u_dlinkeditem___reduce_cython __pyx_string_tab[21]
-#define __pyx_n_u_dlinkeditem___setstate_cython __pyx_string_tab[22]
-#define __pyx_n_u_dlinkedlist __pyx_string_tab[23]
-#define __pyx_n_u_dlinkedlist___reduce_cython __pyx_string_tab[24]
-#define __pyx_n_u_dlinkedlist___setstate_cython __pyx_string_tab[25]
-#define __pyx_n_u_dlinkedlist_append __pyx_string_tab[26]
-#define __pyx_n_u_extend __pyx_string_tab[27]
-#define __pyx_n_u_func __pyx_string_tab[28]
-#define __pyx_n_u_getstate __pyx_string_tab[29]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[30]
-#define __pyx_n_u_items __pyx_string_tab[31]
-#define __pyx_n_u_iterdlinkedlist __pyx_string_tab[32]
-#define __pyx_n_u_iterdlinkedlist___reduce_cython __pyx_string_tab[33]
-#define __pyx_n_u_iterdlinkedlist___setstate_cytho __pyx_string_tab[34]
-#define __pyx_n_u_iterlinkedlist __pyx_string_tab[35]
-#define __pyx_n_u_iterlinkedlist___reduce_cython __pyx_string_tab[36]
-#define __pyx_n_u_iterlinkedlist___setstate_cython __pyx_string_tab[37]
-#define __pyx_n_u_linkeditem __pyx_string_tab[38]
-#define __pyx_n_u_linkeditem___reduce_cython __pyx_string_tab[39]
-#define __pyx_n_u_linkeditem___setstate_cython __pyx_string_tab[40]
-#define __pyx_n_u_linkedlist __pyx_string_tab[41]
-#define __pyx_n_u_linkedlist___reduce_cython __pyx_string_tab[42]
-#define __pyx_n_u_linkedlist___setstate_cython __pyx_string_tab[43]
-#define __pyx_n_u_linkedlist_append __pyx_string_tab[44]
-#define __pyx_n_u_linkedlist_extend __pyx_string_tab[45]
-#define __pyx_n_u_linkedlist_pop __pyx_string_tab[46]
-#define __pyx_n_u_ll __pyx_string_tab[47]
-#define __pyx_n_u_main __pyx_string_tab[48]
-#define __pyx_n_u_module __pyx_string_tab[49]
-#define __pyx_n_u_name __pyx_string_tab[50]
-#define __pyx_n_u_new __pyx_string_tab[51]
-#define __pyx_n_u_node __pyx_string_tab[52]
-#define __pyx_n_u_pop __pyx_string_tab[53]
-#define __pyx_n_u_pyx_checksum __pyx_string_tab[54]
-#define __pyx_n_u_pyx_result __pyx_string_tab[55]
-#define __pyx_n_u_pyx_state __pyx_string_tab[56]
-#define __pyx_n_u_pyx_type __pyx_string_tab[57]
-#define __pyx_n_u_pyx_unpickle_dlinkeditem __pyx_string_tab[58]
-#define __pyx_n_u_pyx_unpickle_dlinkedlist __pyx_string_tab[59]
-#define __pyx_n_u_pyx_unpickle_iterdlinkedlist __pyx_string_tab[60]
-#define __pyx_n_u_pyx_unpickle_iterlinkedlist __pyx_string_tab[61]
-#define __pyx_n_u_pyx_unpickle_linkeditem __pyx_string_tab[62]
-#define __pyx_n_u_pyx_unpickle_linkedlist __pyx_string_tab[63]
-#define __pyx_n_u_pyx_vtable __pyx_string_tab[64]
-#define __pyx_n_u_qualname __pyx_string_tab[65]
-#define __pyx_n_u_recordclass__linkedlist __pyx_string_tab[66]
-#define __pyx_n_u_reduce __pyx_string_tab[67]
-#define __pyx_n_u_reduce_cython __pyx_string_tab[68]
-#define __pyx_n_u_reduce_ex __pyx_string_tab[69]
-#define __pyx_n_u_self __pyx_string_tab[70]
-#define __pyx_n_u_set_name __pyx_string_tab[71]
-#define __pyx_n_u_setdefault __pyx_string_tab[72]
-#define __pyx_n_u_setstate __pyx_string_tab[73]
-#define __pyx_n_u_setstate_cython __pyx_string_tab[74]
-#define __pyx_n_u_state __pyx_string_tab[75]
-#define __pyx_n_u_test __pyx_string_tab[76]
-#define __pyx_n_u_update __pyx_string_tab[77]
-#define __pyx_n_u_use_setstate __pyx_string_tab[78]
-#define __pyx_n_u_val __pyx_string_tab[79]
-#define __pyx_n_u_vals __pyx_string_tab[80]
-#define __pyx_n_u_values __pyx_string_tab[81]
-#define __pyx_kp_b_iso88591_AV1 __pyx_string_tab[82]
-#define __pyx_kp_b_iso88591_A_1_G1_HA_HA_4wc_q_a_xq_G1 __pyx_string_tab[83]
-#define __pyx_kp_b_iso88591_A_A_6_A_1A_IU_6_D_q_q __pyx_string_tab[84]
-#define __pyx_kp_b_iso88591_A_G1_XQa_q_t7_Q_IQ_G1_D __pyx_string_tab[85]
-#define __pyx_kp_b_iso88591_A_z_G1_HA_4wc_HA_G1 __pyx_string_tab[86]
-#define __pyx_kp_b_iso88591_QfA __pyx_string_tab[87]
-#define __pyx_kp_b_iso88591_T_A_G1F_a_vWE_Q_q_q_4q_4q __pyx_string_tab[88]
-#define __pyx_kp_b_iso88591_T_G1F_a_vWE_Q_q_q_0_AWKwa_0_AWK __pyx_string_tab[89]
-#define __pyx_kp_b_iso88591_T_G1F_a_vWE_Q_q_q_t1G_gQ_t1G_a __pyx_string_tab[90]
-#define __pyx_kp_b_iso88591_T_G4q_G1F_a_vWE_Q_q_q_D_7_D_1 __pyx_string_tab[91]
-#define __pyx_kp_b_iso88591_T_t1_G1F_a_vWE_Q_q_q_4q_4q __pyx_string_tab[92]
-#define __pyx_kp_b_iso88591_T_t1_G1F_a_vWE_Q_q_q_D_7_D_1 __pyx_string_tab[93]
-#define __pyx_kp_b_iso88591__2 __pyx_string_tab[94]
-#define __pyx_kp_b_iso88591_q __pyx_string_tab[95]
-#define __pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1 __pyx_string_tab[96]
-#define __pyx_kp_b_iso88591_q_0_kQR_7_0_1B_PQ_1 __pyx_string_tab[97]
-#define __pyx_kp_b_iso88591_q_0_kQR_XQa_7_A_1 __pyx_string_tab[98]
-#define __pyx_kp_b_iso88591_q_0_kQR_haq_7_QnN_1 __pyx_string_tab[99]
+#define __pyx_kp_u_chunkedlist_index_out_of_range __pyx_string_tab[3]
+#define __pyx_kp_u_chunkedlist_mutated_during_itera __pyx_string_tab[4]
+#define __pyx_kp_u_chunkedlist_r __pyx_string_tab[5]
+#define __pyx_kp_u_disable __pyx_string_tab[6]
+#define __pyx_kp_u_enable __pyx_string_tab[7]
+#define __pyx_kp_u_gc __pyx_string_tab[8]
+#define __pyx_kp_u_isenabled __pyx_string_tab[9]
+#define __pyx_kp_u_lib_recordclass__linkedlist_pyx __pyx_string_tab[10]
+#define __pyx_kp_u_linkedlist_is_empty __pyx_string_tab[11]
+#define __pyx_kp_u_pop_from_an_empty_chunkedlist __pyx_string_tab[12]
+#define __pyx_kp_u_self_end_is_not_None_or_self_sta __pyx_string_tab[13]
+#define __pyx_kp_u_self_next_is_not_None_or_self_pr __pyx_string_tab[14]
+#define __pyx_kp_u_self_next_is_not_None_or_self_va __pyx_string_tab[15]
+#define __pyx_kp_u_self_node_cannot_be_converted_to __pyx_string_tab[16]
+#define __pyx_kp_u_self_node_is_not_None __pyx_string_tab[17]
+#define __pyx_kp_u_stringsource __pyx_string_tab[18]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[19]
+#define __pyx_n_u_append __pyx_string_tab[20]
+#define __pyx_n_u_appendleft __pyx_string_tab[21]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[22]
+#define __pyx_n_u_basicsize __pyx_string_tab[23]
+#define __pyx_n_u_c __pyx_string_tab[24]
+#define __pyx_n_u_chunkedlist __pyx_string_tab[25]
+#define __pyx_n_u_chunkedlist___reduce __pyx_string_tab[26]
+#define __pyx_n_u_chunkedlist___sizeof __pyx_string_tab[27]
+#define __pyx_n_u_chunkedlist_append __pyx_string_tab[28]
+#define __pyx_n_u_chunkedlist_appendleft __pyx_string_tab[29]
+#define __pyx_n_u_chunkedlist_clear __pyx_string_tab[30]
+#define __pyx_n_u_chunkedlist_extend __pyx_string_tab[31]
+#define __pyx_n_u_chunkedlist_pop __pyx_string_tab[32]
+#define __pyx_n_u_chunkedlist_popleft __pyx_string_tab[33]
+#define __pyx_n_u_clear __pyx_string_tab[34]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[35]
+#define __pyx_n_u_dict __pyx_string_tab[36]
+#define __pyx_n_u_dict_2 __pyx_string_tab[37]
+#define __pyx_n_u_dlinkeditem __pyx_string_tab[38]
+#define __pyx_n_u_dlinkeditem___reduce_cython __pyx_string_tab[39]
+#define __pyx_n_u_dlinkeditem___setstate_cython __pyx_string_tab[40]
+#define __pyx_n_u_dlinkedlist __pyx_string_tab[41]
+#define __pyx_n_u_dlinkedlist___reduce_cython __pyx_string_tab[42]
+#define __pyx_n_u_dlinkedlist___setstate_cython __pyx_string_tab[43]
+#define __pyx_n_u_dlinkedlist_append __pyx_string_tab[44]
+#define __pyx_n_u_extend __pyx_string_tab[45]
+#define __pyx_n_u_func __pyx_string_tab[46]
+#define __pyx_n_u_getstate __pyx_string_tab[47]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[48]
+#define __pyx_n_u_items __pyx_string_tab[49]
+#define __pyx_n_u_iterchunkedlist __pyx_string_tab[50]
+#define __pyx_n_u_iterchunkedlist___length_hint __pyx_string_tab[51]
+#define __pyx_n_u_iterchunkedlist___reduce_cython __pyx_string_tab[52]
+#define __pyx_n_u_iterchunkedlist___setstate_cytho __pyx_string_tab[53]
+#define __pyx_n_u_iterdlinkedlist __pyx_string_tab[54]
+#define __pyx_n_u_iterdlinkedlist___reduce_cython __pyx_string_tab[55]
+#define __pyx_n_u_iterdlinkedlist___setstate_cytho __pyx_string_tab[56]
+#define __pyx_n_u_iterlinkedlist __pyx_string_tab[57]
+#define __pyx_n_u_iterlinkedlist___reduce_cython __pyx_string_tab[58]
+#define __pyx_n_u_iterlinkedlist___setstate_cython __pyx_string_tab[59]
+#define __pyx_n_u_length_hint __pyx_string_tab[60]
+#define __pyx_n_u_linkeditem __pyx_string_tab[61]
+#define __pyx_n_u_linkeditem___reduce_cython __pyx_string_tab[62]
+#define __pyx_n_u_linkeditem___setstate_cython __pyx_string_tab[63]
+#define __pyx_n_u_linkedlist __pyx_string_tab[64]
+#define __pyx_n_u_linkedlist___reduce_cython __pyx_string_tab[65]
+#define __pyx_n_u_linkedlist___setstate_cython __pyx_string_tab[66]
+#define __pyx_n_u_linkedlist_append __pyx_string_tab[67]
+#define __pyx_n_u_linkedlist_extend __pyx_string_tab[68]
+#define __pyx_n_u_linkedlist_pop __pyx_string_tab[69]
+#define __pyx_n_u_ll __pyx_string_tab[70]
+#define __pyx_n_u_lst __pyx_string_tab[71]
+#define __pyx_n_u_main __pyx_string_tab[72]
+#define __pyx_n_u_module __pyx_string_tab[73]
+#define __pyx_n_u_n __pyx_string_tab[74]
+#define __pyx_n_u_name __pyx_string_tab[75]
+#define __pyx_n_u_new __pyx_string_tab[76]
+#define __pyx_n_u_node __pyx_string_tab[77]
+#define __pyx_n_u_pop __pyx_string_tab[78]
+#define __pyx_n_u_popleft __pyx_string_tab[79]
+#define __pyx_n_u_pyx_checksum __pyx_string_tab[80]
+#define __pyx_n_u_pyx_result __pyx_string_tab[81]
+#define __pyx_n_u_pyx_state __pyx_string_tab[82]
+#define __pyx_n_u_pyx_type __pyx_string_tab[83]
+#define __pyx_n_u_pyx_unpickle_dlinkeditem __pyx_string_tab[84]
+#define __pyx_n_u_pyx_unpickle_dlinkedlist __pyx_string_tab[85]
+#define __pyx_n_u_pyx_unpickle_iterdlinkedlist __pyx_string_tab[86]
+#define __pyx_n_u_pyx_unpickle_iterlinkedlist __pyx_string_tab[87]
+#define __pyx_n_u_pyx_unpickle_linkeditem __pyx_string_tab[88]
+#define __pyx_n_u_pyx_unpickle_linkedlist __pyx_string_tab[89]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[90]
+#define __pyx_n_u_qualname __pyx_string_tab[91]
+#define __pyx_n_u_recordclass__linkedlist __pyx_string_tab[92]
+#define __pyx_n_u_reduce __pyx_string_tab[93]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[94]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[95]
+#define __pyx_n_u_self __pyx_string_tab[96]
+#define __pyx_n_u_set_name __pyx_string_tab[97]
+#define __pyx_n_u_setdefault __pyx_string_tab[98]
+#define __pyx_n_u_setstate __pyx_string_tab[99]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[100]
+#define __pyx_n_u_sizeof __pyx_string_tab[101]
+#define __pyx_n_u_state __pyx_string_tab[102]
+#define __pyx_n_u_test __pyx_string_tab[103]
+#define __pyx_n_u_update __pyx_string_tab[104]
+#define __pyx_n_u_use_setstate __pyx_string_tab[105]
+#define __pyx_n_u_val __pyx_string_tab[106]
+#define __pyx_n_u_vals __pyx_string_tab[107]
+#define __pyx_n_u_values __pyx_string_tab[108]
+#define __pyx_kp_b_iso88591_AV1 __pyx_string_tab[109]
+#define __pyx_kp_b_iso88591_A_1_G1_HA_HA_4wc_q_a_xq_G1 __pyx_string_tab[110]
+#define __pyx_kp_b_iso88591_A_4q_A_t1_HD_IT_HA_Ja_L_wa __pyx_string_tab[111]
+#define __pyx_kp_b_iso88591_A_4vS_AQ_IQ_t5_at1_IQ_Ja_4vS_at1 __pyx_string_tab[112]
+#define __pyx_kp_b_iso88591_A_4vS_AQ_t5_at1_Ja_IQ_Ja_4vS_at1 __pyx_string_tab[113]
+#define __pyx_kp_b_iso88591_A_4vS_Ja_HA_XQ_1_Ja_XT_XQ_Ja_E_q __pyx_string_tab[114]
+#define __pyx_kp_b_iso88591_A_4vS_Ja_HA_XQ_s_Ja_XT_XQ_E_q_I __pyx_string_tab[115]
+#define __pyx_kp_b_iso88591_A_A_6_A_1A_IU_6_D_q_uA __pyx_string_tab[116]
+#define __pyx_kp_b_iso88591_A_A_A_b_q_4wgQ_2Rq __pyx_string_tab[117]
+#define __pyx_kp_b_iso88591_A_G1_XQa_q_t7_Q_IQ_D_q __pyx_string_tab[118]
+#define __pyx_kp_b_iso88591_A_G1_q __pyx_string_tab[119]
+#define __pyx_kp_b_iso88591_A_T __pyx_string_tab[120]
+#define __pyx_kp_b_iso88591_A_t1 __pyx_string_tab[121]
+#define __pyx_kp_b_iso88591_A_z_G1_HA_4wc_HA_G1 __pyx_string_tab[122]
+#define __pyx_kp_b_iso88591_Q __pyx_string_tab[123]
+#define __pyx_kp_b_iso88591_QfA __pyx_string_tab[124]
+#define __pyx_kp_b_iso88591_T_A_G1F_a_vWE_Q_q_q_4q_4q __pyx_string_tab[125]
+#define __pyx_kp_b_iso88591_T_G1F_a_vWE_Q_q_q_0_AWKwa_0_AWK __pyx_string_tab[126]
+#define __pyx_kp_b_iso88591_T_G1F_a_vWE_Q_q_q_t1G_gQ_t1G_a __pyx_string_tab[127]
+#define __pyx_kp_b_iso88591_T_G4q_G1F_a_vWE_Q_q_q_D_7_D_1 __pyx_string_tab[128]
+#define __pyx_kp_b_iso88591_T_t1_G1F_a_vWE_Q_q_q_4q_4q __pyx_string_tab[129]
+#define __pyx_kp_b_iso88591_T_t1_G1F_a_vWE_Q_q_q_D_7_D_1 __pyx_string_tab[130]
+#define __pyx_kp_b_iso88591__2 __pyx_string_tab[131]
+#define __pyx_kp_b_iso88591_q __pyx_string_tab[132]
+#define __pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1 __pyx_string_tab[133]
+#define __pyx_kp_b_iso88591_q_0_kQR_7_0_1B_PQ_1 __pyx_string_tab[134]
+#define __pyx_kp_b_iso88591_q_0_kQR_XQa_7_A_1 __pyx_string_tab[135]
+#define __pyx_kp_b_iso88591_q_0_kQR_haq_7_QnN_1 __pyx_string_tab[136]
 #define __pyx_int_5726981 __pyx_number_tab[0]
 #define __pyx_int_17540454 __pyx_number_tab[1]
 #define __pyx_int_88468051 __pyx_number_tab[2]
@@ -2708,6 +2922,7 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   #if CYTHON_PEP489_MULTI_PHASE_INIT
   __Pyx_State_RemoveModule(NULL);
   #endif
+  Py_CLEAR(clear_module_state->__pyx_ptype_7cpython_4type_type);
   Py_CLEAR(clear_module_state->__pyx_ptype_11recordclass_11_linkedlist_linkeditem);
   Py_CLEAR(clear_module_state->LinkedItemType);
   Py_CLEAR(clear_module_state->__pyx_ptype_11recordclass_11_linkedlist_linkedlist);
@@ -2720,9 +2935,13 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   Py_CLEAR(clear_module_state->DLinkedListType);
   Py_CLEAR(clear_module_state->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist);
   Py_CLEAR(clear_module_state->__pyx_type_11recordclass_11_linkedlist_iterdlinkedlist);
+  Py_CLEAR(clear_module_state->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist);
+  Py_CLEAR(clear_module_state->ChunkedListType);
+  Py_CLEAR(clear_module_state->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist);
+  Py_CLEAR(clear_module_state->__pyx_type_11recordclass_11_linkedlist_iterchunkedlist);
   for (int i=0; i<4; ++i) { Py_CLEAR(clear_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<22; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<100; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<33; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<137; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<4; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
@@ -2746,6 +2965,7 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
+  Py_VISIT(traverse_module_state->__pyx_ptype_7cpython_4type_type);
   Py_VISIT(traverse_module_state->__pyx_ptype_11recordclass_11_linkedlist_linkeditem);
   Py_VISIT(traverse_module_state->LinkedItemType);
   Py_VISIT(traverse_module_state->__pyx_ptype_11recordclass_11_linkedlist_linkedlist);
@@ -2758,9 +2978,13 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   Py_VISIT(traverse_module_state->DLinkedListType);
   Py_VISIT(traverse_module_state->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist);
   Py_VISIT(traverse_module_state->__pyx_type_11recordclass_11_linkedlist_iterdlinkedlist);
+  Py_VISIT(traverse_module_state->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist);
+  Py_VISIT(traverse_module_state->ChunkedListType);
+  Py_VISIT(traverse_module_state->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist);
+  Py_VISIT(traverse_module_state->__pyx_type_11recordclass_11_linkedlist_iterchunkedlist);
   for (int i=0; i<4; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_tuple[i]); }
-  for (int i=0; i<22; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<100; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<33; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<137; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
   for (int i=0; i<4; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
@@ -3189,7 +3413,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkeditem_2__setstate_c
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":45
+/* "recordclass/_linkedlist.pyx":47
  *     cdef public linkeditem end
  *     #
  *     cpdef append(self, val):             # <<<<<<<<<<<<<<
@@ -3215,19 +3439,19 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("append", 0);
 
-  /* "recordclass/_linkedlist.pyx":48
+  /* "recordclass/_linkedlist.pyx":50
  *         cdef linkeditem item
  * 
  *         item = linkeditem.__new__(linkeditem)             # <<<<<<<<<<<<<<
  *         item.val = val
  *         item.next = None
 */
-  __pyx_t_1 = ((PyObject *)__pyx_tp_new_11recordclass_11_linkedlist_linkeditem(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 48, __pyx_L1_error)
+  __pyx_t_1 = ((PyObject *)__pyx_tp_new_11recordclass_11_linkedlist_linkeditem(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 50, __pyx_L1_error)
   __Pyx_GOTREF((PyObject *)__pyx_t_1);
   __pyx_v_item = ((struct LinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":49
+  /* "recordclass/_linkedlist.pyx":51
  * 
  *         item = linkeditem.__new__(linkeditem)
  *         item.val = val             # <<<<<<<<<<<<<<
@@ -3240,7 +3464,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
   __Pyx_DECREF(__pyx_v_item->val);
   __pyx_v_item->val = __pyx_v_val;
 
-  /* "recordclass/_linkedlist.pyx":50
+  /* "recordclass/_linkedlist.pyx":52
  *         item = linkeditem.__new__(linkeditem)
  *         item.val = val
  *         item.next = None             # <<<<<<<<<<<<<<
@@ -3253,7 +3477,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
   __Pyx_DECREF((PyObject *)__pyx_v_item->next);
   __pyx_v_item->next = ((struct LinkedItem *)Py_None);
 
-  /* "recordclass/_linkedlist.pyx":51
+  /* "recordclass/_linkedlist.pyx":53
  *         item.val = val
  *         item.next = None
  *         if self.start is None:             # <<<<<<<<<<<<<<
@@ -3263,7 +3487,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
   __pyx_t_2 = (((PyObject *)__pyx_v_self->start) == Py_None);
   if (__pyx_t_2) {
 
-    /* "recordclass/_linkedlist.pyx":52
+    /* "recordclass/_linkedlist.pyx":54
  *         item.next = None
  *         if self.start is None:
  *             self.start = item             # <<<<<<<<<<<<<<
@@ -3276,7 +3500,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
     __Pyx_DECREF((PyObject *)__pyx_v_self->start);
     __pyx_v_self->start = __pyx_v_item;
 
-    /* "recordclass/_linkedlist.pyx":51
+    /* "recordclass/_linkedlist.pyx":53
  *         item.val = val
  *         item.next = None
  *         if self.start is None:             # <<<<<<<<<<<<<<
@@ -3286,7 +3510,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
     goto __pyx_L3;
   }
 
-  /* "recordclass/_linkedlist.pyx":54
+  /* "recordclass/_linkedlist.pyx":56
  *             self.start = item
  *         else:
  *             self.end.next = item             # <<<<<<<<<<<<<<
@@ -3302,7 +3526,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
   }
   __pyx_L3:;
 
-  /* "recordclass/_linkedlist.pyx":55
+  /* "recordclass/_linkedlist.pyx":57
  *         else:
  *             self.end.next = item
  *         self.end = item             # <<<<<<<<<<<<<<
@@ -3315,7 +3539,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_append(struct
   __Pyx_DECREF((PyObject *)__pyx_v_self->end);
   __pyx_v_self->end = __pyx_v_item;
 
-  /* "recordclass/_linkedlist.pyx":45
+  /* "recordclass/_linkedlist.pyx":47
  *     cdef public linkeditem end
  *     #
  *     cpdef append(self, val):             # <<<<<<<<<<<<<<
@@ -3377,32 +3601,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_val,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 45, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 47, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 45, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 47, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "append", 0) < (0)) __PYX_ERR(0, 45, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "append", 0) < (0)) __PYX_ERR(0, 47, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, i); __PYX_ERR(0, 45, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, i); __PYX_ERR(0, 47, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 45, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 47, __pyx_L3_error)
     }
     __pyx_v_val = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 45, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 47, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -3432,7 +3656,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_append(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("append", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_10linkedlist_append(__pyx_v_self, __pyx_v_val, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_10linkedlist_append(__pyx_v_self, __pyx_v_val, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 47, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3449,7 +3673,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_append(struct
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":57
+/* "recordclass/_linkedlist.pyx":59
  *         self.end = item
  *     #
  *     cpdef extend(self, vals):             # <<<<<<<<<<<<<<
@@ -3479,7 +3703,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("extend", 0);
 
-  /* "recordclass/_linkedlist.pyx":60
+  /* "recordclass/_linkedlist.pyx":62
  *         cdef linkeditem item
  * 
  *         for val in vals:             # <<<<<<<<<<<<<<
@@ -3491,9 +3715,9 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
     __pyx_t_2 = 0;
     __pyx_t_3 = NULL;
   } else {
-    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_vals); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_vals); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_3 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 60, __pyx_L1_error)
+    __pyx_t_3 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 62, __pyx_L1_error)
   }
   for (;;) {
     if (likely(!__pyx_t_3)) {
@@ -3501,7 +3725,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
         {
           Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
           #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 60, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 62, __pyx_L1_error)
           #endif
           if (__pyx_t_2 >= __pyx_temp) break;
         }
@@ -3511,7 +3735,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
         {
           Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_1);
           #if !CYTHON_ASSUME_SAFE_SIZE
-          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 60, __pyx_L1_error)
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 62, __pyx_L1_error)
           #endif
           if (__pyx_t_2 >= __pyx_temp) break;
         }
@@ -3522,13 +3746,13 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
         #endif
         ++__pyx_t_2;
       }
-      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 60, __pyx_L1_error)
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 62, __pyx_L1_error)
     } else {
       __pyx_t_4 = __pyx_t_3(__pyx_t_1);
       if (unlikely(!__pyx_t_4)) {
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
-          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 60, __pyx_L1_error)
+          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 62, __pyx_L1_error)
           PyErr_Clear();
         }
         break;
@@ -3538,19 +3762,19 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
     __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "recordclass/_linkedlist.pyx":61
+    /* "recordclass/_linkedlist.pyx":63
  * 
  *         for val in vals:
  *             item = linkeditem.__new__(linkeditem)             # <<<<<<<<<<<<<<
  *             item.val = val
  *             item.next = None
 */
-    __pyx_t_4 = ((PyObject *)__pyx_tp_new_11recordclass_11_linkedlist_linkeditem(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 61, __pyx_L1_error)
+    __pyx_t_4 = ((PyObject *)__pyx_tp_new_11recordclass_11_linkedlist_linkeditem(((PyTypeObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem), __pyx_mstate_global->__pyx_empty_tuple, NULL)); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 63, __pyx_L1_error)
     __Pyx_GOTREF((PyObject *)__pyx_t_4);
     __Pyx_XDECREF_SET(__pyx_v_item, ((struct LinkedItem *)__pyx_t_4));
     __pyx_t_4 = 0;
 
-    /* "recordclass/_linkedlist.pyx":62
+    /* "recordclass/_linkedlist.pyx":64
  *         for val in vals:
  *             item = linkeditem.__new__(linkeditem)
  *             item.val = val             # <<<<<<<<<<<<<<
@@ -3563,7 +3787,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
     __Pyx_DECREF(__pyx_v_item->val);
     __pyx_v_item->val = __pyx_v_val;
 
-    /* "recordclass/_linkedlist.pyx":63
+    /* "recordclass/_linkedlist.pyx":65
  *             item = linkeditem.__new__(linkeditem)
  *             item.val = val
  *             item.next = None             # <<<<<<<<<<<<<<
@@ -3576,22 +3800,22 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
     __Pyx_DECREF((PyObject *)__pyx_v_item->next);
     __pyx_v_item->next = ((struct LinkedItem *)Py_None);
 
-    /* "recordclass/_linkedlist.pyx":64
+    /* "recordclass/_linkedlist.pyx":66
  *             item.val = val
  *             item.next = None
  *             if self.start is None:             # <<<<<<<<<<<<<<
  *                 self.start = item
- *                 self.end = item
+ *             else:
 */
     __pyx_t_5 = (((PyObject *)__pyx_v_self->start) == Py_None);
     if (__pyx_t_5) {
 
-      /* "recordclass/_linkedlist.pyx":65
+      /* "recordclass/_linkedlist.pyx":67
  *             item.next = None
  *             if self.start is None:
  *                 self.start = item             # <<<<<<<<<<<<<<
- *                 self.end = item
  *             else:
+ *                 self.end.next = item
 */
       __Pyx_INCREF((PyObject *)__pyx_v_item);
       __Pyx_GIVEREF((PyObject *)__pyx_v_item);
@@ -3600,34 +3824,21 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
       __pyx_v_self->start = __pyx_v_item;
 
       /* "recordclass/_linkedlist.pyx":66
- *             if self.start is None:
- *                 self.start = item
- *                 self.end = item             # <<<<<<<<<<<<<<
- *             else:
- *                 self.end.next = item
-*/
-      __Pyx_INCREF((PyObject *)__pyx_v_item);
-      __Pyx_GIVEREF((PyObject *)__pyx_v_item);
-      __Pyx_GOTREF((PyObject *)__pyx_v_self->end);
-      __Pyx_DECREF((PyObject *)__pyx_v_self->end);
-      __pyx_v_self->end = __pyx_v_item;
-
-      /* "recordclass/_linkedlist.pyx":64
  *             item.val = val
  *             item.next = None
  *             if self.start is None:             # <<<<<<<<<<<<<<
  *                 self.start = item
- *                 self.end = item
+ *             else:
 */
       goto __pyx_L5;
     }
 
-    /* "recordclass/_linkedlist.pyx":68
- *                 self.end = item
+    /* "recordclass/_linkedlist.pyx":69
+ *                 self.start = item
  *             else:
  *                 self.end.next = item             # <<<<<<<<<<<<<<
+ *             self.end = item
  *     #
- *     cpdef pop(self):
 */
     /*else*/ {
       __Pyx_INCREF((PyObject *)__pyx_v_item);
@@ -3638,7 +3849,20 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
     }
     __pyx_L5:;
 
-    /* "recordclass/_linkedlist.pyx":60
+    /* "recordclass/_linkedlist.pyx":70
+ *             else:
+ *                 self.end.next = item
+ *             self.end = item             # <<<<<<<<<<<<<<
+ *     #
+ *     cpdef pop(self):
+*/
+    __Pyx_INCREF((PyObject *)__pyx_v_item);
+    __Pyx_GIVEREF((PyObject *)__pyx_v_item);
+    __Pyx_GOTREF((PyObject *)__pyx_v_self->end);
+    __Pyx_DECREF((PyObject *)__pyx_v_self->end);
+    __pyx_v_self->end = __pyx_v_item;
+
+    /* "recordclass/_linkedlist.pyx":62
  *         cdef linkeditem item
  * 
  *         for val in vals:             # <<<<<<<<<<<<<<
@@ -3648,7 +3872,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(struct
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":57
+  /* "recordclass/_linkedlist.pyx":59
  *         self.end = item
  *     #
  *     cpdef extend(self, vals):             # <<<<<<<<<<<<<<
@@ -3712,32 +3936,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_vals,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 57, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 59, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 57, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 59, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "extend", 0) < (0)) __PYX_ERR(0, 57, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "extend", 0) < (0)) __PYX_ERR(0, 59, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("extend", 1, 1, 1, i); __PYX_ERR(0, 57, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("extend", 1, 1, 1, i); __PYX_ERR(0, 59, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 57, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 59, __pyx_L3_error)
     }
     __pyx_v_vals = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("extend", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 57, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("extend", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 59, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -3767,7 +3991,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_2extend(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("extend", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(__pyx_v_self, __pyx_v_vals, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_10linkedlist_extend(__pyx_v_self, __pyx_v_vals, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -3784,8 +4008,8 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_2extend(struc
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":70
- *                 self.end.next = item
+/* "recordclass/_linkedlist.pyx":72
+ *             self.end = item
  *     #
  *     cpdef pop(self):             # <<<<<<<<<<<<<<
  *         cdef linkeditem start
@@ -3812,7 +4036,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct Lin
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pop", 0);
 
-  /* "recordclass/_linkedlist.pyx":73
+  /* "recordclass/_linkedlist.pyx":75
  *         cdef linkeditem start
  * 
  *         start = self.start             # <<<<<<<<<<<<<<
@@ -3824,7 +4048,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct Lin
   __pyx_v_start = ((struct LinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":74
+  /* "recordclass/_linkedlist.pyx":76
  * 
  *         start = self.start
  *         if start is None:             # <<<<<<<<<<<<<<
@@ -3834,7 +4058,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct Lin
   __pyx_t_2 = (((PyObject *)__pyx_v_start) == Py_None);
   if (unlikely(__pyx_t_2)) {
 
-    /* "recordclass/_linkedlist.pyx":75
+    /* "recordclass/_linkedlist.pyx":77
  *         start = self.start
  *         if start is None:
  *             raise TypeError("linkedlist is empty")             # <<<<<<<<<<<<<<
@@ -3847,14 +4071,14 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct Lin
       PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_linkedlist_is_empty};
       __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_TypeError)), __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 75, __pyx_L1_error)
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 77, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
     }
     __Pyx_Raise(__pyx_t_1, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __PYX_ERR(0, 75, __pyx_L1_error)
+    __PYX_ERR(0, 77, __pyx_L1_error)
 
-    /* "recordclass/_linkedlist.pyx":74
+    /* "recordclass/_linkedlist.pyx":76
  * 
  *         start = self.start
  *         if start is None:             # <<<<<<<<<<<<<<
@@ -3863,7 +4087,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct Lin
 */
   }
 
-  /* "recordclass/_linkedlist.pyx":77
+  /* "recordclass/_linkedlist.pyx":79
  *             raise TypeError("linkedlist is empty")
  * 
  *         self.start = start.next             # <<<<<<<<<<<<<<
@@ -3878,21 +4102,21 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct Lin
   __pyx_v_self->start = ((struct LinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":78
+  /* "recordclass/_linkedlist.pyx":80
  * 
  *         self.start = start.next
  *         if start is self.end:             # <<<<<<<<<<<<<<
  *             self.end = None
- *         return start
+ *         return start.val
 */
   __pyx_t_2 = (__pyx_v_start == __pyx_v_self->end);
   if (__pyx_t_2) {
 
-    /* "recordclass/_linkedlist.pyx":79
+    /* "recordclass/_linkedlist.pyx":81
  *         self.start = start.next
  *         if start is self.end:
  *             self.end = None             # <<<<<<<<<<<<<<
- *         return start
+ *         return start.val
  *     #
 */
     __Pyx_INCREF(Py_None);
@@ -3901,29 +4125,29 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(struct Lin
     __Pyx_DECREF((PyObject *)__pyx_v_self->end);
     __pyx_v_self->end = ((struct LinkedItem *)Py_None);
 
-    /* "recordclass/_linkedlist.pyx":78
+    /* "recordclass/_linkedlist.pyx":80
  * 
  *         self.start = start.next
  *         if start is self.end:             # <<<<<<<<<<<<<<
  *             self.end = None
- *         return start
+ *         return start.val
 */
   }
 
-  /* "recordclass/_linkedlist.pyx":80
+  /* "recordclass/_linkedlist.pyx":82
  *         if start is self.end:
  *             self.end = None
- *         return start             # <<<<<<<<<<<<<<
+ *         return start.val             # <<<<<<<<<<<<<<
  *     #
  *     def __dealloc__(self):
 */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF((PyObject *)__pyx_v_start);
-  __pyx_r = ((PyObject *)__pyx_v_start);
+  __Pyx_INCREF(__pyx_v_start->val);
+  __pyx_r = __pyx_v_start->val;
   goto __pyx_L0;
 
-  /* "recordclass/_linkedlist.pyx":70
- *                 self.end.next = item
+  /* "recordclass/_linkedlist.pyx":72
+ *             self.end = item
  *     #
  *     cpdef pop(self):             # <<<<<<<<<<<<<<
  *         cdef linkeditem start
@@ -3995,7 +4219,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_4pop(struct L
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("pop", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_10linkedlist_pop(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 72, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -4012,8 +4236,8 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_4pop(struct L
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":82
- *         return start
+/* "recordclass/_linkedlist.pyx":84
+ *         return start.val
  *     #
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         cdef linkeditem curr
@@ -4041,7 +4265,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_10linkedlist_6__dealloc__(struc
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "recordclass/_linkedlist.pyx":86
+  /* "recordclass/_linkedlist.pyx":88
  *         cdef linkeditem next
  * 
  *         curr = self.start             # <<<<<<<<<<<<<<
@@ -4053,7 +4277,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_10linkedlist_6__dealloc__(struc
   __pyx_v_curr = ((struct LinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":87
+  /* "recordclass/_linkedlist.pyx":89
  * 
  *         curr = self.start
  *         while curr is not None:             # <<<<<<<<<<<<<<
@@ -4064,7 +4288,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_10linkedlist_6__dealloc__(struc
     __pyx_t_2 = (((PyObject *)__pyx_v_curr) != Py_None);
     if (!__pyx_t_2) break;
 
-    /* "recordclass/_linkedlist.pyx":88
+    /* "recordclass/_linkedlist.pyx":90
  *         curr = self.start
  *         while curr is not None:
  *             next = curr.next             # <<<<<<<<<<<<<<
@@ -4076,7 +4300,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_10linkedlist_6__dealloc__(struc
     __Pyx_XDECREF_SET(__pyx_v_next, ((struct LinkedItem *)__pyx_t_1));
     __pyx_t_1 = 0;
 
-    /* "recordclass/_linkedlist.pyx":89
+    /* "recordclass/_linkedlist.pyx":91
  *         while curr is not None:
  *             next = curr.next
  *             curr.next = None             # <<<<<<<<<<<<<<
@@ -4089,7 +4313,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_10linkedlist_6__dealloc__(struc
     __Pyx_DECREF((PyObject *)__pyx_v_curr->next);
     __pyx_v_curr->next = ((struct LinkedItem *)Py_None);
 
-    /* "recordclass/_linkedlist.pyx":90
+    /* "recordclass/_linkedlist.pyx":92
  *             next = curr.next
  *             curr.next = None
  *             curr = next             # <<<<<<<<<<<<<<
@@ -4100,8 +4324,8 @@ static void __pyx_pf_11recordclass_11_linkedlist_10linkedlist_6__dealloc__(struc
     __Pyx_DECREF_SET(__pyx_v_curr, __pyx_v_next);
   }
 
-  /* "recordclass/_linkedlist.pyx":82
- *         return start
+  /* "recordclass/_linkedlist.pyx":84
+ *         return start.val
  *     #
  *     def __dealloc__(self):             # <<<<<<<<<<<<<<
  *         cdef linkeditem curr
@@ -4114,7 +4338,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_10linkedlist_6__dealloc__(struc
   __Pyx_RefNannyFinishContext();
 }
 
-/* "recordclass/_linkedlist.pyx":92
+/* "recordclass/_linkedlist.pyx":94
  *             curr = next
  *     #
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -4148,7 +4372,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_8__iter__(str
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__iter__", 0);
 
-  /* "recordclass/_linkedlist.pyx":93
+  /* "recordclass/_linkedlist.pyx":95
  *     #
  *     def __iter__(self):
  *         return iterlinkedlist(self)             # <<<<<<<<<<<<<<
@@ -4162,14 +4386,14 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_8__iter__(str
     PyObject *__pyx_callargs[2] = {__pyx_t_2, ((PyObject *)__pyx_v_self)};
     __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist, __pyx_callargs+__pyx_t_3, (2-__pyx_t_3) | (__pyx_t_3*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 93, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
     __Pyx_GOTREF((PyObject *)__pyx_t_1);
   }
   __pyx_r = ((PyObject *)__pyx_t_1);
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "recordclass/_linkedlist.pyx":92
+  /* "recordclass/_linkedlist.pyx":94
  *             curr = next
  *     #
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -4189,7 +4413,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_8__iter__(str
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":42
+/* "recordclass/_linkedlist.pyx":44
  * @cython.final
  * cdef public class linkedlist[object LinkedList, type LinkedListType]:
  *     cdef public linkeditem start             # <<<<<<<<<<<<<<
@@ -4253,7 +4477,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_10linkedlist_5start_2__set__(str
   __Pyx_RefNannySetupContext("__set__", 0);
   __pyx_t_1 = __pyx_v_value;
   __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(0, 44, __pyx_L1_error)
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF((PyObject *)__pyx_v_self->start);
   __Pyx_DECREF((PyObject *)__pyx_v_self->start);
@@ -4303,7 +4527,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_10linkedlist_5start_4__del__(str
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":43
+/* "recordclass/_linkedlist.pyx":45
  * cdef public class linkedlist[object LinkedList, type LinkedListType]:
  *     cdef public linkeditem start
  *     cdef public linkeditem end             # <<<<<<<<<<<<<<
@@ -4367,7 +4591,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_10linkedlist_3end_2__set__(struc
   __Pyx_RefNannySetupContext("__set__", 0);
   __pyx_t_1 = __pyx_v_value;
   __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(0, 43, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF((PyObject *)__pyx_v_self->end);
   __Pyx_DECREF((PyObject *)__pyx_v_self->end);
@@ -4831,7 +5055,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_10linkedlist_12__setstate_
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":99
+/* "recordclass/_linkedlist.pyx":101
  *     cdef linkeditem node
  * 
  *     def __init__(self, linkedlist ll):             # <<<<<<<<<<<<<<
@@ -4861,32 +5085,32 @@ static int __pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_1__init__(PyObj
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_ll,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 99, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 101, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 99, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 101, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 99, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 101, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 99, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 101, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 99, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 101, __pyx_L3_error)
     }
     __pyx_v_ll = ((struct LinkedList *)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 99, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 101, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4897,7 +5121,7 @@ static int __pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_1__init__(PyObj
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ll), __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, 1, "ll", 0))) __PYX_ERR(0, 99, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_ll), __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, 1, "ll", 0))) __PYX_ERR(0, 101, __pyx_L1_error)
   __pyx_r = __pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist___init__(((struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)__pyx_v_self), __pyx_v_ll);
 
   /* function exit code */
@@ -4923,7 +5147,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist___init__(struct
   PyObject *__pyx_t_1 = NULL;
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "recordclass/_linkedlist.pyx":100
+  /* "recordclass/_linkedlist.pyx":102
  * 
  *     def __init__(self, linkedlist ll):
  *         self.node = ll.start             # <<<<<<<<<<<<<<
@@ -4938,7 +5162,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist___init__(struct
   __pyx_v_self->node = ((struct LinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":99
+  /* "recordclass/_linkedlist.pyx":101
  *     cdef linkeditem node
  * 
  *     def __init__(self, linkedlist ll):             # <<<<<<<<<<<<<<
@@ -4952,7 +5176,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist___init__(struct
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":102
+/* "recordclass/_linkedlist.pyx":104
  *         self.node = ll.start
  * 
  *     def __next__(self):             # <<<<<<<<<<<<<<
@@ -4985,7 +5209,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist_2__next__
   int __pyx_t_2;
   __Pyx_RefNannySetupContext("__next__", 0);
 
-  /* "recordclass/_linkedlist.pyx":105
+  /* "recordclass/_linkedlist.pyx":107
  *         cdef linkeditem node
  * 
  *         node =  self.node             # <<<<<<<<<<<<<<
@@ -4997,7 +5221,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist_2__next__
   __pyx_v_node = ((struct LinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":106
+  /* "recordclass/_linkedlist.pyx":108
  * 
  *         node =  self.node
  *         if node is None:             # <<<<<<<<<<<<<<
@@ -5007,7 +5231,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist_2__next__
   __pyx_t_2 = (((PyObject *)__pyx_v_node) == Py_None);
   if (unlikely(__pyx_t_2)) {
 
-    /* "recordclass/_linkedlist.pyx":107
+    /* "recordclass/_linkedlist.pyx":109
  *         node =  self.node
  *         if node is None:
  *             raise StopIteration             # <<<<<<<<<<<<<<
@@ -5017,7 +5241,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist_2__next__
     __pyx_error_without_exception = 1;
     goto __pyx_L1_error;;
 
-    /* "recordclass/_linkedlist.pyx":106
+    /* "recordclass/_linkedlist.pyx":108
  * 
  *         node =  self.node
  *         if node is None:             # <<<<<<<<<<<<<<
@@ -5026,7 +5250,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist_2__next__
 */
   }
 
-  /* "recordclass/_linkedlist.pyx":109
+  /* "recordclass/_linkedlist.pyx":111
  *             raise StopIteration
  * 
  *         val = node.val             # <<<<<<<<<<<<<<
@@ -5038,7 +5262,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist_2__next__
   __pyx_v_val = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":110
+  /* "recordclass/_linkedlist.pyx":112
  * 
  *         val = node.val
  *         self.node = node.next             # <<<<<<<<<<<<<<
@@ -5053,7 +5277,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist_2__next__
   __pyx_v_self->node = ((struct LinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":111
+  /* "recordclass/_linkedlist.pyx":113
  *         val = node.val
  *         self.node = node.next
  *         return val             # <<<<<<<<<<<<<<
@@ -5065,7 +5289,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_14iterlinkedlist_2__next__
   __pyx_r = __pyx_v_val;
   goto __pyx_L0;
 
-  /* "recordclass/_linkedlist.pyx":102
+  /* "recordclass/_linkedlist.pyx":104
  *         self.node = ll.start
  * 
  *     def __next__(self):             # <<<<<<<<<<<<<<
@@ -5916,7 +6140,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_11dlinkeditem_2__setstate_
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":125
+/* "recordclass/_linkedlist.pyx":127
  *     cdef public dlinkeditem end
  *     #
  *     @cython.nonecheck(False)             # <<<<<<<<<<<<<<
@@ -5945,7 +6169,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("append", 0);
 
-  /* "recordclass/_linkedlist.pyx":130
+  /* "recordclass/_linkedlist.pyx":132
  *         cdef dlinkeditem end
  * 
  *         item = dlinkeditem.__new__(linkeditem)             # <<<<<<<<<<<<<<
@@ -5959,14 +6183,14 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
     PyObject *__pyx_callargs[2] = {__pyx_t_2, ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem)};
     __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_3, (2-__pyx_t_3) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 130, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 132, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
   }
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 130, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 132, __pyx_L1_error)
   __pyx_v_item = ((struct DLinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":131
+  /* "recordclass/_linkedlist.pyx":133
  * 
  *         item = dlinkeditem.__new__(linkeditem)
  *         item.val = val             # <<<<<<<<<<<<<<
@@ -5979,7 +6203,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
   __Pyx_DECREF(__pyx_v_item->val);
   __pyx_v_item->val = __pyx_v_val;
 
-  /* "recordclass/_linkedlist.pyx":132
+  /* "recordclass/_linkedlist.pyx":134
  *         item = dlinkeditem.__new__(linkeditem)
  *         item.val = val
  *         item.next = None             # <<<<<<<<<<<<<<
@@ -5992,7 +6216,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
   __Pyx_DECREF((PyObject *)__pyx_v_item->next);
   __pyx_v_item->next = ((struct LinkedItem *)Py_None);
 
-  /* "recordclass/_linkedlist.pyx":133
+  /* "recordclass/_linkedlist.pyx":135
  *         item.val = val
  *         item.next = None
  *         item.prev = None             # <<<<<<<<<<<<<<
@@ -6005,7 +6229,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
   __Pyx_DECREF((PyObject *)__pyx_v_item->prev);
   __pyx_v_item->prev = ((struct LinkedItem *)Py_None);
 
-  /* "recordclass/_linkedlist.pyx":134
+  /* "recordclass/_linkedlist.pyx":136
  *         item.next = None
  *         item.prev = None
  *         if self.start is None:             # <<<<<<<<<<<<<<
@@ -6015,7 +6239,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
   __pyx_t_4 = (((PyObject *)__pyx_v_self->start) == Py_None);
   if (__pyx_t_4) {
 
-    /* "recordclass/_linkedlist.pyx":135
+    /* "recordclass/_linkedlist.pyx":137
  *         item.prev = None
  *         if self.start is None:
  *             self.start = item             # <<<<<<<<<<<<<<
@@ -6028,7 +6252,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
     __Pyx_DECREF((PyObject *)__pyx_v_self->start);
     __pyx_v_self->start = __pyx_v_item;
 
-    /* "recordclass/_linkedlist.pyx":136
+    /* "recordclass/_linkedlist.pyx":138
  *         if self.start is None:
  *             self.start = item
  *             self.end = item             # <<<<<<<<<<<<<<
@@ -6041,7 +6265,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
     __Pyx_DECREF((PyObject *)__pyx_v_self->end);
     __pyx_v_self->end = __pyx_v_item;
 
-    /* "recordclass/_linkedlist.pyx":134
+    /* "recordclass/_linkedlist.pyx":136
  *         item.next = None
  *         item.prev = None
  *         if self.start is None:             # <<<<<<<<<<<<<<
@@ -6051,7 +6275,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
     goto __pyx_L3;
   }
 
-  /* "recordclass/_linkedlist.pyx":138
+  /* "recordclass/_linkedlist.pyx":140
  *             self.end = item
  *         else:
  *             end = self.end             # <<<<<<<<<<<<<<
@@ -6064,7 +6288,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
     __pyx_v_end = ((struct DLinkedItem *)__pyx_t_1);
     __pyx_t_1 = 0;
 
-    /* "recordclass/_linkedlist.pyx":139
+    /* "recordclass/_linkedlist.pyx":141
  *         else:
  *             end = self.end
  *             end.next = item             # <<<<<<<<<<<<<<
@@ -6073,14 +6297,14 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
 */
     __pyx_t_1 = ((PyObject *)__pyx_v_item);
     __Pyx_INCREF(__pyx_t_1);
-    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(0, 139, __pyx_L1_error)
+    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(0, 141, __pyx_L1_error)
     __Pyx_GIVEREF((PyObject *)__pyx_t_1);
     __Pyx_GOTREF((PyObject *)__pyx_v_end->next);
     __Pyx_DECREF((PyObject *)__pyx_v_end->next);
     __pyx_v_end->next = ((struct LinkedItem *)__pyx_t_1);
     __pyx_t_1 = 0;
 
-    /* "recordclass/_linkedlist.pyx":140
+    /* "recordclass/_linkedlist.pyx":142
  *             end = self.end
  *             end.next = item
  *             item.prev = end             # <<<<<<<<<<<<<<
@@ -6089,7 +6313,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
 */
     __pyx_t_1 = ((PyObject *)__pyx_v_end);
     __Pyx_INCREF(__pyx_t_1);
-    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(0, 140, __pyx_L1_error)
+    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(0, 142, __pyx_L1_error)
     __Pyx_GIVEREF((PyObject *)__pyx_t_1);
     __Pyx_GOTREF((PyObject *)__pyx_v_item->prev);
     __Pyx_DECREF((PyObject *)__pyx_v_item->prev);
@@ -6098,7 +6322,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
   }
   __pyx_L3:;
 
-  /* "recordclass/_linkedlist.pyx":141
+  /* "recordclass/_linkedlist.pyx":143
  *             end.next = item
  *             item.prev = end
  *         self.end = item             # <<<<<<<<<<<<<<
@@ -6111,7 +6335,7 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(struct
   __Pyx_DECREF((PyObject *)__pyx_v_self->end);
   __pyx_v_self->end = __pyx_v_item;
 
-  /* "recordclass/_linkedlist.pyx":125
+  /* "recordclass/_linkedlist.pyx":127
  *     cdef public dlinkeditem end
  *     #
  *     @cython.nonecheck(False)             # <<<<<<<<<<<<<<
@@ -6175,32 +6399,32 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_val,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 125, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 127, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 125, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 127, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "append", 0) < (0)) __PYX_ERR(0, 125, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "append", 0) < (0)) __PYX_ERR(0, 127, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, i); __PYX_ERR(0, 125, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, i); __PYX_ERR(0, 127, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 125, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 127, __pyx_L3_error)
     }
     __pyx_v_val = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 125, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 127, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -6230,7 +6454,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_append(struc
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("append", 0);
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(__pyx_v_self, __pyx_v_val, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append(__pyx_v_self, __pyx_v_val, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 127, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
@@ -6247,7 +6471,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_append(struc
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":169
+/* "recordclass/_linkedlist.pyx":171
  * #         return start
  *     #
  *     @cython.nonecheck(False)             # <<<<<<<<<<<<<<
@@ -6279,7 +6503,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_2__dealloc__(stru
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__dealloc__", 0);
 
-  /* "recordclass/_linkedlist.pyx":174
+  /* "recordclass/_linkedlist.pyx":176
  *         cdef dlinkeditem next
  * 
  *         curr = self.start             # <<<<<<<<<<<<<<
@@ -6291,7 +6515,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_2__dealloc__(stru
   __pyx_v_curr = ((struct DLinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":175
+  /* "recordclass/_linkedlist.pyx":177
  * 
  *         curr = self.start
  *         while curr is not None:             # <<<<<<<<<<<<<<
@@ -6302,7 +6526,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_2__dealloc__(stru
     __pyx_t_2 = (((PyObject *)__pyx_v_curr) != Py_None);
     if (!__pyx_t_2) break;
 
-    /* "recordclass/_linkedlist.pyx":176
+    /* "recordclass/_linkedlist.pyx":178
  *         curr = self.start
  *         while curr is not None:
  *             next = curr.next             # <<<<<<<<<<<<<<
@@ -6311,11 +6535,11 @@ static void __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_2__dealloc__(stru
 */
     __pyx_t_1 = ((PyObject *)__pyx_v_curr->next);
     __Pyx_INCREF(__pyx_t_1);
-    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 176, __pyx_L1_error)
+    if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 178, __pyx_L1_error)
     __Pyx_XDECREF_SET(__pyx_v_next, ((struct DLinkedItem *)__pyx_t_1));
     __pyx_t_1 = 0;
 
-    /* "recordclass/_linkedlist.pyx":177
+    /* "recordclass/_linkedlist.pyx":179
  *         while curr is not None:
  *             next = curr.next
  *             curr.next = None             # <<<<<<<<<<<<<<
@@ -6328,7 +6552,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_2__dealloc__(stru
     __Pyx_DECREF((PyObject *)__pyx_v_curr->next);
     __pyx_v_curr->next = ((struct LinkedItem *)Py_None);
 
-    /* "recordclass/_linkedlist.pyx":178
+    /* "recordclass/_linkedlist.pyx":180
  *             next = curr.next
  *             curr.next = None
  *             curr.prev = None             # <<<<<<<<<<<<<<
@@ -6341,7 +6565,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_2__dealloc__(stru
     __Pyx_DECREF((PyObject *)__pyx_v_curr->prev);
     __pyx_v_curr->prev = ((struct LinkedItem *)Py_None);
 
-    /* "recordclass/_linkedlist.pyx":179
+    /* "recordclass/_linkedlist.pyx":181
  *             curr.next = None
  *             curr.prev = None
  *             curr = next             # <<<<<<<<<<<<<<
@@ -6352,7 +6576,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_2__dealloc__(stru
     __Pyx_DECREF_SET(__pyx_v_curr, __pyx_v_next);
   }
 
-  /* "recordclass/_linkedlist.pyx":169
+  /* "recordclass/_linkedlist.pyx":171
  * #         return start
  *     #
  *     @cython.nonecheck(False)             # <<<<<<<<<<<<<<
@@ -6371,7 +6595,7 @@ static void __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_2__dealloc__(stru
   __Pyx_RefNannyFinishContext();
 }
 
-/* "recordclass/_linkedlist.pyx":181
+/* "recordclass/_linkedlist.pyx":183
  *             curr = next
  * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -6405,7 +6629,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_4__iter__(st
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__iter__", 0);
 
-  /* "recordclass/_linkedlist.pyx":182
+  /* "recordclass/_linkedlist.pyx":184
  * 
  *     def __iter__(self):
  *         return iterdlinkedlist(self.start)             # <<<<<<<<<<<<<<
@@ -6419,14 +6643,14 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_4__iter__(st
     PyObject *__pyx_callargs[2] = {__pyx_t_2, ((PyObject *)__pyx_v_self->start)};
     __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist, __pyx_callargs+__pyx_t_3, (2-__pyx_t_3) | (__pyx_t_3*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 182, __pyx_L1_error)
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
     __Pyx_GOTREF((PyObject *)__pyx_t_1);
   }
   __pyx_r = ((PyObject *)__pyx_t_1);
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "recordclass/_linkedlist.pyx":181
+  /* "recordclass/_linkedlist.pyx":183
  *             curr = next
  * 
  *     def __iter__(self):             # <<<<<<<<<<<<<<
@@ -6446,7 +6670,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_4__iter__(st
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":122
+/* "recordclass/_linkedlist.pyx":124
  * @cython.final
  * cdef public class dlinkedlist[object DLinkedList, type DLinkedListType]:
  *     cdef public dlinkeditem start             # <<<<<<<<<<<<<<
@@ -6510,7 +6734,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_5start_2__set__(st
   __Pyx_RefNannySetupContext("__set__", 0);
   __pyx_t_1 = __pyx_v_value;
   __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 122, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 124, __pyx_L1_error)
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF((PyObject *)__pyx_v_self->start);
   __Pyx_DECREF((PyObject *)__pyx_v_self->start);
@@ -6560,7 +6784,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_5start_4__del__(st
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":123
+/* "recordclass/_linkedlist.pyx":125
  * cdef public class dlinkedlist[object DLinkedList, type DLinkedListType]:
  *     cdef public dlinkeditem start
  *     cdef public dlinkeditem end             # <<<<<<<<<<<<<<
@@ -6624,7 +6848,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_3end_2__set__(stru
   __Pyx_RefNannySetupContext("__set__", 0);
   __pyx_t_1 = __pyx_v_value;
   __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 123, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 125, __pyx_L1_error)
   __Pyx_GIVEREF(__pyx_t_1);
   __Pyx_GOTREF((PyObject *)__pyx_v_self->end);
   __Pyx_DECREF((PyObject *)__pyx_v_self->end);
@@ -7088,7 +7312,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_11dlinkedlist_8__setstate_
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":188
+/* "recordclass/_linkedlist.pyx":190
  *     cdef dlinkeditem node
  *     #
  *     def __init__(self, dlinkeditem node):             # <<<<<<<<<<<<<<
@@ -7118,32 +7342,32 @@ static int __pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_1__init__(PyOb
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_node,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 188, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 190, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  1:
         values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 188, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 190, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 188, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 190, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 188, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 190, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 188, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 190, __pyx_L3_error)
     }
     __pyx_v_node = ((struct DLinkedItem *)values[0]);
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 188, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 190, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -7154,7 +7378,7 @@ static int __pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_1__init__(PyOb
   __Pyx_RefNannyFinishContext();
   return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node), __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem, 1, "node", 0))) __PYX_ERR(0, 188, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_node), __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem, 1, "node", 0))) __PYX_ERR(0, 190, __pyx_L1_error)
   __pyx_r = __pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist___init__(((struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)__pyx_v_self), __pyx_v_node);
 
   /* function exit code */
@@ -7179,7 +7403,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist___init__(struc
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "recordclass/_linkedlist.pyx":189
+  /* "recordclass/_linkedlist.pyx":191
  *     #
  *     def __init__(self, dlinkeditem node):
  *         self.node = node             # <<<<<<<<<<<<<<
@@ -7192,7 +7416,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist___init__(struc
   __Pyx_DECREF((PyObject *)__pyx_v_self->node);
   __pyx_v_self->node = __pyx_v_node;
 
-  /* "recordclass/_linkedlist.pyx":188
+  /* "recordclass/_linkedlist.pyx":190
  *     cdef dlinkeditem node
  *     #
  *     def __init__(self, dlinkeditem node):             # <<<<<<<<<<<<<<
@@ -7206,7 +7430,7 @@ static int __pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist___init__(struc
   return __pyx_r;
 }
 
-/* "recordclass/_linkedlist.pyx":191
+/* "recordclass/_linkedlist.pyx":193
  *         self.node = node
  *     #
  *     @cython.nonecheck(False)             # <<<<<<<<<<<<<<
@@ -7242,7 +7466,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_2__next_
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__next__", 0);
 
-  /* "recordclass/_linkedlist.pyx":195
+  /* "recordclass/_linkedlist.pyx":197
  *         cdef dlinkeditem node
  * 
  *         node =  self.node             # <<<<<<<<<<<<<<
@@ -7254,7 +7478,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_2__next_
   __pyx_v_node = ((struct DLinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":196
+  /* "recordclass/_linkedlist.pyx":198
  * 
  *         node =  self.node
  *         if node is None:             # <<<<<<<<<<<<<<
@@ -7264,7 +7488,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_2__next_
   __pyx_t_2 = (((PyObject *)__pyx_v_node) == Py_None);
   if (unlikely(__pyx_t_2)) {
 
-    /* "recordclass/_linkedlist.pyx":197
+    /* "recordclass/_linkedlist.pyx":199
  *         node =  self.node
  *         if node is None:
  *             raise StopIteration             # <<<<<<<<<<<<<<
@@ -7274,7 +7498,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_2__next_
     __pyx_error_without_exception = 1;
     goto __pyx_L1_error;;
 
-    /* "recordclass/_linkedlist.pyx":196
+    /* "recordclass/_linkedlist.pyx":198
  * 
  *         node =  self.node
  *         if node is None:             # <<<<<<<<<<<<<<
@@ -7283,7 +7507,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_2__next_
 */
   }
 
-  /* "recordclass/_linkedlist.pyx":199
+  /* "recordclass/_linkedlist.pyx":201
  *             raise StopIteration
  * 
  *         val = node.val             # <<<<<<<<<<<<<<
@@ -7295,7 +7519,7 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_2__next_
   __pyx_v_val = __pyx_t_1;
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":200
+  /* "recordclass/_linkedlist.pyx":202
  * 
  *         val = node.val
  *         self.node = node.next             # <<<<<<<<<<<<<<
@@ -7304,25 +7528,26 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_2__next_
 */
   __pyx_t_1 = ((PyObject *)__pyx_v_node->next);
   __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 200, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(0, 202, __pyx_L1_error)
   __Pyx_GIVEREF((PyObject *)__pyx_t_1);
   __Pyx_GOTREF((PyObject *)__pyx_v_self->node);
   __Pyx_DECREF((PyObject *)__pyx_v_self->node);
   __pyx_v_self->node = ((struct DLinkedItem *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "recordclass/_linkedlist.pyx":201
+  /* "recordclass/_linkedlist.pyx":203
  *         val = node.val
  *         self.node = node.next
  *         return val             # <<<<<<<<<<<<<<
  *     #
+ * 
 */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(__pyx_v_val);
   __pyx_r = __pyx_v_val;
   goto __pyx_L0;
 
-  /* "recordclass/_linkedlist.pyx":191
+  /* "recordclass/_linkedlist.pyx":193
  *         self.node = node
  *     #
  *     @cython.nonecheck(False)             # <<<<<<<<<<<<<<
@@ -7756,297 +7981,549 @@ static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterdlinkedlist_6__setst
   return __pyx_r;
 }
 
-/* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_linkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
+/* "recordclass/_linkedlist.pyx":228
+ *     cdef Py_ssize_t state  # counter of changes for iterators
+ *     #
+ *     def __init__(self, vals=None):             # <<<<<<<<<<<<<<
+ *         if vals is not None:
+ *             self.extend(vals)
 */
 
 /* Python wrapper */
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-); /*proto*/
-PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist___pyx_unpickle_linkeditem, "__pyx_unpickle_linkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
-static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem = {"__pyx_unpickle_linkeditem", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist___pyx_unpickle_linkeditem};
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem(PyObject *__pyx_self, 
-#if CYTHON_METH_FASTCALL
-PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
-#else
-PyObject *__pyx_args, PyObject *__pyx_kwds
-#endif
-) {
-  PyObject *__pyx_v___pyx_type = 0;
-  long __pyx_v___pyx_checksum;
-  PyObject *__pyx_v___pyx_state = 0;
-  #if !CYTHON_METH_FASTCALL
+static int __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_vals = 0;
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
-  #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  PyObject *__pyx_r = 0;
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_linkeditem (wrapper)", 0);
-  #if !CYTHON_METH_FASTCALL
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
   #else
-  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
-  #endif
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
   #endif
-  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_vals,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 228, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
         case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 228, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_linkeditem", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_linkeditem", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
-      }
-    } else if (unlikely(__pyx_nargs != 3)) {
-      goto __pyx_L5_argtuple_error;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 228, __pyx_L3_error)
+      if (!values[0]) values[0] = __Pyx_NewRef(((PyObject *)Py_None));
     } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 228, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      if (!values[0]) values[0] = __Pyx_NewRef(((PyObject *)Py_None));
     }
-    __pyx_v___pyx_type = values[0];
-    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
-    __pyx_v___pyx_state = ((PyObject*)values[2]);
+    __pyx_v_vals = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_linkeditem", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 0, 1, __pyx_nargs); __PYX_ERR(0, 228, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkeditem", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
-  return NULL;
+  return -1;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
-  __pyx_r = __pyx_pf_11recordclass_11_linkedlist___pyx_unpickle_linkeditem(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist___init__(((struct ChunkedList *)__pyx_v_self), __pyx_v_vals);
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
-  __pyx_L0:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __pyx_L7_cleaned_up:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_11recordclass_11_linkedlist___pyx_unpickle_linkeditem(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_v___pyx_result = 0;
-  PyObject *__pyx_r = NULL;
+static int __pyx_pf_11recordclass_11_linkedlist_11chunkedlist___init__(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_vals) {
+  int __pyx_r;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  size_t __pyx_t_4;
-  int __pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_linkeditem", 0);
+  __Pyx_RefNannySetupContext("__init__", 0);
 
-  /* "(tree fragment)":6
- * def __pyx_unpickle_linkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')             # <<<<<<<<<<<<<<
- *     __pyx_result = linkeditem.__new__(__pyx_type)
- *     if __pyx_state is not None:
+  /* "recordclass/_linkedlist.pyx":229
+ *     #
+ *     def __init__(self, vals=None):
+ *         if vals is not None:             # <<<<<<<<<<<<<<
+ *             self.extend(vals)
+ *     #
 */
-  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, __pyx_k_next_val); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+  __pyx_t_1 = (__pyx_v_vals != Py_None);
+  if (__pyx_t_1) {
 
-  /* "(tree fragment)":7
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
- *     __pyx_result = linkeditem.__new__(__pyx_type)             # <<<<<<<<<<<<<<
- *     if __pyx_state is not None:
- *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
+    /* "recordclass/_linkedlist.pyx":230
+ *     def __init__(self, vals=None):
+ *         if vals is not None:
+ *             self.extend(vals)             # <<<<<<<<<<<<<<
+ *     #
+ *     cdef chunk* new_chunk(self) except NULL:
 */
-  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_t_4 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
-    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_extend(__pyx_v_self, __pyx_v_vals, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 230, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-  }
-  __pyx_v___pyx_result = __pyx_t_2;
-  __pyx_t_2 = 0;
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
- *     __pyx_result = linkeditem.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result
+    /* "recordclass/_linkedlist.pyx":229
+ *     #
+ *     def __init__(self, vals=None):
+ *         if vals is not None:             # <<<<<<<<<<<<<<
+ *             self.extend(vals)
+ *     #
 */
-  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
-  if (__pyx_t_5) {
+  }
 
-    /* "(tree fragment)":9
- *     __pyx_result = linkeditem.__new__(__pyx_type)
- *     if __pyx_state is not None:
- *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
- *     return __pyx_result
- * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):
+  /* "recordclass/_linkedlist.pyx":228
+ *     cdef Py_ssize_t state  # counter of changes for iterators
+ *     #
+ *     def __init__(self, vals=None):             # <<<<<<<<<<<<<<
+ *         if vals is not None:
+ *             self.extend(vals)
 */
-    if (unlikely(__pyx_v___pyx_state == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-      __PYX_ERR(1, 9, __pyx_L1_error)
-    }
-    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkeditem__set_state(((struct LinkedItem *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
- *     __pyx_result = linkeditem.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "recordclass/_linkedlist.pyx":232
+ *             self.extend(vals)
+ *     #
+ *     cdef chunk* new_chunk(self) except NULL:             # <<<<<<<<<<<<<<
+ *         cdef chunk *c = self.spare
+ * 
+*/
+
+static struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_new_chunk(struct ChunkedList *__pyx_v_self) {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_r;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "recordclass/_linkedlist.pyx":233
+ *     #
+ *     cdef chunk* new_chunk(self) except NULL:
+ *         cdef chunk *c = self.spare             # <<<<<<<<<<<<<<
+ * 
+ *         if c is not NULL:
+*/
+  __pyx_t_1 = __pyx_v_self->spare;
+  __pyx_v_c = __pyx_t_1;
+
+  /* "recordclass/_linkedlist.pyx":235
+ *         cdef chunk *c = self.spare
+ * 
+ *         if c is not NULL:             # <<<<<<<<<<<<<<
+ *             self.spare = NULL
+ *         else:
+*/
+  __pyx_t_2 = (__pyx_v_c != NULL);
+  if (__pyx_t_2) {
+
+    /* "recordclass/_linkedlist.pyx":236
+ * 
+ *         if c is not NULL:
+ *             self.spare = NULL             # <<<<<<<<<<<<<<
+ *         else:
+ *             c = <chunk*>PyMem_Malloc(sizeof(chunk))
+*/
+    __pyx_v_self->spare = NULL;
+
+    /* "recordclass/_linkedlist.pyx":235
+ *         cdef chunk *c = self.spare
+ * 
+ *         if c is not NULL:             # <<<<<<<<<<<<<<
+ *             self.spare = NULL
+ *         else:
 */
+    goto __pyx_L3;
   }
 
-  /* "(tree fragment)":10
- *     if __pyx_state is not None:
- *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]
+  /* "recordclass/_linkedlist.pyx":238
+ *             self.spare = NULL
+ *         else:
+ *             c = <chunk*>PyMem_Malloc(sizeof(chunk))             # <<<<<<<<<<<<<<
+ *             if c is NULL:
+ *                 raise MemoryError()
 */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v___pyx_result);
-  __pyx_r = __pyx_v___pyx_result;
+  /*else*/ {
+    __pyx_v_c = ((struct __pyx_t_11recordclass_11_linkedlist_chunk *)PyMem_Malloc((sizeof(struct __pyx_t_11recordclass_11_linkedlist_chunk))));
+
+    /* "recordclass/_linkedlist.pyx":239
+ *         else:
+ *             c = <chunk*>PyMem_Malloc(sizeof(chunk))
+ *             if c is NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *         c.prev = NULL
+*/
+    __pyx_t_2 = (__pyx_v_c == NULL);
+    if (unlikely(__pyx_t_2)) {
+
+      /* "recordclass/_linkedlist.pyx":240
+ *             c = <chunk*>PyMem_Malloc(sizeof(chunk))
+ *             if c is NULL:
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ *         c.prev = NULL
+ *         c.next = NULL
+*/
+      PyErr_NoMemory(); __PYX_ERR(0, 240, __pyx_L1_error)
+
+      /* "recordclass/_linkedlist.pyx":239
+ *         else:
+ *             c = <chunk*>PyMem_Malloc(sizeof(chunk))
+ *             if c is NULL:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *         c.prev = NULL
+*/
+    }
+  }
+  __pyx_L3:;
+
+  /* "recordclass/_linkedlist.pyx":241
+ *             if c is NULL:
+ *                 raise MemoryError()
+ *         c.prev = NULL             # <<<<<<<<<<<<<<
+ *         c.next = NULL
+ *         return c
+*/
+  __pyx_v_c->prev = NULL;
+
+  /* "recordclass/_linkedlist.pyx":242
+ *                 raise MemoryError()
+ *         c.prev = NULL
+ *         c.next = NULL             # <<<<<<<<<<<<<<
+ *         return c
+ *     #
+*/
+  __pyx_v_c->next = NULL;
+
+  /* "recordclass/_linkedlist.pyx":243
+ *         c.prev = NULL
+ *         c.next = NULL
+ *         return c             # <<<<<<<<<<<<<<
+ *     #
+ *     cdef void release_chunk(self, chunk *c):
+*/
+  __pyx_r = __pyx_v_c;
   goto __pyx_L0;
 
-  /* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_linkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
+  /* "recordclass/_linkedlist.pyx":232
+ *             self.extend(vals)
+ *     #
+ *     cdef chunk* new_chunk(self) except NULL:             # <<<<<<<<<<<<<<
+ *         cdef chunk *c = self.spare
+ * 
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkeditem", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.new_chunk", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v___pyx_result);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":11
- *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+/* "recordclass/_linkedlist.pyx":245
+ *         return c
+ *     #
+ *     cdef void release_chunk(self, chunk *c):             # <<<<<<<<<<<<<<
+ *         if self.spare is NULL:
+ *             self.spare = c
 */
 
-static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkeditem__set_state(struct LinkedItem *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+static void __pyx_f_11recordclass_11_linkedlist_11chunkedlist_release_chunk(struct ChunkedList *__pyx_v_self, struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c) {
+  int __pyx_t_1;
+
+  /* "recordclass/_linkedlist.pyx":246
+ *     #
+ *     cdef void release_chunk(self, chunk *c):
+ *         if self.spare is NULL:             # <<<<<<<<<<<<<<
+ *             self.spare = c
+ *         else:
+*/
+  __pyx_t_1 = (__pyx_v_self->spare == NULL);
+  if (__pyx_t_1) {
+
+    /* "recordclass/_linkedlist.pyx":247
+ *     cdef void release_chunk(self, chunk *c):
+ *         if self.spare is NULL:
+ *             self.spare = c             # <<<<<<<<<<<<<<
+ *         else:
+ *             PyMem_Free(c)
+*/
+    __pyx_v_self->spare = __pyx_v_c;
+
+    /* "recordclass/_linkedlist.pyx":246
+ *     #
+ *     cdef void release_chunk(self, chunk *c):
+ *         if self.spare is NULL:             # <<<<<<<<<<<<<<
+ *             self.spare = c
+ *         else:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "recordclass/_linkedlist.pyx":249
+ *             self.spare = c
+ *         else:
+ *             PyMem_Free(c)             # <<<<<<<<<<<<<<
+ *     #
+ *     cpdef append(self, val):
+*/
+  /*else*/ {
+    PyMem_Free(__pyx_v_c);
+  }
+  __pyx_L3:;
+
+  /* "recordclass/_linkedlist.pyx":245
+ *         return c
+ *     #
+ *     cdef void release_chunk(self, chunk *c):             # <<<<<<<<<<<<<<
+ *         if self.spare is NULL:
+ *             self.spare = c
+*/
+
+  /* function exit code */
+}
+
+/* "recordclass/_linkedlist.pyx":251
+ *             PyMem_Free(c)
+ *     #
+ *     cpdef append(self, val):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ * 
+*/
+
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_3append(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_append(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_val, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  int __pyx_t_1;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_2;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_linkeditem__set_state", 0);
+  __Pyx_RefNannySetupContext("append", 0);
 
-  /* "(tree fragment)":12
- *     return __pyx_result
- * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]             # <<<<<<<<<<<<<<
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+  /* "recordclass/_linkedlist.pyx":254
+ *         cdef chunk *c
+ * 
+ *         if self.tail is NULL:             # <<<<<<<<<<<<<<
+ *             c = self.new_chunk()
+ *             self.head = self.tail = c
 */
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->next);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->next);
-  __pyx_v___pyx_result->next = ((struct LinkedItem *)__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1);
-  __Pyx_INCREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v___pyx_result->val);
-  __Pyx_DECREF(__pyx_v___pyx_result->val);
-  __pyx_v___pyx_result->val = __pyx_t_1;
-  __pyx_t_1 = 0;
+  __pyx_t_1 = (__pyx_v_self->tail == NULL);
+  if (__pyx_t_1) {
 
-  /* "(tree fragment)":13
- * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)             # <<<<<<<<<<<<<<
+    /* "recordclass/_linkedlist.pyx":255
+ * 
+ *         if self.tail is NULL:
+ *             c = self.new_chunk()             # <<<<<<<<<<<<<<
+ *             self.head = self.tail = c
+ *             self.first = self.last = 0
+*/
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_new_chunk(__pyx_v_self); if (unlikely(__pyx_t_2 == ((void *)NULL))) __PYX_ERR(0, 255, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_2;
+
+    /* "recordclass/_linkedlist.pyx":256
+ *         if self.tail is NULL:
+ *             c = self.new_chunk()
+ *             self.head = self.tail = c             # <<<<<<<<<<<<<<
+ *             self.first = self.last = 0
+ *         elif self.last == CHUNK_SIZE:
+*/
+    __pyx_v_self->head = __pyx_v_c;
+    __pyx_v_self->tail = __pyx_v_c;
+
+    /* "recordclass/_linkedlist.pyx":257
+ *             c = self.new_chunk()
+ *             self.head = self.tail = c
+ *             self.first = self.last = 0             # <<<<<<<<<<<<<<
+ *         elif self.last == CHUNK_SIZE:
+ *             c = self.new_chunk()
+*/
+    __pyx_v_self->first = 0;
+    __pyx_v_self->last = 0;
+
+    /* "recordclass/_linkedlist.pyx":254
+ *         cdef chunk *c
+ * 
+ *         if self.tail is NULL:             # <<<<<<<<<<<<<<
+ *             c = self.new_chunk()
+ *             self.head = self.tail = c
 */
-  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 2); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+    goto __pyx_L3;
+  }
 
-  /* "(tree fragment)":11
- *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+  /* "recordclass/_linkedlist.pyx":258
+ *             self.head = self.tail = c
+ *             self.first = self.last = 0
+ *         elif self.last == CHUNK_SIZE:             # <<<<<<<<<<<<<<
+ *             c = self.new_chunk()
+ *             c.prev = self.tail
+*/
+  __pyx_t_1 = (__pyx_v_self->last == __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE);
+  if (__pyx_t_1) {
+
+    /* "recordclass/_linkedlist.pyx":259
+ *             self.first = self.last = 0
+ *         elif self.last == CHUNK_SIZE:
+ *             c = self.new_chunk()             # <<<<<<<<<<<<<<
+ *             c.prev = self.tail
+ *             self.tail.next = c
+*/
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_new_chunk(__pyx_v_self); if (unlikely(__pyx_t_2 == ((void *)NULL))) __PYX_ERR(0, 259, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_2;
+
+    /* "recordclass/_linkedlist.pyx":260
+ *         elif self.last == CHUNK_SIZE:
+ *             c = self.new_chunk()
+ *             c.prev = self.tail             # <<<<<<<<<<<<<<
+ *             self.tail.next = c
+ *             self.tail = c
+*/
+    __pyx_t_2 = __pyx_v_self->tail;
+    __pyx_v_c->prev = __pyx_t_2;
+
+    /* "recordclass/_linkedlist.pyx":261
+ *             c = self.new_chunk()
+ *             c.prev = self.tail
+ *             self.tail.next = c             # <<<<<<<<<<<<<<
+ *             self.tail = c
+ *             self.last = 0
+*/
+    __pyx_v_self->tail->next = __pyx_v_c;
+
+    /* "recordclass/_linkedlist.pyx":262
+ *             c.prev = self.tail
+ *             self.tail.next = c
+ *             self.tail = c             # <<<<<<<<<<<<<<
+ *             self.last = 0
+ *         Py_INCREF(val)
+*/
+    __pyx_v_self->tail = __pyx_v_c;
+
+    /* "recordclass/_linkedlist.pyx":263
+ *             self.tail.next = c
+ *             self.tail = c
+ *             self.last = 0             # <<<<<<<<<<<<<<
+ *         Py_INCREF(val)
+ *         self.tail.items[self.last] = <PyObject*>val
+*/
+    __pyx_v_self->last = 0;
+
+    /* "recordclass/_linkedlist.pyx":258
+ *             self.head = self.tail = c
+ *             self.first = self.last = 0
+ *         elif self.last == CHUNK_SIZE:             # <<<<<<<<<<<<<<
+ *             c = self.new_chunk()
+ *             c.prev = self.tail
+*/
+  }
+  __pyx_L3:;
+
+  /* "recordclass/_linkedlist.pyx":264
+ *             self.tail = c
+ *             self.last = 0
+ *         Py_INCREF(val)             # <<<<<<<<<<<<<<
+ *         self.tail.items[self.last] = <PyObject*>val
+ *         self.last += 1
+*/
+  Py_INCREF(__pyx_v_val);
+
+  /* "recordclass/_linkedlist.pyx":265
+ *             self.last = 0
+ *         Py_INCREF(val)
+ *         self.tail.items[self.last] = <PyObject*>val             # <<<<<<<<<<<<<<
+ *         self.last += 1
+ *         self.size += 1
+*/
+  (__pyx_v_self->tail->items[__pyx_v_self->last]) = ((PyObject *)__pyx_v_val);
+
+  /* "recordclass/_linkedlist.pyx":266
+ *         Py_INCREF(val)
+ *         self.tail.items[self.last] = <PyObject*>val
+ *         self.last += 1             # <<<<<<<<<<<<<<
+ *         self.size += 1
+ *         self.state += 1
+*/
+  __pyx_v_self->last = (__pyx_v_self->last + 1);
+
+  /* "recordclass/_linkedlist.pyx":267
+ *         self.tail.items[self.last] = <PyObject*>val
+ *         self.last += 1
+ *         self.size += 1             # <<<<<<<<<<<<<<
+ *         self.state += 1
+ *     #
+*/
+  __pyx_v_self->size = (__pyx_v_self->size + 1);
+
+  /* "recordclass/_linkedlist.pyx":268
+ *         self.last += 1
+ *         self.size += 1
+ *         self.state += 1             # <<<<<<<<<<<<<<
+ *     #
+ *     cpdef appendleft(self, val):
+*/
+  __pyx_v_self->state = (__pyx_v_self->state + 1);
+
+  /* "recordclass/_linkedlist.pyx":251
+ *             PyMem_Free(c)
+ *     #
+ *     cpdef append(self, val):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ * 
 */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkeditem__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.append", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8054,45 +8531,35 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkeditem__
   return __pyx_r;
 }
 
-/* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_linkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
-*/
-
 /* Python wrapper */
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_3append(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist, "__pyx_unpickle_linkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
-static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist = {"__pyx_unpickle_linkedlist", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist};
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_11chunkedlist_2append, "chunkedlist.append(self, val)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_3append = {"append", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_3append, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_2append};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_3append(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v___pyx_type = 0;
-  long __pyx_v___pyx_checksum;
-  PyObject *__pyx_v___pyx_state = 0;
+  PyObject *__pyx_v_val = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_linkedlist (wrapper)", 0);
+  __Pyx_RefNannySetupContext("append (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -8102,250 +8569,281 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_val,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 251, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 251, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_linkedlist", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_linkedlist", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "append", 0) < (0)) __PYX_ERR(0, 251, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, i); __PYX_ERR(0, 251, __pyx_L3_error) }
       }
-    } else if (unlikely(__pyx_nargs != 3)) {
+    } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 251, __pyx_L3_error)
     }
-    __pyx_v___pyx_type = values[0];
-    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
-    __pyx_v___pyx_state = ((PyObject*)values[2]);
+    __pyx_v_val = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_linkedlist", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("append", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 251, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.append", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
-  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_2append(((struct ChunkedList *)__pyx_v_self), __pyx_v_val);
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
-  __pyx_L0:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __pyx_L7_cleaned_up:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_v___pyx_result = 0;
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_2append(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_val) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  size_t __pyx_t_4;
-  int __pyx_t_5;
+  PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_linkedlist", 0);
-
-  /* "(tree fragment)":6
- * def __pyx_unpickle_linkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')             # <<<<<<<<<<<<<<
- *     __pyx_result = linkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:
-*/
-  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, __pyx_k_end_start); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
-
-  /* "(tree fragment)":7
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
- *     __pyx_result = linkedlist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
- *     if __pyx_state is not None:
- *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
-*/
-  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_t_4 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
-    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-  }
-  __pyx_v___pyx_result = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
- *     __pyx_result = linkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
-*/
-  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
-  if (__pyx_t_5) {
-
-    /* "(tree fragment)":9
- *     __pyx_result = linkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:
- *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
- *     return __pyx_result
- * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):
-*/
-    if (unlikely(__pyx_v___pyx_state == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-      __PYX_ERR(1, 9, __pyx_L1_error)
-    }
-    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkedlist__set_state(((struct LinkedList *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
- *     __pyx_result = linkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
-*/
-  }
-
-  /* "(tree fragment)":10
- *     if __pyx_state is not None:
- *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
-*/
+  __Pyx_RefNannySetupContext("append", 0);
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v___pyx_result);
-  __pyx_r = __pyx_v___pyx_result;
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_append(__pyx_v_self, __pyx_v_val, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_linkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
-*/
-
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.append", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v___pyx_result);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":11
- *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+/* "recordclass/_linkedlist.pyx":270
+ *         self.state += 1
+ *     #
+ *     cpdef appendleft(self, val):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ * 
 */
 
-static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkedlist__set_state(struct LinkedList *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_5appendleft(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_appendleft(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_val, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  int __pyx_t_1;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_2;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_linkedlist__set_state", 0);
+  __Pyx_RefNannySetupContext("appendleft", 0);
 
-  /* "(tree fragment)":12
- *     return __pyx_result
- * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]             # <<<<<<<<<<<<<<
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+  /* "recordclass/_linkedlist.pyx":273
+ *         cdef chunk *c
+ * 
+ *         if self.head is NULL:             # <<<<<<<<<<<<<<
+ *             c = self.new_chunk()
+ *             self.head = self.tail = c
 */
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->end);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->end);
-  __pyx_v___pyx_result->end = ((struct LinkedItem *)__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->start);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->start);
-  __pyx_v___pyx_result->start = ((struct LinkedItem *)__pyx_t_1);
-  __pyx_t_1 = 0;
+  __pyx_t_1 = (__pyx_v_self->head == NULL);
+  if (__pyx_t_1) {
 
-  /* "(tree fragment)":13
- * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)             # <<<<<<<<<<<<<<
+    /* "recordclass/_linkedlist.pyx":274
+ * 
+ *         if self.head is NULL:
+ *             c = self.new_chunk()             # <<<<<<<<<<<<<<
+ *             self.head = self.tail = c
+ *             self.first = self.last = CHUNK_SIZE
+*/
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_new_chunk(__pyx_v_self); if (unlikely(__pyx_t_2 == ((void *)NULL))) __PYX_ERR(0, 274, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_2;
+
+    /* "recordclass/_linkedlist.pyx":275
+ *         if self.head is NULL:
+ *             c = self.new_chunk()
+ *             self.head = self.tail = c             # <<<<<<<<<<<<<<
+ *             self.first = self.last = CHUNK_SIZE
+ *         elif self.first == 0:
+*/
+    __pyx_v_self->head = __pyx_v_c;
+    __pyx_v_self->tail = __pyx_v_c;
+
+    /* "recordclass/_linkedlist.pyx":276
+ *             c = self.new_chunk()
+ *             self.head = self.tail = c
+ *             self.first = self.last = CHUNK_SIZE             # <<<<<<<<<<<<<<
+ *         elif self.first == 0:
+ *             c = self.new_chunk()
+*/
+    __pyx_v_self->first = __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE;
+    __pyx_v_self->last = __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE;
+
+    /* "recordclass/_linkedlist.pyx":273
+ *         cdef chunk *c
+ * 
+ *         if self.head is NULL:             # <<<<<<<<<<<<<<
+ *             c = self.new_chunk()
+ *             self.head = self.tail = c
 */
-  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 2); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+    goto __pyx_L3;
+  }
 
-  /* "(tree fragment)":11
- *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+  /* "recordclass/_linkedlist.pyx":277
+ *             self.head = self.tail = c
+ *             self.first = self.last = CHUNK_SIZE
+ *         elif self.first == 0:             # <<<<<<<<<<<<<<
+ *             c = self.new_chunk()
+ *             c.next = self.head
+*/
+  __pyx_t_1 = (__pyx_v_self->first == 0);
+  if (__pyx_t_1) {
+
+    /* "recordclass/_linkedlist.pyx":278
+ *             self.first = self.last = CHUNK_SIZE
+ *         elif self.first == 0:
+ *             c = self.new_chunk()             # <<<<<<<<<<<<<<
+ *             c.next = self.head
+ *             self.head.prev = c
+*/
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_new_chunk(__pyx_v_self); if (unlikely(__pyx_t_2 == ((void *)NULL))) __PYX_ERR(0, 278, __pyx_L1_error)
+    __pyx_v_c = __pyx_t_2;
+
+    /* "recordclass/_linkedlist.pyx":279
+ *         elif self.first == 0:
+ *             c = self.new_chunk()
+ *             c.next = self.head             # <<<<<<<<<<<<<<
+ *             self.head.prev = c
+ *             self.head = c
+*/
+    __pyx_t_2 = __pyx_v_self->head;
+    __pyx_v_c->next = __pyx_t_2;
+
+    /* "recordclass/_linkedlist.pyx":280
+ *             c = self.new_chunk()
+ *             c.next = self.head
+ *             self.head.prev = c             # <<<<<<<<<<<<<<
+ *             self.head = c
+ *             self.first = CHUNK_SIZE
+*/
+    __pyx_v_self->head->prev = __pyx_v_c;
+
+    /* "recordclass/_linkedlist.pyx":281
+ *             c.next = self.head
+ *             self.head.prev = c
+ *             self.head = c             # <<<<<<<<<<<<<<
+ *             self.first = CHUNK_SIZE
+ *         Py_INCREF(val)
+*/
+    __pyx_v_self->head = __pyx_v_c;
+
+    /* "recordclass/_linkedlist.pyx":282
+ *             self.head.prev = c
+ *             self.head = c
+ *             self.first = CHUNK_SIZE             # <<<<<<<<<<<<<<
+ *         Py_INCREF(val)
+ *         self.first -= 1
+*/
+    __pyx_v_self->first = __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE;
+
+    /* "recordclass/_linkedlist.pyx":277
+ *             self.head = self.tail = c
+ *             self.first = self.last = CHUNK_SIZE
+ *         elif self.first == 0:             # <<<<<<<<<<<<<<
+ *             c = self.new_chunk()
+ *             c.next = self.head
+*/
+  }
+  __pyx_L3:;
+
+  /* "recordclass/_linkedlist.pyx":283
+ *             self.head = c
+ *             self.first = CHUNK_SIZE
+ *         Py_INCREF(val)             # <<<<<<<<<<<<<<
+ *         self.first -= 1
+ *         self.head.items[self.first] = <PyObject*>val
+*/
+  Py_INCREF(__pyx_v_val);
+
+  /* "recordclass/_linkedlist.pyx":284
+ *             self.first = CHUNK_SIZE
+ *         Py_INCREF(val)
+ *         self.first -= 1             # <<<<<<<<<<<<<<
+ *         self.head.items[self.first] = <PyObject*>val
+ *         self.size += 1
+*/
+  __pyx_v_self->first = (__pyx_v_self->first - 1);
+
+  /* "recordclass/_linkedlist.pyx":285
+ *         Py_INCREF(val)
+ *         self.first -= 1
+ *         self.head.items[self.first] = <PyObject*>val             # <<<<<<<<<<<<<<
+ *         self.size += 1
+ *         self.state += 1
+*/
+  (__pyx_v_self->head->items[__pyx_v_self->first]) = ((PyObject *)__pyx_v_val);
+
+  /* "recordclass/_linkedlist.pyx":286
+ *         self.first -= 1
+ *         self.head.items[self.first] = <PyObject*>val
+ *         self.size += 1             # <<<<<<<<<<<<<<
+ *         self.state += 1
+ *     #
+*/
+  __pyx_v_self->size = (__pyx_v_self->size + 1);
+
+  /* "recordclass/_linkedlist.pyx":287
+ *         self.head.items[self.first] = <PyObject*>val
+ *         self.size += 1
+ *         self.state += 1             # <<<<<<<<<<<<<<
+ *     #
+ *     cpdef extend(self, vals):
+*/
+  __pyx_v_self->state = (__pyx_v_self->state + 1);
+
+  /* "recordclass/_linkedlist.pyx":270
+ *         self.state += 1
+ *     #
+ *     cpdef appendleft(self, val):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ * 
 */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkedlist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.appendleft", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -8353,45 +8851,35 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkedlist__
   return __pyx_r;
 }
 
-/* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_iterlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
-*/
-
 /* Python wrapper */
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_5appendleft(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist, "__pyx_unpickle_iterlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
-static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist = {"__pyx_unpickle_iterlinkedlist", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist};
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_11chunkedlist_4appendleft, "chunkedlist.appendleft(self, val)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_5appendleft = {"appendleft", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_5appendleft, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_4appendleft};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_5appendleft(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v___pyx_type = 0;
-  long __pyx_v___pyx_checksum;
-  PyObject *__pyx_v___pyx_state = 0;
+  PyObject *__pyx_v_val = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_iterlinkedlist (wrapper)", 0);
+  __Pyx_RefNannySetupContext("appendleft (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -8401,234 +8889,194 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_val,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 270, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 270, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_iterlinkedlist", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_iterlinkedlist", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "appendleft", 0) < (0)) __PYX_ERR(0, 270, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("appendleft", 1, 1, 1, i); __PYX_ERR(0, 270, __pyx_L3_error) }
       }
-    } else if (unlikely(__pyx_nargs != 3)) {
+    } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 270, __pyx_L3_error)
     }
-    __pyx_v___pyx_type = values[0];
-    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
-    __pyx_v___pyx_state = ((PyObject*)values[2]);
+    __pyx_v_val = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_iterlinkedlist", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("appendleft", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 270, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.appendleft", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
-  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_4appendleft(((struct ChunkedList *)__pyx_v_self), __pyx_v_val);
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
-  __pyx_L0:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __pyx_L7_cleaned_up:;
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_v___pyx_result = 0;
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_4appendleft(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_val) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  size_t __pyx_t_4;
-  int __pyx_t_5;
+  PyObject *__pyx_t_1 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_iterlinkedlist", 0);
-
-  /* "(tree fragment)":6
- * def __pyx_unpickle_iterlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')             # <<<<<<<<<<<<<<
- *     __pyx_result = iterlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:
-*/
-  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, __pyx_k_node); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
-
-  /* "(tree fragment)":7
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
- *     __pyx_result = iterlinkedlist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
- *     if __pyx_state is not None:
- *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
-*/
-  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_t_4 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
-    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-  }
-  __pyx_v___pyx_result = __pyx_t_2;
-  __pyx_t_2 = 0;
-
-  /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
- *     __pyx_result = iterlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
-*/
-  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
-  if (__pyx_t_5) {
-
-    /* "(tree fragment)":9
- *     __pyx_result = iterlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:
- *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
- *     return __pyx_result
- * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):
-*/
-    if (unlikely(__pyx_v___pyx_state == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-      __PYX_ERR(1, 9, __pyx_L1_error)
-    }
-    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterlinkedlist__set_state(((struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-
-    /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
- *     __pyx_result = iterlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
-*/
-  }
-
-  /* "(tree fragment)":10
- *     if __pyx_state is not None:
- *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.node = __pyx_state[0]
-*/
+  __Pyx_RefNannySetupContext("appendleft", 0);
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v___pyx_result);
-  __pyx_r = __pyx_v___pyx_result;
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_appendleft(__pyx_v_self, __pyx_v_val, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_iterlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
-*/
-
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.appendleft", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v___pyx_result);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":11
- *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.node = __pyx_state[0]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+/* "recordclass/_linkedlist.pyx":289
+ *         self.state += 1
+ *     #
+ *     cpdef extend(self, vals):             # <<<<<<<<<<<<<<
+ *         for val in vals:
+ *             self.append(val)
 */
 
-static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterlinkedlist__set_state(struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_7extend(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_extend(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_vals, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  PyObject *__pyx_v_val = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  Py_ssize_t __pyx_t_2;
+  PyObject *(*__pyx_t_3)(PyObject *);
+  PyObject *__pyx_t_4 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_iterlinkedlist__set_state", 0);
+  __Pyx_RefNannySetupContext("extend", 0);
 
-  /* "(tree fragment)":12
- *     return __pyx_result
- * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.node = __pyx_state[0]             # <<<<<<<<<<<<<<
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+  /* "recordclass/_linkedlist.pyx":290
+ *     #
+ *     cpdef extend(self, vals):
+ *         for val in vals:             # <<<<<<<<<<<<<<
+ *             self.append(val)
+ *     #
 */
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->node);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->node);
-  __pyx_v___pyx_result->node = ((struct LinkedItem *)__pyx_t_1);
-  __pyx_t_1 = 0;
+  if (likely(PyList_CheckExact(__pyx_v_vals)) || PyTuple_CheckExact(__pyx_v_vals)) {
+    __pyx_t_1 = __pyx_v_vals; __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_2 = 0;
+    __pyx_t_3 = NULL;
+  } else {
+    __pyx_t_2 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_v_vals); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 290, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_3 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 290, __pyx_L1_error)
+  }
+  for (;;) {
+    if (likely(!__pyx_t_3)) {
+      if (likely(PyList_CheckExact(__pyx_t_1))) {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 290, __pyx_L1_error)
+          #endif
+          if (__pyx_t_2 >= __pyx_temp) break;
+        }
+        __pyx_t_4 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_2, __Pyx_ReferenceSharing_OwnStrongReference);
+        ++__pyx_t_2;
+      } else {
+        {
+          Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_1);
+          #if !CYTHON_ASSUME_SAFE_SIZE
+          if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 290, __pyx_L1_error)
+          #endif
+          if (__pyx_t_2 >= __pyx_temp) break;
+        }
+        #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+        __pyx_t_4 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2));
+        #else
+        __pyx_t_4 = __Pyx_PySequence_ITEM(__pyx_t_1, __pyx_t_2);
+        #endif
+        ++__pyx_t_2;
+      }
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 290, __pyx_L1_error)
+    } else {
+      __pyx_t_4 = __pyx_t_3(__pyx_t_1);
+      if (unlikely(!__pyx_t_4)) {
+        PyObject* exc_type = PyErr_Occurred();
+        if (exc_type) {
+          if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 290, __pyx_L1_error)
+          PyErr_Clear();
+        }
+        break;
+      }
+    }
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_XDECREF_SET(__pyx_v_val, __pyx_t_4);
+    __pyx_t_4 = 0;
 
-  /* "(tree fragment)":13
- * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.node = __pyx_state[0]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)             # <<<<<<<<<<<<<<
+    /* "recordclass/_linkedlist.pyx":291
+ *     cpdef extend(self, vals):
+ *         for val in vals:
+ *             self.append(val)             # <<<<<<<<<<<<<<
+ *     #
+ *     cpdef pop(self):
 */
-  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+    __pyx_t_4 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_append(__pyx_v_self, __pyx_v_val, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 291, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "(tree fragment)":11
- *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.node = __pyx_state[0]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+    /* "recordclass/_linkedlist.pyx":290
+ *     #
+ *     cpdef extend(self, vals):
+ *         for val in vals:             # <<<<<<<<<<<<<<
+ *             self.append(val)
+ *     #
+*/
+  }
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "recordclass/_linkedlist.pyx":289
+ *         self.state += 1
+ *     #
+ *     cpdef extend(self, vals):             # <<<<<<<<<<<<<<
+ *         for val in vals:
+ *             self.append(val)
 */
 
   /* function exit code */
@@ -8636,53 +9084,45 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterlinkedli
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterlinkedlist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.extend", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_val);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_dlinkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
-*/
-
 /* Python wrapper */
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_7extend(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_6__pyx_unpickle_dlinkeditem, "__pyx_unpickle_dlinkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
-static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem = {"__pyx_unpickle_dlinkeditem", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_6__pyx_unpickle_dlinkeditem};
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_11chunkedlist_6extend, "chunkedlist.extend(self, vals)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_7extend = {"extend", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_7extend, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_6extend};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_7extend(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v___pyx_type = 0;
-  long __pyx_v___pyx_checksum;
-  PyObject *__pyx_v___pyx_state = 0;
+  PyObject *__pyx_v_vals = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
+  PyObject* values[1] = {0};
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkeditem (wrapper)", 0);
+  __Pyx_RefNannySetupContext("extend (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -8692,303 +9132,370 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
   {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_vals,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 289, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 289, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_dlinkeditem", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_dlinkeditem", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "extend", 0) < (0)) __PYX_ERR(0, 289, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("extend", 1, 1, 1, i); __PYX_ERR(0, 289, __pyx_L3_error) }
       }
-    } else if (unlikely(__pyx_nargs != 3)) {
+    } else if (unlikely(__pyx_nargs != 1)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 289, __pyx_L3_error)
     }
-    __pyx_v___pyx_type = values[0];
-    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
-    __pyx_v___pyx_state = ((PyObject*)values[2]);
+    __pyx_v_vals = values[0];
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_dlinkeditem", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("extend", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 289, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkeditem", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.extend", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
-  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_6__pyx_unpickle_dlinkeditem(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_6extend(((struct ChunkedList *)__pyx_v_self), __pyx_v_vals);
 
   /* function exit code */
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  __pyx_r = NULL;
   for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
     Py_XDECREF(values[__pyx_temp]);
   }
-  goto __pyx_L7_cleaned_up;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_6extend(struct ChunkedList *__pyx_v_self, PyObject *__pyx_v_vals) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("extend", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_extend(__pyx_v_self, __pyx_v_vals, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.extend", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __pyx_L7_cleaned_up:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_11recordclass_11_linkedlist_6__pyx_unpickle_dlinkeditem(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_v___pyx_result = 0;
+/* "recordclass/_linkedlist.pyx":293
+ *             self.append(val)
+ *     #
+ *     cpdef pop(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ *         cdef PyObject *item
+*/
+
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_9pop(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_pop(struct ChunkedList *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c;
+  PyObject *__pyx_v_item;
+  PyObject *__pyx_v_val = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   size_t __pyx_t_4;
-  int __pyx_t_5;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkeditem", 0);
-
-  /* "(tree fragment)":6
- * def __pyx_unpickle_dlinkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')             # <<<<<<<<<<<<<<
- *     __pyx_result = dlinkeditem.__new__(__pyx_type)
- *     if __pyx_state is not None:
-*/
-  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, __pyx_k_next_prev_val); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
-
-  /* "(tree fragment)":7
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
- *     __pyx_result = dlinkeditem.__new__(__pyx_type)             # <<<<<<<<<<<<<<
- *     if __pyx_state is not None:
- *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
-*/
-  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_t_4 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
-    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-  }
-  __pyx_v___pyx_result = __pyx_t_2;
-  __pyx_t_2 = 0;
+  __Pyx_RefNannySetupContext("pop", 0);
 
-  /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
- *     __pyx_result = dlinkeditem.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result
+  /* "recordclass/_linkedlist.pyx":297
+ *         cdef PyObject *item
+ * 
+ *         if self.size == 0:             # <<<<<<<<<<<<<<
+ *             raise IndexError("pop from an empty chunkedlist")
+ * 
 */
-  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
-  if (__pyx_t_5) {
+  __pyx_t_1 = (__pyx_v_self->size == 0);
+  if (unlikely(__pyx_t_1)) {
 
-    /* "(tree fragment)":9
- *     __pyx_result = dlinkeditem.__new__(__pyx_type)
- *     if __pyx_state is not None:
- *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
- *     return __pyx_result
- * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):
+    /* "recordclass/_linkedlist.pyx":298
+ * 
+ *         if self.size == 0:
+ *             raise IndexError("pop from an empty chunkedlist")             # <<<<<<<<<<<<<<
+ * 
+ *         self.last -= 1
 */
-    if (unlikely(__pyx_v___pyx_state == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-      __PYX_ERR(1, 9, __pyx_L1_error)
+    __pyx_t_3 = NULL;
+    __pyx_t_4 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_pop_from_an_empty_chunkedlist};
+      __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_IndexError)), __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 298, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
     }
-    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkeditem__set_state(((struct DLinkedItem *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 298, __pyx_L1_error)
 
-    /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
- *     __pyx_result = dlinkeditem.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result
+    /* "recordclass/_linkedlist.pyx":297
+ *         cdef PyObject *item
+ * 
+ *         if self.size == 0:             # <<<<<<<<<<<<<<
+ *             raise IndexError("pop from an empty chunkedlist")
+ * 
 */
   }
 
-  /* "(tree fragment)":10
- *     if __pyx_state is not None:
- *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]
+  /* "recordclass/_linkedlist.pyx":300
+ *             raise IndexError("pop from an empty chunkedlist")
+ * 
+ *         self.last -= 1             # <<<<<<<<<<<<<<
+ *         item = self.tail.items[self.last]
+ *         self.size -= 1
 */
-  __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v___pyx_result);
-  __pyx_r = __pyx_v___pyx_result;
-  goto __pyx_L0;
+  __pyx_v_self->last = (__pyx_v_self->last - 1);
 
-  /* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_dlinkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
+  /* "recordclass/_linkedlist.pyx":301
+ * 
+ *         self.last -= 1
+ *         item = self.tail.items[self.last]             # <<<<<<<<<<<<<<
+ *         self.size -= 1
+ *         self.state += 1
+*/
+  __pyx_v_item = (__pyx_v_self->tail->items[__pyx_v_self->last]);
+
+  /* "recordclass/_linkedlist.pyx":302
+ *         self.last -= 1
+ *         item = self.tail.items[self.last]
+ *         self.size -= 1             # <<<<<<<<<<<<<<
+ *         self.state += 1
+ *         if self.size == 0:
+*/
+  __pyx_v_self->size = (__pyx_v_self->size - 1);
+
+  /* "recordclass/_linkedlist.pyx":303
+ *         item = self.tail.items[self.last]
+ *         self.size -= 1
+ *         self.state += 1             # <<<<<<<<<<<<<<
+ *         if self.size == 0:
+ *             self.release_chunk(self.tail)
+*/
+  __pyx_v_self->state = (__pyx_v_self->state + 1);
+
+  /* "recordclass/_linkedlist.pyx":304
+ *         self.size -= 1
+ *         self.state += 1
+ *         if self.size == 0:             # <<<<<<<<<<<<<<
+ *             self.release_chunk(self.tail)
+ *             self.head = self.tail = NULL
+*/
+  __pyx_t_1 = (__pyx_v_self->size == 0);
+  if (__pyx_t_1) {
+
+    /* "recordclass/_linkedlist.pyx":305
+ *         self.state += 1
+ *         if self.size == 0:
+ *             self.release_chunk(self.tail)             # <<<<<<<<<<<<<<
+ *             self.head = self.tail = NULL
+ *         elif self.last == 0:
+*/
+    __pyx_f_11recordclass_11_linkedlist_11chunkedlist_release_chunk(__pyx_v_self, __pyx_v_self->tail); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 305, __pyx_L1_error)
+
+    /* "recordclass/_linkedlist.pyx":306
+ *         if self.size == 0:
+ *             self.release_chunk(self.tail)
+ *             self.head = self.tail = NULL             # <<<<<<<<<<<<<<
+ *         elif self.last == 0:
+ *             c = self.tail
+*/
+    __pyx_v_self->head = NULL;
+    __pyx_v_self->tail = NULL;
+
+    /* "recordclass/_linkedlist.pyx":304
+ *         self.size -= 1
+ *         self.state += 1
+ *         if self.size == 0:             # <<<<<<<<<<<<<<
+ *             self.release_chunk(self.tail)
+ *             self.head = self.tail = NULL
+*/
+    goto __pyx_L4;
+  }
+
+  /* "recordclass/_linkedlist.pyx":307
+ *             self.release_chunk(self.tail)
+ *             self.head = self.tail = NULL
+ *         elif self.last == 0:             # <<<<<<<<<<<<<<
+ *             c = self.tail
+ *             self.tail = c.prev
+*/
+  __pyx_t_1 = (__pyx_v_self->last == 0);
+  if (__pyx_t_1) {
+
+    /* "recordclass/_linkedlist.pyx":308
+ *             self.head = self.tail = NULL
+ *         elif self.last == 0:
+ *             c = self.tail             # <<<<<<<<<<<<<<
+ *             self.tail = c.prev
+ *             self.tail.next = NULL
+*/
+    __pyx_t_5 = __pyx_v_self->tail;
+    __pyx_v_c = __pyx_t_5;
+
+    /* "recordclass/_linkedlist.pyx":309
+ *         elif self.last == 0:
+ *             c = self.tail
+ *             self.tail = c.prev             # <<<<<<<<<<<<<<
+ *             self.tail.next = NULL
+ *             self.release_chunk(c)
+*/
+    __pyx_t_5 = __pyx_v_c->prev;
+    __pyx_v_self->tail = __pyx_t_5;
+
+    /* "recordclass/_linkedlist.pyx":310
+ *             c = self.tail
+ *             self.tail = c.prev
+ *             self.tail.next = NULL             # <<<<<<<<<<<<<<
+ *             self.release_chunk(c)
+ *             self.last = CHUNK_SIZE
+*/
+    __pyx_v_self->tail->next = NULL;
+
+    /* "recordclass/_linkedlist.pyx":311
+ *             self.tail = c.prev
+ *             self.tail.next = NULL
+ *             self.release_chunk(c)             # <<<<<<<<<<<<<<
+ *             self.last = CHUNK_SIZE
+ * 
 */
+    __pyx_f_11recordclass_11_linkedlist_11chunkedlist_release_chunk(__pyx_v_self, __pyx_v_c); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 311, __pyx_L1_error)
 
-  /* function exit code */
-  __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkeditem", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
-  __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v___pyx_result);
-  __Pyx_XGIVEREF(__pyx_r);
-  __Pyx_RefNannyFinishContext();
-  return __pyx_r;
-}
+    /* "recordclass/_linkedlist.pyx":312
+ *             self.tail.next = NULL
+ *             self.release_chunk(c)
+ *             self.last = CHUNK_SIZE             # <<<<<<<<<<<<<<
+ * 
+ *         val = <object>item
+*/
+    __pyx_v_self->last = __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE;
 
-/* "(tree fragment)":11
- *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+    /* "recordclass/_linkedlist.pyx":307
+ *             self.release_chunk(self.tail)
+ *             self.head = self.tail = NULL
+ *         elif self.last == 0:             # <<<<<<<<<<<<<<
+ *             c = self.tail
+ *             self.tail = c.prev
 */
+  }
+  __pyx_L4:;
 
-static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkeditem__set_state(struct DLinkedItem *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_r = NULL;
-  __Pyx_RefNannyDeclarations
-  PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkeditem__set_state", 0);
+  /* "recordclass/_linkedlist.pyx":314
+ *             self.last = CHUNK_SIZE
+ * 
+ *         val = <object>item             # <<<<<<<<<<<<<<
+ *         Py_DECREF(val)
+ *         return val
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_item);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_val = __pyx_t_2;
+  __pyx_t_2 = 0;
 
-  /* "(tree fragment)":12
- *     return __pyx_result
- * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]             # <<<<<<<<<<<<<<
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+  /* "recordclass/_linkedlist.pyx":315
+ * 
+ *         val = <object>item
+ *         Py_DECREF(val)             # <<<<<<<<<<<<<<
+ *         return val
+ *     #
 */
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->next);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->next);
-  __pyx_v___pyx_result->next = ((struct LinkedItem *)__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->prev);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->prev);
-  __pyx_v___pyx_result->prev = ((struct LinkedItem *)__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 2);
-  __Pyx_INCREF(__pyx_t_1);
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF(__pyx_v___pyx_result->val);
-  __Pyx_DECREF(__pyx_v___pyx_result->val);
-  __pyx_v___pyx_result->val = __pyx_t_1;
-  __pyx_t_1 = 0;
+  Py_DECREF(__pyx_v_val);
 
-  /* "(tree fragment)":13
- * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)             # <<<<<<<<<<<<<<
+  /* "recordclass/_linkedlist.pyx":316
+ *         val = <object>item
+ *         Py_DECREF(val)
+ *         return val             # <<<<<<<<<<<<<<
+ *     #
+ *     cpdef popleft(self):
 */
-  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 3); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_val);
+  __pyx_r = __pyx_v_val;
+  goto __pyx_L0;
 
-  /* "(tree fragment)":11
- *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+  /* "recordclass/_linkedlist.pyx":293
+ *             self.append(val)
+ *     #
+ *     cpdef pop(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ *         cdef PyObject *item
 */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkeditem__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.pop", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_val);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_dlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
-*/
-
 /* Python wrapper */
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_9pop(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_8__pyx_unpickle_dlinkedlist, "__pyx_unpickle_dlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
-static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist = {"__pyx_unpickle_dlinkedlist", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_8__pyx_unpickle_dlinkedlist};
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_11chunkedlist_8pop, "chunkedlist.pop(self)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_9pop = {"pop", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_9pop, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_8pop};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_9pop(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v___pyx_type = 0;
-  long __pyx_v___pyx_checksum;
-  PyObject *__pyx_v___pyx_state = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkedlist (wrapper)", 0);
+  __Pyx_RefNannySetupContext("pop (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -8997,251 +9504,671 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_dlinkedlist", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_dlinkedlist", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
-      }
-    } else if (unlikely(__pyx_nargs != 3)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
-    }
-    __pyx_v___pyx_type = values[0];
-    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
-    __pyx_v___pyx_state = ((PyObject*)values[2]);
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_dlinkedlist", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
-  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_8__pyx_unpickle_dlinkedlist(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("pop", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("pop", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_8pop(((struct ChunkedList *)__pyx_v_self));
 
   /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_8pop(struct ChunkedList *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("pop", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_pop(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
+
+  /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.pop", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
   __pyx_L0:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __pyx_L7_cleaned_up:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_11recordclass_11_linkedlist_8__pyx_unpickle_dlinkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_v___pyx_result = 0;
+/* "recordclass/_linkedlist.pyx":318
+ *         return val
+ *     #
+ *     cpdef popleft(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ *         cdef PyObject *item
+*/
+
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_11popleft(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_popleft(struct ChunkedList *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c;
+  PyObject *__pyx_v_item;
+  PyObject *__pyx_v_val = NULL;
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   int __pyx_t_1;
   PyObject *__pyx_t_2 = NULL;
   PyObject *__pyx_t_3 = NULL;
   size_t __pyx_t_4;
-  int __pyx_t_5;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_5;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkedlist", 0);
+  __Pyx_RefNannySetupContext("popleft", 0);
 
-  /* "(tree fragment)":6
- * def __pyx_unpickle_dlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')             # <<<<<<<<<<<<<<
- *     __pyx_result = dlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:
+  /* "recordclass/_linkedlist.pyx":322
+ *         cdef PyObject *item
+ * 
+ *         if self.size == 0:             # <<<<<<<<<<<<<<
+ *             raise IndexError("pop from an empty chunkedlist")
+ * 
 */
-  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, __pyx_k_end_start); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+  __pyx_t_1 = (__pyx_v_self->size == 0);
+  if (unlikely(__pyx_t_1)) {
 
-  /* "(tree fragment)":7
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
- *     __pyx_result = dlinkedlist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
- *     if __pyx_state is not None:
- *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
+    /* "recordclass/_linkedlist.pyx":323
+ * 
+ *         if self.size == 0:
+ *             raise IndexError("pop from an empty chunkedlist")             # <<<<<<<<<<<<<<
+ * 
+ *         item = self.head.items[self.first]
+*/
+    __pyx_t_3 = NULL;
+    __pyx_t_4 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_pop_from_an_empty_chunkedlist};
+      __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_IndexError)), __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 323, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 323, __pyx_L1_error)
+
+    /* "recordclass/_linkedlist.pyx":322
+ *         cdef PyObject *item
+ * 
+ *         if self.size == 0:             # <<<<<<<<<<<<<<
+ *             raise IndexError("pop from an empty chunkedlist")
+ * 
 */
-  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_t_4 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
-    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
   }
-  __pyx_v___pyx_result = __pyx_t_2;
-  __pyx_t_2 = 0;
 
-  /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
- *     __pyx_result = dlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
+  /* "recordclass/_linkedlist.pyx":325
+ *             raise IndexError("pop from an empty chunkedlist")
+ * 
+ *         item = self.head.items[self.first]             # <<<<<<<<<<<<<<
+ *         self.first += 1
+ *         self.size -= 1
 */
-  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
-  if (__pyx_t_5) {
+  __pyx_v_item = (__pyx_v_self->head->items[__pyx_v_self->first]);
 
-    /* "(tree fragment)":9
- *     __pyx_result = dlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:
- *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
- *     return __pyx_result
- * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):
+  /* "recordclass/_linkedlist.pyx":326
+ * 
+ *         item = self.head.items[self.first]
+ *         self.first += 1             # <<<<<<<<<<<<<<
+ *         self.size -= 1
+ *         self.state += 1
+*/
+  __pyx_v_self->first = (__pyx_v_self->first + 1);
+
+  /* "recordclass/_linkedlist.pyx":327
+ *         item = self.head.items[self.first]
+ *         self.first += 1
+ *         self.size -= 1             # <<<<<<<<<<<<<<
+ *         self.state += 1
+ *         if self.size == 0:
+*/
+  __pyx_v_self->size = (__pyx_v_self->size - 1);
+
+  /* "recordclass/_linkedlist.pyx":328
+ *         self.first += 1
+ *         self.size -= 1
+ *         self.state += 1             # <<<<<<<<<<<<<<
+ *         if self.size == 0:
+ *             self.release_chunk(self.head)
+*/
+  __pyx_v_self->state = (__pyx_v_self->state + 1);
+
+  /* "recordclass/_linkedlist.pyx":329
+ *         self.size -= 1
+ *         self.state += 1
+ *         if self.size == 0:             # <<<<<<<<<<<<<<
+ *             self.release_chunk(self.head)
+ *             self.head = self.tail = NULL
+*/
+  __pyx_t_1 = (__pyx_v_self->size == 0);
+  if (__pyx_t_1) {
+
+    /* "recordclass/_linkedlist.pyx":330
+ *         self.state += 1
+ *         if self.size == 0:
+ *             self.release_chunk(self.head)             # <<<<<<<<<<<<<<
+ *             self.head = self.tail = NULL
+ *         elif self.first == CHUNK_SIZE:
+*/
+    __pyx_f_11recordclass_11_linkedlist_11chunkedlist_release_chunk(__pyx_v_self, __pyx_v_self->head); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 330, __pyx_L1_error)
+
+    /* "recordclass/_linkedlist.pyx":331
+ *         if self.size == 0:
+ *             self.release_chunk(self.head)
+ *             self.head = self.tail = NULL             # <<<<<<<<<<<<<<
+ *         elif self.first == CHUNK_SIZE:
+ *             c = self.head
+*/
+    __pyx_v_self->head = NULL;
+    __pyx_v_self->tail = NULL;
+
+    /* "recordclass/_linkedlist.pyx":329
+ *         self.size -= 1
+ *         self.state += 1
+ *         if self.size == 0:             # <<<<<<<<<<<<<<
+ *             self.release_chunk(self.head)
+ *             self.head = self.tail = NULL
+*/
+    goto __pyx_L4;
+  }
+
+  /* "recordclass/_linkedlist.pyx":332
+ *             self.release_chunk(self.head)
+ *             self.head = self.tail = NULL
+ *         elif self.first == CHUNK_SIZE:             # <<<<<<<<<<<<<<
+ *             c = self.head
+ *             self.head = c.next
+*/
+  __pyx_t_1 = (__pyx_v_self->first == __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE);
+  if (__pyx_t_1) {
+
+    /* "recordclass/_linkedlist.pyx":333
+ *             self.head = self.tail = NULL
+ *         elif self.first == CHUNK_SIZE:
+ *             c = self.head             # <<<<<<<<<<<<<<
+ *             self.head = c.next
+ *             self.head.prev = NULL
+*/
+    __pyx_t_5 = __pyx_v_self->head;
+    __pyx_v_c = __pyx_t_5;
+
+    /* "recordclass/_linkedlist.pyx":334
+ *         elif self.first == CHUNK_SIZE:
+ *             c = self.head
+ *             self.head = c.next             # <<<<<<<<<<<<<<
+ *             self.head.prev = NULL
+ *             self.release_chunk(c)
+*/
+    __pyx_t_5 = __pyx_v_c->next;
+    __pyx_v_self->head = __pyx_t_5;
+
+    /* "recordclass/_linkedlist.pyx":335
+ *             c = self.head
+ *             self.head = c.next
+ *             self.head.prev = NULL             # <<<<<<<<<<<<<<
+ *             self.release_chunk(c)
+ *             self.first = 0
+*/
+    __pyx_v_self->head->prev = NULL;
+
+    /* "recordclass/_linkedlist.pyx":336
+ *             self.head = c.next
+ *             self.head.prev = NULL
+ *             self.release_chunk(c)             # <<<<<<<<<<<<<<
+ *             self.first = 0
+ * 
 */
-    if (unlikely(__pyx_v___pyx_state == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-      __PYX_ERR(1, 9, __pyx_L1_error)
-    }
-    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkedlist__set_state(((struct DLinkedList *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __pyx_f_11recordclass_11_linkedlist_11chunkedlist_release_chunk(__pyx_v_self, __pyx_v_c); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 336, __pyx_L1_error)
 
-    /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
- *     __pyx_result = dlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
+    /* "recordclass/_linkedlist.pyx":337
+ *             self.head.prev = NULL
+ *             self.release_chunk(c)
+ *             self.first = 0             # <<<<<<<<<<<<<<
+ * 
+ *         val = <object>item
+*/
+    __pyx_v_self->first = 0;
+
+    /* "recordclass/_linkedlist.pyx":332
+ *             self.release_chunk(self.head)
+ *             self.head = self.tail = NULL
+ *         elif self.first == CHUNK_SIZE:             # <<<<<<<<<<<<<<
+ *             c = self.head
+ *             self.head = c.next
 */
   }
+  __pyx_L4:;
 
-  /* "(tree fragment)":10
- *     if __pyx_state is not None:
- *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+  /* "recordclass/_linkedlist.pyx":339
+ *             self.first = 0
+ * 
+ *         val = <object>item             # <<<<<<<<<<<<<<
+ *         Py_DECREF(val)
+ *         return val
+*/
+  __pyx_t_2 = ((PyObject *)__pyx_v_item);
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_v_val = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":340
+ * 
+ *         val = <object>item
+ *         Py_DECREF(val)             # <<<<<<<<<<<<<<
+ *         return val
+ *     #
+*/
+  Py_DECREF(__pyx_v_val);
+
+  /* "recordclass/_linkedlist.pyx":341
+ *         val = <object>item
+ *         Py_DECREF(val)
+ *         return val             # <<<<<<<<<<<<<<
+ *     #
+ *     cdef void free_chunks(self, chunk *c, Py_ssize_t i, Py_ssize_t n):
 */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v___pyx_result);
-  __pyx_r = __pyx_v___pyx_result;
+  __Pyx_INCREF(__pyx_v_val);
+  __pyx_r = __pyx_v_val;
   goto __pyx_L0;
 
-  /* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_dlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+  /* "recordclass/_linkedlist.pyx":318
+ *         return val
+ *     #
+ *     cpdef popleft(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ *         cdef PyObject *item
 */
 
   /* function exit code */
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_2);
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = NULL;
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.popleft", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XDECREF(__pyx_v_val);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":11
- *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
-*/
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_11popleft(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_11chunkedlist_10popleft, "chunkedlist.popleft(self)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_11popleft = {"popleft", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_11popleft, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_10popleft};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_11popleft(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("popleft (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("popleft", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("popleft", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_10popleft(((struct ChunkedList *)__pyx_v_self));
 
-static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkedlist__set_state(struct DLinkedList *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_10popleft(struct ChunkedList *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkedlist__set_state", 0);
+  __Pyx_RefNannySetupContext("popleft", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_popleft(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "(tree fragment)":12
- *     return __pyx_result
- * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]             # <<<<<<<<<<<<<<
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
-*/
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->end);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->end);
-  __pyx_v___pyx_result->end = ((struct DLinkedItem *)__pyx_t_1);
-  __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->start);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->start);
-  __pyx_v___pyx_result->start = ((struct DLinkedItem *)__pyx_t_1);
-  __pyx_t_1 = 0;
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.popleft", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
 
-  /* "(tree fragment)":13
- * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)             # <<<<<<<<<<<<<<
+/* "recordclass/_linkedlist.pyx":343
+ *         return val
+ *     #
+ *     cdef void free_chunks(self, chunk *c, Py_ssize_t i, Py_ssize_t n):             # <<<<<<<<<<<<<<
+ *         # release items of the detached chain of chunks
+ *         cdef chunk *next
 */
-  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 2); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
 
-  /* "(tree fragment)":11
- *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+static void __pyx_f_11recordclass_11_linkedlist_11chunkedlist_free_chunks(CYTHON_UNUSED struct ChunkedList *__pyx_v_self, struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c, Py_ssize_t __pyx_v_i, Py_ssize_t __pyx_v_n) {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_next;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_t_3;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_4;
+  __Pyx_RefNannySetupContext("free_chunks", 0);
+
+  /* "recordclass/_linkedlist.pyx":347
+ *         cdef chunk *next
+ * 
+ *         while n > 0:             # <<<<<<<<<<<<<<
+ *             Py_DECREF(<object>c.items[i])
+ *             i += 1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_n > 0);
+    if (!__pyx_t_1) break;
+
+    /* "recordclass/_linkedlist.pyx":348
+ * 
+ *         while n > 0:
+ *             Py_DECREF(<object>c.items[i])             # <<<<<<<<<<<<<<
+ *             i += 1
+ *             n -= 1
+*/
+    __pyx_t_2 = ((PyObject *)(__pyx_v_c->items[__pyx_v_i]));
+    __Pyx_INCREF(__pyx_t_2);
+    Py_DECREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "recordclass/_linkedlist.pyx":349
+ *         while n > 0:
+ *             Py_DECREF(<object>c.items[i])
+ *             i += 1             # <<<<<<<<<<<<<<
+ *             n -= 1
+ *             if i == CHUNK_SIZE or n == 0:
+*/
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "recordclass/_linkedlist.pyx":350
+ *             Py_DECREF(<object>c.items[i])
+ *             i += 1
+ *             n -= 1             # <<<<<<<<<<<<<<
+ *             if i == CHUNK_SIZE or n == 0:
+ *                 next = c.next
+*/
+    __pyx_v_n = (__pyx_v_n - 1);
+
+    /* "recordclass/_linkedlist.pyx":351
+ *             i += 1
+ *             n -= 1
+ *             if i == CHUNK_SIZE or n == 0:             # <<<<<<<<<<<<<<
+ *                 next = c.next
+ *                 PyMem_Free(c)
+*/
+    __pyx_t_3 = (__pyx_v_i == __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_1 = __pyx_t_3;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_3 = (__pyx_v_n == 0);
+    __pyx_t_1 = __pyx_t_3;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_1) {
+
+      /* "recordclass/_linkedlist.pyx":352
+ *             n -= 1
+ *             if i == CHUNK_SIZE or n == 0:
+ *                 next = c.next             # <<<<<<<<<<<<<<
+ *                 PyMem_Free(c)
+ *                 c = next
+*/
+      __pyx_t_4 = __pyx_v_c->next;
+      __pyx_v_next = __pyx_t_4;
+
+      /* "recordclass/_linkedlist.pyx":353
+ *             if i == CHUNK_SIZE or n == 0:
+ *                 next = c.next
+ *                 PyMem_Free(c)             # <<<<<<<<<<<<<<
+ *                 c = next
+ *                 i = 0
+*/
+      PyMem_Free(__pyx_v_c);
+
+      /* "recordclass/_linkedlist.pyx":354
+ *                 next = c.next
+ *                 PyMem_Free(c)
+ *                 c = next             # <<<<<<<<<<<<<<
+ *                 i = 0
+ *         while c is not NULL:
+*/
+      __pyx_v_c = __pyx_v_next;
+
+      /* "recordclass/_linkedlist.pyx":355
+ *                 PyMem_Free(c)
+ *                 c = next
+ *                 i = 0             # <<<<<<<<<<<<<<
+ *         while c is not NULL:
+ *             next = c.next
+*/
+      __pyx_v_i = 0;
+
+      /* "recordclass/_linkedlist.pyx":351
+ *             i += 1
+ *             n -= 1
+ *             if i == CHUNK_SIZE or n == 0:             # <<<<<<<<<<<<<<
+ *                 next = c.next
+ *                 PyMem_Free(c)
+*/
+    }
+  }
+
+  /* "recordclass/_linkedlist.pyx":356
+ *                 c = next
+ *                 i = 0
+ *         while c is not NULL:             # <<<<<<<<<<<<<<
+ *             next = c.next
+ *             PyMem_Free(c)
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_c != NULL);
+    if (!__pyx_t_1) break;
+
+    /* "recordclass/_linkedlist.pyx":357
+ *                 i = 0
+ *         while c is not NULL:
+ *             next = c.next             # <<<<<<<<<<<<<<
+ *             PyMem_Free(c)
+ *             c = next
+*/
+    __pyx_t_4 = __pyx_v_c->next;
+    __pyx_v_next = __pyx_t_4;
+
+    /* "recordclass/_linkedlist.pyx":358
+ *         while c is not NULL:
+ *             next = c.next
+ *             PyMem_Free(c)             # <<<<<<<<<<<<<<
+ *             c = next
+ *     #
+*/
+    PyMem_Free(__pyx_v_c);
+
+    /* "recordclass/_linkedlist.pyx":359
+ *             next = c.next
+ *             PyMem_Free(c)
+ *             c = next             # <<<<<<<<<<<<<<
+ *     #
+ *     cpdef clear(self):
+*/
+    __pyx_v_c = __pyx_v_next;
+  }
+
+  /* "recordclass/_linkedlist.pyx":343
+ *         return val
+ *     #
+ *     cdef void free_chunks(self, chunk *c, Py_ssize_t i, Py_ssize_t n):             # <<<<<<<<<<<<<<
+ *         # release items of the detached chain of chunks
+ *         cdef chunk *next
+*/
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "recordclass/_linkedlist.pyx":361
+ *             c = next
+ *     #
+ *     cpdef clear(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *head = self.head
+ *         cdef Py_ssize_t first = self.first
+*/
+
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_13clear(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_11recordclass_11_linkedlist_11chunkedlist_clear(struct ChunkedList *__pyx_v_self, CYTHON_UNUSED int __pyx_skip_dispatch) {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_head;
+  Py_ssize_t __pyx_v_first;
+  Py_ssize_t __pyx_v_size;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("clear", 0);
+
+  /* "recordclass/_linkedlist.pyx":362
+ *     #
+ *     cpdef clear(self):
+ *         cdef chunk *head = self.head             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t first = self.first
+ *         cdef Py_ssize_t size = self.size
+*/
+  __pyx_t_1 = __pyx_v_self->head;
+  __pyx_v_head = __pyx_t_1;
+
+  /* "recordclass/_linkedlist.pyx":363
+ *     cpdef clear(self):
+ *         cdef chunk *head = self.head
+ *         cdef Py_ssize_t first = self.first             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t size = self.size
+ * 
+*/
+  __pyx_t_2 = __pyx_v_self->first;
+  __pyx_v_first = __pyx_t_2;
+
+  /* "recordclass/_linkedlist.pyx":364
+ *         cdef chunk *head = self.head
+ *         cdef Py_ssize_t first = self.first
+ *         cdef Py_ssize_t size = self.size             # <<<<<<<<<<<<<<
+ * 
+ *         # the list is consistent before items are released,
+*/
+  __pyx_t_2 = __pyx_v_self->size;
+  __pyx_v_size = __pyx_t_2;
+
+  /* "recordclass/_linkedlist.pyx":368
+ *         # the list is consistent before items are released,
+ *         # because their deallocation can run arbitrary code
+ *         self.head = self.tail = NULL             # <<<<<<<<<<<<<<
+ *         self.first = self.last = 0
+ *         self.size = 0
+*/
+  __pyx_v_self->head = NULL;
+  __pyx_v_self->tail = NULL;
+
+  /* "recordclass/_linkedlist.pyx":369
+ *         # because their deallocation can run arbitrary code
+ *         self.head = self.tail = NULL
+ *         self.first = self.last = 0             # <<<<<<<<<<<<<<
+ *         self.size = 0
+ *         self.state += 1
+*/
+  __pyx_v_self->first = 0;
+  __pyx_v_self->last = 0;
+
+  /* "recordclass/_linkedlist.pyx":370
+ *         self.head = self.tail = NULL
+ *         self.first = self.last = 0
+ *         self.size = 0             # <<<<<<<<<<<<<<
+ *         self.state += 1
+ *         self.free_chunks(head, first, size)
+*/
+  __pyx_v_self->size = 0;
+
+  /* "recordclass/_linkedlist.pyx":371
+ *         self.first = self.last = 0
+ *         self.size = 0
+ *         self.state += 1             # <<<<<<<<<<<<<<
+ *         self.free_chunks(head, first, size)
+ *     #
+*/
+  __pyx_v_self->state = (__pyx_v_self->state + 1);
+
+  /* "recordclass/_linkedlist.pyx":372
+ *         self.size = 0
+ *         self.state += 1
+ *         self.free_chunks(head, first, size)             # <<<<<<<<<<<<<<
+ *     #
+ *     def __dealloc__(self):
+*/
+  __pyx_f_11recordclass_11_linkedlist_11chunkedlist_free_chunks(__pyx_v_self, __pyx_v_head, __pyx_v_first, __pyx_v_size); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 372, __pyx_L1_error)
+
+  /* "recordclass/_linkedlist.pyx":361
+ *             c = next
+ *     #
+ *     cpdef clear(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *head = self.head
+ *         cdef Py_ssize_t first = self.first
 */
 
   /* function exit code */
   __pyx_r = Py_None; __Pyx_INCREF(Py_None);
   goto __pyx_L0;
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkedlist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.clear", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = 0;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
@@ -9249,45 +10176,30 @@ static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkedlist_
   return __pyx_r;
 }
 
-/* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_iterdlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
-*/
-
 /* Python wrapper */
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist(PyObject *__pyx_self, 
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_13clear(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ); /*proto*/
-PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_10__pyx_unpickle_iterdlinkedlist, "__pyx_unpickle_iterdlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
-static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist = {"__pyx_unpickle_iterdlinkedlist", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10__pyx_unpickle_iterdlinkedlist};
-static PyObject *__pyx_pw_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist(PyObject *__pyx_self, 
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_11chunkedlist_12clear, "chunkedlist.clear(self)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_13clear = {"clear", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_13clear, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_12clear};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_13clear(PyObject *__pyx_v_self, 
 #if CYTHON_METH_FASTCALL
 PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
 #else
 PyObject *__pyx_args, PyObject *__pyx_kwds
 #endif
 ) {
-  PyObject *__pyx_v___pyx_type = 0;
-  long __pyx_v___pyx_checksum;
-  PyObject *__pyx_v___pyx_state = 0;
   #if !CYTHON_METH_FASTCALL
   CYTHON_UNUSED Py_ssize_t __pyx_nargs;
   #endif
   CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
-  PyObject* values[3] = {0,0,0};
-  int __pyx_lineno = 0;
-  const char *__pyx_filename = NULL;
-  int __pyx_clineno = 0;
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
-  __Pyx_RefNannySetupContext("__pyx_unpickle_iterdlinkedlist (wrapper)", 0);
+  __Pyx_RefNannySetupContext("clear (wrapper)", 0);
   #if !CYTHON_METH_FASTCALL
   #if CYTHON_ASSUME_SAFE_SIZE
   __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
@@ -9296,272 +10208,3434 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   #endif
   #endif
   __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
-  {
-    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
-    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
-    if (__pyx_kwds_len > 0) {
-      switch (__pyx_nargs) {
-        case  3:
-        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  2:
-        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  1:
-        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
-        CYTHON_FALLTHROUGH;
-        case  0: break;
-        default: goto __pyx_L5_argtuple_error;
-      }
-      const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_iterdlinkedlist", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
-      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_iterdlinkedlist", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
-      }
-    } else if (unlikely(__pyx_nargs != 3)) {
-      goto __pyx_L5_argtuple_error;
-    } else {
-      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
-      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
-    }
-    __pyx_v___pyx_type = values[0];
-    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
-    __pyx_v___pyx_state = ((PyObject*)values[2]);
-  }
-  goto __pyx_L6_skip;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_iterdlinkedlist", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
-  __pyx_L6_skip:;
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L3_error:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterdlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __Pyx_RefNannyFinishContext();
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
-  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_10__pyx_unpickle_iterdlinkedlist(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("clear", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("clear", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_12clear(((struct ChunkedList *)__pyx_v_self));
 
   /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_12clear(struct ChunkedList *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("clear", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_11recordclass_11_linkedlist_11chunkedlist_clear(__pyx_v_self, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
   goto __pyx_L0;
+
+  /* function exit code */
   __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.clear", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  goto __pyx_L7_cleaned_up;
   __pyx_L0:;
-  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
-    Py_XDECREF(values[__pyx_temp]);
-  }
-  __pyx_L7_cleaned_up:;
+  __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-static PyObject *__pyx_pf_11recordclass_11_linkedlist_10__pyx_unpickle_iterdlinkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
-  PyObject *__pyx_v___pyx_result = 0;
-  PyObject *__pyx_r = NULL;
+/* "recordclass/_linkedlist.pyx":374
+ *         self.free_chunks(head, first, size)
+ *     #
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         self.free_chunks(self.head, self.first, self.size)
+ *         self.head = self.tail = NULL
+*/
+
+/* Python wrapper */
+static void __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_15__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_15__dealloc__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
   __Pyx_RefNannyDeclarations
-  int __pyx_t_1;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  size_t __pyx_t_4;
-  int __pyx_t_5;
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_14__dealloc__(((struct ChunkedList *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_14__dealloc__(struct ChunkedList *__pyx_v_self) {
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_iterdlinkedlist", 0);
 
-  /* "(tree fragment)":6
- * def __pyx_unpickle_iterdlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')             # <<<<<<<<<<<<<<
- *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:
+  /* "recordclass/_linkedlist.pyx":375
+ *     #
+ *     def __dealloc__(self):
+ *         self.free_chunks(self.head, self.first, self.size)             # <<<<<<<<<<<<<<
+ *         self.head = self.tail = NULL
+ *         PyMem_Free(self.spare)
 */
-  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, __pyx_k_node); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+  __pyx_f_11recordclass_11_linkedlist_11chunkedlist_free_chunks(__pyx_v_self, __pyx_v_self->head, __pyx_v_self->first, __pyx_v_self->size); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 375, __pyx_L1_error)
 
-  /* "(tree fragment)":7
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
- *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
- *     if __pyx_state is not None:
- *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
+  /* "recordclass/_linkedlist.pyx":376
+ *     def __dealloc__(self):
+ *         self.free_chunks(self.head, self.first, self.size)
+ *         self.head = self.tail = NULL             # <<<<<<<<<<<<<<
+ *         PyMem_Free(self.spare)
+ *         self.spare = NULL
+*/
+  __pyx_v_self->head = NULL;
+  __pyx_v_self->tail = NULL;
+
+  /* "recordclass/_linkedlist.pyx":377
+ *         self.free_chunks(self.head, self.first, self.size)
+ *         self.head = self.tail = NULL
+ *         PyMem_Free(self.spare)             # <<<<<<<<<<<<<<
+ *         self.spare = NULL
+ *     #
 */
-  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist);
-  __Pyx_INCREF(__pyx_t_3);
-  __pyx_t_4 = 0;
-  {
-    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
-    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-  }
-  __pyx_v___pyx_result = __pyx_t_2;
-  __pyx_t_2 = 0;
+  PyMem_Free(__pyx_v_self->spare);
 
-  /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
- *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
+  /* "recordclass/_linkedlist.pyx":378
+ *         self.head = self.tail = NULL
+ *         PyMem_Free(self.spare)
+ *         self.spare = NULL             # <<<<<<<<<<<<<<
+ *     #
+ *     def __len__(self):
 */
-  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
-  if (__pyx_t_5) {
+  __pyx_v_self->spare = NULL;
 
-    /* "(tree fragment)":9
- *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:
- *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
- *     return __pyx_result
- * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):
+  /* "recordclass/_linkedlist.pyx":374
+ *         self.free_chunks(head, first, size)
+ *     #
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         self.free_chunks(self.head, self.first, self.size)
+ *         self.head = self.tail = NULL
 */
-    if (unlikely(__pyx_v___pyx_state == Py_None)) {
-      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
-      __PYX_ERR(1, 9, __pyx_L1_error)
-    }
-    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterdlinkedlist__set_state(((struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_2);
-    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-    /* "(tree fragment)":8
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
- *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)
- *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
- *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_WriteUnraisable("recordclass._linkedlist.chunkedlist.__dealloc__", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_L0:;
+}
+
+/* "recordclass/_linkedlist.pyx":380
+ *         self.spare = NULL
+ *     #
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.size
+ *     #
+*/
+
+/* Python wrapper */
+static Py_ssize_t __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_17__len__(PyObject *__pyx_v_self); /*proto*/
+static Py_ssize_t __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_17__len__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  Py_ssize_t __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__len__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_16__len__(((struct ChunkedList *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static Py_ssize_t __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_16__len__(struct ChunkedList *__pyx_v_self) {
+  Py_ssize_t __pyx_r;
+
+  /* "recordclass/_linkedlist.pyx":381
+ *     #
+ *     def __len__(self):
+ *         return self.size             # <<<<<<<<<<<<<<
+ *     #
+ *     def __getitem__(self, Py_ssize_t index):
+*/
+  __pyx_r = __pyx_v_self->size;
+  goto __pyx_L0;
+
+  /* "recordclass/_linkedlist.pyx":380
+ *         self.spare = NULL
+ *     #
+ *     def __len__(self):             # <<<<<<<<<<<<<<
+ *         return self.size
+ *     #
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "recordclass/_linkedlist.pyx":383
+ *         return self.size
+ *     #
+ *     def __getitem__(self, Py_ssize_t index):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c = self.head
+ * 
 */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_19__getitem__(PyObject *__pyx_v_self, PyObject *__pyx_arg_index); /*proto*/
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_19__getitem__(PyObject *__pyx_v_self, PyObject *__pyx_arg_index) {
+  Py_ssize_t __pyx_v_index;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__getitem__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  assert(__pyx_arg_index); {
+    __pyx_v_index = __Pyx_PyIndex_AsSsize_t(__pyx_arg_index); if (unlikely((__pyx_v_index == (Py_ssize_t)-1) && PyErr_Occurred())) __PYX_ERR(0, 383, __pyx_L3_error)
   }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.__getitem__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_18__getitem__(((struct ChunkedList *)__pyx_v_self), ((Py_ssize_t)__pyx_v_index));
 
-  /* "(tree fragment)":10
- *     if __pyx_state is not None:
- *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result             # <<<<<<<<<<<<<<
- * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.node = __pyx_state[0]
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_18__getitem__(struct ChunkedList *__pyx_v_self, Py_ssize_t __pyx_v_index) {
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__getitem__", 0);
+
+  /* "recordclass/_linkedlist.pyx":384
+ *     #
+ *     def __getitem__(self, Py_ssize_t index):
+ *         cdef chunk *c = self.head             # <<<<<<<<<<<<<<
+ * 
+ *         if index < 0:
+*/
+  __pyx_t_1 = __pyx_v_self->head;
+  __pyx_v_c = __pyx_t_1;
+
+  /* "recordclass/_linkedlist.pyx":386
+ *         cdef chunk *c = self.head
+ * 
+ *         if index < 0:             # <<<<<<<<<<<<<<
+ *             index += self.size
+ *         if index < 0 or index >= self.size:
+*/
+  __pyx_t_2 = (__pyx_v_index < 0);
+  if (__pyx_t_2) {
+
+    /* "recordclass/_linkedlist.pyx":387
+ * 
+ *         if index < 0:
+ *             index += self.size             # <<<<<<<<<<<<<<
+ *         if index < 0 or index >= self.size:
+ *             raise IndexError("chunkedlist index out of range")
+*/
+    __pyx_v_index = (__pyx_v_index + __pyx_v_self->size);
+
+    /* "recordclass/_linkedlist.pyx":386
+ *         cdef chunk *c = self.head
+ * 
+ *         if index < 0:             # <<<<<<<<<<<<<<
+ *             index += self.size
+ *         if index < 0 or index >= self.size:
+*/
+  }
+
+  /* "recordclass/_linkedlist.pyx":388
+ *         if index < 0:
+ *             index += self.size
+ *         if index < 0 or index >= self.size:             # <<<<<<<<<<<<<<
+ *             raise IndexError("chunkedlist index out of range")
+ * 
+*/
+  __pyx_t_3 = (__pyx_v_index < 0);
+  if (!__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_index >= __pyx_v_self->size);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L5_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "recordclass/_linkedlist.pyx":389
+ *             index += self.size
+ *         if index < 0 or index >= self.size:
+ *             raise IndexError("chunkedlist index out of range")             # <<<<<<<<<<<<<<
+ * 
+ *         index += self.first
+*/
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_kp_u_chunkedlist_index_out_of_range};
+      __pyx_t_4 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_IndexError)), __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 389, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+    }
+    __Pyx_Raise(__pyx_t_4, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __PYX_ERR(0, 389, __pyx_L1_error)
+
+    /* "recordclass/_linkedlist.pyx":388
+ *         if index < 0:
+ *             index += self.size
+ *         if index < 0 or index >= self.size:             # <<<<<<<<<<<<<<
+ *             raise IndexError("chunkedlist index out of range")
+ * 
+*/
+  }
+
+  /* "recordclass/_linkedlist.pyx":391
+ *             raise IndexError("chunkedlist index out of range")
+ * 
+ *         index += self.first             # <<<<<<<<<<<<<<
+ *         while index >= CHUNK_SIZE:
+ *             c = c.next
+*/
+  __pyx_v_index = (__pyx_v_index + __pyx_v_self->first);
+
+  /* "recordclass/_linkedlist.pyx":392
+ * 
+ *         index += self.first
+ *         while index >= CHUNK_SIZE:             # <<<<<<<<<<<<<<
+ *             c = c.next
+ *             index -= CHUNK_SIZE
+*/
+  while (1) {
+    __pyx_t_2 = (__pyx_v_index >= __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE);
+    if (!__pyx_t_2) break;
+
+    /* "recordclass/_linkedlist.pyx":393
+ *         index += self.first
+ *         while index >= CHUNK_SIZE:
+ *             c = c.next             # <<<<<<<<<<<<<<
+ *             index -= CHUNK_SIZE
+ *         return <object>c.items[index]
+*/
+    __pyx_t_1 = __pyx_v_c->next;
+    __pyx_v_c = __pyx_t_1;
+
+    /* "recordclass/_linkedlist.pyx":394
+ *         while index >= CHUNK_SIZE:
+ *             c = c.next
+ *             index -= CHUNK_SIZE             # <<<<<<<<<<<<<<
+ *         return <object>c.items[index]
+ *     #
+*/
+    __pyx_v_index = (__pyx_v_index - __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE);
+  }
+
+  /* "recordclass/_linkedlist.pyx":395
+ *             c = c.next
+ *             index -= CHUNK_SIZE
+ *         return <object>c.items[index]             # <<<<<<<<<<<<<<
+ *     #
+ *     def __iter__(self):
 */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_INCREF(__pyx_v___pyx_result);
-  __pyx_r = __pyx_v___pyx_result;
+  __Pyx_INCREF(((PyObject *)(__pyx_v_c->items[__pyx_v_index])));
+  __pyx_r = ((PyObject *)(__pyx_v_c->items[__pyx_v_index]));
   goto __pyx_L0;
 
-  /* "(tree fragment)":4
- *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
- *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
- * def __pyx_unpickle_iterdlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
- *     cdef object __pyx_result
- *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+  /* "recordclass/_linkedlist.pyx":383
+ *         return self.size
+ *     #
+ *     def __getitem__(self, Py_ssize_t index):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c = self.head
+ * 
 */
 
   /* function exit code */
   __pyx_L1_error:;
-  __Pyx_XDECREF(__pyx_t_2);
-  __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterdlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.__getitem__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = NULL;
   __pyx_L0:;
-  __Pyx_XDECREF(__pyx_v___pyx_result);
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
 
-/* "(tree fragment)":11
- *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.node = __pyx_state[0]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+/* "recordclass/_linkedlist.pyx":397
+ *         return <object>c.items[index]
+ *     #
+ *     def __iter__(self):             # <<<<<<<<<<<<<<
+ *         return iterchunkedlist(self)
+ *     #
 */
 
-static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterdlinkedlist__set_state(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_21__iter__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_21__iter__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__iter__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_20__iter__(((struct ChunkedList *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_20__iter__(struct ChunkedList *__pyx_v_self) {
   PyObject *__pyx_r = NULL;
   __Pyx_RefNannyDeclarations
   PyObject *__pyx_t_1 = NULL;
-  int __pyx_t_2;
+  PyObject *__pyx_t_2 = NULL;
+  size_t __pyx_t_3;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
-  __Pyx_RefNannySetupContext("__pyx_unpickle_iterdlinkedlist__set_state", 0);
+  __Pyx_RefNannySetupContext("__iter__", 0);
 
-  /* "(tree fragment)":12
- *     return __pyx_result
- * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.node = __pyx_state[0]             # <<<<<<<<<<<<<<
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+  /* "recordclass/_linkedlist.pyx":398
+ *     #
+ *     def __iter__(self):
+ *         return iterchunkedlist(self)             # <<<<<<<<<<<<<<
+ *     #
+ *     def __sizeof__(self):
 */
-  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
-  __Pyx_INCREF(__pyx_t_1);
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
-  __Pyx_GIVEREF(__pyx_t_1);
-  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->node);
-  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->node);
-  __pyx_v___pyx_result->node = ((struct DLinkedItem *)__pyx_t_1);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_2 = NULL;
+  __pyx_t_3 = 1;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, ((PyObject *)__pyx_v_self)};
+    __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist, __pyx_callargs+__pyx_t_3, (2-__pyx_t_3) | (__pyx_t_3*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 398, __pyx_L1_error)
+    __Pyx_GOTREF((PyObject *)__pyx_t_1);
+  }
+  __pyx_r = ((PyObject *)__pyx_t_1);
   __pyx_t_1 = 0;
+  goto __pyx_L0;
 
-  /* "(tree fragment)":13
- * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):
- *     __pyx_result.node = __pyx_state[0]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)             # <<<<<<<<<<<<<<
-*/
-  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
-
-  /* "(tree fragment)":11
- *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
- *     return __pyx_result
- * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
- *     __pyx_result.node = __pyx_state[0]
- *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+  /* "recordclass/_linkedlist.pyx":397
+ *         return <object>c.items[index]
+ *     #
+ *     def __iter__(self):             # <<<<<<<<<<<<<<
+ *         return iterchunkedlist(self)
+ *     #
 */
 
   /* function exit code */
-  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
-  goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_1);
-  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterdlinkedlist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
-  __pyx_r = 0;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.__iter__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
   __pyx_L0:;
   __Pyx_XGIVEREF(__pyx_r);
   __Pyx_RefNannyFinishContext();
   return __pyx_r;
 }
-/* #### Code section: module_exttypes ### */
 
-static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_linkeditem(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct LinkedItem *p;
-  PyObject *o;
-  o = __Pyx_AllocateExtensionType(t, 1);
-  if (unlikely(!o)) return 0;
-  p = ((struct LinkedItem *)o);
-  p->val = Py_None; Py_INCREF(Py_None);
-  p->next = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
-  return o;
-}
+/* "recordclass/_linkedlist.pyx":400
+ *         return iterchunkedlist(self)
+ *     #
+ *     def __sizeof__(self):             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t n = 0
+ *         cdef chunk *c = self.head
+*/
 
-static void __pyx_tp_dealloc_11recordclass_11_linkedlist_linkeditem(PyObject *o) {
-  struct LinkedItem *p = (struct LinkedItem *)o;
-  Py_CLEAR(p->val);
-  Py_CLEAR(p->next);
-  PyTypeObject *tp = Py_TYPE(o);
-  #if CYTHON_USE_TYPE_SLOTS
-  (*tp->tp_free)(o);
-  #else
-  {
-    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_23__sizeof__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_11chunkedlist_22__sizeof__, "chunkedlist.__sizeof__(self)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_23__sizeof__ = {"__sizeof__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_23__sizeof__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_22__sizeof__};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_23__sizeof__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__sizeof__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__sizeof__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__sizeof__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_22__sizeof__(((struct ChunkedList *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_22__sizeof__(struct ChunkedList *__pyx_v_self) {
+  Py_ssize_t __pyx_v_n;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_v_c;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__sizeof__", 0);
+
+  /* "recordclass/_linkedlist.pyx":401
+ *     #
+ *     def __sizeof__(self):
+ *         cdef Py_ssize_t n = 0             # <<<<<<<<<<<<<<
+ *         cdef chunk *c = self.head
+ * 
+*/
+  __pyx_v_n = 0;
+
+  /* "recordclass/_linkedlist.pyx":402
+ *     def __sizeof__(self):
+ *         cdef Py_ssize_t n = 0
+ *         cdef chunk *c = self.head             # <<<<<<<<<<<<<<
+ * 
+ *         while c is not NULL:
+*/
+  __pyx_t_1 = __pyx_v_self->head;
+  __pyx_v_c = __pyx_t_1;
+
+  /* "recordclass/_linkedlist.pyx":404
+ *         cdef chunk *c = self.head
+ * 
+ *         while c is not NULL:             # <<<<<<<<<<<<<<
+ *             n += 1
+ *             c = c.next
+*/
+  while (1) {
+    __pyx_t_2 = (__pyx_v_c != NULL);
+    if (!__pyx_t_2) break;
+
+    /* "recordclass/_linkedlist.pyx":405
+ * 
+ *         while c is not NULL:
+ *             n += 1             # <<<<<<<<<<<<<<
+ *             c = c.next
+ *         if self.spare is not NULL:
+*/
+    __pyx_v_n = (__pyx_v_n + 1);
+
+    /* "recordclass/_linkedlist.pyx":406
+ *         while c is not NULL:
+ *             n += 1
+ *             c = c.next             # <<<<<<<<<<<<<<
+ *         if self.spare is not NULL:
+ *             n += 1
+*/
+    __pyx_t_1 = __pyx_v_c->next;
+    __pyx_v_c = __pyx_t_1;
+  }
+
+  /* "recordclass/_linkedlist.pyx":407
+ *             n += 1
+ *             c = c.next
+ *         if self.spare is not NULL:             # <<<<<<<<<<<<<<
+ *             n += 1
+ *         return chunkedlist.__basicsize__ + n * sizeof(chunk)
+*/
+  __pyx_t_2 = (__pyx_v_self->spare != NULL);
+  if (__pyx_t_2) {
+
+    /* "recordclass/_linkedlist.pyx":408
+ *             c = c.next
+ *         if self.spare is not NULL:
+ *             n += 1             # <<<<<<<<<<<<<<
+ *         return chunkedlist.__basicsize__ + n * sizeof(chunk)
+ *     #
+*/
+    __pyx_v_n = (__pyx_v_n + 1);
+
+    /* "recordclass/_linkedlist.pyx":407
+ *             n += 1
+ *             c = c.next
+ *         if self.spare is not NULL:             # <<<<<<<<<<<<<<
+ *             n += 1
+ *         return chunkedlist.__basicsize__ + n * sizeof(chunk)
+*/
+  }
+
+  /* "recordclass/_linkedlist.pyx":409
+ *         if self.spare is not NULL:
+ *             n += 1
+ *         return chunkedlist.__basicsize__ + n * sizeof(chunk)             # <<<<<<<<<<<<<<
+ *     #
+ *     def __reduce__(self):
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist), __pyx_mstate_global->__pyx_n_u_basicsize); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_3);
+  __pyx_t_4 = __Pyx_PyLong_FromSize_t((__pyx_v_n * (sizeof(struct __pyx_t_11recordclass_11_linkedlist_chunk)))); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  __pyx_t_5 = PyNumber_Add(__pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 409, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_r = __pyx_t_5;
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "recordclass/_linkedlist.pyx":400
+ *         return iterchunkedlist(self)
+ *     #
+ *     def __sizeof__(self):             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t n = 0
+ *         cdef chunk *c = self.head
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.__sizeof__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "recordclass/_linkedlist.pyx":411
+ *         return chunkedlist.__basicsize__ + n * sizeof(chunk)
+ *     #
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return chunkedlist, (list(self),)
+ *     #
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_25__reduce__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_11chunkedlist_24__reduce__, "chunkedlist.__reduce__(self)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_25__reduce__ = {"__reduce__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_25__reduce__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_24__reduce__};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_25__reduce__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__reduce__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_24__reduce__(((struct ChunkedList *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_24__reduce__(struct ChunkedList *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce__", 0);
+
+  /* "recordclass/_linkedlist.pyx":412
+ *     #
+ *     def __reduce__(self):
+ *         return chunkedlist, (list(self),)             # <<<<<<<<<<<<<<
+ *     #
+ *     def __repr__(self):
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PySequence_List(((PyObject *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1) != (0)) __PYX_ERR(0, 412, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 412, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist);
+  __Pyx_GIVEREF((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist)) != (0)) __PYX_ERR(0, 412, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_2);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2) != (0)) __PYX_ERR(0, 412, __pyx_L1_error);
+  __pyx_t_2 = 0;
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "recordclass/_linkedlist.pyx":411
+ *         return chunkedlist.__basicsize__ + n * sizeof(chunk)
+ *     #
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return chunkedlist, (list(self),)
+ *     #
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.__reduce__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "recordclass/_linkedlist.pyx":414
+ *         return chunkedlist, (list(self),)
+ *     #
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return "chunkedlist(%r)" % list(self)
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_27__repr__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_27__repr__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__repr__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_11chunkedlist_26__repr__(((struct ChunkedList *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_11chunkedlist_26__repr__(struct ChunkedList *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__repr__", 0);
+
+  /* "recordclass/_linkedlist.pyx":415
+ *     #
+ *     def __repr__(self):
+ *         return "chunkedlist(%r)" % list(self)             # <<<<<<<<<<<<<<
+ * 
+ * @cython.final
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PySequence_List(((PyObject *)__pyx_v_self)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 415, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = PyUnicode_Format(__pyx_mstate_global->__pyx_kp_u_chunkedlist_r, __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 415, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_r = __pyx_t_2;
+  __pyx_t_2 = 0;
+  goto __pyx_L0;
+
+  /* "recordclass/_linkedlist.pyx":414
+ *         return chunkedlist, (list(self),)
+ *     #
+ *     def __repr__(self):             # <<<<<<<<<<<<<<
+ *         return "chunkedlist(%r)" % list(self)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_AddTraceback("recordclass._linkedlist.chunkedlist.__repr__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "recordclass/_linkedlist.pyx":425
+ *     cdef Py_ssize_t state
+ * 
+ *     def __init__(self, chunkedlist lst):             # <<<<<<<<<<<<<<
+ *         self.lst = lst
+ *         self.node = lst.head
+*/
+
+/* Python wrapper */
+static int __pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_1__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  struct ChunkedList *__pyx_v_lst = 0;
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_lst,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 425, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 425, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 425, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, i); __PYX_ERR(0, 425, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 425, __pyx_L3_error)
+    }
+    __pyx_v_lst = ((struct ChunkedList *)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 425, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("recordclass._linkedlist.iterchunkedlist.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_lst), __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, 1, "lst", 0))) __PYX_ERR(0, 425, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist___init__(((struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)__pyx_v_self), __pyx_v_lst);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = -1;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist___init__(struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self, struct ChunkedList *__pyx_v_lst) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "recordclass/_linkedlist.pyx":426
+ * 
+ *     def __init__(self, chunkedlist lst):
+ *         self.lst = lst             # <<<<<<<<<<<<<<
+ *         self.node = lst.head
+ *         self.index = lst.first
+*/
+  __Pyx_INCREF((PyObject *)__pyx_v_lst);
+  __Pyx_GIVEREF((PyObject *)__pyx_v_lst);
+  __Pyx_GOTREF((PyObject *)__pyx_v_self->lst);
+  __Pyx_DECREF((PyObject *)__pyx_v_self->lst);
+  __pyx_v_self->lst = __pyx_v_lst;
+
+  /* "recordclass/_linkedlist.pyx":427
+ *     def __init__(self, chunkedlist lst):
+ *         self.lst = lst
+ *         self.node = lst.head             # <<<<<<<<<<<<<<
+ *         self.index = lst.first
+ *         self.count = lst.size
+*/
+  __pyx_t_1 = __pyx_v_lst->head;
+  __pyx_v_self->node = __pyx_t_1;
+
+  /* "recordclass/_linkedlist.pyx":428
+ *         self.lst = lst
+ *         self.node = lst.head
+ *         self.index = lst.first             # <<<<<<<<<<<<<<
+ *         self.count = lst.size
+ *         self.state = lst.state
+*/
+  __pyx_t_2 = __pyx_v_lst->first;
+  __pyx_v_self->index = __pyx_t_2;
+
+  /* "recordclass/_linkedlist.pyx":429
+ *         self.node = lst.head
+ *         self.index = lst.first
+ *         self.count = lst.size             # <<<<<<<<<<<<<<
+ *         self.state = lst.state
+ * 
+*/
+  __pyx_t_2 = __pyx_v_lst->size;
+  __pyx_v_self->count = __pyx_t_2;
+
+  /* "recordclass/_linkedlist.pyx":430
+ *         self.index = lst.first
+ *         self.count = lst.size
+ *         self.state = lst.state             # <<<<<<<<<<<<<<
+ * 
+ *     def __next__(self):
+*/
+  __pyx_t_2 = __pyx_v_lst->state;
+  __pyx_v_self->state = __pyx_t_2;
+
+  /* "recordclass/_linkedlist.pyx":425
+ *     cdef Py_ssize_t state
+ * 
+ *     def __init__(self, chunkedlist lst):             # <<<<<<<<<<<<<<
+ *         self.lst = lst
+ *         self.node = lst.head
+*/
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "recordclass/_linkedlist.pyx":432
+ *         self.state = lst.state
+ * 
+ *     def __next__(self):             # <<<<<<<<<<<<<<
+ *         cdef PyObject *item
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_3__next__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_3__next__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__next__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_2__next__(((struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_2__next__(struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self) {
+  PyObject *__pyx_v_item;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_error_without_exception = 0; /* StopIteration */
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *__pyx_t_6;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__next__", 0);
+
+  /* "recordclass/_linkedlist.pyx":435
+ *         cdef PyObject *item
+ * 
+ *         if self.state != self.lst.state:             # <<<<<<<<<<<<<<
+ *             self.count = 0
+ *             raise RuntimeError("chunkedlist mutated during iteration")
+*/
+  __pyx_t_1 = (__pyx_v_self->state != __pyx_v_self->lst->state);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "recordclass/_linkedlist.pyx":436
+ * 
+ *         if self.state != self.lst.state:
+ *             self.count = 0             # <<<<<<<<<<<<<<
+ *             raise RuntimeError("chunkedlist mutated during iteration")
+ *         if self.count == 0:
+*/
+    __pyx_v_self->count = 0;
+
+    /* "recordclass/_linkedlist.pyx":437
+ *         if self.state != self.lst.state:
+ *             self.count = 0
+ *             raise RuntimeError("chunkedlist mutated during iteration")             # <<<<<<<<<<<<<<
+ *         if self.count == 0:
+ *             raise StopIteration
+*/
+    __pyx_t_3 = NULL;
+    __pyx_t_4 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_mstate_global->__pyx_kp_u_chunkedlist_mutated_during_itera};
+      __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_RuntimeError)), __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 437, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_Raise(__pyx_t_2, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+    __PYX_ERR(0, 437, __pyx_L1_error)
+
+    /* "recordclass/_linkedlist.pyx":435
+ *         cdef PyObject *item
+ * 
+ *         if self.state != self.lst.state:             # <<<<<<<<<<<<<<
+ *             self.count = 0
+ *             raise RuntimeError("chunkedlist mutated during iteration")
+*/
+  }
+
+  /* "recordclass/_linkedlist.pyx":438
+ *             self.count = 0
+ *             raise RuntimeError("chunkedlist mutated during iteration")
+ *         if self.count == 0:             # <<<<<<<<<<<<<<
+ *             raise StopIteration
+ * 
+*/
+  __pyx_t_1 = (__pyx_v_self->count == 0);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "recordclass/_linkedlist.pyx":439
+ *             raise RuntimeError("chunkedlist mutated during iteration")
+ *         if self.count == 0:
+ *             raise StopIteration             # <<<<<<<<<<<<<<
+ * 
+ *         item = self.node.items[self.index]
+*/
+    __pyx_error_without_exception = 1;
+    goto __pyx_L1_error;;
+
+    /* "recordclass/_linkedlist.pyx":438
+ *             self.count = 0
+ *             raise RuntimeError("chunkedlist mutated during iteration")
+ *         if self.count == 0:             # <<<<<<<<<<<<<<
+ *             raise StopIteration
+ * 
+*/
+  }
+
+  /* "recordclass/_linkedlist.pyx":441
+ *             raise StopIteration
+ * 
+ *         item = self.node.items[self.index]             # <<<<<<<<<<<<<<
+ *         self.index += 1
+ *         self.count -= 1
+*/
+  __pyx_v_item = (__pyx_v_self->node->items[__pyx_v_self->index]);
+
+  /* "recordclass/_linkedlist.pyx":442
+ * 
+ *         item = self.node.items[self.index]
+ *         self.index += 1             # <<<<<<<<<<<<<<
+ *         self.count -= 1
+ *         if self.index == CHUNK_SIZE and self.count:
+*/
+  __pyx_v_self->index = (__pyx_v_self->index + 1);
+
+  /* "recordclass/_linkedlist.pyx":443
+ *         item = self.node.items[self.index]
+ *         self.index += 1
+ *         self.count -= 1             # <<<<<<<<<<<<<<
+ *         if self.index == CHUNK_SIZE and self.count:
+ *             self.node = self.node.next
+*/
+  __pyx_v_self->count = (__pyx_v_self->count - 1);
+
+  /* "recordclass/_linkedlist.pyx":444
+ *         self.index += 1
+ *         self.count -= 1
+ *         if self.index == CHUNK_SIZE and self.count:             # <<<<<<<<<<<<<<
+ *             self.node = self.node.next
+ *             self.index = 0
+*/
+  __pyx_t_5 = (__pyx_v_self->index == __pyx_e_11recordclass_11_linkedlist_CHUNK_SIZE);
+  if (__pyx_t_5) {
+  } else {
+    __pyx_t_1 = __pyx_t_5;
+    goto __pyx_L6_bool_binop_done;
+  }
+  __pyx_t_5 = (__pyx_v_self->count != 0);
+  __pyx_t_1 = __pyx_t_5;
+  __pyx_L6_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "recordclass/_linkedlist.pyx":445
+ *         self.count -= 1
+ *         if self.index == CHUNK_SIZE and self.count:
+ *             self.node = self.node.next             # <<<<<<<<<<<<<<
+ *             self.index = 0
+ *         return <object>item
+*/
+    __pyx_t_6 = __pyx_v_self->node->next;
+    __pyx_v_self->node = __pyx_t_6;
+
+    /* "recordclass/_linkedlist.pyx":446
+ *         if self.index == CHUNK_SIZE and self.count:
+ *             self.node = self.node.next
+ *             self.index = 0             # <<<<<<<<<<<<<<
+ *         return <object>item
+ * 
+*/
+    __pyx_v_self->index = 0;
+
+    /* "recordclass/_linkedlist.pyx":444
+ *         self.index += 1
+ *         self.count -= 1
+ *         if self.index == CHUNK_SIZE and self.count:             # <<<<<<<<<<<<<<
+ *             self.node = self.node.next
+ *             self.index = 0
+*/
+  }
+
+  /* "recordclass/_linkedlist.pyx":447
+ *             self.node = self.node.next
+ *             self.index = 0
+ *         return <object>item             # <<<<<<<<<<<<<<
+ * 
+ *     def __length_hint__(self):
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_item));
+  __pyx_r = ((PyObject *)__pyx_v_item);
+  goto __pyx_L0;
+
+  /* "recordclass/_linkedlist.pyx":432
+ *         self.state = lst.state
+ * 
+ *     def __next__(self):             # <<<<<<<<<<<<<<
+ *         cdef PyObject *item
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  if (!__pyx_error_without_exception) {
+    __Pyx_AddTraceback("recordclass._linkedlist.iterchunkedlist.__next__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  }
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "recordclass/_linkedlist.pyx":449
+ *         return <object>item
+ * 
+ *     def __length_hint__(self):             # <<<<<<<<<<<<<<
+ *         return self.count
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_5__length_hint__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_4__length_hint__, "iterchunkedlist.__length_hint__(self)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_15iterchunkedlist_5__length_hint__ = {"__length_hint__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_5__length_hint__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_4__length_hint__};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_5__length_hint__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__length_hint__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__length_hint__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__length_hint__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_4__length_hint__(((struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_4__length_hint__(struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__length_hint__", 0);
+
+  /* "recordclass/_linkedlist.pyx":450
+ * 
+ *     def __length_hint__(self):
+ *         return self.count             # <<<<<<<<<<<<<<
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyLong_FromSsize_t(__pyx_v_self->count); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 450, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "recordclass/_linkedlist.pyx":449
+ *         return <object>item
+ * 
+ *     def __length_hint__(self):             # <<<<<<<<<<<<<<
+ *         return self.count
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.iterchunkedlist.__length_hint__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_7__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_6__reduce_cython__, "iterchunkedlist.__reduce_cython__(self)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_15iterchunkedlist_7__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_7__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_6__reduce_cython__};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_7__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce_cython__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_6__reduce_cython__(((struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_6__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_self_node_cannot_be_converted_to, 0, 0);
+  __PYX_ERR(1, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("recordclass._linkedlist.iterchunkedlist.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_9__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_8__setstate_cython__, "iterchunkedlist.__setstate_cython__(self, __pyx_state)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_15iterchunkedlist_9__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_9__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_8__setstate_cython__};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_9__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 3, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__setstate_cython__", 0) < (0)) __PYX_ERR(1, 3, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, i); __PYX_ERR(1, 3, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 3, __pyx_L3_error)
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(1, 3, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("recordclass._linkedlist.iterchunkedlist.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_8__setstate_cython__(((struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_15iterchunkedlist_8__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"             # <<<<<<<<<<<<<<
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_self_node_cannot_be_converted_to, 0, 0);
+  __PYX_ERR(1, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("recordclass._linkedlist.iterchunkedlist.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_linkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist___pyx_unpickle_linkeditem, "__pyx_unpickle_linkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem = {"__pyx_unpickle_linkeditem", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist___pyx_unpickle_linkeditem};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_linkeditem (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_linkeditem", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_linkeditem", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
+    __pyx_v___pyx_state = ((PyObject*)values[2]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_linkeditem", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkeditem", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist___pyx_unpickle_linkeditem(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist___pyx_unpickle_linkeditem(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_linkeditem", 0);
+
+  /* "(tree fragment)":6
+ * def __pyx_unpickle_linkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')             # <<<<<<<<<<<<<<
+ *     __pyx_result = linkeditem.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+*/
+  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, __pyx_k_next_val); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+
+  /* "(tree fragment)":7
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
+ *     __pyx_result = linkeditem.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
+    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v___pyx_result = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
+ *     __pyx_result = linkeditem.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = linkeditem.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):
+*/
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+      __PYX_ERR(1, 9, __pyx_L1_error)
+    }
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkeditem__set_state(((struct LinkedItem *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
+ *     __pyx_result = linkeditem.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_linkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkeditem", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+
+static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkeditem__set_state(struct LinkedItem *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_linkeditem__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]             # <<<<<<<<<<<<<<
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->next);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->next);
+  __pyx_v___pyx_result->next = ((struct LinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->val);
+  __Pyx_DECREF(__pyx_v___pyx_result->val);
+  __pyx_v___pyx_result->val = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)             # <<<<<<<<<<<<<<
+*/
+  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 2); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_linkeditem__set_state(<linkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_linkeditem__set_state(linkeditem __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.val = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkeditem__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_linkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist, "__pyx_unpickle_linkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist = {"__pyx_unpickle_linkedlist", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_linkedlist (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_linkedlist", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_linkedlist", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
+    __pyx_v___pyx_state = ((PyObject*)values[2]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_linkedlist", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_2__pyx_unpickle_linkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_linkedlist", 0);
+
+  /* "(tree fragment)":6
+ * def __pyx_unpickle_linkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')             # <<<<<<<<<<<<<<
+ *     __pyx_result = linkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+*/
+  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, __pyx_k_end_start); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+
+  /* "(tree fragment)":7
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+ *     __pyx_result = linkedlist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
+    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v___pyx_result = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+ *     __pyx_result = linkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = linkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):
+*/
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+      __PYX_ERR(1, 9, __pyx_L1_error)
+    }
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkedlist__set_state(((struct LinkedList *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+ *     __pyx_result = linkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_linkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+
+static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_linkedlist__set_state(struct LinkedList *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_linkedlist__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]             # <<<<<<<<<<<<<<
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->end);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->end);
+  __pyx_v___pyx_result->end = ((struct LinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->start);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->start);
+  __pyx_v___pyx_result->start = ((struct LinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)             # <<<<<<<<<<<<<<
+*/
+  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 2); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_linkedlist__set_state(<linkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_linkedlist__set_state(linkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_linkedlist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_iterlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist, "__pyx_unpickle_iterlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist = {"__pyx_unpickle_iterlinkedlist", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_iterlinkedlist (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_iterlinkedlist", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_iterlinkedlist", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
+    __pyx_v___pyx_state = ((PyObject*)values[2]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_iterlinkedlist", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_4__pyx_unpickle_iterlinkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_iterlinkedlist", 0);
+
+  /* "(tree fragment)":6
+ * def __pyx_unpickle_iterlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')             # <<<<<<<<<<<<<<
+ *     __pyx_result = iterlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+*/
+  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, __pyx_k_node); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+
+  /* "(tree fragment)":7
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+ *     __pyx_result = iterlinkedlist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
+    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v___pyx_result = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+ *     __pyx_result = iterlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = iterlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):
+*/
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+      __PYX_ERR(1, 9, __pyx_L1_error)
+    }
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterlinkedlist__set_state(((struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+ *     __pyx_result = iterlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.node = __pyx_state[0]
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_iterlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.node = __pyx_state[0]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+*/
+
+static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterlinkedlist__set_state(struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_iterlinkedlist__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.node = __pyx_state[0]             # <<<<<<<<<<<<<<
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+*/
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->node);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->node);
+  __pyx_v___pyx_result->node = ((struct LinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.node = __pyx_state[0]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)             # <<<<<<<<<<<<<<
+*/
+  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_iterlinkedlist__set_state(<iterlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_iterlinkedlist__set_state(iterlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.node = __pyx_state[0]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterlinkedlist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_dlinkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_6__pyx_unpickle_dlinkeditem, "__pyx_unpickle_dlinkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem = {"__pyx_unpickle_dlinkeditem", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_6__pyx_unpickle_dlinkeditem};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkeditem (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_dlinkeditem", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_dlinkeditem", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
+    __pyx_v___pyx_state = ((PyObject*)values[2]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_dlinkeditem", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkeditem", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_6__pyx_unpickle_dlinkeditem(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_6__pyx_unpickle_dlinkeditem(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkeditem", 0);
+
+  /* "(tree fragment)":6
+ * def __pyx_unpickle_dlinkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')             # <<<<<<<<<<<<<<
+ *     __pyx_result = dlinkeditem.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+*/
+  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, __pyx_k_next_prev_val); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+
+  /* "(tree fragment)":7
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
+ *     __pyx_result = dlinkeditem.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
+    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v___pyx_result = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
+ *     __pyx_result = dlinkeditem.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = dlinkeditem.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):
+*/
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+      __PYX_ERR(1, 9, __pyx_L1_error)
+    }
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkeditem__set_state(((struct DLinkedItem *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
+ *     __pyx_result = dlinkeditem.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_dlinkeditem(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x6b443d1, 0x76b156b, 0xa11cc5d, b'next, prev, val')
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkeditem", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+*/
+
+static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkeditem__set_state(struct DLinkedItem *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkeditem__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]             # <<<<<<<<<<<<<<
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+*/
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->next);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->next);
+  __pyx_v___pyx_result->next = ((struct LinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->prev);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->prev);
+  __pyx_v___pyx_result->prev = ((struct LinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 2);
+  __Pyx_INCREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v___pyx_result->val);
+  __Pyx_DECREF(__pyx_v___pyx_result->val);
+  __pyx_v___pyx_result->val = __pyx_t_1;
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)             # <<<<<<<<<<<<<<
+*/
+  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 3); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_dlinkeditem__set_state(<dlinkeditem> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_dlinkeditem__set_state(dlinkeditem __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.next = __pyx_state[0]; __pyx_result.prev = __pyx_state[1]; __pyx_result.val = __pyx_state[2]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 3)
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkeditem__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_dlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_8__pyx_unpickle_dlinkedlist, "__pyx_unpickle_dlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist = {"__pyx_unpickle_dlinkedlist", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_8__pyx_unpickle_dlinkedlist};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkedlist (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_dlinkedlist", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_dlinkedlist", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
+    __pyx_v___pyx_state = ((PyObject*)values[2]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_dlinkedlist", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_8__pyx_unpickle_dlinkedlist(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_8__pyx_unpickle_dlinkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkedlist", 0);
+
+  /* "(tree fragment)":6
+ * def __pyx_unpickle_dlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')             # <<<<<<<<<<<<<<
+ *     __pyx_result = dlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+*/
+  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, __pyx_k_end_start); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+
+  /* "(tree fragment)":7
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+ *     __pyx_result = dlinkedlist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
+    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v___pyx_result = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+ *     __pyx_result = dlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = dlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):
+*/
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+      __PYX_ERR(1, 9, __pyx_L1_error)
+    }
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkedlist__set_state(((struct DLinkedList *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+ *     __pyx_result = dlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_dlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+
+static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_dlinkedlist__set_state(struct DLinkedList *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_dlinkedlist__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]             # <<<<<<<<<<<<<<
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->end);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->end);
+  __pyx_v___pyx_result->end = ((struct DLinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 1);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->start);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->start);
+  __pyx_v___pyx_result->start = ((struct DLinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)             # <<<<<<<<<<<<<<
+*/
+  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 2); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_dlinkedlist__set_state(<dlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_dlinkedlist__set_state(dlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.end = __pyx_state[0]; __pyx_result.start = __pyx_state[1]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 2)
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_dlinkedlist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_iterdlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11recordclass_11_linkedlist_10__pyx_unpickle_iterdlinkedlist, "__pyx_unpickle_iterdlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state)");
+static PyMethodDef __pyx_mdef_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist = {"__pyx_unpickle_iterdlinkedlist", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10__pyx_unpickle_iterdlinkedlist};
+static PyObject *__pyx_pw_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist(PyObject *__pyx_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  PyObject *__pyx_v___pyx_type = 0;
+  long __pyx_v___pyx_checksum;
+  PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[3] = {0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__pyx_unpickle_iterdlinkedlist (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_type,&__pyx_mstate_global->__pyx_n_u_pyx_checksum,&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(1, 4, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  3:
+        values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__pyx_unpickle_iterdlinkedlist", 0) < (0)) __PYX_ERR(1, 4, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 3; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_iterdlinkedlist", 1, 3, 3, i); __PYX_ERR(1, 4, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 3)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(1, 4, __pyx_L3_error)
+      values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(1, 4, __pyx_L3_error)
+    }
+    __pyx_v___pyx_type = values[0];
+    __pyx_v___pyx_checksum = __Pyx_PyLong_As_long(values[1]); if (unlikely((__pyx_v___pyx_checksum == (long)-1) && PyErr_Occurred())) __PYX_ERR(1, 4, __pyx_L3_error)
+    __pyx_v___pyx_state = ((PyObject*)values[2]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__pyx_unpickle_iterdlinkedlist", 1, 3, 3, __pyx_nargs); __PYX_ERR(1, 4, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterdlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v___pyx_state), (&PyTuple_Type), 1, "__pyx_state", 1))) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11recordclass_11_linkedlist_10__pyx_unpickle_iterdlinkedlist(__pyx_self, __pyx_v___pyx_type, __pyx_v___pyx_checksum, __pyx_v___pyx_state);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11recordclass_11_linkedlist_10__pyx_unpickle_iterdlinkedlist(CYTHON_UNUSED PyObject *__pyx_self, PyObject *__pyx_v___pyx_type, long __pyx_v___pyx_checksum, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_v___pyx_result = 0;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  size_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_iterdlinkedlist", 0);
+
+  /* "(tree fragment)":6
+ * def __pyx_unpickle_iterdlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')             # <<<<<<<<<<<<<<
+ *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+*/
+  __pyx_t_1 = __Pyx_CheckUnpickleChecksum(__pyx_v___pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, __pyx_k_node); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(1, 6, __pyx_L1_error)
+
+  /* "(tree fragment)":7
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+ *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)             # <<<<<<<<<<<<<<
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
+*/
+  __pyx_t_3 = ((PyObject *)__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v___pyx_type};
+    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_new, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 7, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __pyx_v___pyx_result = __pyx_t_2;
+  __pyx_t_2 = 0;
+
+  /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+ *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  __pyx_t_5 = (__pyx_v___pyx_state != ((PyObject*)Py_None));
+  if (__pyx_t_5) {
+
+    /* "(tree fragment)":9
+ *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)             # <<<<<<<<<<<<<<
+ *     return __pyx_result
+ * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):
+*/
+    if (unlikely(__pyx_v___pyx_state == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "cannot pass None into a C function argument that is declared 'not None'");
+      __PYX_ERR(1, 9, __pyx_L1_error)
+    }
+    __pyx_t_2 = __pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterdlinkedlist__set_state(((struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)__pyx_v___pyx_result), __pyx_v___pyx_state); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 9, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "(tree fragment)":8
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+ *     __pyx_result = iterdlinkedlist.__new__(__pyx_type)
+ *     if __pyx_state is not None:             # <<<<<<<<<<<<<<
+ *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+*/
+  }
+
+  /* "(tree fragment)":10
+ *     if __pyx_state is not None:
+ *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result             # <<<<<<<<<<<<<<
+ * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.node = __pyx_state[0]
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v___pyx_result);
+  __pyx_r = __pyx_v___pyx_result;
+  goto __pyx_L0;
+
+  /* "(tree fragment)":4
+ *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
+ *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
+ * def __pyx_unpickle_iterdlinkedlist(__pyx_type, long __pyx_checksum, tuple __pyx_state):             # <<<<<<<<<<<<<<
+ *     cdef object __pyx_result
+ *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterdlinkedlist", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v___pyx_result);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":11
+ *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.node = __pyx_state[0]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+*/
+
+static PyObject *__pyx_f_11recordclass_11_linkedlist___pyx_unpickle_iterdlinkedlist__set_state(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *__pyx_v___pyx_result, PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__pyx_unpickle_iterdlinkedlist__set_state", 0);
+
+  /* "(tree fragment)":12
+ *     return __pyx_result
+ * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.node = __pyx_state[0]             # <<<<<<<<<<<<<<
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+*/
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v___pyx_state, 0);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem))))) __PYX_ERR(1, 12, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF((PyObject *)__pyx_v___pyx_result->node);
+  __Pyx_DECREF((PyObject *)__pyx_v___pyx_result->node);
+  __pyx_v___pyx_result->node = ((struct DLinkedItem *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "(tree fragment)":13
+ * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):
+ *     __pyx_result.node = __pyx_state[0]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)             # <<<<<<<<<<<<<<
+*/
+  __pyx_t_2 = __Pyx_UpdateUnpickledDict(((PyObject *)__pyx_v___pyx_result), __pyx_v___pyx_state, 1); if (unlikely(__pyx_t_2 == ((int)-1))) __PYX_ERR(1, 13, __pyx_L1_error)
+
+  /* "(tree fragment)":11
+ *         __pyx_unpickle_iterdlinkedlist__set_state(<iterdlinkedlist> __pyx_result, __pyx_state)
+ *     return __pyx_result
+ * cdef __pyx_unpickle_iterdlinkedlist__set_state(iterdlinkedlist __pyx_result, __pyx_state: tuple):             # <<<<<<<<<<<<<<
+ *     __pyx_result.node = __pyx_state[0]
+ *     __Pyx_UpdateUnpickledDict(__pyx_result, __pyx_state, 1)
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("recordclass._linkedlist.__pyx_unpickle_iterdlinkedlist__set_state", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+/* #### Code section: module_exttypes ### */
+
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_linkeditem(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct LinkedItem *p;
+  PyObject *o;
+  o = __Pyx_AllocateExtensionType(t, 1);
+  if (unlikely(!o)) return 0;
+  p = ((struct LinkedItem *)o);
+  p->val = Py_None; Py_INCREF(Py_None);
+  p->next = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_11recordclass_11_linkedlist_linkeditem(PyObject *o) {
+  struct LinkedItem *p = (struct LinkedItem *)o;
+  Py_CLEAR(p->val);
+  Py_CLEAR(p->next);
+  PyTypeObject *tp = Py_TYPE(o);
+  #if CYTHON_USE_TYPE_SLOTS
+  (*tp->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    if (tp_free) tp_free(o);
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  Py_DECREF(tp);
+  #endif
+}
+
+static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_linkeditem[] = {
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_10linkeditem_1__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10linkeditem___reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_10linkeditem_3__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10linkeditem_2__setstate_cython__},
+  {0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot LinkedItemType_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_linkeditem},
+  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_linkeditem},
+  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_linkeditem},
+  {0, 0},
+};
+static PyType_Spec LinkedItemType_spec = {
+  "recordclass._linkedlist.linkeditem",
+  sizeof(struct LinkedItem),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER,
+  LinkedItemType_slots,
+};
+#else
+
+DL_EXPORT(PyTypeObject) LinkedItemType = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "recordclass._linkedlist.""linkeditem", /*tp_name*/
+  sizeof(struct LinkedItem), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_11recordclass_11_linkedlist_linkeditem, /*tp_dealloc*/
+  0, /*tp_vectorcall_offset*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_as_async*/
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
+  0, /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_11recordclass_11_linkedlist_linkeditem, /*tp_methods*/
+  0, /*tp_members*/
+  0, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_11recordclass_11_linkedlist_linkeditem, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #if !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+static struct __pyx_vtabstruct_11recordclass_11_linkedlist_linkedlist __pyx_vtable_11recordclass_11_linkedlist_linkedlist;
+
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_linkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct LinkedList *p;
+  PyObject *o;
+  o = __Pyx_AllocateExtensionType(t, 1);
+  if (unlikely(!o)) return 0;
+  p = ((struct LinkedList *)o);
+  p->__pyx_vtab = __pyx_vtabptr_11recordclass_11_linkedlist_linkedlist;
+  p->start = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  p->end = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_11recordclass_11_linkedlist_linkedlist(PyObject *o) {
+  struct LinkedList *p = (struct LinkedList *)o;
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_11recordclass_11_linkedlist_10linkedlist_7__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  Py_CLEAR(p->start);
+  Py_CLEAR(p->end);
+  PyTypeObject *tp = Py_TYPE(o);
+  #if CYTHON_USE_TYPE_SLOTS
+  (*tp->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
     if (tp_free) tp_free(o);
   }
   #endif
@@ -9570,33 +13644,253 @@ static void __pyx_tp_dealloc_11recordclass_11_linkedlist_linkeditem(PyObject *o)
   #endif
 }
 
-static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_linkeditem[] = {
-  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_10linkeditem_1__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10linkeditem___reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_10linkeditem_3__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10linkeditem_2__setstate_cython__},
+static int __pyx_tp_traverse_11recordclass_11_linkedlist_linkedlist(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct LinkedList *p = (struct LinkedList *)o;
+  {
+    e = __Pyx_call_type_traverse(o, 1, v, a);
+    if (e) return e;
+  }
+  if (p->start) {
+    e = (*v)(((PyObject *)p->start), a); if (e) return e;
+  }
+  if (p->end) {
+    e = (*v)(((PyObject *)p->end), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_11recordclass_11_linkedlist_linkedlist(PyObject *o) {
+  PyObject* tmp;
+  struct LinkedList *p = (struct LinkedList *)o;
+  tmp = ((PyObject*)p->start);
+  p->start = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->end);
+  p->end = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_11recordclass_11_linkedlist_10linkedlist_start(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_5start_1__get__(o);
+}
+
+static int __pyx_setprop_11recordclass_11_linkedlist_10linkedlist_start(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_5start_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_5start_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_11recordclass_11_linkedlist_10linkedlist_end(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_3end_1__get__(o);
+}
+
+static int __pyx_setprop_11recordclass_11_linkedlist_10linkedlist_end(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_3end_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_3end_5__del__(o);
+  }
+}
+
+static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_linkedlist[] = {
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_10linkedlist_11__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10linkedlist_10__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_10linkedlist_13__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10linkedlist_12__setstate_cython__},
   {0, 0, 0, 0}
 };
+
+static struct PyGetSetDef __pyx_getsets_11recordclass_11_linkedlist_linkedlist[] = {
+  {"start", __pyx_getprop_11recordclass_11_linkedlist_10linkedlist_start, __pyx_setprop_11recordclass_11_linkedlist_10linkedlist_start, PyDoc_STR("start: recordclass._linkedlist.linkeditem"), 0},
+  {"end", __pyx_getprop_11recordclass_11_linkedlist_10linkedlist_end, __pyx_setprop_11recordclass_11_linkedlist_10linkedlist_end, PyDoc_STR("end: recordclass._linkedlist.linkeditem"), 0},
+  {0, 0, 0, 0, 0}
+};
 #if CYTHON_USE_TYPE_SPECS
-static PyType_Slot LinkedItemType_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_linkeditem},
-  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_linkeditem},
-  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_linkeditem},
+static PyType_Slot LinkedListType_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_linkedlist},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_linkedlist},
+  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_linkedlist},
+  {Py_tp_iter, (void *)__pyx_pw_11recordclass_11_linkedlist_10linkedlist_9__iter__},
+  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_linkedlist},
+  {Py_tp_getset, (void *)__pyx_getsets_11recordclass_11_linkedlist_linkedlist},
+  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_linkedlist},
   {0, 0},
 };
-static PyType_Spec LinkedItemType_spec = {
-  "recordclass._linkedlist.linkeditem",
-  sizeof(struct LinkedItem),
+static PyType_Spec LinkedListType_spec = {
+  "recordclass._linkedlist.linkedlist",
+  sizeof(struct LinkedList),
   0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER,
-  LinkedItemType_slots,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC,
+  LinkedListType_slots,
 };
 #else
 
-DL_EXPORT(PyTypeObject) LinkedItemType = {
+DL_EXPORT(PyTypeObject) LinkedListType = {
   PyVarObject_HEAD_INIT(0, 0)
-  "recordclass._linkedlist.""linkeditem", /*tp_name*/
-  sizeof(struct LinkedItem), /*tp_basicsize*/
+  "recordclass._linkedlist.""linkedlist", /*tp_name*/
+  sizeof(struct LinkedList), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_11recordclass_11_linkedlist_linkedlist, /*tp_dealloc*/
+  0, /*tp_vectorcall_offset*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_as_async*/
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_11recordclass_11_linkedlist_linkedlist, /*tp_traverse*/
+  __pyx_tp_clear_11recordclass_11_linkedlist_linkedlist, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  __pyx_pw_11recordclass_11_linkedlist_10linkedlist_9__iter__, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_11recordclass_11_linkedlist_linkedlist, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_11recordclass_11_linkedlist_linkedlist, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  0, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_11recordclass_11_linkedlist_linkedlist, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #if !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_iterlinkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *p;
+  PyObject *o;
+  o = __Pyx_AllocateExtensionType(t, 1);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)o);
+  p->node = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  return o;
+}
+
+static void __pyx_tp_dealloc_11recordclass_11_linkedlist_iterlinkedlist(PyObject *o) {
+  struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)o;
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->node);
+  PyTypeObject *tp = Py_TYPE(o);
+  #if CYTHON_USE_TYPE_SLOTS
+  (*tp->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    if (tp_free) tp_free(o);
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  Py_DECREF(tp);
+  #endif
+}
+
+static int __pyx_tp_traverse_11recordclass_11_linkedlist_iterlinkedlist(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)o;
+  {
+    e = __Pyx_call_type_traverse(o, 1, v, a);
+    if (e) return e;
+  }
+  if (p->node) {
+    e = (*v)(((PyObject *)p->node), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_11recordclass_11_linkedlist_iterlinkedlist(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)o;
+  tmp = ((PyObject*)p->node);
+  p->node = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__(PyObject *self, CYTHON_UNUSED PyObject *arg) {
+  PyObject *res = __pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__(self);
+  if (!res && !PyErr_Occurred()) { PyErr_SetNone(PyExc_StopIteration); }
+  return res;
+}
+
+static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_iterlinkedlist[] = {
+  {"__next__", (PyCFunction)__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__, METH_NOARGS|METH_COEXIST, 0},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_5__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_14iterlinkedlist_4__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_7__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_14iterlinkedlist_6__setstate_cython__},
+  {0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_11recordclass_11_linkedlist_iterlinkedlist_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_iterlinkedlist},
+  {Py_tp_doc, (void *)PyDoc_STR("iterlinkedlist(linkedlist ll)")},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_iterlinkedlist},
+  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_iterlinkedlist},
+  {Py_tp_iternext, (void *)__pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__},
+  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_iterlinkedlist},
+  {Py_tp_init, (void *)__pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_1__init__},
+  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_iterlinkedlist},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_11recordclass_11_linkedlist_iterlinkedlist_spec = {
+  "recordclass._linkedlist.iterlinkedlist",
+  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_11recordclass_11_linkedlist_iterlinkedlist_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterlinkedlist = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "recordclass._linkedlist.""iterlinkedlist", /*tp_name*/
+  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_11recordclass_11_linkedlist_linkeditem, /*tp_dealloc*/
+  __pyx_tp_dealloc_11recordclass_11_linkedlist_iterlinkedlist, /*tp_dealloc*/
   0, /*tp_vectorcall_offset*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
@@ -9611,15 +13905,15 @@ DL_EXPORT(PyTypeObject) LinkedItemType = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  PyDoc_STR("iterlinkedlist(linkedlist ll)"), /*tp_doc*/
+  __pyx_tp_traverse_11recordclass_11_linkedlist_iterlinkedlist, /*tp_traverse*/
+  __pyx_tp_clear_11recordclass_11_linkedlist_iterlinkedlist, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_11recordclass_11_linkedlist_linkeditem, /*tp_methods*/
+  __pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__, /*tp_iternext*/
+  __pyx_methods_11recordclass_11_linkedlist_iterlinkedlist, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -9629,9 +13923,9 @@ DL_EXPORT(PyTypeObject) LinkedItemType = {
   #if !CYTHON_USE_TYPE_SPECS
   0, /*tp_dictoffset*/
   #endif
-  0, /*tp_init*/
+  __pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_1__init__, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_11recordclass_11_linkedlist_linkeditem, /*tp_new*/
+  __pyx_tp_new_11recordclass_11_linkedlist_iterlinkedlist, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -9663,33 +13957,24 @@ DL_EXPORT(PyTypeObject) LinkedItemType = {
   #endif
 };
 #endif
-static struct __pyx_vtabstruct_11recordclass_11_linkedlist_linkedlist __pyx_vtable_11recordclass_11_linkedlist_linkedlist;
 
-static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_linkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct LinkedList *p;
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_dlinkeditem(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct DLinkedItem *p;
   PyObject *o;
   o = __Pyx_AllocateExtensionType(t, 1);
   if (unlikely(!o)) return 0;
-  p = ((struct LinkedList *)o);
-  p->__pyx_vtab = __pyx_vtabptr_11recordclass_11_linkedlist_linkedlist;
-  p->start = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
-  p->end = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  p = ((struct DLinkedItem *)o);
+  p->val = Py_None; Py_INCREF(Py_None);
+  p->next = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  p->prev = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
   return o;
 }
 
-static void __pyx_tp_dealloc_11recordclass_11_linkedlist_linkedlist(PyObject *o) {
-  struct LinkedList *p = (struct LinkedList *)o;
-  PyObject_GC_UnTrack(o);
-  {
-    PyObject *etype, *eval, *etb;
-    PyErr_Fetch(&etype, &eval, &etb);
-    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
-    __pyx_pw_11recordclass_11_linkedlist_10linkedlist_7__dealloc__(o);
-    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
-    PyErr_Restore(etype, eval, etb);
-  }
-  Py_CLEAR(p->start);
-  Py_CLEAR(p->end);
+static void __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkeditem(PyObject *o) {
+  struct DLinkedItem *p = (struct DLinkedItem *)o;
+  Py_CLEAR(p->val);
+  Py_CLEAR(p->next);
+  Py_CLEAR(p->prev);
   PyTypeObject *tp = Py_TYPE(o);
   #if CYTHON_USE_TYPE_SLOTS
   (*tp->tp_free)(o);
@@ -9704,97 +13989,33 @@ static void __pyx_tp_dealloc_11recordclass_11_linkedlist_linkedlist(PyObject *o)
   #endif
 }
 
-static int __pyx_tp_traverse_11recordclass_11_linkedlist_linkedlist(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct LinkedList *p = (struct LinkedList *)o;
-  {
-    e = __Pyx_call_type_traverse(o, 1, v, a);
-    if (e) return e;
-  }
-  if (p->start) {
-    e = (*v)(((PyObject *)p->start), a); if (e) return e;
-  }
-  if (p->end) {
-    e = (*v)(((PyObject *)p->end), a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_11recordclass_11_linkedlist_linkedlist(PyObject *o) {
-  PyObject* tmp;
-  struct LinkedList *p = (struct LinkedList *)o;
-  tmp = ((PyObject*)p->start);
-  p->start = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->end);
-  p->end = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static PyObject *__pyx_getprop_11recordclass_11_linkedlist_10linkedlist_start(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_5start_1__get__(o);
-}
-
-static int __pyx_setprop_11recordclass_11_linkedlist_10linkedlist_start(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_5start_3__set__(o, v);
-  }
-  else {
-    return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_5start_5__del__(o);
-  }
-}
-
-static PyObject *__pyx_getprop_11recordclass_11_linkedlist_10linkedlist_end(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_3end_1__get__(o);
-}
-
-static int __pyx_setprop_11recordclass_11_linkedlist_10linkedlist_end(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_3end_3__set__(o, v);
-  }
-  else {
-    return __pyx_pw_11recordclass_11_linkedlist_10linkedlist_3end_5__del__(o);
-  }
-}
-
-static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_linkedlist[] = {
-  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_10linkedlist_11__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10linkedlist_10__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_10linkedlist_13__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_10linkedlist_12__setstate_cython__},
+static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_dlinkeditem[] = {
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11dlinkeditem_1__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11dlinkeditem___reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11dlinkeditem_3__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11dlinkeditem_2__setstate_cython__},
   {0, 0, 0, 0}
 };
-
-static struct PyGetSetDef __pyx_getsets_11recordclass_11_linkedlist_linkedlist[] = {
-  {"start", __pyx_getprop_11recordclass_11_linkedlist_10linkedlist_start, __pyx_setprop_11recordclass_11_linkedlist_10linkedlist_start, PyDoc_STR("start: recordclass._linkedlist.linkeditem"), 0},
-  {"end", __pyx_getprop_11recordclass_11_linkedlist_10linkedlist_end, __pyx_setprop_11recordclass_11_linkedlist_10linkedlist_end, PyDoc_STR("end: recordclass._linkedlist.linkeditem"), 0},
-  {0, 0, 0, 0, 0}
-};
 #if CYTHON_USE_TYPE_SPECS
-static PyType_Slot LinkedListType_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_linkedlist},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_linkedlist},
-  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_linkedlist},
-  {Py_tp_iter, (void *)__pyx_pw_11recordclass_11_linkedlist_10linkedlist_9__iter__},
-  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_linkedlist},
-  {Py_tp_getset, (void *)__pyx_getsets_11recordclass_11_linkedlist_linkedlist},
-  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_linkedlist},
+static PyType_Slot DLinkedItemType_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkeditem},
+  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_dlinkeditem},
+  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_dlinkeditem},
   {0, 0},
 };
-static PyType_Spec LinkedListType_spec = {
-  "recordclass._linkedlist.linkedlist",
-  sizeof(struct LinkedList),
+static PyType_Spec DLinkedItemType_spec = {
+  "recordclass._linkedlist.dlinkeditem",
+  sizeof(struct DLinkedItem),
   0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC,
-  LinkedListType_slots,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER,
+  DLinkedItemType_slots,
 };
 #else
 
-DL_EXPORT(PyTypeObject) LinkedListType = {
+DL_EXPORT(PyTypeObject) DLinkedItemType = {
   PyVarObject_HEAD_INIT(0, 0)
-  "recordclass._linkedlist.""linkedlist", /*tp_name*/
-  sizeof(struct LinkedList), /*tp_basicsize*/
+  "recordclass._linkedlist.""dlinkeditem", /*tp_name*/
+  sizeof(struct DLinkedItem), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_11recordclass_11_linkedlist_linkedlist, /*tp_dealloc*/
+  __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkeditem, /*tp_dealloc*/
   0, /*tp_vectorcall_offset*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
@@ -9809,17 +14030,17 @@ DL_EXPORT(PyTypeObject) LinkedListType = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
   0, /*tp_doc*/
-  __pyx_tp_traverse_11recordclass_11_linkedlist_linkedlist, /*tp_traverse*/
-  __pyx_tp_clear_11recordclass_11_linkedlist_linkedlist, /*tp_clear*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
-  __pyx_pw_11recordclass_11_linkedlist_10linkedlist_9__iter__, /*tp_iter*/
+  0, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_11recordclass_11_linkedlist_linkedlist, /*tp_methods*/
+  __pyx_methods_11recordclass_11_linkedlist_dlinkeditem, /*tp_methods*/
   0, /*tp_members*/
-  __pyx_getsets_11recordclass_11_linkedlist_linkedlist, /*tp_getset*/
+  0, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
   0, /*tp_descr_get*/
@@ -9829,7 +14050,7 @@ DL_EXPORT(PyTypeObject) LinkedListType = {
   #endif
   0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_11recordclass_11_linkedlist_linkedlist, /*tp_new*/
+  __pyx_tp_new_11recordclass_11_linkedlist_dlinkeditem, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -9861,21 +14082,33 @@ DL_EXPORT(PyTypeObject) LinkedListType = {
   #endif
 };
 #endif
+static struct __pyx_vtabstruct_11recordclass_11_linkedlist_dlinkedlist __pyx_vtable_11recordclass_11_linkedlist_dlinkedlist;
 
-static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_iterlinkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *p;
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_dlinkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct DLinkedList *p;
   PyObject *o;
   o = __Pyx_AllocateExtensionType(t, 1);
   if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)o);
-  p->node = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  p = ((struct DLinkedList *)o);
+  p->__pyx_vtab = __pyx_vtabptr_11recordclass_11_linkedlist_dlinkedlist;
+  p->start = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
+  p->end = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
   return o;
 }
 
-static void __pyx_tp_dealloc_11recordclass_11_linkedlist_iterlinkedlist(PyObject *o) {
-  struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)o;
+static void __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkedlist(PyObject *o) {
+  struct DLinkedList *p = (struct DLinkedList *)o;
   PyObject_GC_UnTrack(o);
-  Py_CLEAR(p->node);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  Py_CLEAR(p->start);
+  Py_CLEAR(p->end);
   PyTypeObject *tp = Py_TYPE(o);
   #if CYTHON_USE_TYPE_SLOTS
   (*tp->tp_free)(o);
@@ -9890,67 +14123,97 @@ static void __pyx_tp_dealloc_11recordclass_11_linkedlist_iterlinkedlist(PyObject
   #endif
 }
 
-static int __pyx_tp_traverse_11recordclass_11_linkedlist_iterlinkedlist(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_11recordclass_11_linkedlist_dlinkedlist(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)o;
+  struct DLinkedList *p = (struct DLinkedList *)o;
   {
     e = __Pyx_call_type_traverse(o, 1, v, a);
     if (e) return e;
   }
-  if (p->node) {
-    e = (*v)(((PyObject *)p->node), a); if (e) return e;
+  if (p->start) {
+    e = (*v)(((PyObject *)p->start), a); if (e) return e;
+  }
+  if (p->end) {
+    e = (*v)(((PyObject *)p->end), a); if (e) return e;
   }
   return 0;
 }
 
-static int __pyx_tp_clear_11recordclass_11_linkedlist_iterlinkedlist(PyObject *o) {
+static int __pyx_tp_clear_11recordclass_11_linkedlist_dlinkedlist(PyObject *o) {
   PyObject* tmp;
-  struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist *)o;
-  tmp = ((PyObject*)p->node);
-  p->node = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  struct DLinkedList *p = (struct DLinkedList *)o;
+  tmp = ((PyObject*)p->start);
+  p->start = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  tmp = ((PyObject*)p->end);
+  p->end = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
   Py_XDECREF(tmp);
   return 0;
 }
 
-static PyObject *__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__(PyObject *self, CYTHON_UNUSED PyObject *arg) {
-  PyObject *res = __pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__(self);
-  if (!res && !PyErr_Occurred()) { PyErr_SetNone(PyExc_StopIteration); }
-  return res;
+static PyObject *__pyx_getprop_11recordclass_11_linkedlist_11dlinkedlist_start(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5start_1__get__(o);
 }
 
-static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_iterlinkedlist[] = {
-  {"__next__", (PyCFunction)__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__, METH_NOARGS|METH_COEXIST, 0},
-  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_5__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_14iterlinkedlist_4__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_7__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_14iterlinkedlist_6__setstate_cython__},
+static int __pyx_setprop_11recordclass_11_linkedlist_11dlinkedlist_start(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5start_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5start_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_11recordclass_11_linkedlist_11dlinkedlist_end(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_3end_1__get__(o);
+}
+
+static int __pyx_setprop_11recordclass_11_linkedlist_11dlinkedlist_end(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_3end_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_3end_5__del__(o);
+  }
+}
+
+static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_dlinkedlist[] = {
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_7__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11dlinkedlist_6__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_9__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11dlinkedlist_8__setstate_cython__},
   {0, 0, 0, 0}
 };
-#if CYTHON_USE_TYPE_SPECS
-static PyType_Slot __pyx_type_11recordclass_11_linkedlist_iterlinkedlist_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_iterlinkedlist},
-  {Py_tp_doc, (void *)PyDoc_STR("iterlinkedlist(linkedlist ll)")},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_iterlinkedlist},
-  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_iterlinkedlist},
-  {Py_tp_iternext, (void *)__pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__},
-  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_iterlinkedlist},
-  {Py_tp_init, (void *)__pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_1__init__},
-  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_iterlinkedlist},
+
+static struct PyGetSetDef __pyx_getsets_11recordclass_11_linkedlist_dlinkedlist[] = {
+  {"start", __pyx_getprop_11recordclass_11_linkedlist_11dlinkedlist_start, __pyx_setprop_11recordclass_11_linkedlist_11dlinkedlist_start, PyDoc_STR("start: recordclass._linkedlist.dlinkeditem"), 0},
+  {"end", __pyx_getprop_11recordclass_11_linkedlist_11dlinkedlist_end, __pyx_setprop_11recordclass_11_linkedlist_11dlinkedlist_end, PyDoc_STR("end: recordclass._linkedlist.dlinkeditem"), 0},
+  {0, 0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot DLinkedListType_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkedlist},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_dlinkedlist},
+  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_dlinkedlist},
+  {Py_tp_iter, (void *)__pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5__iter__},
+  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_dlinkedlist},
+  {Py_tp_getset, (void *)__pyx_getsets_11recordclass_11_linkedlist_dlinkedlist},
+  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_dlinkedlist},
   {0, 0},
 };
-static PyType_Spec __pyx_type_11recordclass_11_linkedlist_iterlinkedlist_spec = {
-  "recordclass._linkedlist.iterlinkedlist",
-  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist),
+static PyType_Spec DLinkedListType_spec = {
+  "recordclass._linkedlist.dlinkedlist",
+  sizeof(struct DLinkedList),
   0,
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC,
-  __pyx_type_11recordclass_11_linkedlist_iterlinkedlist_slots,
+  DLinkedListType_slots,
 };
 #else
 
-static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterlinkedlist = {
+DL_EXPORT(PyTypeObject) DLinkedListType = {
   PyVarObject_HEAD_INIT(0, 0)
-  "recordclass._linkedlist.""iterlinkedlist", /*tp_name*/
-  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterlinkedlist), /*tp_basicsize*/
+  "recordclass._linkedlist.""dlinkedlist", /*tp_name*/
+  sizeof(struct DLinkedList), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_11recordclass_11_linkedlist_iterlinkedlist, /*tp_dealloc*/
+  __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkedlist, /*tp_dealloc*/
   0, /*tp_vectorcall_offset*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
@@ -9966,16 +14229,16 @@ static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterlinkedlist = {
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  PyDoc_STR("iterlinkedlist(linkedlist ll)"), /*tp_doc*/
-  __pyx_tp_traverse_11recordclass_11_linkedlist_iterlinkedlist, /*tp_traverse*/
-  __pyx_tp_clear_11recordclass_11_linkedlist_iterlinkedlist, /*tp_clear*/
+  0, /*tp_doc*/
+  __pyx_tp_traverse_11recordclass_11_linkedlist_dlinkedlist, /*tp_traverse*/
+  __pyx_tp_clear_11recordclass_11_linkedlist_dlinkedlist, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
-  0, /*tp_iter*/
-  __pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_3__next__, /*tp_iternext*/
-  __pyx_methods_11recordclass_11_linkedlist_iterlinkedlist, /*tp_methods*/
+  __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5__iter__, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_11recordclass_11_linkedlist_dlinkedlist, /*tp_methods*/
   0, /*tp_members*/
-  0, /*tp_getset*/
+  __pyx_getsets_11recordclass_11_linkedlist_dlinkedlist, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
   0, /*tp_descr_get*/
@@ -9983,9 +14246,9 @@ static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterlinkedlist = {
   #if !CYTHON_USE_TYPE_SPECS
   0, /*tp_dictoffset*/
   #endif
-  __pyx_pw_11recordclass_11_linkedlist_14iterlinkedlist_1__init__, /*tp_init*/
+  0, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_11recordclass_11_linkedlist_iterlinkedlist, /*tp_new*/
+  __pyx_tp_new_11recordclass_11_linkedlist_dlinkedlist, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -10018,23 +14281,20 @@ static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterlinkedlist = {
 };
 #endif
 
-static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_dlinkeditem(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct DLinkedItem *p;
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_iterdlinkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *p;
   PyObject *o;
   o = __Pyx_AllocateExtensionType(t, 1);
   if (unlikely(!o)) return 0;
-  p = ((struct DLinkedItem *)o);
-  p->val = Py_None; Py_INCREF(Py_None);
-  p->next = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
-  p->prev = ((struct LinkedItem *)Py_None); Py_INCREF(Py_None);
+  p = ((struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)o);
+  p->node = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
   return o;
 }
 
-static void __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkeditem(PyObject *o) {
-  struct DLinkedItem *p = (struct DLinkedItem *)o;
-  Py_CLEAR(p->val);
-  Py_CLEAR(p->next);
-  Py_CLEAR(p->prev);
+static void __pyx_tp_dealloc_11recordclass_11_linkedlist_iterdlinkedlist(PyObject *o) {
+  struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)o;
+  PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->node);
   PyTypeObject *tp = Py_TYPE(o);
   #if CYTHON_USE_TYPE_SLOTS
   (*tp->tp_free)(o);
@@ -10049,33 +14309,67 @@ static void __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkeditem(PyObject *o
   #endif
 }
 
-static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_dlinkeditem[] = {
-  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11dlinkeditem_1__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11dlinkeditem___reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11dlinkeditem_3__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11dlinkeditem_2__setstate_cython__},
+static int __pyx_tp_traverse_11recordclass_11_linkedlist_iterdlinkedlist(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)o;
+  {
+    e = __Pyx_call_type_traverse(o, 1, v, a);
+    if (e) return e;
+  }
+  if (p->node) {
+    e = (*v)(((PyObject *)p->node), a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_11recordclass_11_linkedlist_iterdlinkedlist(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)o;
+  tmp = ((PyObject*)p->node);
+  p->node = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__(PyObject *self, CYTHON_UNUSED PyObject *arg) {
+  PyObject *res = __pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__(self);
+  if (!res && !PyErr_Occurred()) { PyErr_SetNone(PyExc_StopIteration); }
+  return res;
+}
+
+static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_iterdlinkedlist[] = {
+  {"__next__", (PyCFunction)__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__, METH_NOARGS|METH_COEXIST, 0},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_5__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterdlinkedlist_4__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_7__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterdlinkedlist_6__setstate_cython__},
   {0, 0, 0, 0}
 };
 #if CYTHON_USE_TYPE_SPECS
-static PyType_Slot DLinkedItemType_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkeditem},
-  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_dlinkeditem},
-  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_dlinkeditem},
+static PyType_Slot __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_iterdlinkedlist},
+  {Py_tp_doc, (void *)PyDoc_STR("iterdlinkedlist(dlinkeditem node)")},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_iterdlinkedlist},
+  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_iterdlinkedlist},
+  {Py_tp_iternext, (void *)__pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__},
+  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_iterdlinkedlist},
+  {Py_tp_init, (void *)__pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_1__init__},
+  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_iterdlinkedlist},
   {0, 0},
 };
-static PyType_Spec DLinkedItemType_spec = {
-  "recordclass._linkedlist.dlinkeditem",
-  sizeof(struct DLinkedItem),
+static PyType_Spec __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_spec = {
+  "recordclass._linkedlist.iterdlinkedlist",
+  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist),
   0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER,
-  DLinkedItemType_slots,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_slots,
 };
 #else
 
-DL_EXPORT(PyTypeObject) DLinkedItemType = {
+static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist = {
   PyVarObject_HEAD_INIT(0, 0)
-  "recordclass._linkedlist.""dlinkeditem", /*tp_name*/
-  sizeof(struct DLinkedItem), /*tp_basicsize*/
+  "recordclass._linkedlist.""iterdlinkedlist", /*tp_name*/
+  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkeditem, /*tp_dealloc*/
+  __pyx_tp_dealloc_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_dealloc*/
   0, /*tp_vectorcall_offset*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
@@ -10090,15 +14384,15 @@ DL_EXPORT(PyTypeObject) DLinkedItemType = {
   0, /*tp_getattro*/
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
-  0, /*tp_doc*/
-  0, /*tp_traverse*/
-  0, /*tp_clear*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  PyDoc_STR("iterdlinkedlist(dlinkeditem node)"), /*tp_doc*/
+  __pyx_tp_traverse_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_traverse*/
+  __pyx_tp_clear_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
-  0, /*tp_iternext*/
-  __pyx_methods_11recordclass_11_linkedlist_dlinkeditem, /*tp_methods*/
+  __pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__, /*tp_iternext*/
+  __pyx_methods_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -10108,9 +14402,9 @@ DL_EXPORT(PyTypeObject) DLinkedItemType = {
   #if !CYTHON_USE_TYPE_SPECS
   0, /*tp_dictoffset*/
   #endif
-  0, /*tp_init*/
+  __pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_1__init__, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_11recordclass_11_linkedlist_dlinkeditem, /*tp_new*/
+  __pyx_tp_new_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -10142,33 +14436,27 @@ DL_EXPORT(PyTypeObject) DLinkedItemType = {
   #endif
 };
 #endif
-static struct __pyx_vtabstruct_11recordclass_11_linkedlist_dlinkedlist __pyx_vtable_11recordclass_11_linkedlist_dlinkedlist;
+static struct __pyx_vtabstruct_11recordclass_11_linkedlist_chunkedlist __pyx_vtable_11recordclass_11_linkedlist_chunkedlist;
 
-static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_dlinkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct DLinkedList *p;
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_chunkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct ChunkedList *p;
   PyObject *o;
   o = __Pyx_AllocateExtensionType(t, 1);
   if (unlikely(!o)) return 0;
-  p = ((struct DLinkedList *)o);
-  p->__pyx_vtab = __pyx_vtabptr_11recordclass_11_linkedlist_dlinkedlist;
-  p->start = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
-  p->end = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
+  p = ((struct ChunkedList *)o);
+  p->__pyx_vtab = __pyx_vtabptr_11recordclass_11_linkedlist_chunkedlist;
   return o;
 }
 
-static void __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkedlist(PyObject *o) {
-  struct DLinkedList *p = (struct DLinkedList *)o;
-  PyObject_GC_UnTrack(o);
+static void __pyx_tp_dealloc_11recordclass_11_linkedlist_chunkedlist(PyObject *o) {
   {
     PyObject *etype, *eval, *etb;
     PyErr_Fetch(&etype, &eval, &etb);
     __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
-    __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_3__dealloc__(o);
+    __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_15__dealloc__(o);
     __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
     PyErr_Restore(etype, eval, etb);
   }
-  Py_CLEAR(p->start);
-  Py_CLEAR(p->end);
   PyTypeObject *tp = Py_TYPE(o);
   #if CYTHON_USE_TYPE_SLOTS
   (*tp->tp_free)(o);
@@ -10183,122 +14471,97 @@ static void __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkedlist(PyObject *o
   #endif
 }
 
-static int __pyx_tp_traverse_11recordclass_11_linkedlist_dlinkedlist(PyObject *o, visitproc v, void *a) {
-  int e;
-  struct DLinkedList *p = (struct DLinkedList *)o;
-  {
-    e = __Pyx_call_type_traverse(o, 1, v, a);
-    if (e) return e;
-  }
-  if (p->start) {
-    e = (*v)(((PyObject *)p->start), a); if (e) return e;
-  }
-  if (p->end) {
-    e = (*v)(((PyObject *)p->end), a); if (e) return e;
-  }
-  return 0;
-}
-
-static int __pyx_tp_clear_11recordclass_11_linkedlist_dlinkedlist(PyObject *o) {
-  PyObject* tmp;
-  struct DLinkedList *p = (struct DLinkedList *)o;
-  tmp = ((PyObject*)p->start);
-  p->start = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  tmp = ((PyObject*)p->end);
-  p->end = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
-  Py_XDECREF(tmp);
-  return 0;
-}
-
-static PyObject *__pyx_getprop_11recordclass_11_linkedlist_11dlinkedlist_start(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5start_1__get__(o);
-}
-
-static int __pyx_setprop_11recordclass_11_linkedlist_11dlinkedlist_start(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5start_3__set__(o, v);
-  }
-  else {
-    return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5start_5__del__(o);
-  }
-}
-
-static PyObject *__pyx_getprop_11recordclass_11_linkedlist_11dlinkedlist_end(PyObject *o, CYTHON_UNUSED void *x) {
-  return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_3end_1__get__(o);
-}
-
-static int __pyx_setprop_11recordclass_11_linkedlist_11dlinkedlist_end(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
-  if (v) {
-    return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_3end_3__set__(o, v);
-  }
-  else {
-    return __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_3end_5__del__(o);
-  }
+static PyObject *__pyx_sq_item_11recordclass_11_linkedlist_chunkedlist(PyObject *o, Py_ssize_t i) {
+  PyObject *r;
+  PyObject *x = PyLong_FromSsize_t(i); if(!x) return 0;
+  #if CYTHON_USE_TYPE_SLOTS || (!CYTHON_USE_TYPE_SPECS && __PYX_LIMITED_VERSION_HEX < 0x030A0000)
+  r = Py_TYPE(o)->tp_as_mapping->mp_subscript(o, x);
+  #else
+  r = ((binaryfunc)PyType_GetSlot(Py_TYPE(o), Py_mp_subscript))(o, x);
+  #endif
+  Py_DECREF(x);
+  return r;
 }
 
-static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_dlinkedlist[] = {
-  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_7__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11dlinkedlist_6__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_9__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11dlinkedlist_8__setstate_cython__},
+static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_chunkedlist[] = {
+  {"__sizeof__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_23__sizeof__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_22__sizeof__},
+  {"__reduce__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_25__reduce__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_11chunkedlist_24__reduce__},
   {0, 0, 0, 0}
 };
-
-static struct PyGetSetDef __pyx_getsets_11recordclass_11_linkedlist_dlinkedlist[] = {
-  {"start", __pyx_getprop_11recordclass_11_linkedlist_11dlinkedlist_start, __pyx_setprop_11recordclass_11_linkedlist_11dlinkedlist_start, PyDoc_STR("start: recordclass._linkedlist.dlinkeditem"), 0},
-  {"end", __pyx_getprop_11recordclass_11_linkedlist_11dlinkedlist_end, __pyx_setprop_11recordclass_11_linkedlist_11dlinkedlist_end, PyDoc_STR("end: recordclass._linkedlist.dlinkeditem"), 0},
-  {0, 0, 0, 0, 0}
-};
 #if CYTHON_USE_TYPE_SPECS
-static PyType_Slot DLinkedListType_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkedlist},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_dlinkedlist},
-  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_dlinkedlist},
-  {Py_tp_iter, (void *)__pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5__iter__},
-  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_dlinkedlist},
-  {Py_tp_getset, (void *)__pyx_getsets_11recordclass_11_linkedlist_dlinkedlist},
-  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_dlinkedlist},
+static PyType_Slot ChunkedListType_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_chunkedlist},
+  {Py_tp_repr, (void *)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_27__repr__},
+  {Py_sq_length, (void *)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_17__len__},
+  {Py_sq_item, (void *)__pyx_sq_item_11recordclass_11_linkedlist_chunkedlist},
+  {Py_mp_length, (void *)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_17__len__},
+  {Py_mp_subscript, (void *)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_19__getitem__},
+  {Py_tp_doc, (void *)PyDoc_STR("chunkedlist(vals=None)")},
+  {Py_tp_iter, (void *)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_21__iter__},
+  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_chunkedlist},
+  {Py_tp_init, (void *)__pyx_pw_11recordclass_11_linkedlist_11chunkedlist_1__init__},
+  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_chunkedlist},
   {0, 0},
 };
-static PyType_Spec DLinkedListType_spec = {
-  "recordclass._linkedlist.dlinkedlist",
-  sizeof(struct DLinkedList),
+static PyType_Spec ChunkedListType_spec = {
+  "recordclass._linkedlist.chunkedlist",
+  sizeof(struct ChunkedList),
   0,
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC,
-  DLinkedListType_slots,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER,
+  ChunkedListType_slots,
 };
 #else
 
-DL_EXPORT(PyTypeObject) DLinkedListType = {
+static PySequenceMethods __pyx_tp_as_sequence_chunkedlist = {
+  __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_17__len__, /*sq_length*/
+  0, /*sq_concat*/
+  0, /*sq_repeat*/
+  __pyx_sq_item_11recordclass_11_linkedlist_chunkedlist, /*sq_item*/
+  0, /*sq_slice*/
+  0, /*sq_ass_item*/
+  0, /*sq_ass_slice*/
+  0, /*sq_contains*/
+  0, /*sq_inplace_concat*/
+  0, /*sq_inplace_repeat*/
+};
+
+static PyMappingMethods __pyx_tp_as_mapping_chunkedlist = {
+  __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_17__len__, /*mp_length*/
+  __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_19__getitem__, /*mp_subscript*/
+  0, /*mp_ass_subscript*/
+};
+
+DL_EXPORT(PyTypeObject) ChunkedListType = {
   PyVarObject_HEAD_INIT(0, 0)
-  "recordclass._linkedlist.""dlinkedlist", /*tp_name*/
-  sizeof(struct DLinkedList), /*tp_basicsize*/
+  "recordclass._linkedlist.""chunkedlist", /*tp_name*/
+  sizeof(struct ChunkedList), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_11recordclass_11_linkedlist_dlinkedlist, /*tp_dealloc*/
+  __pyx_tp_dealloc_11recordclass_11_linkedlist_chunkedlist, /*tp_dealloc*/
   0, /*tp_vectorcall_offset*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
   0, /*tp_as_async*/
-  0, /*tp_repr*/
+  __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_27__repr__, /*tp_repr*/
   0, /*tp_as_number*/
-  0, /*tp_as_sequence*/
-  0, /*tp_as_mapping*/
+  &__pyx_tp_as_sequence_chunkedlist, /*tp_as_sequence*/
+  &__pyx_tp_as_mapping_chunkedlist, /*tp_as_mapping*/
   0, /*tp_hash*/
   0, /*tp_call*/
   0, /*tp_str*/
   0, /*tp_getattro*/
   0, /*tp_setattro*/
-  0, /*tp_as_buffer*/
-  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  0, /*tp_doc*/
-  __pyx_tp_traverse_11recordclass_11_linkedlist_dlinkedlist, /*tp_traverse*/
-  __pyx_tp_clear_11recordclass_11_linkedlist_dlinkedlist, /*tp_clear*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER, /*tp_flags*/
+  PyDoc_STR("chunkedlist(vals=None)"), /*tp_doc*/
+  0, /*tp_traverse*/
+  0, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
-  __pyx_pw_11recordclass_11_linkedlist_11dlinkedlist_5__iter__, /*tp_iter*/
+  __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_21__iter__, /*tp_iter*/
   0, /*tp_iternext*/
-  __pyx_methods_11recordclass_11_linkedlist_dlinkedlist, /*tp_methods*/
+  __pyx_methods_11recordclass_11_linkedlist_chunkedlist, /*tp_methods*/
   0, /*tp_members*/
-  __pyx_getsets_11recordclass_11_linkedlist_dlinkedlist, /*tp_getset*/
+  0, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
   0, /*tp_descr_get*/
@@ -10306,9 +14569,9 @@ DL_EXPORT(PyTypeObject) DLinkedListType = {
   #if !CYTHON_USE_TYPE_SPECS
   0, /*tp_dictoffset*/
   #endif
-  0, /*tp_init*/
+  __pyx_pw_11recordclass_11_linkedlist_11chunkedlist_1__init__, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_11recordclass_11_linkedlist_dlinkedlist, /*tp_new*/
+  __pyx_tp_new_11recordclass_11_linkedlist_chunkedlist, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -10341,20 +14604,20 @@ DL_EXPORT(PyTypeObject) DLinkedListType = {
 };
 #endif
 
-static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_iterdlinkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
-  struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *p;
+static PyObject *__pyx_tp_new_11recordclass_11_linkedlist_iterchunkedlist(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *p;
   PyObject *o;
   o = __Pyx_AllocateExtensionType(t, 1);
   if (unlikely(!o)) return 0;
-  p = ((struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)o);
-  p->node = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
+  p = ((struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)o);
+  p->lst = ((struct ChunkedList *)Py_None); Py_INCREF(Py_None);
   return o;
 }
 
-static void __pyx_tp_dealloc_11recordclass_11_linkedlist_iterdlinkedlist(PyObject *o) {
-  struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)o;
+static void __pyx_tp_dealloc_11recordclass_11_linkedlist_iterchunkedlist(PyObject *o) {
+  struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)o;
   PyObject_GC_UnTrack(o);
-  Py_CLEAR(p->node);
+  Py_CLEAR(p->lst);
   PyTypeObject *tp = Py_TYPE(o);
   #if CYTHON_USE_TYPE_SLOTS
   (*tp->tp_free)(o);
@@ -10369,67 +14632,68 @@ static void __pyx_tp_dealloc_11recordclass_11_linkedlist_iterdlinkedlist(PyObjec
   #endif
 }
 
-static int __pyx_tp_traverse_11recordclass_11_linkedlist_iterdlinkedlist(PyObject *o, visitproc v, void *a) {
+static int __pyx_tp_traverse_11recordclass_11_linkedlist_iterchunkedlist(PyObject *o, visitproc v, void *a) {
   int e;
-  struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)o;
+  struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)o;
   {
     e = __Pyx_call_type_traverse(o, 1, v, a);
     if (e) return e;
   }
-  if (p->node) {
-    e = (*v)(((PyObject *)p->node), a); if (e) return e;
+  if (p->lst) {
+    e = (*v)(((PyObject *)p->lst), a); if (e) return e;
   }
   return 0;
 }
 
-static int __pyx_tp_clear_11recordclass_11_linkedlist_iterdlinkedlist(PyObject *o) {
+static int __pyx_tp_clear_11recordclass_11_linkedlist_iterchunkedlist(PyObject *o) {
   PyObject* tmp;
-  struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist *)o;
-  tmp = ((PyObject*)p->node);
-  p->node = ((struct DLinkedItem *)Py_None); Py_INCREF(Py_None);
+  struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *p = (struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist *)o;
+  tmp = ((PyObject*)p->lst);
+  p->lst = ((struct ChunkedList *)Py_None); Py_INCREF(Py_None);
   Py_XDECREF(tmp);
   return 0;
 }
 
-static PyObject *__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__(PyObject *self, CYTHON_UNUSED PyObject *arg) {
-  PyObject *res = __pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__(self);
+static PyObject *__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_3__next__(PyObject *self, CYTHON_UNUSED PyObject *arg) {
+  PyObject *res = __pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_3__next__(self);
   if (!res && !PyErr_Occurred()) { PyErr_SetNone(PyExc_StopIteration); }
   return res;
 }
 
-static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_iterdlinkedlist[] = {
-  {"__next__", (PyCFunction)__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__, METH_NOARGS|METH_COEXIST, 0},
-  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_5__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterdlinkedlist_4__reduce_cython__},
-  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_7__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterdlinkedlist_6__setstate_cython__},
+static PyMethodDef __pyx_methods_11recordclass_11_linkedlist_iterchunkedlist[] = {
+  {"__next__", (PyCFunction)__pyx_specialmethod___pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_3__next__, METH_NOARGS|METH_COEXIST, 0},
+  {"__length_hint__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_5__length_hint__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_4__length_hint__},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_7__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_6__reduce_cython__},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_9__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11recordclass_11_linkedlist_15iterchunkedlist_8__setstate_cython__},
   {0, 0, 0, 0}
 };
 #if CYTHON_USE_TYPE_SPECS
-static PyType_Slot __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_slots[] = {
-  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_iterdlinkedlist},
-  {Py_tp_doc, (void *)PyDoc_STR("iterdlinkedlist(dlinkeditem node)")},
-  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_iterdlinkedlist},
-  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_iterdlinkedlist},
-  {Py_tp_iternext, (void *)__pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__},
-  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_iterdlinkedlist},
-  {Py_tp_init, (void *)__pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_1__init__},
-  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_iterdlinkedlist},
+static PyType_Slot __pyx_type_11recordclass_11_linkedlist_iterchunkedlist_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11recordclass_11_linkedlist_iterchunkedlist},
+  {Py_tp_doc, (void *)PyDoc_STR("iterchunkedlist(chunkedlist lst)")},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_11recordclass_11_linkedlist_iterchunkedlist},
+  {Py_tp_clear, (void *)__pyx_tp_clear_11recordclass_11_linkedlist_iterchunkedlist},
+  {Py_tp_iternext, (void *)__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_3__next__},
+  {Py_tp_methods, (void *)__pyx_methods_11recordclass_11_linkedlist_iterchunkedlist},
+  {Py_tp_init, (void *)__pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_1__init__},
+  {Py_tp_new, (void *)__pyx_tp_new_11recordclass_11_linkedlist_iterchunkedlist},
   {0, 0},
 };
-static PyType_Spec __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_spec = {
-  "recordclass._linkedlist.iterdlinkedlist",
-  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist),
+static PyType_Spec __pyx_type_11recordclass_11_linkedlist_iterchunkedlist_spec = {
+  "recordclass._linkedlist.iterchunkedlist",
+  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist),
   0,
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC,
-  __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_slots,
+  __pyx_type_11recordclass_11_linkedlist_iterchunkedlist_slots,
 };
 #else
 
-static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist = {
+static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterchunkedlist = {
   PyVarObject_HEAD_INIT(0, 0)
-  "recordclass._linkedlist.""iterdlinkedlist", /*tp_name*/
-  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterdlinkedlist), /*tp_basicsize*/
+  "recordclass._linkedlist.""iterchunkedlist", /*tp_name*/
+  sizeof(struct __pyx_obj_11recordclass_11_linkedlist_iterchunkedlist), /*tp_basicsize*/
   0, /*tp_itemsize*/
-  __pyx_tp_dealloc_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_dealloc*/
+  __pyx_tp_dealloc_11recordclass_11_linkedlist_iterchunkedlist, /*tp_dealloc*/
   0, /*tp_vectorcall_offset*/
   0, /*tp_getattr*/
   0, /*tp_setattr*/
@@ -10445,14 +14709,14 @@ static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist = {
   0, /*tp_setattro*/
   0, /*tp_as_buffer*/
   Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
-  PyDoc_STR("iterdlinkedlist(dlinkeditem node)"), /*tp_doc*/
-  __pyx_tp_traverse_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_traverse*/
-  __pyx_tp_clear_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_clear*/
+  PyDoc_STR("iterchunkedlist(chunkedlist lst)"), /*tp_doc*/
+  __pyx_tp_traverse_11recordclass_11_linkedlist_iterchunkedlist, /*tp_traverse*/
+  __pyx_tp_clear_11recordclass_11_linkedlist_iterchunkedlist, /*tp_clear*/
   0, /*tp_richcompare*/
   0, /*tp_weaklistoffset*/
   0, /*tp_iter*/
-  __pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_3__next__, /*tp_iternext*/
-  __pyx_methods_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_methods*/
+  __pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_3__next__, /*tp_iternext*/
+  __pyx_methods_11recordclass_11_linkedlist_iterchunkedlist, /*tp_methods*/
   0, /*tp_members*/
   0, /*tp_getset*/
   0, /*tp_base*/
@@ -10462,9 +14726,9 @@ static PyTypeObject __pyx_type_11recordclass_11_linkedlist_iterdlinkedlist = {
   #if !CYTHON_USE_TYPE_SPECS
   0, /*tp_dictoffset*/
   #endif
-  __pyx_pw_11recordclass_11_linkedlist_15iterdlinkedlist_1__init__, /*tp_init*/
+  __pyx_pw_11recordclass_11_linkedlist_15iterchunkedlist_1__init__, /*tp_init*/
   0, /*tp_alloc*/
-  __pyx_tp_new_11recordclass_11_linkedlist_iterdlinkedlist, /*tp_new*/
+  __pyx_tp_new_11recordclass_11_linkedlist_iterchunkedlist, /*tp_new*/
   0, /*tp_free*/
   0, /*tp_is_gc*/
   0, /*tp_bases*/
@@ -10551,15 +14815,15 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
   /*--- Type init code ---*/
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &LinkedItemType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem)) __PYX_ERR(0, 34, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&LinkedItemType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem) < (0)) __PYX_ERR(0, 34, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &LinkedItemType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem)) __PYX_ERR(0, 36, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&LinkedItemType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem) < (0)) __PYX_ERR(0, 36, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem = &LinkedItemType;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem) < (0)) __PYX_ERR(0, 34, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem) < (0)) __PYX_ERR(0, 36, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem);
@@ -10569,22 +14833,22 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_linkeditem, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem) < (0)) __PYX_ERR(0, 34, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem) < (0)) __PYX_ERR(0, 34, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_linkeditem, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem) < (0)) __PYX_ERR(0, 36, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkeditem) < (0)) __PYX_ERR(0, 36, __pyx_L1_error)
   __pyx_vtabptr_11recordclass_11_linkedlist_linkedlist = &__pyx_vtable_11recordclass_11_linkedlist_linkedlist;
   __pyx_vtable_11recordclass_11_linkedlist_linkedlist.append = (PyObject *(*)(struct LinkedList *, PyObject *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_10linkedlist_append;
   __pyx_vtable_11recordclass_11_linkedlist_linkedlist.extend = (PyObject *(*)(struct LinkedList *, PyObject *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_10linkedlist_extend;
   __pyx_vtable_11recordclass_11_linkedlist_linkedlist.pop = (PyObject *(*)(struct LinkedList *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_10linkedlist_pop;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &LinkedListType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist)) __PYX_ERR(0, 40, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&LinkedListType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 40, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &LinkedListType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist)) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&LinkedListType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 42, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist = &LinkedListType;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 40, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 42, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist);
@@ -10594,20 +14858,20 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, __pyx_vtabptr_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 40, __pyx_L1_error)
-  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 40, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_linkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 40, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 40, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, __pyx_vtabptr_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_linkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_linkedlist) < (0)) __PYX_ERR(0, 42, __pyx_L1_error)
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_11recordclass_11_linkedlist_iterlinkedlist_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist)) __PYX_ERR(0, 95, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_11recordclass_11_linkedlist_iterlinkedlist_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist) < (0)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_11recordclass_11_linkedlist_iterlinkedlist_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist)) __PYX_ERR(0, 97, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_11recordclass_11_linkedlist_iterlinkedlist_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist) < (0)) __PYX_ERR(0, 97, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist = &__pyx_type_11recordclass_11_linkedlist_iterlinkedlist;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist) < (0)) __PYX_ERR(0, 95, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist) < (0)) __PYX_ERR(0, 97, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist);
@@ -10617,18 +14881,18 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_iterlinkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist) < (0)) __PYX_ERR(0, 95, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist) < (0)) __PYX_ERR(0, 95, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_iterlinkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist) < (0)) __PYX_ERR(0, 97, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterlinkedlist) < (0)) __PYX_ERR(0, 97, __pyx_L1_error)
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &DLinkedItemType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem)) __PYX_ERR(0, 113, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&DLinkedItemType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem) < (0)) __PYX_ERR(0, 113, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &DLinkedItemType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem)) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&DLinkedItemType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem = &DLinkedItemType;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem) < (0)) __PYX_ERR(0, 113, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem);
@@ -10638,20 +14902,20 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_dlinkeditem, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem) < (0)) __PYX_ERR(0, 113, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem) < (0)) __PYX_ERR(0, 113, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_dlinkeditem, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
   __pyx_vtabptr_11recordclass_11_linkedlist_dlinkedlist = &__pyx_vtable_11recordclass_11_linkedlist_dlinkedlist;
   __pyx_vtable_11recordclass_11_linkedlist_dlinkedlist.append = (PyObject *(*)(struct DLinkedList *, PyObject *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_11dlinkedlist_append;
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &DLinkedListType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist)) __PYX_ERR(0, 120, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&DLinkedListType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 120, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &DLinkedListType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist)) __PYX_ERR(0, 122, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&DLinkedListType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 122, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist = &DLinkedListType;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 120, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 122, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist);
@@ -10661,20 +14925,20 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist, __pyx_vtabptr_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 120, __pyx_L1_error)
-  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 120, __pyx_L1_error)
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_dlinkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 120, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 120, __pyx_L1_error)
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist, __pyx_vtabptr_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 122, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 122, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_dlinkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 122, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist) < (0)) __PYX_ERR(0, 122, __pyx_L1_error)
   #if CYTHON_USE_TYPE_SPECS
-  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist)) __PYX_ERR(0, 184, __pyx_L1_error)
-  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist) < (0)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist)) __PYX_ERR(0, 186, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_11recordclass_11_linkedlist_iterdlinkedlist_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist) < (0)) __PYX_ERR(0, 186, __pyx_L1_error)
   #else
   __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist = &__pyx_type_11recordclass_11_linkedlist_iterdlinkedlist;
   #endif
   #if !CYTHON_COMPILING_IN_LIMITED_API
   #endif
   #if !CYTHON_USE_TYPE_SPECS
-  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist) < (0)) __PYX_ERR(0, 184, __pyx_L1_error)
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist) < (0)) __PYX_ERR(0, 186, __pyx_L1_error)
   #endif
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist);
@@ -10684,8 +14948,61 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist->tp_getattro = PyObject_GenericGetAttr;
   }
   #endif
-  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_iterdlinkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist) < (0)) __PYX_ERR(0, 184, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist) < (0)) __PYX_ERR(0, 184, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_iterdlinkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist) < (0)) __PYX_ERR(0, 186, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist) < (0)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_vtabptr_11recordclass_11_linkedlist_chunkedlist = &__pyx_vtable_11recordclass_11_linkedlist_chunkedlist;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.new_chunk = (struct __pyx_t_11recordclass_11_linkedlist_chunk *(*)(struct ChunkedList *))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_new_chunk;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.release_chunk = (void (*)(struct ChunkedList *, struct __pyx_t_11recordclass_11_linkedlist_chunk *))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_release_chunk;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.append = (PyObject *(*)(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_append;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.appendleft = (PyObject *(*)(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_appendleft;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.extend = (PyObject *(*)(struct ChunkedList *, PyObject *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_extend;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.pop = (PyObject *(*)(struct ChunkedList *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_pop;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.popleft = (PyObject *(*)(struct ChunkedList *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_popleft;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.free_chunks = (void (*)(struct ChunkedList *, struct __pyx_t_11recordclass_11_linkedlist_chunk *, Py_ssize_t, Py_ssize_t))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_free_chunks;
+  __pyx_vtable_11recordclass_11_linkedlist_chunkedlist.clear = (PyObject *(*)(struct ChunkedList *, int __pyx_skip_dispatch))__pyx_f_11recordclass_11_linkedlist_11chunkedlist_clear;
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &ChunkedListType_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist)) __PYX_ERR(0, 218, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&ChunkedListType_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist) < (0)) __PYX_ERR(0, 218, __pyx_L1_error)
+  #else
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist = &ChunkedListType;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist) < (0)) __PYX_ERR(0, 218, __pyx_L1_error)
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist);
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist->tp_dictoffset && __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist->tp_getattro = PyObject_GenericGetAttr;
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_vtabptr_11recordclass_11_linkedlist_chunkedlist) < (0)) __PYX_ERR(0, 218, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist) < (0)) __PYX_ERR(0, 218, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_chunkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist) < (0)) __PYX_ERR(0, 218, __pyx_L1_error)
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_11recordclass_11_linkedlist_iterchunkedlist_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist)) __PYX_ERR(0, 417, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_11recordclass_11_linkedlist_iterchunkedlist_spec, __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist) < (0)) __PYX_ERR(0, 417, __pyx_L1_error)
+  #else
+  __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist = &__pyx_type_11recordclass_11_linkedlist_iterchunkedlist;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist) < (0)) __PYX_ERR(0, 417, __pyx_L1_error)
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist);
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist->tp_dictoffset && __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist->tp_getattro = PyObject_GenericGetAttr;
+  }
+  #endif
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_iterchunkedlist, (PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist) < (0)) __PYX_ERR(0, 417, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist) < (0)) __PYX_ERR(0, 417, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -10696,10 +15013,30 @@ static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
   __Pyx_RefNannyDeclarations
   CYTHON_UNUSED_VAR(__pyx_mstate);
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
   /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_7cpython_4type_type = __Pyx_ImportType_3_2_3(__pyx_t_1, __Pyx_BUILTIN_MODULE_NAME, "type",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(PyTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_3(PyTypeObject),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  0, 0,
+  #else
+  sizeof(PyHeapTypeObject), __PYX_GET_STRUCT_ALIGNMENT_3_2_3(PyHeapTypeObject),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_3); if (!__pyx_mstate->__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
 }
 
 static int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate) {
@@ -10981,7 +15318,7 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
   (void)__Pyx_modinit_variable_export_code(__pyx_mstate);
   (void)__Pyx_modinit_function_export_code(__pyx_mstate);
   if (unlikely((__Pyx_modinit_type_init_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
-  (void)__Pyx_modinit_type_import_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_type_import_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
   (void)__Pyx_modinit_variable_import_code(__pyx_mstate);
   (void)__Pyx_modinit_function_import_code(__pyx_mstate);
   /*--- Execution code ---*/
@@ -11013,49 +15350,49 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
   if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkeditem, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "recordclass/_linkedlist.pyx":45
+  /* "recordclass/_linkedlist.pyx":47
  *     cdef public linkeditem end
  *     #
  *     cpdef append(self, val):             # <<<<<<<<<<<<<<
  *         cdef linkeditem item
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_10linkedlist_1append, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_linkedlist_append, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 45, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_10linkedlist_1append, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_linkedlist_append, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 47, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, __pyx_mstate_global->__pyx_n_u_append, __pyx_t_2) < (0)) __PYX_ERR(0, 45, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, __pyx_mstate_global->__pyx_n_u_append, __pyx_t_2) < (0)) __PYX_ERR(0, 47, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "recordclass/_linkedlist.pyx":57
+  /* "recordclass/_linkedlist.pyx":59
  *         self.end = item
  *     #
  *     cpdef extend(self, vals):             # <<<<<<<<<<<<<<
  *         cdef linkeditem item
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_10linkedlist_3extend, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_linkedlist_extend, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_10linkedlist_3extend, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_linkedlist_extend, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 59, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, __pyx_mstate_global->__pyx_n_u_extend, __pyx_t_2) < (0)) __PYX_ERR(0, 57, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, __pyx_mstate_global->__pyx_n_u_extend, __pyx_t_2) < (0)) __PYX_ERR(0, 59, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "recordclass/_linkedlist.pyx":70
- *                 self.end.next = item
+  /* "recordclass/_linkedlist.pyx":72
+ *             self.end = item
  *     #
  *     cpdef pop(self):             # <<<<<<<<<<<<<<
  *         cdef linkeditem start
  * 
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_10linkedlist_5pop, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_linkedlist_pop, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 70, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_10linkedlist_5pop, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_linkedlist_pop, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[4])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 72, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, __pyx_mstate_global->__pyx_n_u_pop, __pyx_t_2) < (0)) __PYX_ERR(0, 70, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_linkedlist, __pyx_mstate_global->__pyx_n_u_pop, __pyx_t_2) < (0)) __PYX_ERR(0, 72, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "(tree fragment)":1
@@ -11139,19 +15476,19 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
   if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkeditem, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "recordclass/_linkedlist.pyx":125
+  /* "recordclass/_linkedlist.pyx":127
  *     cdef public dlinkeditem end
  *     #
  *     @cython.nonecheck(False)             # <<<<<<<<<<<<<<
  *     cpdef append(self, val):
  *         cdef dlinkeditem item
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11dlinkedlist_1append, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_dlinkedlist_append, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[11])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11dlinkedlist_1append, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_dlinkedlist_append, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[11])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 127, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
   #endif
-  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist, __pyx_mstate_global->__pyx_n_u_append, __pyx_t_2) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_dlinkedlist, __pyx_mstate_global->__pyx_n_u_append, __pyx_t_2) < (0)) __PYX_ERR(0, 127, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "(tree fragment)":1
@@ -11208,6 +15545,167 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
   if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterdlinkedlist, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 16, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
+  /* "recordclass/_linkedlist.pyx":251
+ *             PyMem_Free(c)
+ *     #
+ *     cpdef append(self, val):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_3append, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_chunkedlist_append, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[16])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_mstate_global->__pyx_n_u_append, __pyx_t_2) < (0)) __PYX_ERR(0, 251, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":270
+ *         self.state += 1
+ *     #
+ *     cpdef appendleft(self, val):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_5appendleft, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_chunkedlist_appendleft, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[17])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_mstate_global->__pyx_n_u_appendleft, __pyx_t_2) < (0)) __PYX_ERR(0, 270, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":289
+ *         self.state += 1
+ *     #
+ *     cpdef extend(self, vals):             # <<<<<<<<<<<<<<
+ *         for val in vals:
+ *             self.append(val)
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_7extend, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_chunkedlist_extend, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[18])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_mstate_global->__pyx_n_u_extend, __pyx_t_2) < (0)) __PYX_ERR(0, 289, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":293
+ *             self.append(val)
+ *     #
+ *     cpdef pop(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ *         cdef PyObject *item
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_9pop, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_chunkedlist_pop, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[19])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_mstate_global->__pyx_n_u_pop, __pyx_t_2) < (0)) __PYX_ERR(0, 293, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":318
+ *         return val
+ *     #
+ *     cpdef popleft(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *c
+ *         cdef PyObject *item
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_11popleft, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_chunkedlist_popleft, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[20])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_mstate_global->__pyx_n_u_popleft, __pyx_t_2) < (0)) __PYX_ERR(0, 318, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":361
+ *             c = next
+ *     #
+ *     cpdef clear(self):             # <<<<<<<<<<<<<<
+ *         cdef chunk *head = self.head
+ *         cdef Py_ssize_t first = self.first
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_13clear, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_chunkedlist_clear, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[21])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_mstate_global->__pyx_n_u_clear, __pyx_t_2) < (0)) __PYX_ERR(0, 361, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":400
+ *         return iterchunkedlist(self)
+ *     #
+ *     def __sizeof__(self):             # <<<<<<<<<<<<<<
+ *         cdef Py_ssize_t n = 0
+ *         cdef chunk *c = self.head
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_23__sizeof__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_chunkedlist___sizeof, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[22])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_mstate_global->__pyx_n_u_sizeof, __pyx_t_2) < (0)) __PYX_ERR(0, 400, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":411
+ *         return chunkedlist.__basicsize__ + n * sizeof(chunk)
+ *     #
+ *     def __reduce__(self):             # <<<<<<<<<<<<<<
+ *         return chunkedlist, (list(self),)
+ *     #
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11chunkedlist_25__reduce__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_chunkedlist___reduce, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[23])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 411, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_chunkedlist, __pyx_mstate_global->__pyx_n_u_reduce, __pyx_t_2) < (0)) __PYX_ERR(0, 411, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "recordclass/_linkedlist.pyx":449
+ *         return <object>item
+ * 
+ *     def __length_hint__(self):             # <<<<<<<<<<<<<<
+ *         return self.count
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_15iterchunkedlist_5__length_hint__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_iterchunkedlist___length_hint, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[24])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11recordclass_11_linkedlist_iterchunkedlist, __pyx_mstate_global->__pyx_n_u_length_hint, __pyx_t_2) < (0)) __PYX_ERR(0, 449, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_15iterchunkedlist_7__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_iterchunkedlist___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[25])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_reduce_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "self.node cannot be converted to a Python object for pickling"
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_15iterchunkedlist_9__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_iterchunkedlist___setstate_cytho, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[26])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(1, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
   /* "(tree fragment)":4
  *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
  *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
@@ -11215,7 +15713,7 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
  *     cdef object __pyx_result
  *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x10ba566, 0x4f88647, 0x87bb7de, b'next, val')
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_linkeditem, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[16])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_1__pyx_unpickle_linkeditem, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_linkeditem, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[27])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -11228,7 +15726,7 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
  *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
  *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_linkedlist, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[17])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_3__pyx_unpickle_linkedlist, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_linkedlist, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[28])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -11243,7 +15741,7 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
  *     cdef object __pyx_result
  *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x545ea53, 0xf8e966d, 0x36c4536, b'node')
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_iterlinkedlist, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[18])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_5__pyx_unpickle_iterlinkedlist, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_iterlinkedlist, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[29])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -11256,7 +15754,7 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
  *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
  *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_dlinkeditem, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[19])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_7__pyx_unpickle_dlinkeditem, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_dlinkeditem, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[30])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -11271,7 +15769,7 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
  *     cdef object __pyx_result
  *     __Pyx_CheckUnpickleChecksum(__pyx_checksum, 0x0576305, 0x67094f3, 0xccc3210, b'end, start')
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_dlinkedlist, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[20])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_9__pyx_unpickle_dlinkedlist, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_dlinkedlist, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[31])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -11284,7 +15782,7 @@ __Pyx_RefNannySetupContext("PyInit__linkedlist", 0);
  *     int __Pyx_CheckUnpickleChecksum(long, long, long, long, const char*) except -1
  *     int __Pyx_UpdateUnpickledDict(object, object, Py_ssize_t) except -1
 */
-  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_iterdlinkedlist, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[21])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11recordclass_11_linkedlist_11__pyx_unpickle_iterdlinkedlist, 0, __pyx_mstate_global->__pyx_n_u_pyx_unpickle_iterdlinkedlist, NULL, __pyx_mstate_global->__pyx_n_u_recordclass__linkedlist, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[32])); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 4, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
@@ -11397,34 +15895,34 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 8; } index[] = {{1},{179},{8},{7},{6},{2},{9},{31},{19},{46},{70},{45},{21},{14},{20},{6},{18},{18},{8},{5},{11},{29},{31},{11},{29},{31},{18},{6},{8},{12},{13},{5},{15},{33},{35},{14},{32},{34},{10},{28},{30},{10},{28},{30},{17},{17},{14},{2},{8},{10},{8},{7},{4},{3},{14},{12},{11},{10},{26},{26},{30},{29},{25},{25},{14},{12},{23},{10},{17},{13},{4},{12},{10},{12},{19},{5},{8},{6},{12},{3},{4},{6},{11},{89},{61},{70},{63},{11},{95},{91},{91},{99},{95},{95},{11},{11},{57},{57},{55},{55}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1177 bytes) */
-const char* const cstring = "BZh91AY&SYF\320\215Y\000\001\030\177\377\347\377\375\300\355\357\365\335\277\351\177\302\277\377\377\374@@@@@@@@@@@@@\000@\000P\004~\351\233#l\211*\230T%\021\004\324\332Q\247\223G\352\247\352@\306\201\001\246OQ\241\220`@h\306\247\352\207\211\017\322\236\233T\375 \3248\320\321\243A\243@\320\000\000\000\000\310\000\000\000\320\031\000\006\t\021@T\366\212z\023\3222h\332\201\243\324\320\000\000\000\000\000\000\000\014\215\01644h\320h\3204\000\000\000\0002\000\000\0004\006@\001\202I\000\210\323M\rLQ\3514\3054\321\211\350'\244b4\014\004\036\210dd`\207\244\332M<\211\n%\033\264\007\007\257\201\310\340\027\267\326\016L#\204Iq\003\007\264\201\"\301k, \024\252\002EREm\214c\033m\t\211\205\005u\204\021\230Z\024\016\020\241S$\314@\210\230Y\262\213\334\t\371\306\0059\222 \003]q\202\302\325p\325\212\205\214\312'\035DN)!8\2408P\252a/P9f\325`\023k\333\345\361\253\317\227'e5\274O\n\003\301\0343\204X`\033\004Md\020G\210\253\224I]\256\021\200\321X\365\3530\217\272\224,\360\003\3022F\204\255n<\365QX\332q\227&,\250i\266\326\347\005_K\215s0\206\266\215yR\2421\261e\331&)3E:\235\356\305d\246\016&\212\315\227,b\314;\266\326Pb\307\246a\271\301\034{\021&\035\316;\305\026\026$\206\252\261\351\360s\260\233\220\003y\370\377X_!\203)\210\277|\014t\350{\003\333\204Xm\201e\026\223p\026j\302\017#\003\357\245\236\r\324\377t\320\033\310\2004\365u2[i\020\233\207\302\025\374\224Q@\255\231\247$\211^M\215\266\330\333ck\305\025\311S\276\322\n\330\212b\013!\261C\246l|\r;c\3245.1!J3u\252\304T\255\\+Ry\020\352\265\2049\366\000\355\256v\027V\031\204:\325jE\0044\303\246\371\212\226\232\r/)|\201\343\304\255+\036\324k\3540n\346\306\351VM\2423\344\250\262\033\250p\335 \005y\267\252\n\363\260\316\216u\316*Z\372\010\224\3066\333T\021L\005Sm\313R\375\230\300\261\244\212P[:X\"h\274\202\211\240\271\260B\273\341ji\266\263\001\"\025\203\353\321\020\320\300B\r\033\330\337\257\006\267\371r\013Jr\252\177\330\355\214+C\000r\3522\213\372\264\2734\365\355\243\312I\351%\\)\240D\335\010\244\207\001l\242^\347&|\255I&J\320\302T\360""\263?\030L\250\202\347Lh;\233ou\006\034\020E\020\330\331\020A\021\t#*\372\270\307\005\344K*r\236&F\312* I\270(\303U|Jlh\255\026bd+s\311@\022uR\002\367V-8\312D\311=t\2245\001q\000\274&\202\rv\233\314\223\305\032\223LM\034\267dMnD\207e\313\247\232\340\324\037\001\267\272&A`Y\245\345\311\001\177&t`bx\243\025\245aa\231`\211\243c\003$\215\235\331\262\257\005\351L{\320amm\254(\232AL\366\023\030\010\005^v%\263mOl`b\344\232\024\312\024\355J\345\r\321\245\010U\31536$7r\013\n`\014\024\027\006bK\006b\025\224i\023p\374\002\037\006\277V\203Qo\377Y\264\203\026\333\237\211\276<)S\023\r\244\252O\313.@\237i\263{\330\023!\364\350\325\233P\177y\304\243\234\025\016\200X\033\372\364\324\034Zb\314\347\240|\370\000|@\334\020\371(|\304\260&\341\355\027x\340P'?b\207\010\027\321\014A\331\264\206\003\201XK\314%q\030\372\37397\307Y[b-\262\340\226\215\347\305\373w\205\372\211\323\315\201\014\\\"_\353\231y29\216\021\327\277\305\027\303'+\357\203B\356\266?I-\002]<\276,h\335e\265\010\350\014a&<\344f\214a)F\220aM\200`\344\343\016-\263{l\211\210\334\r\300\367k\237Xn\236npp\3002r\305\304~{\344\332\247'\243h\023,$\317\212\350D\360\235\324H4d[\017\342\354>AL\376\204\000\372RV2ObIPP\021\032\231\251\021\211\316d\201\360&Bs\024\032rS\023{\305\334\221N\024$\021\264#V@";
-    PyObject *data = __Pyx_DecompressString(cstring, 1177, 2);
+    const struct { const unsigned int length: 8; } index[] = {{1},{179},{8},{30},{36},{15},{7},{6},{2},{9},{31},{19},{29},{46},{70},{45},{61},{21},{14},{20},{6},{10},{18},{13},{1},{11},{22},{22},{18},{22},{17},{18},{15},{19},{5},{18},{8},{5},{11},{29},{31},{11},{29},{31},{18},{6},{8},{12},{13},{5},{15},{31},{33},{35},{15},{33},{35},{14},{32},{34},{15},{10},{28},{30},{10},{28},{30},{17},{17},{14},{2},{3},{8},{10},{1},{8},{7},{4},{3},{7},{14},{12},{11},{10},{26},{26},{30},{29},{25},{25},{14},{12},{23},{10},{17},{13},{4},{12},{10},{12},{19},{10},{5},{8},{6},{12},{3},{4},{6},{11},{89},{74},{162},{162},{141},{141},{63},{66},{70},{18},{13},{9},{63},{9},{11},{95},{91},{91},{99},{95},{95},{11},{11},{57},{57},{55},{55}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1594 bytes) */
+const char* const cstring = "BZh91AY&SY\267\364\310\024\000\001\301\377\377\357\377\375\314\357\377\367\335\277\375\177\312\277\377\377\375@@@@@@@@@@@@@\000@\000`\006\235\365\032\003N\2005@\t\3240\022\212\022i\2404\000\r4\320\323@\0004\323M\000\000\000\000h\032i\220\364'\2442\021)\2405=&\236\2040O@&\020\300\236\2020\t\202`\0010\010\301\032`\004`8\000\000\000\000\000\003 \000\000\000\000\000\000\0002\000\t5)'\242A\243@\000=F\206\232\000\0004\000\000\000\000\000\000z\2314\003\200\000\000\000\000\0002\000\000\000\000\000\000\000\003 \000\221\020\232&\200 OCR\237\246\246\246\232h\r\251\352\000\000\006\215\000\365\000\003F\232\001\221\223\324\272KDW\r\353\300\312\301\201\231VB\211\2031\n\263.\201d\260\024\214\367RK\377\003\013\201(+cH\250\036tT\332\001\"\250Q\005\331!yP\030\202\304DEX\002F\005\300\226\227P@\253\2025\245p\367B\351b\320\201\260\346\n\205\204\322D\204\235\0070\250\262\0178(E\033bW\303\002\211 t\010:\203\000\326n4\312\230\215\215\201\270w\025\303\rP\325\216\262\300@\235l)\013\203\010\215\017\030\035\202\307\253\006\345\346\260\004\270\355K\321u\352\361\305\231\017\332\235\227\177J\312\215Na\332\266{1\376\361\002\356l\036\336\317k^p\027\327\2117\306b\305\260\346\363\235'Y\313\217e\032\010\024\216>\225w\374\333\232\360\355\313nR\317?\220,*j\220\376\023<2;X6\233M\3074#\243\204\014\032m\257Ke\277\306\235&\206n\r~-\270\312pw\261^\362s\311\315Q\220D\r\336\237\203\355\344\203\013T0(4dw\302\330.\004}\327\245\344bI\022\237\304\201\220\315\0221\262I\002\333<6W\017[\216\262\202\263\024\002\307A\010\231\nH\0230\224\004i'\324\250\036jm\3754\346\2648\014v\232\2152,\322(5\334\355\327\207\256\030\013\371l\024,\035d[FHP2\302\316@\303\331\321\017\033\003\361\216j\"\266\325\364\327\345\335\2642*\355\220\335\264\306\355fO\242\350D&\341\324\r9R\224\002fnU\232(\001\t\261\266\375\242 \033\033M\2574^C\007\233B.\322*\341\231\303b\207\306\324\311\372~\035\010\034\003|#\010\350\211 \007\353-\031\000\210\300\"\002z\213,\000\311\363\002\001\020x`\030~\362\203\270\240\023\002\022\201\304\036/oW\203\240\341O\213\345""\t\356\351\2145\335\"\323\211j\354e\r\2631\303\246r\303\343e\251-\030\235\007NyecMo,\031 \034\010\314c\311\352f&{L\363\212\231\023\3712\002\203\354\251\201\2147Q\303uH\025\357\325\236\307p\307\257\266xi\353\213\036\344L\356\251\005\033\030\306\333\031B-\001\203&\234\371\354?\353t6\367\201v\002*\221\224\372;!\023L\304R\3507\017E2\352\246\301\260y\033Lg{B\337\211\206\220\246\237\005CsAJ:\343\317\007\367\235GA\354\354A\r\3557\2141\367\331\022\376\243\016\317\026\244qw\030\202\020\036\023\273I\316\227\017cy\315\321\227\274\317~T-\224\303I.\263UL\260\021x\245\200D\001\276\266\261\246!6\234.5\276\360\004\300\357\336\032\311\013l\344)$\333\250q\247\2371\030M\267l\276\332\253\217F\213\025\242\342\242\225E\025T\0043z\034Aq\014h4\361aF]\321=msIbp\206\322V\210\222n\357O%pa\203E\310U\344\251\207\254,-KD\013\312\n\301DU\024dm\264\344\241\215\300\347\"\242\261\217f\3058`\267A\240\333\324 \261\310\016}\342\367\267\t\014\204U\357\343\\\215p\366W!<\005X\252{\252\315[\305Y\330oH\216\034<\034\271K\205\001\310;I\362\212`c\003B4\376~;\244\340\326\326\354@l\364\370\301\265\244\357\0342\311\3348\344h\234\204:\365@\307'e\353E\337\230g\205\311\220\322\322\313\247\262iz\242\340\226m\031uf\\h(-\036\274An\353\343<\304mA\253a\334r\215\367\204\n\2259\023\315\242\020\335\274qF\n\357'%o4\320\t\275\017Z\014\325\241\013u\016\006\320\360\2105\352*f\261vW\202^\224\216\232U\307 \336u\243\221\273\334\310\357H\327\350D\353|\376\202\003RX\333drf\271\3553\312z8\345\334+\212\255n\357\236\246\3011S\303\243\311\237U\003\372S\210\003\342\013b\305z\201\254#\345z\257?,.\303\364C\366;i8V\265\2510D}\340\017[\357\207HD`\302t\320P\016\3316\304\260\251\321\223\235\001\352\010\367\031&C$(0\030\264{\316yE\301\021\016\371\017\241} \237\320|He}\034\212(\310\307l\361-Dt\312\204\235q,\304\374\030;Bj$BO\032@<\207\226\236\2626\006\313\310e{IS,\354\321@\336\227\032\013O\271i\352\276c\025\303\024\274\021Fy]O\232\031\202\320\356\021{/\211D\271\205\344/\230L\201\010H!\314\336\201\177E\301\331\020\230)\204\023\347\006\206\240""\214`\337\033\317\360\t1[_\215\227\350F\266|\026\341i\227\232\340\233e\235\215\223\332\330>\230\215W\225\332\221\202\244F\306\357G\243\351OB\250r\030O\240\244PP\304\223`\024 \022 \024\205a\252\032aF\t\312\033\207\234P\240\320W\344\tD\220\341;T\371\337\013\314\013\254<\036\226=a\215\005\360R\267\277\360R<q\352\365\324\266\203\306\026\014K\024x\223\024\234$eh\361\233RB\324\265d\212_\t\201a6*+\n\301h\n\026v\234\033\241 \341\322lZ\217\001\324\261KQ\330\261A\322d\254Q\262A\301Y\2300#\014\005G6E\204\314\037\377\027rE8P\220\267\364\310\024";
+    PyObject *data = __Pyx_DecompressString(cstring, 1594, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1040 bytes) */
-const char* const cstring = "x\332\265T\275o\333F\024\267\000\266\226k\267\266\342 \366\326\023Z\324\016\352\310fa4ES$P\353\3041\n\010\226\373\221.\305\341D\236$\326\024I\361\216\266\325t\360\310\361F\216\0349r\324\250Q\243F\215\372\023\362'\364\235(K\224d+\201\213\n\"\357\361}\374\336{\277ww/J6\247\210\327\tG?\265x\335\266\220\301\220NM\243B]\302\251\331B\214\273\206\306\251+\235,t\372\362\364\311\341w\207\210X:r\351_T\343\0141\257\242\231\2041\312\220]E\025\3170\271a!\336r(+\240\223*j\331\036\262(\325\021\267\221\003~\351\000^\247\026b\224K\001\355\020\313\2629\341\206ma\0107\254\332\016\322\r\027\222\030\027TF\277\"&\243\005\242\353\030\374\250n0R1)\265\344\273\246\031,\221t(~\037\202lW\037f\331\307\246a\235K5\343\005\247u5\371\222\275\322\206\303[\214\232\325\002\205\226@\001\310\250d[\024\331.\032\352\031'.O[\206Z\213^\361[\335\035\227^\334j\270 \346\207\243\334\352l\3534\255\374A\216\306\2521\333s5\372\034\343\323\326\025<G0-\\\002\3343Z%\216\003]\021\326\2624\303.\000#\266\007\243\241L\003\016(6\200e\227h\264B\264s\214u\031\227,zB\221\301i#%\0260v\251\356i\024k\303\235\002\276SF\230\"P\305\347\314\222\351\224x'\314\310\270\010\246\2204\004\315\301\033\343\252giP2\256\335\204`l0<nS\326\305\340\345\246\020f>\347\213\231w\230+H\272L#\276\017p1\336\204\305Ed/\346z\222aQ-\037RG\212\347\224\"\241<}\220l\30741n\020\330E\360k\330\272g\312\001`\2134\222\225^\302\013\266,xb\014\347\016ku\252\2353\257\221|\271\224y&O\344\321\364\244(\257\215D\362,\307\320\316\0014\265\315n\267\310\202f,3c\274\305z\247\361\316l\263\021\027\\^7\262\327\246G\314\244\357\324\275S\230\n\030M\002\317\315d\254\240Wr&fu8\231\021\215 \351p\214\207D\261\311.\237\237\335\310\302\251\314\3459:|y\214\216\375\340:\201?\203\307\243\354:\323W\366\242b\364{\254^\027\337}\262\264\262\341\277\rv\303|\250\366\263k\376\261\030.\257Eq\274\254\372\207\376\245\320\202\\\177mC\254$\313\262h\016\326\036\210/\005\351\257\255\373W\242)\225\331 3\202\000\340\217\227VrBI\342\277\025\233 \200\377\343@\r\212\003\3609\021\277\005\371\033\323\021""\304%\230\375\354\272\337L\202?\035\226\262\266)\276\017\376\010\313!\271\361\030\345\201\254\\<\r\276\010\312\375\215\207\342$Y\216\003u\000\313Q\220\r3\t\312\206\377w\260\035\346\302\374lo\263M\r`Q\304\353\240x\323\001\260\364$*G\325\270x\235y\227]\372\3503\377W\261\025(\340\240\014\035\304\253`\017\252R\226\257/\3747\342e\360\020J\310>\020\220h\013\270\311nC\215`\223\035\365\326\277\216\016\243f\274\034\277\355\354ts\203iM~\002\237\273\007\364A\254\304\305\370M\373\347\316e\227\014\2465\315\377\006\275\037\361X\215\217\333\317:\265ny0\255!\323\244\034\207\207a\363\036)\366\242\2438\023o\265W;O\273\371\301\264F\235\244x$x\240\376\177\274\337\027\376=\325\367\225\307Q.\372*\316Hq7\312D\217\"\230\310@\371<h\366\320A\274\n4\236\367\312g}eS\274\010w\243|\244J\350\177`WC65\316\365\2769\352\224zg\277\364\225U_\275#\360y\270\r9\362\251\300\2038\323S\177\354\024z\247\345E\2017\247j\022(\357\204?\333\205nfQ\330\263\240\036\0229\352q\230<$V\273\324\315\017\303\376\005\377j\003\240";
-    PyObject *data = __Pyx_DecompressString(cstring, 1040, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1488 bytes) */
+const char* const cstring = "x\332\265U\315o\023G\024\307\252\001C\034\022\007\024\220Z\211\261\372A(\340`\224\226\252T \267\341#PEq\240\005\251\252V\343\335\261\275\315z\327\336\231Mb\250\252\034}\334\343\034\367\270\307=\346\230c\2169\372\350?\201?\241\357\355z\355\265\3438@U\311\336\235y\363>~\357\367\336\233}\264n\tFD\235\n\362K[\324-\223\350\234h\314\320+\314\246\202\031m\302\205\255\253\202\331\250d\222\215\307\033wV~X!\324\324\210\315\376b\252\340\204;\025\325\240\2343N\254*\2518\272!t\223\210v\223\361\002Y\253\222\266\345\020\2231\215\010\2134A/i \352\314$\234\t\\\220\033\3244-A\205n\231\n\230\353f\355\006\321t\033\202\350\333\014\255\237P\203\263\002\3254\005\364\230Zw\314-\246\031:\027D75\266K,G \004\233\232\265\221\323\206\003^\001\200\346\330\340\224\350\002\223\203(\t\235\245\257\355\233\232\316i\305`\314\304gM\325y\264\202\363\3122\240\260l-\204\275\254\030zlVh\266w\207;$\2175\232\200\335j\222\252m5\200\247H@\022\24183\252\005\006\004\2026\344A\326-\223\021\313&\241\234\013j\213\344I(5\331\256\230\250\336\264\331\366\304\203mj|\270\227\211\312\226\306\210\032V\204T`e\231\333\314\026Q\025)\331\210\232\305\252`\013\220*8j\352\352\0260Q\033\032'<\376\204]\004g\226c\253\354\241\242l\264w\341\277\n\215\245\254\003\250MV\245\315&P\022=\rV\025\224\267MU\267\n\300:TU\007P\212R\241\\W\271\376\226)\212\232\3403\261,(\212\3154GE\215\021)ZY\325Qi\024\354\270\004\303'\245\252\301\250\235\024\000\3421C\250\367\3306t\022\032\002)L\321\241\243m\252\262\nU\267\024E\303\304\243\227\026u\017\264d#\261\034\346\241\206D\203\356\310!L\014\307\226\036?\306\350\211\345\211nbV\246\270\351\223\021\345\252(U\307T\001\262R\213M\024E\347\312\240:\210\213\343\\%h\030\333B<\203\2315QW\352\272\t\351\037?\036\303z\\\341\030^TI`\036\333Nvy\n\005\2502\352\3614\207\323\375\215e=,\343\264jO/\3660\3404h\323a\035+tB\020\325<y\311A?\033\006\007\370\r\252\20795,\3151\240\t`c\322\006v\203b\262\035x\300\340\203v\177\000\024\005\256G\2309\246nq\247\021\355l\306\035\243\177\322\357$\\\342\347\"Z9fx\225\260d\313O>Alc'c\005""\236pz\342\341\211\321\306-\266\005~\0250\345\226C\215(\375\304\347\2410b\020_G\307\3123\020\260],\217Q\r\213\324g\023V\032\334\211!Q|8q\223\272+\276\331\372:\202aT\247\251\301\316\341l`\001W<\3748\374\035\306\367R\335\364m\277\344\377\036\024\367J\357/\236\2710\337y'\227\274\274W\354f\262\235\247n\370z\346\226\006\257\231\316Jg\307Ue\256\233\235w/D\257\363n\253\227]p\277ri7;\327\331u[(\314\310T\337\305\036\230}.Wd\253\233!^\332\203\335u)\274\342\373\314\231\013\263\340tUf\274Pu\315}%\257y\271D\304\347\340\021^\277\312\224\\\224;\036\005\210`\224\005\010\333\356K\360\017A\277\225%Y\356\205\326\345nf\256#\334\357\3449I1@7\226\366\035\315\014\355\346\335K}\235\020iZ>\003X\2639w\321\3452\217\2624\000\210\222\210R<\353\276\221\345\330.\316\257\227\271\324\251\243\347\234\233s\363\030\275u2\302c\320\372\311}$\302\253\3623Y\3740\204P\235\311\010\317\215 DW\317%M\306\t\215\257\3107^y,d\2507\333y\003\225\032\r\232\211<aC\304\261\006\031>\006Z[\340\371\271\267\025\344FS\376x0\211\n\235\006&\354\300\001\230\030\305\232\367G\220J\240\030\007\223\013\231\205R|\357^F\212\027\334\233\262(KQ\213\375\006\261\373G\253Q\020\350}\244\325qK\330\346_Hx\\\203(%d\276\022\236f\001\002j\246\340\325\037\237\032\342D1X\276\223\313\376\202\177\317\337\364\373\245\231\r\307.{\331\375\021s\366h\034%N\014\033\351\276\374\022\\\314_q\327\240\265\340\025\315P\244\270W\212G7\332\313\024J\346:\377\310W^\316\313G\033\201c\211\321\346;oq\350\274\374\370\274\217\017z/\344\374\231\214\275\343\315q\261s\313-\343\342\216_\366\253Ai/\005\335\177\366R\347\025\364\014p\320M\207\232\356\023y\033\322H\237\337\333\356\274v\037C-\201\361\005\254\312U\2708\200\256\024\236!\215Gs\267\374\025\277\025\234\017\336\035\3348\204\356\035\221\344\207\356s\237\340\372n\220\016J\301\353\375\027\007;\207\2647*i\3757\327\313\276\010\212\301\323\375\007\007\265\303roTBGIy\352\255x\255O\010q\333_\rR\301\325\375\231\203\373\207\371\336\250\2448\014\261\350\n\230\325\377\215\367Ou\177\n\372n\372\246\237\363\277\tR\270\\\362S\376""\"\014C\252\227\276.[G\344n0\0034n\035\2257\273\351\313\356#o\311\317\373Et\3757\214\001D+\006\271\243{\253\007\353G\233/\273\351\231N\361\004\303\207\3365\210\221O\030\336\rRG\305\237\017\nG\033\345i\206\361\030\016\r\361\203\371\347~\34105\315\354\201\254{\024K=0\303!1\367\327\017\363\241\331\277\334\247\363O";
+    PyObject *data = __Pyx_DecompressString(cstring, 1488, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (2641 bytes) */
-const char* const bytes = "?Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.add_notedisableenablegcisenabledlib/recordclass/_linkedlist.pyxlinkedlist is emptyself.end is not None or self.start is not Noneself.next is not None or self.prev is not None or self.val is not Noneself.next is not None or self.val is not Noneself.node is not None<stringsource>__Pyx_PyDict_NextRefappendasyncio.coroutinescline_in_traceback__dict___dictdlinkeditemdlinkeditem.__reduce_cython__dlinkeditem.__setstate_cython__dlinkedlistdlinkedlist.__reduce_cython__dlinkedlist.__setstate_cython__dlinkedlist.appendextend__func____getstate___is_coroutineitemsiterdlinkedlistiterdlinkedlist.__reduce_cython__iterdlinkedlist.__setstate_cython__iterlinkedlistiterlinkedlist.__reduce_cython__iterlinkedlist.__setstate_cython__linkeditemlinkeditem.__reduce_cython__linkeditem.__setstate_cython__linkedlistlinkedlist.__reduce_cython__linkedlist.__setstate_cython__linkedlist.appendlinkedlist.extendlinkedlist.popll__main____module____name____new__nodepop__pyx_checksum__pyx_result__pyx_state__pyx_type__pyx_unpickle_dlinkeditem__pyx_unpickle_dlinkedlist__pyx_unpickle_iterdlinkedlist__pyx_unpickle_iterlinkedlist__pyx_unpickle_linkeditem__pyx_unpickle_linkedlist__pyx_vtable____qualname__recordclass._linkedlist__reduce____reduce_cython____reduce_ex__self__set_name__setdefault__setstate____setstate_cython__state__test__updateuse_setstatevalvalsvalues\200\001\330\004,\250A\250V\2601\200A\360\n\000\t\020\210{\230(\240!\2401\330\010\014\210G\2201\330\010\014\210H\220A\330\010\014\210H\220A\330\010\013\2104\210w\220c\230\021\330\014\020\220\t\230\021\330\014\020\220\007\220q\340\014\022\220$\220a\330\014\017\210x\220q\330\014\020\220\010\230\001\330\010\014\210G\2201\200A\360\006\000\t\021\220\004\220A\330\010\013\2106\220\023\220A\330\014\022\220)\2301\230A\340\010\014\210I\220U\230!\330\010\013\2106\220\023\220D\230""\001\330\014\020\220\007\220q\330\010\017\210q\200A\360\006\000\t\r\210G\2201\330\014\023\220:\230X\240Q\240a\330\014\020\220\007\220q\330\014\020\220\010\230\001\330\014\017\210t\2207\230#\230Q\330\020\024\220I\230Q\330\020\024\220G\2301\340\020\024\220D\230\010\240\001\200A\360\006\000\t\020\210z\230\030\240\021\240!\330\010\014\210G\2201\330\010\014\210H\220A\330\010\013\2104\210w\220c\230\021\330\014\020\220\t\230\021\340\014\020\220\004\220H\230A\330\010\014\210G\2201\200\001\330\004-\250Q\250f\260A\200\001\360\010\000\005\016\210T\220\027\230\004\230A\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017+\2504\250q\260\007\260{\300'\310\021\340\010\017\320\017+\2504\250q\260\007\260{\300!\200\001\360\010\000\005\016\210T\220\021\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\0170\260\004\260A\260W\270K\300w\310a\340\010\017\320\0170\260\004\260A\260W\270K\300q\200\001\360\010\000\005\016\210T\220\021\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017/\250t\2601\260G\270;\300g\310Q\340\010\017\320\017/\250t\2601\260G\270;\300a\200\001\360\010\000\005\016\210T\220\027\230\004\230G\2404\240q\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017,\250D\260\001\260\027\270\013\3007\310!\340\010\017\320\017,\250D\260\001\260\027\270\013\3001\200\001\360\010\000\005\016\210T\220\026\220t\2301\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017+\2504\250q\260\007\260{\300'\310\021\340\010\017\320\017+""\2504\250q\260\007\260{\300!\200\001\360\010\000\005\016\210T\220\026\220t\2301\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017,\250D\260\001\260\027\270\013\3007\310!\340\010\017\320\017,\250D\260\001\260\027\270\013\3001\200\001\330\004)\250\021\250&\260\001\200\001\330\004(\250\001\250\026\250q\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220?\240(\250!\2501\330\004\007\200|\2207\230!\330\0101\260\021\3202D\300N\320RS\330\004\013\2101\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220>\240\030\250\021\250!\330\004\007\200|\2207\230!\330\0100\260\001\3201B\300.\320PQ\330\004\013\2101\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220:\230X\240Q\240a\330\004\007\200|\2207\230!\330\010,\250A\250]\270.\310\001\330\004\013\2101\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220;\230h\240a\240q\330\004\007\200|\2207\230!\330\010-\250Q\250n\270N\310!\330\004\013\2101";
+    #else /* compression: none (3952 bytes) */
+const char* const bytes = "?Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.add_notechunkedlist index out of rangechunkedlist mutated during iterationchunkedlist(%r)disableenablegcisenabledlib/recordclass/_linkedlist.pyxlinkedlist is emptypop from an empty chunkedlistself.end is not None or self.start is not Noneself.next is not None or self.prev is not None or self.val is not Noneself.next is not None or self.val is not Noneself.node cannot be converted to a Python object for picklingself.node is not None<stringsource>__Pyx_PyDict_NextRefappendappendleftasyncio.coroutines__basicsize__cchunkedlistchunkedlist.__reduce__chunkedlist.__sizeof__chunkedlist.appendchunkedlist.appendleftchunkedlist.clearchunkedlist.extendchunkedlist.popchunkedlist.popleftclearcline_in_traceback__dict___dictdlinkeditemdlinkeditem.__reduce_cython__dlinkeditem.__setstate_cython__dlinkedlistdlinkedlist.__reduce_cython__dlinkedlist.__setstate_cython__dlinkedlist.appendextend__func____getstate___is_coroutineitemsiterchunkedlistiterchunkedlist.__length_hint__iterchunkedlist.__reduce_cython__iterchunkedlist.__setstate_cython__iterdlinkedlistiterdlinkedlist.__reduce_cython__iterdlinkedlist.__setstate_cython__iterlinkedlistiterlinkedlist.__reduce_cython__iterlinkedlist.__setstate_cython____length_hint__linkeditemlinkeditem.__reduce_cython__linkeditem.__setstate_cython__linkedlistlinkedlist.__reduce_cython__linkedlist.__setstate_cython__linkedlist.appendlinkedlist.extendlinkedlist.poplllst__main____module__n__name____new__nodepoppopleft__pyx_checksum__pyx_result__pyx_state__pyx_type__pyx_unpickle_dlinkeditem__pyx_unpickle_dlinkedlist__pyx_unpickle_iterdlinkedlist__pyx_unpickle_iterlinkedlist__pyx_unpickle_linkeditem__pyx_unpickle_linkedlist__pyx_vtable____qualname__recordclass._linkedlist__reduce____reduce_cython____reduce_ex__self__set_name__setdefault__setstate____setstate_cython____sizeof__state_""_test__updateuse_setstatevalvalsvalues\200\001\330\004,\250A\250V\2601\200A\360\n\000\t\020\210{\230(\240!\2401\330\010\014\210G\2201\330\010\014\210H\220A\330\010\014\210H\220A\330\010\013\2104\210w\220c\230\021\330\014\020\220\t\230\021\330\014\020\220\007\220q\340\014\022\220$\220a\330\014\017\210x\220q\330\014\020\220\010\230\001\330\010\014\210G\2201\200A\330\010\033\2304\230q\330\010 \240\004\240A\330\010\037\230t\2401\360\010\000\t\r\210H\220D\230\010\240\001\330\010\014\210I\220T\230\030\240\021\330\010\014\210H\220A\330\010\014\210J\220a\330\010\014\210L\230\001\230\026\230w\240a\200A\360\010\000\t\014\2104\210v\220S\230\001\330\014\022\220*\230A\230Q\340\010\014\210I\220Q\330\010\017\210t\2205\230\006\230a\230t\2401\330\010\014\210I\220Q\330\010\014\210J\220a\330\010\013\2104\210v\220S\230\001\330\014\020\220\016\230a\230t\2401\330\014\020\220\010\230\004\230H\240A\330\r\021\220\026\220s\230!\330\014\020\220\004\220A\330\014\020\220\010\230\001\230\021\330\014\020\220\005\220X\230Q\330\014\020\220\016\230a\230q\330\014\020\220\010\230\001\340\010\016\210h\220a\330\010\021\220\021\220!\330\010\017\210q\200A\360\010\000\t\014\2104\210v\220S\230\001\330\014\022\220*\230A\230Q\340\010\017\210t\2205\230\006\230a\230t\2401\330\010\014\210J\220a\330\010\014\210I\220Q\330\010\014\210J\220a\330\010\013\2104\210v\220S\230\001\330\014\020\220\016\230a\230t\2401\330\014\020\220\010\230\004\230H\240A\330\r\021\220\027\230\003\2301\330\014\020\220\004\220A\330\014\020\220\010\230\001\230\021\330\014\020\220\005\220X\230Q\330\014\020\220\016\230a\230q\330\014\020\220\t\230\021\340\010\016\210h\220a\330\010\021\220\021\220!\330\010\017\210q\200A\360\006\000\t\014\2104\210v\220S\230\001\330\014\020\220\004\220J\230a\330\014\020\220\010\230\004\230H\240A\330\014\020\220\t\230\024\230X\240Q\330\r\021\220\027\230\003\2301\330\014\020\220\004\220J\230a\330\014\r\210X\220T\230\021\330\014\020\220\005\220X\230Q\330\014\020\220\010\230\001\330\014\020\220\t\230\021\330\010\021""\220\021\220!\330\010\014\210J\220a\330\010\014\210E\220\026\220q\230\004\230J\240k\260\021\330\010\014\210I\220Q\330\010\014\210J\220a\200A\360\006\000\t\014\2104\210v\220S\230\001\330\014\020\220\004\220J\230a\330\014\020\220\010\230\004\230H\240A\330\014\020\220\t\230\024\230X\240Q\330\r\021\220\026\220s\230!\330\014\020\220\004\220J\230a\330\014\r\210X\220T\230\021\330\014\020\220\005\220X\230Q\330\014\020\220\010\230\001\330\014\020\220\010\230\001\330\010\021\220\021\220!\330\010\014\210E\220\026\220q\230\004\230I\240[\260\001\330\010\014\210I\220Q\330\010\014\210I\220Q\330\010\014\210J\220a\200A\360\006\000\t\021\220\004\220A\330\010\013\2106\220\023\220A\330\014\022\220)\2301\230A\340\010\014\210I\220U\230!\330\010\013\2106\220\023\220D\230\001\330\014\020\220\007\220q\330\010\017\210u\220A\200A\330\010\034\230A\330\010\030\230\004\230A\340\010\016\210b\220\007\220q\330\014\021\220\021\330\014\020\220\001\220\021\330\010\013\2104\210w\220g\230Q\330\014\021\220\021\330\010\017\210{\230/\250\022\2502\250R\250q\200A\360\006\000\t\r\210G\2201\330\014\023\220:\230X\240Q\240a\330\014\020\220\007\220q\330\014\020\220\010\230\001\330\014\017\210t\2207\230#\230Q\330\020\024\220I\230Q\340\020\024\220D\230\010\240\001\330\014\020\220\007\220q\200A\330\010\014\210G\2201\330\014\020\220\007\220q\230\001\200A\330\010\017\210~\230T\240\021\240!\200A\330\010\017\210t\2201\200A\360\006\000\t\020\210z\230\030\240\021\240!\330\010\014\210G\2201\330\010\014\210H\220A\330\010\013\2104\210w\220c\230\021\330\014\020\220\t\230\021\340\014\020\220\004\220H\230A\330\010\014\210G\2201\200\001\330\004\n\210+\220Q\200\001\330\004-\250Q\250f\260A\200\001\360\010\000\005\016\210T\220\027\230\004\230A\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017+\2504\250q\260\007\260{\300'\310\021\340\010\017\320\017+\2504\250q\260\007\260{\300!\200\001\360\010\000\005\016\210T\220""\021\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\0170\260\004\260A\260W\270K\300w\310a\340\010\017\320\0170\260\004\260A\260W\270K\300q\200\001\360\010\000\005\016\210T\220\021\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017/\250t\2601\260G\270;\300g\310Q\340\010\017\320\017/\250t\2601\260G\270;\300a\200\001\360\010\000\005\016\210T\220\027\230\004\230G\2404\240q\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017,\250D\260\001\260\027\270\013\3007\310!\340\010\017\320\017,\250D\260\001\260\027\270\013\3001\200\001\360\010\000\005\016\210T\220\026\220t\2301\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017+\2504\250q\260\007\260{\300'\310\021\340\010\017\320\017+\2504\250q\260\007\260{\300!\200\001\360\010\000\005\016\210T\220\026\220t\2301\330\004\014\210G\2201\220F\230,\240a\330\004\007\200v\210W\220E\230\024\230Q\330\010\022\220!\330\010\027\220q\340\010\030\230\001\330\004\007\200q\330\010\017\320\017,\250D\260\001\260\027\270\013\3007\310!\340\010\017\320\017,\250D\260\001\260\027\270\013\3001\200\001\330\004)\250\021\250&\260\001\200\001\330\004(\250\001\250\026\250q\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220?\240(\250!\2501\330\004\007\200|\2207\230!\330\0101\260\021\3202D\300N\320RS\330\004\013\2101\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220>\240\030\250\021\250!\330\004\007\200|\2207\230!\330\0100\260\001\3201B\300.\320PQ\330\004\013\2101\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220:\230X\240Q\240a\330\004\007""\200|\2207\230!\330\010,\250A\250]\270.\310\001\330\004\013\2101\200\001\340\004\037\230q\320 0\260\013\270;\300k\320QR\330\004\023\220;\230h\240a\240q\330\004\007\200|\2207\230!\330\010-\250Q\250n\270N\310!\330\004\013\2101";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 82; i++) {
+    for (int i = 0; i < 109; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
-      if (likely(string) && i >= 14) PyUnicode_InternInPlace(&string);
+      if (likely(string) && i >= 19) PyUnicode_InternInPlace(&string);
       if (unlikely(!string)) {
         Py_XDECREF(data);
         __PYX_ERR(0, 1, __pyx_L1_error)
@@ -11432,7 +15930,7 @@ const char* const bytes = "?Note that Cython is deliberately stricter than PEP-4
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 82; i < 100; i++) {
+    for (int i = 109; i < 137; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
@@ -11443,15 +15941,15 @@ const char* const bytes = "?Note that Cython is deliberately stricter than PEP-4
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 100; i++) {
+    for (Py_ssize_t i = 0; i < 137; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 82;
-      for (Py_ssize_t i=0; i<18; ++i) {
+      PyObject **table = stringtab + 109;
+      for (Py_ssize_t i=0; i<28; ++i) {
         #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
         Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
         #else
@@ -11492,7 +15990,7 @@ typedef struct {
     unsigned int num_kwonly_args : 1;
     unsigned int nlocals : 3;
     unsigned int flags : 10;
-    unsigned int first_line : 7;
+    unsigned int first_line : 9;
 } __Pyx_PyCode_New_function_description;
 /* NewCodeObj.proto */
 static PyObject* __Pyx_PyCode_New(
@@ -11519,19 +16017,19 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 45};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 47};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_val};
     __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_append, __pyx_mstate->__pyx_kp_b_iso88591_A_z_G1_HA_4wc_HA_G1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 57};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 59};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_vals};
-    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_extend, __pyx_mstate->__pyx_kp_b_iso88591_A_G1_XQa_q_t7_Q_IQ_G1_D, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_extend, __pyx_mstate->__pyx_kp_b_iso88591_A_G1_XQa_q_t7_Q_IQ_D_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 70};
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 72};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
-    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_pop, __pyx_mstate->__pyx_kp_b_iso88591_A_A_6_A_1A_IU_6_D_q_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[4] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_pop, __pyx_mstate->__pyx_kp_b_iso88591_A_A_6_A_1A_IU_6_D_q_uA, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[4])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
@@ -11564,7 +16062,7 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate_global->__pyx_codeobj_tab[10] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591__2, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[10])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 125};
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 127};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_val};
     __pyx_mstate_global->__pyx_codeobj_tab[11] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_append, __pyx_mstate->__pyx_kp_b_iso88591_A_1_G1_HA_HA_4wc_q_a_xq_G1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[11])) goto bad;
   }
@@ -11588,35 +16086,90 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_pyx_state};
     __pyx_mstate_global->__pyx_codeobj_tab[15] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_QfA, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[15])) goto bad;
   }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 251};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_val};
+    __pyx_mstate_global->__pyx_codeobj_tab[16] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_append, __pyx_mstate->__pyx_kp_b_iso88591_A_4vS_Ja_HA_XQ_s_Ja_XT_XQ_E_q_I, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[16])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 270};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_val};
+    __pyx_mstate_global->__pyx_codeobj_tab[17] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_appendleft, __pyx_mstate->__pyx_kp_b_iso88591_A_4vS_Ja_HA_XQ_1_Ja_XT_XQ_Ja_E_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[17])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 289};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_vals};
+    __pyx_mstate_global->__pyx_codeobj_tab[18] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_extend, __pyx_mstate->__pyx_kp_b_iso88591_A_G1_q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[18])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 293};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[19] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_pop, __pyx_mstate->__pyx_kp_b_iso88591_A_4vS_AQ_IQ_t5_at1_IQ_Ja_4vS_at1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[19])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 318};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[20] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_popleft, __pyx_mstate->__pyx_kp_b_iso88591_A_4vS_AQ_t5_at1_Ja_IQ_Ja_4vS_at1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[20])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 361};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[21] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_clear, __pyx_mstate->__pyx_kp_b_iso88591_A_4q_A_t1_HD_IT_HA_Ja_L_wa, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[21])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 3, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 400};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_n, __pyx_mstate->__pyx_n_u_c};
+    __pyx_mstate_global->__pyx_codeobj_tab[22] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_sizeof, __pyx_mstate->__pyx_kp_b_iso88591_A_A_A_b_q_4wgQ_2Rq, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[22])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 411};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[23] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_reduce, __pyx_mstate->__pyx_kp_b_iso88591_A_T, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[23])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 449};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[24] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_lib_recordclass__linkedlist_pyx, __pyx_mstate->__pyx_n_u_length_hint, __pyx_mstate->__pyx_kp_b_iso88591_A_t1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[24])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[25] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[25])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 3};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_pyx_state};
+    __pyx_mstate_global->__pyx_codeobj_tab[26] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[26])) goto bad;
+  }
   {
     const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pyx_type, __pyx_mstate->__pyx_n_u_pyx_checksum, __pyx_mstate->__pyx_n_u_pyx_state, __pyx_mstate->__pyx_n_u_pyx_result};
-    __pyx_mstate_global->__pyx_codeobj_tab[16] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_linkeditem, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_XQa_7_A_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[16])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[27] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_linkeditem, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_XQa_7_A_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[27])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pyx_type, __pyx_mstate->__pyx_n_u_pyx_checksum, __pyx_mstate->__pyx_n_u_pyx_state, __pyx_mstate->__pyx_n_u_pyx_result};
-    __pyx_mstate_global->__pyx_codeobj_tab[17] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_linkedlist, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_XQa_7_A_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[17])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[28] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_linkedlist, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_XQa_7_A_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[28])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pyx_type, __pyx_mstate->__pyx_n_u_pyx_checksum, __pyx_mstate->__pyx_n_u_pyx_state, __pyx_mstate->__pyx_n_u_pyx_result};
-    __pyx_mstate_global->__pyx_codeobj_tab[18] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_iterlinkedlist, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_7_0_1B_PQ_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[18])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[29] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_iterlinkedlist, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_7_0_1B_PQ_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[29])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pyx_type, __pyx_mstate->__pyx_n_u_pyx_checksum, __pyx_mstate->__pyx_n_u_pyx_state, __pyx_mstate->__pyx_n_u_pyx_result};
-    __pyx_mstate_global->__pyx_codeobj_tab[19] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_dlinkeditem, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_haq_7_QnN_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[19])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[30] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_dlinkeditem, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_haq_7_QnN_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[30])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pyx_type, __pyx_mstate->__pyx_n_u_pyx_checksum, __pyx_mstate->__pyx_n_u_pyx_state, __pyx_mstate->__pyx_n_u_pyx_result};
-    __pyx_mstate_global->__pyx_codeobj_tab[20] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_dlinkedlist, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_haq_7_QnN_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[20])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[31] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_dlinkedlist, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_haq_7_QnN_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[31])) goto bad;
   }
   {
     const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 4, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 4};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_pyx_type, __pyx_mstate->__pyx_n_u_pyx_checksum, __pyx_mstate->__pyx_n_u_pyx_state, __pyx_mstate->__pyx_n_u_pyx_result};
-    __pyx_mstate_global->__pyx_codeobj_tab[21] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_iterdlinkedlist, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[21])) goto bad;
+    __pyx_mstate_global->__pyx_codeobj_tab[32] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_pyx_unpickle_iterdlinkedlist, __pyx_mstate->__pyx_kp_b_iso88591_q_0_kQR_1_7_1_2DNRS_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[32])) goto bad;
   }
   Py_DECREF(tuple_dedup_map);
   return 0;
@@ -13977,6 +18530,89 @@ other_failure:
     return -1;
 }
 
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_3_2_3
+#define __PYX_HAVE_RT_ImportType_3_2_3
+static PyTypeObject *__Pyx_ImportType_3_2_3(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_2_3 check_size)
+{
+    PyObject *result = 0;
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#if defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API)
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#if !( defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API) )
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    if (size == 0) {
+        return (PyTypeObject *)result;
+    }
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize+itemsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_3_2_3 &&
+            ((size_t)basicsize > size || (size_t)(basicsize + itemsize) < size)) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd-%zd from PyObject",
+            module_name, class_name, size, basicsize, basicsize+itemsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_3_2_3 && (size_t)basicsize > size) {
+        if (PyErr_WarnFormat(NULL, 0,
+                "%.200s.%.200s size changed, may indicate binary incompatibility. "
+                "Expected %zd from C header, got %zd from PyObject",
+                module_name, class_name, size, basicsize) < 0) {
+            goto bad;
+        }
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
 /* dict_setdefault (used by FetchCommonType) */
 static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
     PyObject* value;
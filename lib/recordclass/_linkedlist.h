@@ -8,9 +8,10 @@ struct LinkedItem;
 struct LinkedList;
 struct DLinkedItem;
 struct DLinkedList;
+struct ChunkedList;
 
-/* "recordclass/_linkedlist.pyx":34
- * cimport cython
+/* "recordclass/_linkedlist.pyx":36
+ * from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
  * 
  * @cython.no_gc             # <<<<<<<<<<<<<<
  * @cython.final
@@ -22,7 +23,7 @@ struct LinkedItem {
   struct LinkedItem *next;
 };
 
-/* "recordclass/_linkedlist.pyx":40
+/* "recordclass/_linkedlist.pyx":42
  *     cdef linkeditem next
  * 
  * @cython.final             # <<<<<<<<<<<<<<
@@ -36,7 +37,7 @@ struct LinkedList {
   struct LinkedItem *end;
 };
 
-/* "recordclass/_linkedlist.pyx":113
+/* "recordclass/_linkedlist.pyx":115
  *         return val
  * 
  * @cython.no_gc             # <<<<<<<<<<<<<<
@@ -50,7 +51,7 @@ struct DLinkedItem {
   struct LinkedItem *prev;
 };
 
-/* "recordclass/_linkedlist.pyx":120
+/* "recordclass/_linkedlist.pyx":122
  *     cdef linkeditem prev
  * 
  * @cython.final             # <<<<<<<<<<<<<<
@@ -64,6 +65,25 @@ struct DLinkedList {
   struct DLinkedItem *end;
 };
 
+/* "recordclass/_linkedlist.pyx":218
+ *     PyObject *items[CHUNK_SIZE]
+ * 
+ * @cython.final             # <<<<<<<<<<<<<<
+ * cdef public class chunkedlist[object ChunkedList, type ChunkedListType]:
+ *     cdef chunk *head
+*/
+struct ChunkedList {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_11recordclass_11_linkedlist_chunkedlist *__pyx_vtab;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *head;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *tail;
+  struct __pyx_t_11recordclass_11_linkedlist_chunk *spare;
+  Py_ssize_t first;
+  Py_ssize_t last;
+  Py_ssize_t size;
+  Py_ssize_t state;
+};
+
 #ifndef __PYX_HAVE_API__recordclass___linkedlist
 
 #ifdef CYTHON_EXTERN_C
@@ -91,6 +111,7 @@ __PYX_EXTERN_C DL_IMPORT(PyTypeObject) LinkedItemType;
 __PYX_EXTERN_C DL_IMPORT(PyTypeObject) LinkedListType;
 __PYX_EXTERN_C DL_IMPORT(PyTypeObject) DLinkedItemType;
 __PYX_EXTERN_C DL_IMPORT(PyTypeObject) DLinkedListType;
+__PYX_EXTERN_C DL_IMPORT(PyTypeObject) ChunkedListType;
 
 #endif /* !__PYX_HAVE_API__recordclass___linkedlist */
 
@@ -30,6 +30,8 @@
 # THE SOFTWARE.
 
 cimport cython
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
 
 @cython.no_gc
 @cython.final
@@ -63,9 +65,9 @@ cdef public class linkedlist[object LinkedList, type LinkedListType]:
             item.next = None
             if self.start is None:
                 self.start = item
-                self.end = item
             else:
                 self.end.next = item
+            self.end = item
     #
     cpdef pop(self):
         cdef linkeditem start
@@ -77,7 +79,7 @@ cdef public class linkedlist[object LinkedList, type LinkedListType]:
         self.start = start.next
         if start is self.end:
             self.end = None
-        return start
+        return start.val
     #
     def __dealloc__(self):
         cdef linkeditem curr
@@ -200,3 +202,249 @@ cdef class iterdlinkedlist:
         self.node = node.next
         return val
     #
+
+# chunkedlist is the unrolled linked list: items are stored in the chain of chunks
+# of CHUNK_SIZE pointers, so it costs about one pointer per item and iteration over
+# items is sequential in memory
+
+cdef enum:
+    CHUNK_SIZE = 62  # the chunk with links takes 512 bytes
+
+cdef struct chunk:
+    chunk *prev
+    chunk *next
+    PyObject *items[CHUNK_SIZE]
+
+@cython.final
+cdef public class chunkedlist[object ChunkedList, type ChunkedListType]:
+    cdef chunk *head
+    cdef chunk *tail
+    cdef chunk *spare      # the released chunk, which is reused
+    cdef Py_ssize_t first  # index of the first item in the head chunk
+    cdef Py_ssize_t last   # index after the last item in the tail chunk
+    cdef Py_ssize_t size
+    cdef Py_ssize_t state  # counter of changes for iterators
+    #
+    def __init__(self, vals=None):
+        if vals is not None:
+            self.extend(vals)
+    #
+    cdef chunk* new_chunk(self) except NULL:
+        cdef chunk *c = self.spare
+
+        if c is not NULL:
+            self.spare = NULL
+        else:
+            c = <chunk*>PyMem_Malloc(sizeof(chunk))
+            if c is NULL:
+                raise MemoryError()
+        c.prev = NULL
+        c.next = NULL
+        return c
+    #
+    cdef void release_chunk(self, chunk *c):
+        if self.spare is NULL:
+            self.spare = c
+        else:
+            PyMem_Free(c)
+    #
+    cpdef append(self, val):
+        cdef chunk *c
+
+        if self.tail is NULL:
+            c = self.new_chunk()
+            self.head = self.tail = c
+            self.first = self.last = 0
+        elif self.last == CHUNK_SIZE:
+            c = self.new_chunk()
+            c.prev = self.tail
+            self.tail.next = c
+            self.tail = c
+            self.last = 0
+        Py_INCREF(val)
+        self.tail.items[self.last] = <PyObject*>val
+        self.last += 1
+        self.size += 1
+        self.state += 1
+    #
+    cpdef appendleft(self, val):
+        cdef chunk *c
+
+        if self.head is NULL:
+            c = self.new_chunk()
+            self.head = self.tail = c
+            self.first = self.last = CHUNK_SIZE
+        elif self.first == 0:
+            c = self.new_chunk()
+            c.next = self.head
+            self.head.prev = c
+            self.head = c
+            self.first = CHUNK_SIZE
+        Py_INCREF(val)
+        self.first -= 1
+        self.head.items[self.first] = <PyObject*>val
+        self.size += 1
+        self.state += 1
+    #
+    cpdef extend(self, vals):
+        for val in vals:
+            self.append(val)
+    #
+    cpdef pop(self):
+        cdef chunk *c
+        cdef PyObject *item
+
+        if self.size == 0:
+            raise IndexError("pop from an empty chunkedlist")
+
+        self.last -= 1
+        item = self.tail.items[self.last]
+        self.size -= 1
+        self.state += 1
+        if self.size == 0:
+            self.release_chunk(self.tail)
+            self.head = self.tail = NULL
+        elif self.last == 0:
+            c = self.tail
+            self.tail = c.prev
+            self.tail.next = NULL
+            self.release_chunk(c)
+            self.last = CHUNK_SIZE
+
+        val = <object>item
+        Py_DECREF(val)
+        return val
+    #
+    cpdef popleft(self):
+        cdef chunk *c
+        cdef PyObject *item
+
+        if self.size == 0:
+            raise IndexError("pop from an empty chunkedlist")
+
+        item = self.head.items[self.first]
+        self.first += 1
+        self.size -= 1
+        self.state += 1
+        if self.size == 0:
+            self.release_chunk(self.head)
+            self.head = self.tail = NULL
+        elif self.first == CHUNK_SIZE:
+            c = self.head
+            self.head = c.next
+            self.head.prev = NULL
+            self.release_chunk(c)
+            self.first = 0
+
+        val = <object>item
+        Py_DECREF(val)
+        return val
+    #
+    cdef void free_chunks(self, chunk *c, Py_ssize_t i, Py_ssize_t n):
+        # release items of the detached chain of chunks
+        cdef chunk *next
+
+        while n > 0:
+            Py_DECREF(<object>c.items[i])
+            i += 1
+            n -= 1
+            if i == CHUNK_SIZE or n == 0:
+                next = c.next
+                PyMem_Free(c)
+                c = next
+                i = 0
+        while c is not NULL:
+            next = c.next
+            PyMem_Free(c)
+            c = next
+    #
+    cpdef clear(self):
+        cdef chunk *head = self.head
+        cdef Py_ssize_t first = self.first
+        cdef Py_ssize_t size = self.size
+
+        # the list is consistent before items are released,
+        # because their deallocation can run arbitrary code
+        self.head = self.tail = NULL
+        self.first = self.last = 0
+        self.size = 0
+        self.state += 1
+        self.free_chunks(head, first, size)
+    #
+    def __dealloc__(self):
+        self.free_chunks(self.head, self.first, self.size)
+        self.head = self.tail = NULL
+        PyMem_Free(self.spare)
+        self.spare = NULL
+    #
+    def __len__(self):
+        return self.size
+    #
+    def __getitem__(self, Py_ssize_t index):
+        cdef chunk *c = self.head
+
+        if index < 0:
+            index += self.size
+        if index < 0 or index >= self.size:
+            raise IndexError("chunkedlist index out of range")
+
+        index += self.first
+        while index >= CHUNK_SIZE:
+            c = c.next
+            index -= CHUNK_SIZE
+        return <object>c.items[index]
+    #
+    def __iter__(self):
+        return iterchunkedlist(self)
+    #
+    def __sizeof__(self):
+        cdef Py_ssize_t n = 0
+        cdef chunk *c = self.head
+
+        while c is not NULL:
+            n += 1
+            c = c.next
+        if self.spare is not NULL:
+            n += 1
+        return chunkedlist.__basicsize__ + n * sizeof(chunk)
+    #
+    def __reduce__(self):
+        return chunkedlist, (list(self),)
+    #
+    def __repr__(self):
+        return "chunkedlist(%r)" % list(self)
+
+@cython.final
+cdef class iterchunkedlist:
+    cdef chunkedlist lst
+    cdef chunk *node
+    cdef Py_ssize_t index
+    cdef Py_ssize_t count
+    cdef Py_ssize_t state
+
+    def __init__(self, chunkedlist lst):
+        self.lst = lst
+        self.node = lst.head
+        self.index = lst.first
+        self.count = lst.size
+        self.state = lst.state
+
+    def __next__(self):
+        cdef PyObject *item
+
+        if self.state != self.lst.state:
+            self.count = 0
+            raise RuntimeError("chunkedlist mutated during iteration")
+        if self.count == 0:
+            raise StopIteration
+
+        item = self.node.items[self.index]
+        self.index += 1
+        self.count -= 1
+        if self.index == CHUNK_SIZE and self.count:
+            self.node = self.node.next
+            self.index = 0
+        return <object>item
+
+    def __length_hint__(self):
+        return self.count
@@ -58,20 +58,42 @@
 static PyTypeObject PyLiteList_Type;
 typedef PyListObject PyLiteListObject;
 
-static void
+/* growth policy: the list grows to size + (size >> litelist_growth_shift) + const,
+   by default (shift = 3) the overallocation is 1/8 of the size */
+static int litelist_growth_shift = 3;
+
+static int
+litelist_realloc(PyObject *op, Py_ssize_t newsize) {
+    PyObject **items;
+
+    if (newsize > PY_SSIZE_T_MAX / (Py_ssize_t)sizeof(PyObject*)) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    items = (PyObject**)PyMem_Realloc(PyLiteList_ITEMS(op), newsize*sizeof(PyObject*));
+    if (items == NULL && newsize > 0) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    PyLiteList_ITEMS(op) = items;
+    PyLiteList_SET_ALLOCATED(op, newsize);
+    return 0;
+}
+
+static int
 litelist_resize(PyObject *op, Py_ssize_t size) {
     Py_ssize_t newsize;
 
     if (size < 9)
-        newsize =  size + (size / 8) + 3;
+        newsize =  size + (size >> litelist_growth_shift) + 3;
     else
-        newsize =  size + (size / 8) + 6;
+        newsize =  size + (size >> litelist_growth_shift) + 6;
 
-    PyLiteList_ITEMS(op) = (PyObject**)PyMem_Realloc(PyLiteList_ITEMS(op), newsize*sizeof(PyObject*));
-    PyLiteList_SET_ALLOCATED(op, newsize);
+    return litelist_realloc(op, newsize);
 }
 
-
 static PyObject *
 pyobject_get_builtin(const char *attrname_c)
 {
@@ -96,10 +118,17 @@ pyobject_get_builtin(const char *attrname_c)
     return ob;
 }
 
+/* the maximal number of items preallocated by the length hint of the iterable */
+#define LITELIST_MAXPREALLOC (1 << 16)
+
 static PyObject *
 litelist_alloc(PyTypeObject *tp, Py_ssize_t n_items)
 {
     Py_ssize_t size = pyobject_size(tp);
+
+    if (n_items > PY_SSIZE_T_MAX / (Py_ssize_t)sizeof(PyObject*))
+        return PyErr_NoMemory();
+
     PyObject *op = (PyObject*)PyObject_Malloc(size);
 
     if (!op)
@@ -108,6 +137,10 @@ litelist_alloc(PyTypeObject *tp, Py_ssize_t n_items)
     // memset(op, '\0', size);
 
     PyLiteList_ITEMS(op) = (PyObject**)PyMem_Malloc(n_items*sizeof(PyObject*));
+    if (PyLiteList_ITEMS(op) == NULL) {
+        PyObject_Free(op);
+        return PyErr_NoMemory();
+    }
 
     Py_SET_TYPE(op, tp);
 #if PY_VERSION_HEX < 0x03080000
@@ -148,12 +181,19 @@ litelist_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
         src = ((PyListObject*)items)->ob_item;
     } else {
         tpl = (PyTupleObject*)PySequence_Tuple(items);
+        if (tpl == NULL)
+            return NULL;
         n = Py_SIZE(tpl);
         src = ((PyTupleObject*)tpl)->ob_item;
         is_tpl = 1;
     }
 
     PyObject *op = litelist_alloc(type, n);
+    if (op == NULL) {
+        if (is_tpl)
+            Py_DECREF(tpl);
+        return NULL;
+    }
     PyObject **dest = PyLiteList_ITEMS(op);
 
     Py_ssize_t i;
@@ -353,6 +393,51 @@ litelist_slice(PyLiteListObject *a, Py_ssize_t ilow, Py_ssize_t ihigh)
     return (PyObject *)np;
 }
 
+static int
+litelist_del_slice(PyLiteListObject *a, Py_ssize_t start, Py_ssize_t step, Py_ssize_t slicelength)
+{
+    const Py_ssize_t n = Py_SIZE(a);
+    PyObject **items = a->ob_item;
+    PyObject **removed;
+    Py_ssize_t i, j, k;
+
+    if (slicelength <= 0)
+        return 0;
+
+    if (step < 0) {
+        start = start + step * (slicelength - 1);
+        step = -step;
+    }
+
+    // items are released after the litelist is consistent again,
+    // because their deallocation can run arbitrary code
+    removed = PyMem_New(PyObject*, slicelength);
+    if (removed == NULL) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    if (step == 1) {
+        memcpy(removed, items + start, slicelength * sizeof(PyObject*));
+        memmove(items + start, items + start + slicelength,
+                (n - start - slicelength) * sizeof(PyObject*));
+    }
+    else {
+        /* move the kept items to the left */
+        for (i = start, j = start, k = 0; i < n; i++) {
+            if (k < slicelength && i == start + k * step)
+                removed[k++] = items[i];
+            else
+                items[j++] = items[i];
+        }
+    }
+    Py_SET_SIZE(a, n - slicelength);
+
+    for (i = slicelength; --i >= 0; )
+        Py_DECREF(removed[i]);
+    PyMem_Free(removed);
+    return 0;
+}
+
 static int
 litelist_ass_slice(PyLiteListObject *a, Py_ssize_t ilow, Py_ssize_t ihigh, PyObject *v)
 {
@@ -363,8 +448,17 @@ litelist_ass_slice(PyLiteListObject *a, Py_ssize_t ilow, Py_ssize_t ihigh, PyObj
     Py_ssize_t k;
     int result = -1;
 
-    if (v == NULL)
-        return result;
+    if (v == NULL) {
+        if (ilow < 0)
+            ilow = 0;
+        else if (ilow > Py_SIZE(a))
+            ilow = Py_SIZE(a);
+        if (ihigh < ilow)
+            ihigh = ilow;
+        else if (ihigh > Py_SIZE(a))
+            ihigh = Py_SIZE(a);
+        return litelist_del_slice(a, ilow, 1, ihigh - ilow);
+    }
     else {
         if ((PyObject*)a == v) {
             v = litelist_slice((PyLiteListObject*)v, 0, Py_SIZE(v));
@@ -394,6 +488,8 @@ litelist_ass_slice(PyLiteListObject *a, Py_ssize_t ilow, Py_ssize_t ihigh, PyObj
         ihigh = Py_SIZE(a);
 
     if (n != ihigh - ilow) {
+        PyErr_SetString(PyExc_ValueError,
+                        "litelist slice assignment can't change the size of the litelist");
         Py_XDECREF(v_as_SF);
         return -1;
     }
@@ -412,6 +508,57 @@ litelist_ass_slice(PyLiteListObject *a, Py_ssize_t ilow, Py_ssize_t ihigh, PyObj
     return 0;
 }
 
+static int
+litelist_ass_ext_slice(PyLiteListObject *a, PyObject *slice, PyObject *v)
+{
+    PyObject *v_as_SF;
+    PyObject **vitem;
+    PyObject **old;
+    Py_ssize_t start, stop, step, slicelength, k;
+
+    /* the value is copied before the indices are adjusted:
+       the iteration can change the size of the litelist */
+    v_as_SF = PySequence_Tuple(v);
+    if (v_as_SF == NULL)
+        return -1;
+    if (PySlice_Unpack(slice, &start, &stop, &step) < 0) {
+        Py_DECREF(v_as_SF);
+        return -1;
+    }
+    slicelength = PySlice_AdjustIndices(Py_SIZE(a), &start, &stop, step);
+
+    if (PyTuple_GET_SIZE(v_as_SF) != slicelength) {
+        PyErr_Format(PyExc_ValueError,
+                     "attempt to assign sequence of size %zd to extended slice of size %zd",
+                     PyTuple_GET_SIZE(v_as_SF), slicelength);
+        Py_DECREF(v_as_SF);
+        return -1;
+    }
+    if (slicelength == 0) {
+        Py_DECREF(v_as_SF);
+        return 0;
+    }
+
+    old = PyMem_New(PyObject*, slicelength);
+    if (old == NULL) {
+        Py_DECREF(v_as_SF);
+        PyErr_NoMemory();
+        return -1;
+    }
+    vitem = &PyTuple_GET_ITEM(v_as_SF, 0);
+    for (k = 0; k < slicelength; k++, start += step) {
+        PyObject *w = vitem[k];
+        old[k] = a->ob_item[start];
+        Py_INCREF(w);
+        a->ob_item[start] = w;
+    }
+    for (k = 0; k < slicelength; k++)
+        Py_DECREF(old[k]);
+    PyMem_Free(old);
+    Py_DECREF(v_as_SF);
+    return 0;
+}
+
 static int
 litelist_ass_item(PyLiteListObject *a, Py_ssize_t i, PyObject *v)
 {
@@ -486,7 +633,21 @@ litelist_subscript(PyLiteListObject* self, PyObject* item)
 
         if (PySlice_GetIndicesEx(item, (Py_SIZE(self)), &start, &stop, &step, &slicelength) < 0)
             return NULL;
-        return litelist_slice(self, start, stop);
+        if (step == 1)
+            return litelist_slice(self, start, stop);
+        else {
+            PyLiteListObject *np = (PyLiteListObject*)litelist_alloc(Py_TYPE(self), slicelength);
+            Py_ssize_t k;
+
+            if (np == NULL)
+                return NULL;
+            for (k = 0; k < slicelength; k++, start += step) {
+                PyObject *v = self->ob_item[start];
+                Py_INCREF(v);
+                np->ob_item[k] = v;
+            }
+            return (PyObject*)np;
+        }
     }
     else {
         PyErr_Format(PyExc_TypeError,
@@ -508,8 +669,13 @@ litelist_ass_subscript(PyLiteListObject* self, PyObject* item, PyObject* value)
     if (PySlice_Check(item)) {
         Py_ssize_t start, stop, step, slicelength;
 
-        if (PySlice_GetIndicesEx(item, (Py_SIZE(self)), &start, &stop, &step, &slicelength) < 0)
+        if (PySlice_Unpack(item, &start, &stop, &step) < 0)
             return -1;
+        if (value != NULL && step != 1)
+            return litelist_ass_ext_slice(self, item, value);
+        slicelength = PySlice_AdjustIndices(Py_SIZE(self), &start, &stop, step);
+        if (value == NULL)
+            return litelist_del_slice(self, start, step, slicelength);
         return litelist_ass_slice(self, start, stop, value);
     }
     else {
@@ -571,7 +737,7 @@ litelist_sizeof(PyLiteListObject *self)
 {
     Py_ssize_t res;
 
-    res = PyLiteList_Type.tp_basicsize + Py_SIZE(self) * sizeof(PyObject*);
+    res = PyLiteList_Type.tp_basicsize + PyLiteList_ALLOCATED(self) * sizeof(PyObject*);
     return PyLong_FromSsize_t(res);
 }
 
@@ -645,6 +811,8 @@ litelist_richcompare(PyObject *v, PyObject *w, int op)
     return PyObject_RichCompare(vt->ob_item[i], wt->ob_item[i], op);
 }
 
+static PyObject* litelist_inplace_concat(PyObject *op, PyObject *other);
+
 static PySequenceMethods litelist_as_sequence = {
     (lenfunc)litelist_len,                          /* sq_length */
     (binaryfunc)litelist_concat,                    /* sq_concat */
@@ -652,9 +820,9 @@ static PySequenceMethods litelist_as_sequence = {
     (ssizeargfunc)litelist_item,                    /* sq_item */
     0,                                                 /* sq_slice */
     (ssizeobjargproc)litelist_ass_item,             /* sq_ass_item */
-    0,                                                 /* sq_ass_item */
     0,                                                 /* sq_ass_slice */
     0,                                                 /* sq_contains */
+    (binaryfunc)litelist_inplace_concat,               /* sq_inplace_concat */
 };
 
 static PyMappingMethods litelist_as_mapping = {
@@ -751,8 +919,8 @@ static PyObject*
 litelist_append(PyObject *op, PyObject *o) {
     Py_ssize_t size = Py_SIZE(op);
 
-    if (size == PyLiteList_ALLOCATED(op))
-        litelist_resize(op, size+1);
+    if (size == PyLiteList_ALLOCATED(op) && litelist_resize(op, size+1) < 0)
+        return NULL;
 
     Py_INCREF(o);
     PyLiteList_SET_ITEM(op, size, o);
@@ -769,10 +937,14 @@ static PyObject*
 litelist_extend(PyObject *op, PyObject *o) {
     Py_ssize_t size = Py_SIZE(op);
     PyObject *seq = PySequence_Fast(o, "argument must be iterable");
+    if (seq == NULL)
+        return NULL;
     Py_ssize_t size_o = PySequence_Fast_GET_SIZE(seq);
 
-    if (size + size_o > PyLiteList_ALLOCATED(op))
-        litelist_resize(op, size+size_o+1);
+    if (size + size_o > PyLiteList_ALLOCATED(op) && litelist_resize(op, size+size_o) < 0) {
+        Py_DECREF(seq);
+        return NULL;
+    }
 
     PyObject **ptr = PySequence_Fast_ITEMS(seq);
     Py_ssize_t i;
@@ -788,6 +960,346 @@ litelist_extend(PyObject *op, PyObject *o) {
     Py_RETURN_NONE;
 }
 
+static PyObject*
+litelist_inplace_concat(PyObject *op, PyObject *other) {
+    PyObject *res = litelist_extend(op, other);
+    if (res == NULL)
+        return NULL;
+    Py_DECREF(res);
+    Py_INCREF(op);
+    return op;
+}
+
+PyDoc_STRVAR(litelist_insert_doc,
+"T.insert(index, ob) -- insert object before index");
+
+static PyObject*
+litelist_insert(PyObject *op, PyObject *const *args, Py_ssize_t nargs) {
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "insert expected 2 arguments, got %zd", nargs);
+        return NULL;
+    }
+
+    Py_ssize_t i = PyNumber_AsSsize_t(args[0], PyExc_OverflowError);
+    if (i == -1 && PyErr_Occurred())
+        return NULL;
+
+    const Py_ssize_t n = Py_SIZE(op);
+    if (n == PyLiteList_ALLOCATED(op) && litelist_resize(op, n+1) < 0)
+        return NULL;
+
+    if (i < 0) {
+        i += n;
+        if (i < 0)
+            i = 0;
+    }
+    if (i > n)
+        i = n;
+
+    PyObject **items = PyLiteList_ITEMS(op);
+    memmove(items + i + 1, items + i, (n - i) * sizeof(PyObject*));
+    Py_INCREF(args[1]);
+    items[i] = args[1];
+    Py_SET_SIZE(op, n + 1);
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litelist_pop_doc,
+"T.pop([index]) -> item -- remove and return item at index (default last)");
+
+static PyObject*
+litelist_pop(PyObject *op, PyObject *const *args, Py_ssize_t nargs) {
+    Py_ssize_t i = -1;
+    const Py_ssize_t n = Py_SIZE(op);
+
+    if (nargs > 1) {
+        PyErr_Format(PyExc_TypeError, "pop expected at most 1 argument, got %zd", nargs);
+        return NULL;
+    }
+    if (nargs == 1) {
+        i = PyNumber_AsSsize_t(args[0], PyExc_OverflowError);
+        if (i == -1 && PyErr_Occurred())
+            return NULL;
+    }
+
+    if (n == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from empty litelist");
+        return NULL;
+    }
+    if (i < 0)
+        i += n;
+    if (i < 0 || i >= n) {
+        PyErr_SetString(PyExc_IndexError, "pop index out of range");
+        return NULL;
+    }
+
+    PyObject **items = PyLiteList_ITEMS(op);
+    PyObject *v = items[i];
+    memmove(items + i, items + i + 1, (n - i - 1) * sizeof(PyObject*));
+    Py_SET_SIZE(op, n - 1);
+
+    return v;
+}
+
+PyDoc_STRVAR(litelist_clear_doc,
+"T.clear() -- remove all items and release the storage");
+
+static PyObject*
+litelist_clear(PyObject *op, PyObject *Py_UNUSED(ignored)) {
+    PyObject **items = PyLiteList_ITEMS(op);
+    Py_ssize_t i = Py_SIZE(op);
+
+    PyLiteList_ITEMS(op) = NULL;
+    PyLiteList_SET_ALLOCATED(op, 0);
+    Py_SET_SIZE(op, 0);
+
+    while (--i >= 0)
+        Py_DECREF(items[i]);
+    PyMem_Free(items);
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litelist_index_doc,
+"T.index(value, [start, [stop]]) -> integer -- return first index of value");
+
+static PyObject*
+litelist_index(PyObject *op, PyObject *const *args, Py_ssize_t nargs) {
+    Py_ssize_t i, start = 0, stop = PY_SSIZE_T_MAX;
+
+    if (nargs < 1 || nargs > 3) {
+        PyErr_Format(PyExc_TypeError, "index expected from 1 to 3 arguments, got %zd", nargs);
+        return NULL;
+    }
+    if (nargs > 1) {
+        start = PyNumber_AsSsize_t(args[1], NULL);
+        if (start == -1 && PyErr_Occurred())
+            return NULL;
+    }
+    if (nargs > 2) {
+        stop = PyNumber_AsSsize_t(args[2], NULL);
+        if (stop == -1 && PyErr_Occurred())
+            return NULL;
+    }
+
+    if (start < 0) {
+        start += Py_SIZE(op);
+        if (start < 0)
+            start = 0;
+    }
+    if (stop < 0) {
+        stop += Py_SIZE(op);
+        if (stop < 0)
+            stop = 0;
+    }
+
+    // the size is checked on every step: comparison can change the litelist
+    for (i = start; i < stop && i < Py_SIZE(op); i++) {
+        PyObject *item = PyLiteList_GET_ITEM(op, i);
+        Py_INCREF(item);
+        int cmp = PyObject_RichCompareBool(item, args[0], Py_EQ);
+        Py_DECREF(item);
+        if (cmp > 0)
+            return PyLong_FromSsize_t(i);
+        else if (cmp < 0)
+            return NULL;
+    }
+    PyErr_SetString(PyExc_ValueError, "litelist.index(x): x not in litelist");
+    return NULL;
+}
+
+PyDoc_STRVAR(litelist_count_doc,
+"T.count(value) -> integer -- return number of occurrences of value");
+
+static PyObject*
+litelist_count(PyObject *op, PyObject *v) {
+    Py_ssize_t i, count = 0;
+
+    for (i = 0; i < Py_SIZE(op); i++) {
+        PyObject *item = PyLiteList_GET_ITEM(op, i);
+        if (item == v) {
+            count++;
+            continue;
+        }
+        Py_INCREF(item);
+        int cmp = PyObject_RichCompareBool(item, v, Py_EQ);
+        Py_DECREF(item);
+        if (cmp > 0)
+            count++;
+        else if (cmp < 0)
+            return NULL;
+    }
+    return PyLong_FromSsize_t(count);
+}
+
+PyDoc_STRVAR(litelist_reverse_doc,
+"T.reverse() -- reverse *IN PLACE*");
+
+static PyObject*
+litelist_reverse(PyObject *op, PyObject *Py_UNUSED(ignored)) {
+    PyObject **lo, **hi;
+
+    /* the storage of the empty litelist can be NULL */
+    if (Py_SIZE(op) < 2)
+        Py_RETURN_NONE;
+
+    lo = PyLiteList_ITEMS(op);
+    hi = lo + Py_SIZE(op) - 1;
+    while (lo < hi) {
+        PyObject *t = *lo;
+        *lo++ = *hi;
+        *hi-- = t;
+    }
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litelist_sort_doc,
+"T.sort(*, key=None, reverse=False) -- stable sort *IN PLACE*");
+
+static PyObject*
+litelist_sort(PyObject *op, PyObject *args, PyObject *kwds) {
+    // the storage is lent to a temporary list, so list.sort (timsort)
+    // sorts items in place without copying them
+    PyListObject *tmp = (PyListObject*)PyList_New(0);
+    if (tmp == NULL)
+        return NULL;
+
+    tmp->ob_item = PyLiteList_ITEMS(op);
+    tmp->allocated = PyLiteList_ALLOCATED(op);
+    Py_SET_SIZE(tmp, Py_SIZE(op));
+    PyLiteList_ITEMS(op) = NULL;
+    PyLiteList_SET_ALLOCATED(op, 0);
+    Py_SET_SIZE(op, 0);
+
+    PyObject *res = NULL;
+    PyObject *sort = PyObject_GetAttrString((PyObject*)tmp, "sort");
+    if (sort != NULL) {
+        res = PyObject_Call(sort, args, kwds);
+        Py_DECREF(sort);
+    }
+
+    if (PyLiteList_ITEMS(op) != NULL || Py_SIZE(op) != 0) {
+        // the litelist was changed by the key function or comparisons
+        PyObject *tail = litelist_clear(op, NULL);
+        Py_XDECREF(tail);
+        if (res != NULL) {
+            Py_DECREF(res);
+            res = NULL;
+            PyErr_SetString(PyExc_ValueError, "litelist modified during sort");
+        }
+    }
+
+    PyLiteList_ITEMS(op) = tmp->ob_item;
+    PyLiteList_SET_ALLOCATED(op, tmp->allocated);
+    Py_SET_SIZE(op, Py_SIZE(tmp));
+    tmp->ob_item = NULL;
+    tmp->allocated = 0;
+    Py_SET_SIZE(tmp, 0);
+    Py_DECREF(tmp);
+
+    return res;
+}
+
+PyDoc_STRVAR(litelist_fromiter_doc,
+"litelist.fromiter(iterable) -- create litelist from the iterable;\n\
+the storage is preallocated by the length hint of the iterable");
+
+static PyObject*
+litelist_fromiter(PyObject *type, PyObject *iterable) {
+    Py_ssize_t n = PyObject_LengthHint(iterable, 0);
+    if (n < 0)
+        return NULL;
+    /* the hint isn't trusted for the large preallocation */
+    if (n > LITELIST_MAXPREALLOC)
+        n = LITELIST_MAXPREALLOC;
+
+    PyObject *it = PyObject_GetIter(iterable);
+    if (it == NULL)
+        return NULL;
+
+    PyObject *op = litelist_alloc((PyTypeObject*)type, n);
+    if (op == NULL) {
+        Py_DECREF(it);
+        return NULL;
+    }
+    Py_SET_SIZE(op, 0);
+
+    PyObject *v;
+    while ((v = PyIter_Next(it)) != NULL) {
+        Py_ssize_t size = Py_SIZE(op);
+        if (size == PyLiteList_ALLOCATED(op) && litelist_resize(op, size+1) < 0) {
+            Py_DECREF(v);
+            goto error;
+        }
+        PyLiteList_SET_ITEM(op, size, v);
+        Py_SET_SIZE(op, size + 1);
+    }
+    if (PyErr_Occurred())
+        goto error;
+
+    Py_DECREF(it);
+    return op;
+
+error:
+    Py_DECREF(it);
+    Py_DECREF(op);
+    return NULL;
+}
+
+PyDoc_STRVAR(litelist_reserve_doc,
+"T.reserve(n) -- preallocate the storage for at least n items");
+
+static PyObject*
+litelist_reserve(PyObject *op, PyObject *arg) {
+    Py_ssize_t n = PyNumber_AsSsize_t(arg, PyExc_OverflowError);
+
+    if (n == -1 && PyErr_Occurred())
+        return NULL;
+    if (n < 0) {
+        PyErr_SetString(PyExc_ValueError, "the capacity should be non-negative");
+        return NULL;
+    }
+
+    if (n > PyLiteList_ALLOCATED(op) && litelist_realloc(op, n) < 0)
+        return NULL;
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litelist_shrink_to_fit_doc,
+"T.shrink_to_fit() -- release the storage which is allocated over the size");
+
+static PyObject*
+litelist_shrink_to_fit(PyObject *op, PyObject *Py_UNUSED(ignored)) {
+    Py_ssize_t size = Py_SIZE(op);
+
+    if (size == PyLiteList_ALLOCATED(op))
+        Py_RETURN_NONE;
+
+    if (size == 0) {
+        PyMem_Free(PyLiteList_ITEMS(op));
+        PyLiteList_ITEMS(op) = NULL;
+        PyLiteList_SET_ALLOCATED(op, 0);
+        Py_RETURN_NONE;
+    }
+
+    if (litelist_realloc(op, size) < 0)
+        return NULL;
+
+    Py_RETURN_NONE;
+}
+
+static PyObject*
+litelist_capacity(PyObject *op, void *closure) {
+    return PyLong_FromSsize_t(PyLiteList_ALLOCATED(op));
+}
+
+static PyGetSetDef litelist_getset[] = {
+    {"capacity", (getter)litelist_capacity, NULL, "number of items for which the storage is allocated", NULL},
+    {NULL}
+};
+
 PyDoc_STRVAR(litelist_remove_doc,
 "T.remove(ob)");
 
@@ -815,6 +1327,16 @@ static PyMethodDef litelist_methods[] = {
     {"append",  (PyCFunction)litelist_append, METH_O, litelist_append_doc},
     {"extend",  (PyCFunction)litelist_extend, METH_O, litelist_extend_doc},
     {"remove",  (PyCFunction)litelist_remove, METH_O, litelist_remove_doc},
+    {"reserve",  (PyCFunction)litelist_reserve, METH_O, litelist_reserve_doc},
+    {"shrink_to_fit",  (PyCFunction)litelist_shrink_to_fit, METH_NOARGS, litelist_shrink_to_fit_doc},
+    {"insert",  (PyCFunction)(void(*)(void))litelist_insert, METH_FASTCALL, litelist_insert_doc},
+    {"pop",  (PyCFunction)(void(*)(void))litelist_pop, METH_FASTCALL, litelist_pop_doc},
+    {"clear",  (PyCFunction)litelist_clear, METH_NOARGS, litelist_clear_doc},
+    {"index",  (PyCFunction)(void(*)(void))litelist_index, METH_FASTCALL, litelist_index_doc},
+    {"count",  (PyCFunction)litelist_count, METH_O, litelist_count_doc},
+    {"reverse",  (PyCFunction)litelist_reverse, METH_NOARGS, litelist_reverse_doc},
+    {"sort",  (PyCFunction)(void(*)(void))litelist_sort, METH_VARARGS|METH_KEYWORDS, litelist_sort_doc},
+    {"fromiter",  (PyCFunction)litelist_fromiter, METH_O|METH_CLASS, litelist_fromiter_doc},
     // {"__getnewargs__",          (PyCFunction)litelist_getnewargs,  METH_NOARGS},
     {"__copy__", (PyCFunction)litelist_copy, METH_NOARGS, litelist_copy_doc},
     {"__len__", (PyCFunction)litelist_len, METH_NOARGS, litelist_len_doc},
@@ -860,7 +1382,7 @@ static PyTypeObject PyLiteList_Type = {
     0,                                      /* tp_iternext */
     litelist_methods,                    /* tp_methods */
     0,                                      /* tp_members */
-    0,                                      /* tp_getset */
+    litelist_getset,                        /* tp_getset */
     0,                                      /* tp_base */
     0,                                      /* tp_litelist */
     0,                                      /* tp_descr_get */
@@ -1038,6 +1560,8 @@ litelist_fromargs(PyObject *module, PyObject *args)
     const Py_ssize_t n_args = Py_SIZE(args);
 
     PyObject *op = litelist_alloc(&PyLiteList_Type, n_args);
+    if (op == NULL)
+        return NULL;
 
     PyObject **dest = PyLiteList_ITEMS(op);
     PyObject **src = ((PyTupleObject*)args)->ob_item;
@@ -1053,36 +1577,1063 @@ litelist_fromargs(PyObject *module, PyObject *args)
 }
 
 
-/* List of functions defined in the module */
+PyDoc_STRVAR(litelist_growth_doc,
+"litelist_growth(shift) -- set the growth policy of litelists and return the previous one\n\n\
+When the storage is full it grows to size + (size >> shift) + 3 (+6 for size > 8) items:\n\
+shift=0 doubles the storage, shift=1 grows it by 1/2, shift=3 (default) by 1/8.");
 
-PyDoc_STRVAR(litelistmodule_doc,
-"Litelist module provide lite list type without cyclic garbage collection (reference count only).");
+static PyObject *
+litelist_growth(PyObject *module, PyObject *arg)
+{
+    long shift = PyLong_AsLong(arg);
 
-static PyMethodDef litelistmodule_methods[] = {
-    {"litelist_fromargs", (PyCFunction)litelist_fromargs, METH_VARARGS, litelist_fromargs_doc},
-    {0, 0, 0, 0}
-};
+    if (shift == -1 && PyErr_Occurred())
+        return NULL;
+    if (shift < 0 || shift > 16) {
+        PyErr_SetString(PyExc_ValueError, "shift should be in range 0..16");
+        return NULL;
+    }
 
-static struct PyModuleDef litelistmodule = {
-    PyModuleDef_HEAD_INIT,
-    "recordclass._litelist",
-    litelistmodule_doc,
-    -1,
-    litelistmodule_methods,
-    NULL,
-    NULL,
-    NULL,
-    NULL
-};
+    int prev = litelist_growth_shift;
+    litelist_growth_shift = (int)shift;
+    return PyLong_FromLong(prev);
+}
 
-PyMODINIT_FUNC
-PyInit__litelist(void)
-{
-    PyObject *m;
+/*********************** LiteArray **************************/
 
-#ifndef PYPY_VERSION
-    m = PyState_FindModule(&litelistmodule);
-    if (m) {
+/* litearray stores unboxed values of the one machine type (like array.array)
+   in the storage, which grows by the same policy as the storage of litelist */
+
+typedef struct {
+    char typecode;
+    int itemsize;
+    const char *format;
+    PyObject* (*getitem)(const char *ptr);
+    int (*setitem)(char *ptr, PyObject *v);
+} litearray_descr;
+
+typedef struct {
+    PyObject_VAR_HEAD
+    char *ob_data;
+    Py_ssize_t allocated;
+    const litearray_descr *descr;
+    Py_ssize_t ob_exports;  /* number of exported buffers */
+} PyLiteArrayObject;
+
+static PyTypeObject PyLiteArray_Type;
+
+#define PyLiteArray_Check(op) PyObject_TypeCheck(op, &PyLiteArray_Type)
+#define PyLiteArray_ITEMSIZE(op) (((PyLiteArrayObject*)(op))->descr->itemsize)
+#define PyLiteArray_ITEMPTR(op, i) (((PyLiteArrayObject*)(op))->ob_data + (i) * PyLiteArray_ITEMSIZE(op))
+
+static PyObject *
+litearray_q_getitem(const char *ptr) {
+    return PyLong_FromLongLong(*(long long*)ptr);
+}
+
+static int
+litearray_q_setitem(char *ptr, PyObject *v) {
+    long long x = PyLong_AsLongLong(v);
+    if (x == -1 && PyErr_Occurred())
+        return -1;
+    *(long long*)ptr = x;
+    return 0;
+}
+
+static PyObject *
+litearray_i_getitem(const char *ptr) {
+    return PyLong_FromLong(*(int*)ptr);
+}
+
+static int
+litearray_i_setitem(char *ptr, PyObject *v) {
+    long x = PyLong_AsLong(v);
+    if (x == -1 && PyErr_Occurred())
+        return -1;
+    if (x < INT_MIN || x > INT_MAX) {
+        PyErr_SetString(PyExc_OverflowError, "value is out of range of the signed int");
+        return -1;
+    }
+    *(int*)ptr = (int)x;
+    return 0;
+}
+
+static PyObject *
+litearray_d_getitem(const char *ptr) {
+    return PyFloat_FromDouble(*(double*)ptr);
+}
+
+static int
+litearray_d_setitem(char *ptr, PyObject *v) {
+    double x = PyFloat_AsDouble(v);
+    if (x == -1.0 && PyErr_Occurred())
+        return -1;
+    *(double*)ptr = x;
+    return 0;
+}
+
+static PyObject *
+litearray_f_getitem(const char *ptr) {
+    return PyFloat_FromDouble(*(float*)ptr);
+}
+
+static int
+litearray_f_setitem(char *ptr, PyObject *v) {
+    double x = PyFloat_AsDouble(v);
+    if (x == -1.0 && PyErr_Occurred())
+        return -1;
+    *(float*)ptr = (float)x;
+    return 0;
+}
+
+static const litearray_descr litearray_descrs[] = {
+    {'q', sizeof(long long), "q", litearray_q_getitem, litearray_q_setitem},
+    {'d', sizeof(double), "d", litearray_d_getitem, litearray_d_setitem},
+    {'i', sizeof(int), "i", litearray_i_getitem, litearray_i_setitem},
+    {'f', sizeof(float), "f", litearray_f_getitem, litearray_f_setitem},
+    {'\0', 0, NULL, NULL, NULL}
+};
+
+static const litearray_descr *
+litearray_find_descr(PyObject *typecode)
+{
+    const litearray_descr *descr;
+
+    if (!PyUnicode_Check(typecode) || PyUnicode_GET_LENGTH(typecode) != 1) {
+        PyErr_SetString(PyExc_TypeError, "typecode should be a string of length 1");
+        return NULL;
+    }
+
+    Py_UCS4 c = PyUnicode_READ_CHAR(typecode, 0);
+    for (descr = litearray_descrs; descr->typecode; descr++) {
+        if ((Py_UCS4)descr->typecode == c)
+            return descr;
+    }
+    PyErr_SetString(PyExc_ValueError, "typecode should be one of 'q', 'd', 'i', 'f'");
+    return NULL;
+}
+
+static int
+litearray_realloc(PyLiteArrayObject *op, Py_ssize_t newsize) {
+    const Py_ssize_t itemsize = op->descr->itemsize;
+    char *data;
+
+    if (op->ob_exports > 0) {
+        PyErr_SetString(PyExc_BufferError,
+                        "cannot resize litearray that is exporting buffers");
+        return -1;
+    }
+    if (newsize > PY_SSIZE_T_MAX / itemsize) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    data = (char*)PyMem_Realloc(op->ob_data, newsize * itemsize);
+    if (data == NULL && newsize > 0) {
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    op->ob_data = data;
+    op->allocated = newsize;
+    return 0;
+}
+
+static int
+litearray_resize(PyLiteArrayObject *op, Py_ssize_t size) {
+    Py_ssize_t newsize;
+
+    if (size < 9)
+        newsize =  size + (size >> litelist_growth_shift) + 3;
+    else
+        newsize =  size + (size >> litelist_growth_shift) + 6;
+
+    return litearray_realloc(op, newsize);
+}
+
+/* the storage of the empty litearray is allocated exactly */
+static int
+litearray_grow(PyLiteArrayObject *op, Py_ssize_t size) {
+    if (Py_SIZE(op) == 0)
+        return litearray_realloc(op, size);
+    return litearray_resize(op, size);
+}
+
+/* the size of the litearray can't be changed while its buffer is exported */
+static int
+litearray_check_exports(PyLiteArrayObject *op) {
+    if (op->ob_exports > 0) {
+        PyErr_SetString(PyExc_BufferError,
+                        "cannot resize litearray that is exporting buffers");
+        return -1;
+    }
+    return 0;
+}
+
+static PyLiteArrayObject *
+litearray_alloc(PyTypeObject *type, const litearray_descr *descr, Py_ssize_t n)
+{
+    PyLiteArrayObject *op = (PyLiteArrayObject*)type->tp_alloc(type, 0);
+
+    if (op == NULL)
+        return NULL;
+
+    op->descr = descr;
+    if (n > 0 && litearray_realloc(op, n) < 0) {
+        Py_DECREF(op);
+        return NULL;
+    }
+    Py_SET_SIZE(op, n);
+    return op;
+}
+
+/* the format of the buffer is compatible with the type of items of litearray */
+static int
+litearray_compatible_format(const litearray_descr *descr, const Py_buffer *view)
+{
+    const char *format = view->format;
+
+    if (view->itemsize != descr->itemsize || format == NULL)
+        return 0;
+    if (*format == '@' || *format == '=')
+        format++;
+    if (format[0] == '\0' || format[1] != '\0')
+        return 0;
+    if (descr->typecode == 'q' || descr->typecode == 'i')
+        return strchr("bhilq", format[0]) != NULL;
+    return format[0] == 'f' || format[0] == 'd';
+}
+
+/* convert values of the sequence to the new buffer (the caller frees it);
+   __index__ or __float__ of the values can change any litearray, so the values
+   are converted before the litearray is accessed */
+static char *
+litearray_convert(const litearray_descr *descr, PyObject *iterable, Py_ssize_t *n)
+{
+    /* the tuple keeps references to the values while they are converted */
+    PyObject *seq = PySequence_Tuple(iterable);
+    Py_ssize_t i;
+
+    if (seq == NULL)
+        return NULL;
+
+    const Py_ssize_t len = PyTuple_GET_SIZE(seq);
+    char *data = (char*)PyMem_Malloc(len > 0 ? len * descr->itemsize : 1);
+    if (data == NULL) {
+        Py_DECREF(seq);
+        PyErr_NoMemory();
+        return NULL;
+    }
+
+    char *ptr = data;
+    for (i = 0; i < len; i++) {
+        if (descr->setitem(ptr, PyTuple_GET_ITEM(seq, i)) < 0) {
+            PyMem_Free(data);
+            Py_DECREF(seq);
+            return NULL;
+        }
+        ptr += descr->itemsize;
+    }
+    Py_DECREF(seq);
+    *n = len;
+    return data;
+}
+
+/* store values of the iterable to the storage after the last item
+   and return their number; the size of the litearray is not changed */
+static Py_ssize_t
+litearray_store(PyLiteArrayObject *op, PyObject *iterable)
+{
+    const litearray_descr *descr = op->descr;
+    Py_ssize_t size, n;
+
+    if (PyLiteArray_Check(iterable) && ((PyLiteArrayObject*)iterable)->descr == descr) {
+        size = Py_SIZE(op);
+        n = Py_SIZE(iterable);
+        if (size + n > op->allocated && litearray_grow(op, size + n) < 0)
+            return -1;
+        if (n > 0)
+            memcpy(op->ob_data + size * descr->itemsize,
+                   ((PyLiteArrayObject*)iterable)->ob_data, n * descr->itemsize);
+        return n;
+    }
+
+    if (PyObject_CheckBuffer(iterable) && !PyLiteArray_Check(iterable)) {
+        Py_buffer view;
+
+        if (PyObject_GetBuffer(iterable, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) < 0)
+            PyErr_Clear();
+        else {
+            if (view.ndim == 1 && litearray_compatible_format(descr, &view)) {
+                size = Py_SIZE(op);
+                n = view.len / view.itemsize;
+                if (size + n > op->allocated && litearray_grow(op, size + n) < 0) {
+                    PyBuffer_Release(&view);
+                    return -1;
+                }
+                if (n > 0)
+                    memcpy(op->ob_data + size * descr->itemsize, view.buf, view.len);
+                PyBuffer_Release(&view);
+                return n;
+            }
+            PyBuffer_Release(&view);
+        }
+    }
+
+    char *data = litearray_convert(descr, iterable, &n);
+    if (data == NULL)
+        return -1;
+
+    size = Py_SIZE(op);
+    if (op->ob_data == NULL) {
+        /* the empty storage is replaced by the buffer of the values */
+        if (litearray_check_exports(op) < 0) {
+            PyMem_Free(data);
+            return -1;
+        }
+        op->ob_data = data;
+        op->allocated = n;
+        return n;
+    }
+    if (size + n > op->allocated && litearray_grow(op, size + n) < 0) {
+        PyMem_Free(data);
+        return -1;
+    }
+    if (n > 0)
+        memcpy(op->ob_data + size * descr->itemsize, data, n * descr->itemsize);
+    PyMem_Free(data);
+    return n;
+}
+
+static PyObject *
+litearray_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"typecode", "iterable", NULL};
+    PyObject *typecode, *iterable = NULL;
+    const litearray_descr *descr;
+    PyLiteArrayObject *op;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "O|O:litearray", kwlist, &typecode, &iterable))
+        return NULL;
+
+    descr = litearray_find_descr(typecode);
+    if (descr == NULL)
+        return NULL;
+
+    op = litearray_alloc(type, descr, 0);
+    if (op == NULL)
+        return NULL;
+
+    if (iterable != NULL) {
+        Py_ssize_t n = litearray_store(op, iterable);
+        if (n < 0) {
+            Py_DECREF(op);
+            return NULL;
+        }
+        Py_SET_SIZE(op, n);
+    }
+    return (PyObject*)op;
+}
+
+static void
+litearray_dealloc(PyLiteArrayObject *op)
+{
+    PyMem_Free(op->ob_data);
+    Py_TYPE(op)->tp_free((PyObject *)op);
+}
+
+static PyObject *
+litearray_tolist(PyLiteArrayObject *op, PyObject *Py_UNUSED(ignored))
+{
+    const Py_ssize_t n = Py_SIZE(op);
+    PyObject *lst = PyList_New(n);
+    Py_ssize_t i;
+
+    if (lst == NULL)
+        return NULL;
+    for (i = 0; i < n; i++) {
+        PyObject *v = op->descr->getitem(PyLiteArray_ITEMPTR(op, i));
+        if (v == NULL) {
+            Py_DECREF(lst);
+            return NULL;
+        }
+        PyList_SET_ITEM(lst, i, v);
+    }
+    return lst;
+}
+
+static PyObject *
+litearray_repr(PyLiteArrayObject *op)
+{
+    PyObject *lst, *result;
+
+    if (Py_SIZE(op) == 0)
+        return PyUnicode_FromFormat("litearray('%c')", op->descr->typecode);
+
+    lst = litearray_tolist(op, NULL);
+    if (lst == NULL)
+        return NULL;
+    result = PyUnicode_FromFormat("litearray('%c', %R)", op->descr->typecode, lst);
+    Py_DECREF(lst);
+    return result;
+}
+
+PyDoc_STRVAR(litearray_doc,
+"litearray(typecode, [iterable]) --> litearray\n\n\
+Compact list of unboxed values of the one machine type: 'q' (int64), 'i' (int32),\n\
+'d' (double) or 'f' (float). It has no header of the cyclic garbage collector\n\
+and exports its storage by the buffer protocol.");
+
+static Py_ssize_t
+litearray_len(PyLiteArrayObject *op)
+{
+    return Py_SIZE(op);
+}
+
+static PyObject *
+litearray_item(PyLiteArrayObject *op, Py_ssize_t i)
+{
+    if (i < 0)
+        i += Py_SIZE(op);
+    if (i < 0 || i >= Py_SIZE(op)) {
+        PyErr_SetString(PyExc_IndexError, "index out of range");
+        return NULL;
+    }
+    return op->descr->getitem(PyLiteArray_ITEMPTR(op, i));
+}
+
+static int
+litearray_del_slice(PyLiteArrayObject *op, Py_ssize_t start, Py_ssize_t stop, Py_ssize_t step, Py_ssize_t slicelength)
+{
+    const Py_ssize_t n = Py_SIZE(op);
+    const Py_ssize_t itemsize = op->descr->itemsize;
+    Py_ssize_t i, j;
+
+    if (slicelength <= 0)
+        return 0;
+    if (litearray_check_exports(op) < 0)
+        return -1;
+
+    if (step < 0) {
+        start = start + step * (slicelength - 1);
+        step = -step;
+    }
+    if (step == 1) {
+        memmove(op->ob_data + start * itemsize, op->ob_data + (start + slicelength) * itemsize,
+                (n - start - slicelength) * itemsize);
+    }
+    else {
+        /* move the kept items to the left */
+        for (i = start + 1, j = start; i < n; i++) {
+            if (i < start + step * slicelength && (i - start) % step == 0)
+                continue;
+            memcpy(op->ob_data + j * itemsize, op->ob_data + i * itemsize, itemsize);
+            j++;
+        }
+    }
+    Py_SET_SIZE(op, n - slicelength);
+    return 0;
+}
+
+static int
+litearray_ass_item(PyLiteArrayObject *op, Py_ssize_t i, PyObject *v)
+{
+    char buf[sizeof(long long)];
+
+    /* the value is converted before the index is checked:
+       the conversion can change the size of the litearray */
+    if (v != NULL && op->descr->setitem(buf, v) < 0)
+        return -1;
+
+    if (i < 0)
+        i += Py_SIZE(op);
+    if (i < 0 || i >= Py_SIZE(op)) {
+        PyErr_SetString(PyExc_IndexError, "assignment index out of range");
+        return -1;
+    }
+    if (v == NULL)
+        return litearray_del_slice(op, i, i+1, 1, 1);
+    memcpy(PyLiteArray_ITEMPTR(op, i), buf, op->descr->itemsize);
+    return 0;
+}
+
+static PyObject*
+litearray_subscript(PyLiteArrayObject* op, PyObject* item)
+{
+    if (_PyIndex_Check(item)) {
+        Py_ssize_t i = PyLong_AsSsize_t(item);
+        if (i == -1 && PyErr_Occurred())
+            return NULL;
+        return litearray_item(op, i);
+    }
+    if (PySlice_Check(item)) {
+        const Py_ssize_t itemsize = op->descr->itemsize;
+        Py_ssize_t start, stop, step, slicelength, i;
+        PyLiteArrayObject *np;
+
+        if (PySlice_GetIndicesEx(item, Py_SIZE(op), &start, &stop, &step, &slicelength) < 0)
+            return NULL;
+
+        np = litearray_alloc(Py_TYPE(op), op->descr, slicelength);
+        if (np == NULL)
+            return NULL;
+        if (step == 1) {
+            if (slicelength > 0)
+                memcpy(np->ob_data, op->ob_data + start * itemsize, slicelength * itemsize);
+        }
+        else {
+            for (i = 0; i < slicelength; i++, start += step)
+                memcpy(np->ob_data + i * itemsize, op->ob_data + start * itemsize, itemsize);
+        }
+        return (PyObject*)np;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "subscript must be integer or slice, but not %.200s",
+                 Py_TYPE(item)->tp_name);
+    return NULL;
+}
+
+static int
+litearray_ass_subscript(PyLiteArrayObject* op, PyObject* item, PyObject* value)
+{
+    if (_PyIndex_Check(item)) {
+        Py_ssize_t i = PyLong_AsSsize_t(item);
+        if (i == -1 && PyErr_Occurred())
+            return -1;
+        return litearray_ass_item(op, i, value);
+    }
+    if (PySlice_Check(item)) {
+        const Py_ssize_t itemsize = op->descr->itemsize;
+        Py_ssize_t start, stop, step, slicelength, i, n;
+        PyLiteArrayObject *tmp;
+
+        if (value == NULL) {
+            if (PySlice_GetIndicesEx(item, Py_SIZE(op), &start, &stop, &step, &slicelength) < 0)
+                return -1;
+            return litearray_del_slice(op, start, stop, step, slicelength);
+        }
+
+        /* the values are converted before the slice is computed:
+           the conversion can change the litearray */
+        tmp = litearray_alloc(&PyLiteArray_Type, op->descr, 0);
+        if (tmp == NULL)
+            return -1;
+        n = litearray_store(tmp, value);
+        if (n < 0) {
+            Py_DECREF(tmp);
+            return -1;
+        }
+        if (PySlice_Unpack(item, &start, &stop, &step) < 0) {
+            Py_DECREF(tmp);
+            return -1;
+        }
+        slicelength = PySlice_AdjustIndices(Py_SIZE(op), &start, &stop, step);
+        if (n != slicelength) {
+            Py_DECREF(tmp);
+            PyErr_SetString(PyExc_ValueError,
+                            "litearray slice assignment can't change the size of the litearray");
+            return -1;
+        }
+        for (i = 0; i < slicelength; i++, start += step)
+            memcpy(op->ob_data + start * itemsize, tmp->ob_data + i * itemsize, itemsize);
+        Py_DECREF(tmp);
+        return 0;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "indices must be integers, not %.200s",
+                 Py_TYPE(item)->tp_name);
+    return -1;
+}
+
+static PyObject *
+litearray_richcompare(PyObject *v, PyObject *w, int op)
+{
+    PyLiteArrayObject *va, *wa;
+    Py_ssize_t i, vlen, wlen;
+
+    if (!PyLiteArray_Check(v) || !PyLiteArray_Check(w))
+        Py_RETURN_NOTIMPLEMENTED;
+
+    va = (PyLiteArrayObject*)v;
+    wa = (PyLiteArrayObject*)w;
+    vlen = Py_SIZE(va);
+    wlen = Py_SIZE(wa);
+
+    if (vlen != wlen && (op == Py_EQ || op == Py_NE)) {
+        if (op == Py_EQ)
+            Py_RETURN_FALSE;
+        Py_RETURN_TRUE;
+    }
+
+    /* search for the first index where items are different */
+    for (i = 0; i < vlen && i < wlen; i++) {
+        PyObject *vi = va->descr->getitem(PyLiteArray_ITEMPTR(va, i));
+        PyObject *wi = wa->descr->getitem(PyLiteArray_ITEMPTR(wa, i));
+        int k;
+
+        if (vi == NULL || wi == NULL) {
+            Py_XDECREF(vi);
+            Py_XDECREF(wi);
+            return NULL;
+        }
+        k = PyObject_RichCompareBool(vi, wi, Py_EQ);
+        if (k == 0) {
+            PyObject *res = PyObject_RichCompare(vi, wi, op);
+            Py_DECREF(vi);
+            Py_DECREF(wi);
+            return res;
+        }
+        Py_DECREF(vi);
+        Py_DECREF(wi);
+        if (k < 0)
+            return NULL;
+    }
+
+    /* no more items to compare -- compare sizes */
+    Py_RETURN_RICHCOMPARE(vlen, wlen, op);
+}
+
+PyDoc_STRVAR(litearray_append_doc,
+"A.append(value)");
+
+static PyObject*
+litearray_append(PyLiteArrayObject *op, PyObject *v) {
+    char buf[sizeof(long long)];
+
+    if (op->descr->setitem(buf, v) < 0)
+        return NULL;
+
+    const Py_ssize_t size = Py_SIZE(op);
+
+    if (litearray_check_exports(op) < 0)
+        return NULL;
+    if (size == op->allocated && litearray_resize(op, size+1) < 0)
+        return NULL;
+    memcpy(PyLiteArray_ITEMPTR(op, size), buf, op->descr->itemsize);
+    Py_SET_SIZE(op, size + 1);
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litearray_extend_doc,
+"A.extend(iterable) -- append values from the iterable (or the buffer with compatible format)");
+
+static PyObject*
+litearray_extend(PyLiteArrayObject *op, PyObject *iterable) {
+    Py_ssize_t n;
+
+    if (litearray_check_exports(op) < 0)
+        return NULL;
+    n = litearray_store(op, iterable);
+    if (n < 0)
+        return NULL;
+    Py_SET_SIZE(op, Py_SIZE(op) + n);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject*
+litearray_inplace_concat(PyLiteArrayObject *op, PyObject *other) {
+    PyObject *res = litearray_extend(op, other);
+    if (res == NULL)
+        return NULL;
+    Py_DECREF(res);
+    Py_INCREF(op);
+    return (PyObject*)op;
+}
+
+PyDoc_STRVAR(litearray_insert_doc,
+"A.insert(index, value) -- insert value before index");
+
+static PyObject*
+litearray_insert(PyLiteArrayObject *op, PyObject *const *args, Py_ssize_t nargs) {
+    const Py_ssize_t itemsize = op->descr->itemsize;
+    char buf[sizeof(long long)];
+
+    if (nargs != 2) {
+        PyErr_Format(PyExc_TypeError, "insert expected 2 arguments, got %zd", nargs);
+        return NULL;
+    }
+
+    Py_ssize_t i = PyNumber_AsSsize_t(args[0], PyExc_OverflowError);
+    if (i == -1 && PyErr_Occurred())
+        return NULL;
+    if (op->descr->setitem(buf, args[1]) < 0)
+        return NULL;
+
+    /* the size is read after the conversions, which can change the litearray */
+    const Py_ssize_t n = Py_SIZE(op);
+
+    if (litearray_check_exports(op) < 0)
+        return NULL;
+    if (n == op->allocated && litearray_resize(op, n+1) < 0)
+        return NULL;
+
+    if (i < 0) {
+        i += n;
+        if (i < 0)
+            i = 0;
+    }
+    if (i > n)
+        i = n;
+
+    memmove(op->ob_data + (i + 1) * itemsize, op->ob_data + i * itemsize, (n - i) * itemsize);
+    memcpy(op->ob_data + i * itemsize, buf, itemsize);
+    Py_SET_SIZE(op, n + 1);
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litearray_pop_doc,
+"A.pop([index]) -> value -- remove and return value at index (default last)");
+
+static PyObject*
+litearray_pop(PyLiteArrayObject *op, PyObject *const *args, Py_ssize_t nargs) {
+    Py_ssize_t n, i = -1;
+    PyObject *v;
+
+    if (nargs > 1) {
+        PyErr_Format(PyExc_TypeError, "pop expected at most 1 argument, got %zd", nargs);
+        return NULL;
+    }
+    if (nargs == 1) {
+        i = PyNumber_AsSsize_t(args[0], PyExc_OverflowError);
+        if (i == -1 && PyErr_Occurred())
+            return NULL;
+    }
+
+    n = Py_SIZE(op);
+    if (n == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from empty litearray");
+        return NULL;
+    }
+    if (i < 0)
+        i += n;
+    if (i < 0 || i >= n) {
+        PyErr_SetString(PyExc_IndexError, "pop index out of range");
+        return NULL;
+    }
+
+    v = op->descr->getitem(PyLiteArray_ITEMPTR(op, i));
+    if (v == NULL)
+        return NULL;
+    if (litearray_del_slice(op, i, i+1, 1, 1) < 0) {
+        Py_DECREF(v);
+        return NULL;
+    }
+    return v;
+}
+
+PyDoc_STRVAR(litearray_clear_doc,
+"A.clear() -- remove all values and release the storage");
+
+static PyObject*
+litearray_clear(PyLiteArrayObject *op, PyObject *Py_UNUSED(ignored)) {
+    if (litearray_check_exports(op) < 0)
+        return NULL;
+
+    PyMem_Free(op->ob_data);
+    op->ob_data = NULL;
+    op->allocated = 0;
+    Py_SET_SIZE(op, 0);
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litearray_reserve_doc,
+"A.reserve(n) -- preallocate the storage for at least n values");
+
+static PyObject*
+litearray_reserve(PyLiteArrayObject *op, PyObject *arg) {
+    Py_ssize_t n = PyNumber_AsSsize_t(arg, PyExc_OverflowError);
+
+    if (n == -1 && PyErr_Occurred())
+        return NULL;
+    if (n < 0) {
+        PyErr_SetString(PyExc_ValueError, "the capacity should be non-negative");
+        return NULL;
+    }
+
+    if (n > op->allocated && litearray_realloc(op, n) < 0)
+        return NULL;
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litearray_shrink_to_fit_doc,
+"A.shrink_to_fit() -- release the storage which is allocated over the size");
+
+static PyObject*
+litearray_shrink_to_fit(PyLiteArrayObject *op, PyObject *Py_UNUSED(ignored)) {
+    if (Py_SIZE(op) == op->allocated)
+        Py_RETURN_NONE;
+
+    if (litearray_realloc(op, Py_SIZE(op)) < 0)
+        return NULL;
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litearray_tolist_doc,
+"A.tolist() -> list of values");
+
+PyDoc_STRVAR(litearray_tobytes_doc,
+"A.tobytes() -> bytes with the machine values");
+
+static PyObject*
+litearray_tobytes(PyLiteArrayObject *op, PyObject *Py_UNUSED(ignored)) {
+    return PyBytes_FromStringAndSize(op->ob_data, Py_SIZE(op) * op->descr->itemsize);
+}
+
+PyDoc_STRVAR(litearray_frombytes_doc,
+"A.frombytes(data) -- append machine values from the bytes-like object");
+
+static PyObject*
+litearray_frombytes(PyLiteArrayObject *op, PyObject *data) {
+    const Py_ssize_t itemsize = op->descr->itemsize;
+    Py_buffer view;
+    Py_ssize_t size, n;
+
+    if (PyObject_GetBuffer(data, &view, PyBUF_SIMPLE) < 0)
+        return NULL;
+    size = Py_SIZE(op);
+    if (view.len % itemsize != 0) {
+        PyBuffer_Release(&view);
+        PyErr_SetString(PyExc_ValueError, "bytes length not a multiple of item size");
+        return NULL;
+    }
+    n = view.len / itemsize;
+
+    if (litearray_check_exports(op) < 0 ||
+            (size + n > op->allocated && litearray_realloc(op, size + n) < 0)) {
+        PyBuffer_Release(&view);
+        return NULL;
+    }
+    if (n > 0)
+        memcpy(op->ob_data + size * itemsize, view.buf, view.len);
+    Py_SET_SIZE(op, size + n);
+    PyBuffer_Release(&view);
+
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(litearray_copy_doc, "A.copy() -> a copy of A.");
+
+static PyObject *
+litearray_copy(PyLiteArrayObject *op, PyObject *Py_UNUSED(ignored))
+{
+    const Py_ssize_t n = Py_SIZE(op);
+    PyLiteArrayObject *np = litearray_alloc(Py_TYPE(op), op->descr, n);
+
+    if (np == NULL)
+        return NULL;
+    if (n > 0)
+        memcpy(np->ob_data, op->ob_data, n * op->descr->itemsize);
+    return (PyObject*)np;
+}
+
+PyDoc_STRVAR(litearray_sizeof_doc,
+"A.__sizeof__() -- size of A in memory, in bytes");
+
+static PyObject *
+litearray_sizeof(PyLiteArrayObject *op, PyObject *Py_UNUSED(ignored))
+{
+    Py_ssize_t res = Py_TYPE(op)->tp_basicsize + op->allocated * op->descr->itemsize;
+    return PyLong_FromSsize_t(res);
+}
+
+PyDoc_STRVAR(litearray_reduce_doc, "A.__reduce__()");
+
+static PyObject *
+litearray_reduce(PyLiteArrayObject *op, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *data = litearray_tobytes(op, NULL);
+
+    if (data == NULL)
+        return NULL;
+    /* litearray(typecode).frombytes(data) */
+    return Py_BuildValue("O(C)N", Py_TYPE(op), op->descr->typecode, data);
+}
+
+static PyMethodDef litearray_methods[] = {
+    {"append",  (PyCFunction)litearray_append, METH_O, litearray_append_doc},
+    {"extend",  (PyCFunction)litearray_extend, METH_O, litearray_extend_doc},
+    {"insert",  (PyCFunction)(void(*)(void))litearray_insert, METH_FASTCALL, litearray_insert_doc},
+    {"pop",  (PyCFunction)(void(*)(void))litearray_pop, METH_FASTCALL, litearray_pop_doc},
+    {"clear",  (PyCFunction)litearray_clear, METH_NOARGS, litearray_clear_doc},
+    {"reserve",  (PyCFunction)litearray_reserve, METH_O, litearray_reserve_doc},
+    {"shrink_to_fit",  (PyCFunction)litearray_shrink_to_fit, METH_NOARGS, litearray_shrink_to_fit_doc},
+    {"tolist",  (PyCFunction)litearray_tolist, METH_NOARGS, litearray_tolist_doc},
+    {"tobytes",  (PyCFunction)litearray_tobytes, METH_NOARGS, litearray_tobytes_doc},
+    {"frombytes",  (PyCFunction)litearray_frombytes, METH_O, litearray_frombytes_doc},
+    {"__setstate__",  (PyCFunction)litearray_frombytes, METH_O, litearray_frombytes_doc},
+    {"__copy__", (PyCFunction)litearray_copy, METH_NOARGS, litearray_copy_doc},
+    {"__sizeof__", (PyCFunction)litearray_sizeof, METH_NOARGS, litearray_sizeof_doc},
+    {"__reduce__", (PyCFunction)litearray_reduce, METH_NOARGS, litearray_reduce_doc},
+    {NULL}
+};
+
+static PyObject*
+litearray_typecode(PyLiteArrayObject *op, void *closure) {
+    return PyUnicode_FromOrdinal(op->descr->typecode);
+}
+
+static PyObject*
+litearray_itemsize(PyLiteArrayObject *op, void *closure) {
+    return PyLong_FromLong(op->descr->itemsize);
+}
+
+static PyObject*
+litearray_capacity(PyLiteArrayObject *op, void *closure) {
+    return PyLong_FromSsize_t(op->allocated);
+}
+
+static PyGetSetDef litearray_getset[] = {
+    {"typecode", (getter)litearray_typecode, NULL, "the typecode character of values", NULL},
+    {"itemsize", (getter)litearray_itemsize, NULL, "the size in bytes of one value", NULL},
+    {"capacity", (getter)litearray_capacity, NULL, "number of values for which the storage is allocated", NULL},
+    {NULL}
+};
+
+/* the storage is exported as 1-d contiguous array of machine values */
+static int
+litearray_getbuffer(PyLiteArrayObject *op, Py_buffer *view, int flags)
+{
+    static char emptybuf[sizeof(long long)];
+
+    if (view == NULL) {
+        PyErr_SetString(PyExc_BufferError, "view==NULL argument is obsolete");
+        return -1;
+    }
+
+    view->buf = op->ob_data ? (void*)op->ob_data : (void*)emptybuf;
+    view->obj = (PyObject*)op;
+    Py_INCREF(op);
+    view->len = Py_SIZE(op) * op->descr->itemsize;
+    view->readonly = 0;
+    view->ndim = 1;
+    view->itemsize = op->descr->itemsize;
+    view->suboffsets = NULL;
+    view->shape = NULL;
+    if ((flags & PyBUF_ND) == PyBUF_ND)
+        view->shape = &((PyVarObject*)op)->ob_size;
+    view->strides = NULL;
+    if ((flags & PyBUF_STRIDES) == PyBUF_STRIDES)
+        view->strides = &view->itemsize;
+    view->format = NULL;
+    if ((flags & PyBUF_FORMAT) == PyBUF_FORMAT)
+        view->format = (char*)op->descr->format;
+    view->internal = NULL;
+
+    op->ob_exports++;
+    return 0;
+}
+
+static void
+litearray_releasebuffer(PyLiteArrayObject *op, Py_buffer *view)
+{
+    op->ob_exports--;
+}
+
+static PyBufferProcs litearray_as_buffer = {
+    (getbufferproc)litearray_getbuffer,
+    (releasebufferproc)litearray_releasebuffer,
+};
+
+static PySequenceMethods litearray_as_sequence = {
+    (lenfunc)litearray_len,                          /* sq_length */
+    0,                                               /* sq_concat */
+    0,                                               /* sq_repeat */
+    (ssizeargfunc)litearray_item,                    /* sq_item */
+    0,                                               /* sq_slice */
+    (ssizeobjargproc)litearray_ass_item,             /* sq_ass_item */
+    0,                                               /* sq_ass_slice */
+    0,                                               /* sq_contains */
+    (binaryfunc)litearray_inplace_concat,            /* sq_inplace_concat */
+};
+
+static PyMappingMethods litearray_as_mapping = {
+    (lenfunc)litearray_len,
+    (binaryfunc)litearray_subscript,
+    (objobjargproc)litearray_ass_subscript
+};
+
+static PyTypeObject PyLiteArray_Type = {
+    PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
+    "recordclass._litelist.litearray",      /* tp_name */
+    sizeof(PyLiteArrayObject),              /* tp_basicsize */
+    0,                                      /* tp_itemsize */
+    /* methods */
+    (destructor)litearray_dealloc,          /* tp_dealloc */
+    0,                                      /* tp_print */
+    0,                                      /* tp_getattr */
+    0,                                      /* tp_setattr */
+    0,                                      /* tp_reserved */
+    (reprfunc)litearray_repr,               /* tp_repr */
+    0,                                      /* tp_as_number */
+    &litearray_as_sequence,                 /* tp_as_sequence */
+    &litearray_as_mapping,                  /* tp_as_mapping */
+    PyObject_HashNotImplemented,            /* tp_hash */
+    0,                                      /* tp_call */
+    0,                                      /* tp_str */
+    0,                                      /* tp_getattro */
+    0,                                      /* tp_setattro */
+    &litearray_as_buffer,                   /* tp_as_buffer */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+                                            /* tp_flags */
+    litearray_doc,                          /* tp_doc */
+    0,                                      /* tp_traverse */
+    0,                                      /* tp_clear */
+    litearray_richcompare,                  /* tp_richcompare */
+    0,                                      /* tp_weaklistoffset*/
+    PySeqIter_New,                          /* tp_iter */
+    0,                                      /* tp_iternext */
+    litearray_methods,                      /* tp_methods */
+    0,                                      /* tp_members */
+    litearray_getset,                       /* tp_getset */
+    0,                                      /* tp_base */
+    0,                                      /* tp_dict */
+    0,                                      /* tp_descr_get */
+    0,                                      /* tp_descr_set */
+    0,                                      /* tp_dictoffset */
+    0,                                      /* tp_init */
+    0,                                      /* tp_alloc */
+    litearray_new,                          /* tp_new */
+    PyObject_Del,                           /* tp_free */
+    0                                       /* tp_is_gc */
+};
+
+/* List of functions defined in the module */
+
+PyDoc_STRVAR(litelistmodule_doc,
+"Litelist module provide lite list type without cyclic garbage collection (reference count only).");
+
+static PyMethodDef litelistmodule_methods[] = {
+    {"litelist_fromargs", (PyCFunction)litelist_fromargs, METH_VARARGS, litelist_fromargs_doc},
+    {"litelist_growth", (PyCFunction)litelist_growth, METH_O, litelist_growth_doc},
+    {0, 0, 0, 0}
+};
+
+static struct PyModuleDef litelistmodule = {
+    PyModuleDef_HEAD_INIT,
+    "recordclass._litelist",
+    litelistmodule_doc,
+    -1,
+    litelistmodule_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+PyMODINIT_FUNC
+PyInit__litelist(void)
+{
+    PyObject *m;
+
+#ifndef PYPY_VERSION
+    m = PyState_FindModule(&litelistmodule);
+    if (m) {
         Py_INCREF(m);
         return m;
     }
@@ -1104,6 +2655,12 @@ PyInit__litelist(void)
     Py_INCREF(&PyLiteListIter_Type);
     PyModule_AddObject(m, "litelistiter", (PyObject *)&PyLiteListIter_Type);
 
+    if (PyType_Ready(&PyLiteArray_Type) < 0)
+        Py_FatalError("Can't initialize litearray type");
+
+    Py_INCREF(&PyLiteArray_Type);
+    PyModule_AddObject(m, "litearray", (PyObject *)&PyLiteArray_Type);
+
 
     return m;
 }
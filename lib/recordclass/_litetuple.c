@@ -80,25 +80,69 @@ pyobject_get_builtin(const char *attrname_c)
     return ob;
 }
 
-static PyObject *
-litetuple_alloc(PyTypeObject *tp, Py_ssize_t nitems)
+/* free lists of litetuple and mutabletuple instances of small sizes;
+   the link to the next free instance is stored in ob_item[0] */
+
+#define LITETUPLE_MAXSAVESIZE 20
+#define LITETUPLE_MAXFREELIST 2000
+
+typedef struct {
+    PyLiteTupleObject *items[LITETUPLE_MAXSAVESIZE + 1];
+    Py_ssize_t numfree[LITETUPLE_MAXSAVESIZE + 1];
+    Py_ssize_t hits;
+    Py_ssize_t misses;
+} litetuple_freelist;
+
+static litetuple_freelist litetuple_freelists[2];
+static Py_ssize_t litetuple_freelist_maxsize = LITETUPLE_MAXFREELIST;
+
+static litetuple_freelist *
+_litetuple_freelist(PyTypeObject *tp)
 {
-    // Py_ssize_t size = _PyObject_VAR_SIZE(tp, nitems);
-    PyObject *op = (PyObject*)_PyObject_NewVar(tp, nitems);
+    if (tp == &PyLiteTuple_Type)
+        return &litetuple_freelists[0];
+    if (tp == &PyMLiteTuple_Type)
+        return &litetuple_freelists[1];
+    return NULL;
+}
 
-//     if (!op)
-//         return PyErr_NoMemory();
+static void
+_litetuple_freelist_trim(litetuple_freelist *fl, Py_ssize_t maxsize)
+{
+    Py_ssize_t n;
 
-//     // memset(op, '\0', size);
+    for (n = 1; n <= LITETUPLE_MAXSAVESIZE; n++) {
+        while (fl->numfree[n] > maxsize) {
+            PyLiteTupleObject *op = fl->items[n];
+            fl->items[n] = (PyLiteTupleObject*)op->ob_item[0];
+            fl->numfree[n]--;
+            PyObject_Del(op);
+        }
+    }
+}
 
-//     Py_SET_TYPE(op, tp);
-//     if (tp->tp_flags & Py_TPFLAGS_HEAPTYPE)
-//         Py_INCREF(tp);
+/* the items of the new object are not initialized */
+static PyObject *
+litetuple_alloc(PyTypeObject *tp, Py_ssize_t nitems)
+{
+    litetuple_freelist *fl;
+
+    if (nitems > 0 && nitems <= LITETUPLE_MAXSAVESIZE && (fl = _litetuple_freelist(tp)) != NULL) {
+        PyLiteTupleObject *op = fl->items[nitems];
+        if (op != NULL) {
+            fl->items[nitems] = (PyLiteTupleObject*)op->ob_item[0];
+            fl->numfree[nitems]--;
+            fl->hits++;
+            return (PyObject*)PyObject_InitVar((PyVarObject*)op, tp, nitems);
+        }
+        fl->misses++;
+    }
 
-//     Py_SET_SIZE(op, nitems);
-//     _Py_NewReference(op);
+    /* subclasses with __dict__ or __weakref__ are collected by gc */
+    if (PyType_IS_GC(tp))
+        return PyType_GenericAlloc(tp, nitems);
 
-    return op;
+    return (PyObject*)_PyObject_NewVar(tp, nitems);
 }
 
 static PyObject *
@@ -106,7 +150,9 @@ litetuple_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
 {
     const Py_ssize_t n = Py_SIZE(args);
 
-    PyObject *newobj = (PyObject*)_PyObject_NewVar(type, n);
+    PyObject *newobj = litetuple_alloc(type, n);
+    if (newobj == NULL)
+        return NULL;
 
     PyTupleObject *tmp = (PyTupleObject*)args;
     PyObject **dest = ((PyLiteTupleObject*)newobj)->ob_item;
@@ -129,7 +175,9 @@ litetuple_vectorcall(PyObject *type, PyObject * const*args,
 {
     const Py_ssize_t n = PyVectorcall_NARGS(nargsf);
 
-    PyObject *newobj = (PyObject*)_PyObject_NewVar((PyTypeObject*)type, n);
+    PyObject *newobj = litetuple_alloc((PyTypeObject*)type, n);
+    if (newobj == NULL)
+        return NULL;
 
     PyObject **dest = ((PyLiteTupleObject*)newobj)->ob_item;
 
@@ -176,10 +224,21 @@ litetuple_dealloc(PyLiteTupleObject *op)
 {
     Py_ssize_t i = Py_SIZE(op);
 
+    const Py_ssize_t n = i;
+    litetuple_freelist *fl;
+
     while (--i >= 0) {
         Py_XDECREF(op->ob_item[i]);
     }
 
+    if (n > 0 && n <= LITETUPLE_MAXSAVESIZE && (fl = _litetuple_freelist(Py_TYPE(op))) != NULL &&
+            fl->numfree[n] < litetuple_freelist_maxsize) {
+        op->ob_item[0] = (PyObject*)fl->items[n];
+        fl->items[n] = op;
+        fl->numfree[n]++;
+        return;
+    }
+
     Py_TYPE(op)->tp_free((PyObject *)op);
 }
 
@@ -646,11 +705,9 @@ litetuple_reduce(PyObject *ob)
 {
     PyObject *args;
     PyObject *result;
-    PyObject *tmp;
 
-    tmp = PySequence_Tuple(ob);
-    args = PyTuple_Pack(1, tmp);
-    Py_DECREF(tmp);
+    /* litetuple(*args) */
+    args = PySequence_Tuple(ob);
     if (args == NULL)
         return NULL;
 
@@ -695,6 +752,94 @@ litetuple_hash(PyObject *v)
     return (Py_hash_t)x;
 }
 
+PyDoc_STRVAR(mutabletuple_freeze_doc,
+"T.freeze() -> litetuple\n\n\
+Turn the mutabletuple into the hashable litetuple in place (without copying of items)\n\
+and return it. All references to the object refer to the litetuple after that.");
+
+static PyObject *
+mutabletuple_freeze(PyObject *op, PyObject *Py_UNUSED(ignored))
+{
+    if (Py_TYPE(op) != &PyMLiteTuple_Type) {
+        PyErr_Format(PyExc_TypeError,
+                     "only mutabletuple instances can be frozen, not %s", Py_TYPE(op)->tp_name);
+        return NULL;
+    }
+
+    /* litetuple and mutabletuple have the same layout */
+    Py_SET_TYPE(op, &PyLiteTuple_Type);
+    Py_INCREF(op);
+    return op;
+}
+
+PyDoc_STRVAR(mutabletuple_with_capacity_doc,
+"mutabletuple.with_capacity(n) -> mutabletuple with n items which are set to None\n\n\
+The items are assigned by index and then the mutabletuple can be frozen to litetuple by freeze().");
+
+static PyObject *
+mutabletuple_with_capacity(PyObject *type, PyObject *arg)
+{
+    Py_ssize_t i, n = PyNumber_AsSsize_t(arg, PyExc_OverflowError);
+    PyObject *op;
+
+    if (n == -1 && PyErr_Occurred())
+        return NULL;
+    if (n < 0) {
+        PyErr_SetString(PyExc_ValueError, "the capacity should be non-negative");
+        return NULL;
+    }
+
+    op = litetuple_alloc((PyTypeObject*)type, n);
+    if (op == NULL)
+        return NULL;
+
+    for (i = 0; i < n; i++) {
+        Py_INCREF(Py_None);
+        PyLiteTuple_SET_ITEM(op, i, Py_None);
+    }
+    return op;
+}
+
+static PyMethodDef mutabletuple_methods[] = {
+    {"__getnewargs__",          (PyCFunction)litetuple_getnewargs,  METH_NOARGS},
+    {"__copy__", (PyCFunction)litetuple_copy, METH_NOARGS, litetuple_copy_doc},
+    {"__len__", (PyCFunction)litetuple_len, METH_NOARGS, litetuple_len_doc},
+    {"__nonzero__", (PyCFunction)litetuple_bool, METH_NOARGS, litetuple_bool_doc},
+    {"__sizeof__",      (PyCFunction)litetuple_sizeof, METH_NOARGS, litetuple_sizeof_doc},
+    {"__reduce__", (PyCFunction)litetuple_reduce, METH_NOARGS, litetuple_reduce_doc},
+    {"freeze", (PyCFunction)mutabletuple_freeze, METH_NOARGS, mutabletuple_freeze_doc},
+    {"with_capacity", (PyCFunction)mutabletuple_with_capacity, METH_O|METH_CLASS, mutabletuple_with_capacity_doc},
+    {NULL}
+};
+
+static PyObject *litetuple_interned = NULL;
+
+PyDoc_STRVAR(litetuple_intern_doc,
+"T.intern() -> the canonical litetuple which is equal to T\n\n\
+The first interned litetuple with the given items becomes canonical and is kept\n\
+in the table of interned litetuples until litetuple_intern_clear() is called.");
+
+static PyObject *
+litetuple_intern(PyObject *op, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *res;
+
+    if (Py_TYPE(op) != &PyLiteTuple_Type) {
+        PyErr_Format(PyExc_TypeError,
+                     "only litetuple instances can be interned, not %s", Py_TYPE(op)->tp_name);
+        return NULL;
+    }
+    if (litetuple_interned == NULL) {
+        litetuple_interned = PyDict_New();
+        if (litetuple_interned == NULL)
+            return NULL;
+    }
+
+    res = PyDict_SetDefault(litetuple_interned, op, op);
+    Py_XINCREF(res);
+    return res;
+}
+
 static PyMethodDef litetuple_methods[] = {
     {"__getnewargs__",          (PyCFunction)litetuple_getnewargs,  METH_NOARGS},
     {"__copy__", (PyCFunction)litetuple_copy, METH_NOARGS, litetuple_copy_doc},
@@ -702,6 +847,7 @@ static PyMethodDef litetuple_methods[] = {
     {"__nonzero__", (PyCFunction)litetuple_bool, METH_NOARGS, litetuple_bool_doc},
     {"__sizeof__",      (PyCFunction)litetuple_sizeof, METH_NOARGS, litetuple_sizeof_doc},
     {"__reduce__", (PyCFunction)litetuple_reduce, METH_NOARGS, litetuple_reduce_doc},
+    {"intern", (PyCFunction)litetuple_intern, METH_NOARGS, litetuple_intern_doc},
     {NULL}
 };
 
@@ -710,7 +856,7 @@ litetuple_iter(PyObject *seq);
 
 static PyTypeObject PyLiteTuple_Type = {
     PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
-    "recordclass.litetuple.litetuple",          /* tp_name */
+    "recordclass._litetuple.litetuple",          /* tp_name */
     sizeof(PyLiteTupleObject) - sizeof(PyObject*),      /* tp_basicsize */
     sizeof(PyObject*),                              /* tp_itemsize */
     /* methods */
@@ -764,7 +910,7 @@ static PyTypeObject PyLiteTuple_Type = {
 
 static PyTypeObject PyMLiteTuple_Type = {
     PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
-    "recordclass.litetuple.mutabletuple",          /* tp_name */
+    "recordclass._litetuple.mutabletuple",          /* tp_name */
     sizeof(PyLiteTupleObject) - sizeof(PyObject*),      /* tp_basicsize */
     sizeof(PyObject*),                              /* tp_itemsize */
     /* methods */
@@ -797,7 +943,7 @@ static PyTypeObject PyMLiteTuple_Type = {
     0,                                      /* tp_weaklistoffset*/
     litetuple_iter,                         /* tp_iter */
     0,                                      /* tp_iternext */
-    litetuple_methods,                      /* tp_methods */
+    mutabletuple_methods,                   /* tp_methods */
     0,                                      /* tp_members */
     0,                                      /* tp_getset */
     0,                                      /* tp_base */
@@ -920,7 +1066,7 @@ static PyMethodDef litetupleiter_methods[] = {
 
 PyTypeObject PyLiteTupleIter_Type = {
     PyVarObject_HEAD_INIT(DEFERRED_ADDRESS(&PyType_Type), 0)
-    "recordclass.litetuple.litetuple_iterator",                           /* tp_name */
+    "recordclass._litetuple.litetuple_iterator",                           /* tp_name */
     sizeof(litetupleiterobject),                    /* tp_basicsize */
     0,                                          /* tp_itemsize */
     /* methods */
@@ -971,9 +1117,110 @@ litetuple_iter(PyObject *seq)
 PyDoc_STRVAR(litetuplemodule_doc,
 "Litetuple module provide mutable and immutable tuple types without cyclic garbage collection (reference count only).");
 
+PyDoc_STRVAR(litetuple_freelist_doc,
+"litetuple_freelist(maxsize) -- set the maximal number of free litetuple/mutabletuple instances\n\
+of every size from 1 to 20 and return the previous one\n\n\
+Instances of litetuple and mutabletuple of small sizes are reused after deallocation.\n\
+maxsize=0 releases the free lists and disables them.");
+
+static PyObject *
+litetuple_freelist_set(PyObject *module, PyObject *arg)
+{
+    Py_ssize_t maxsize = PyNumber_AsSsize_t(arg, PyExc_OverflowError);
+
+    if (maxsize == -1 && PyErr_Occurred())
+        return NULL;
+    if (maxsize < 0) {
+        PyErr_SetString(PyExc_ValueError, "maxsize should be >= 0");
+        return NULL;
+    }
+
+    Py_ssize_t prev = litetuple_freelist_maxsize;
+    litetuple_freelist_maxsize = maxsize;
+    _litetuple_freelist_trim(&litetuple_freelists[0], maxsize);
+    _litetuple_freelist_trim(&litetuple_freelists[1], maxsize);
+    return PyLong_FromSsize_t(prev);
+}
+
+PyDoc_STRVAR(litetuple_freelist_info_doc,
+"litetuple_freelist_info(cls) -- dict with the state and counters of the free lists of litetuple or mutabletuple");
+
+static PyObject *
+litetuple_freelist_info(PyObject *module, PyObject *cls)
+{
+    litetuple_freelist *fl;
+    Py_ssize_t n, size = 0;
+
+    if (!PyType_Check(cls) || (fl = _litetuple_freelist((PyTypeObject*)cls)) == NULL) {
+        PyErr_SetString(PyExc_TypeError, "argument should be litetuple or mutabletuple");
+        return NULL;
+    }
+
+    for (n = 1; n <= LITETUPLE_MAXSAVESIZE; n++)
+        size += fl->numfree[n];
+
+    return Py_BuildValue("{snsnsnsnsi}",
+                         "size", size,
+                         "maxsize", litetuple_freelist_maxsize,
+                         "hits", fl->hits,
+                         "misses", fl->misses,
+                         "maxlength", LITETUPLE_MAXSAVESIZE);
+}
+
+PyDoc_STRVAR(litetuple_intern_clear_doc,
+"litetuple_intern_clear(unused=False) -- remove litetuples from the table of interned litetuples\n\
+and return the number of removed ones\n\n\
+If unused is true, only litetuples which are referenced by the table only are removed.");
+
+static PyObject *
+litetuple_intern_clear(PyObject *module, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"unused", NULL};
+    int unused = 0;
+    PyObject *key, *value, *garbage;
+    Py_ssize_t pos = 0, i, n;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|p:litetuple_intern_clear", kwlist, &unused))
+        return NULL;
+
+    if (litetuple_interned == NULL)
+        return PyLong_FromLong(0);
+
+    if (!unused) {
+        n = PyDict_GET_SIZE(litetuple_interned);
+        PyDict_Clear(litetuple_interned);
+        return PyLong_FromSsize_t(n);
+    }
+
+    garbage = PyList_New(0);
+    if (garbage == NULL)
+        return NULL;
+
+    /* the interned litetuple is the key and the value of the table */
+    while (PyDict_Next(litetuple_interned, &pos, &key, &value)) {
+        if (py_refcnt(key) == 2 && PyList_Append(garbage, key) < 0) {
+            Py_DECREF(garbage);
+            return NULL;
+        }
+    }
+
+    n = PyList_GET_SIZE(garbage);
+    for (i = 0; i < n; i++) {
+        if (PyDict_DelItem(litetuple_interned, PyList_GET_ITEM(garbage, i)) < 0) {
+            Py_DECREF(garbage);
+            return NULL;
+        }
+    }
+    Py_DECREF(garbage);
+
+    return PyLong_FromSsize_t(n);
+}
+
 static PyMethodDef litetuplemodule_methods[] = {
 //   {"getitem", get_item,     METH_VARARGS,   "__getitem__"},
-//   {"freeze", litetuple_freeze,     METH_VARARGS,   "freeze litetuple object (make it readonly and hashable)"},
+   {"litetuple_freelist", (PyCFunction)litetuple_freelist_set, METH_O, litetuple_freelist_doc},
+   {"litetuple_freelist_info", (PyCFunction)litetuple_freelist_info, METH_O, litetuple_freelist_info_doc},
+   {"litetuple_intern_clear", (PyCFunction)(void(*)(void))litetuple_intern_clear, METH_VARARGS | METH_KEYWORDS, litetuple_intern_clear_doc},
    {0, 0, 0, 0}
 };
 
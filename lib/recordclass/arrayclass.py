@@ -28,9 +28,16 @@ _intern = _sys.intern
 
 int_type = int
 
+_native_kinds = {int:b'q', float:b'd'}
+
 def make_arrayclass(typename, n_fields, *, namespace=None,
              use_weakref=False, hashable=False, readonly=False, gc=False,
-             module=None, immutable_type=False):
+             module=None, immutable_type=False, itemtype=None):
+    """Returns a new fixed size array-like class.
+
+    If `itemtype` is `int` or `float`, items are stored unboxed as int64 or double
+    and the instances support the buffer protocol (`memoryview(ob)`, `numpy.asarray(ob)`).
+    """
 
     from ._dataobject import dataobject
     from .datatype import datatype
@@ -49,6 +56,17 @@ def make_arrayclass(typename, n_fields, *, namespace=None,
 
     ns['__fields__'] = n_fields
 
+    native = False
+    if itemtype is not None:
+        kind = _native_kinds.get(itemtype, None)
+        if kind is None:
+            raise TypeError("itemtype should be int or float")
+        if gc:
+            raise TypeError("arrayclass with itemtype can not have gc=True")
+        native = True
+        ns['__native_kinds__'] = kind * n_fields
+        ns['__default_vals__'] = (itemtype(),) * n_fields
+
     def __repr__(_self):
         return typename + '(' + \
                ', '.join(repr(o) for o in _self) + ')'
@@ -67,6 +85,7 @@ def make_arrayclass(typename, n_fields, *, namespace=None,
     cls = datatype(typename, bases, ns,
                    use_dict=False, use_weakref=use_weakref, hashable=hashable,
                    sequence=True, mapping=False, iterable=True, readonly=readonly,
-                   gc=gc, fast_new=True, immutable_type=immutable_type)
+                   gc=gc, fast_new=True, immutable_type=immutable_type,
+                   native=native)
 
     return cls
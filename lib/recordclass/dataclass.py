@@ -35,7 +35,8 @@ def make_dataclass(typename, fields, defaults=None, *, bases=None, namespace=Non
                    use_dict=False, use_weakref=False, hashable=False,
                    sequence=False, mapping=False, iterable=False, readonly=False, invalid_names=(),
                    deep_dealloc=False, module=None, fast_new=True, rename=False, gc=False,
-                   immutable_type=False, copy_default=False, match=None):
+                   immutable_type=False, copy_default=False, match=None, native=False,
+                   cache_hash=False):
 
     """Returns a new class with named fields and small memory footprint.
 
@@ -89,7 +90,8 @@ def make_dataclass(typename, fields, defaults=None, *, bases=None, namespace=Non
                    use_dict=use_dict, use_weakref=use_weakref,
                    gc=gc, fast_new=fast_new,
                    hashable=hashable, immutable_type=immutable_type,
-                   copy_default=copy_default, match=match)
+                   copy_default=copy_default, match=match, native=native,
+                   cache_hash=cache_hash)
 
     return cls
 
@@ -109,24 +111,18 @@ def make_structclass(typename, fields, defaults=None, *, bases=(datastruct,), na
 
 class DataclassStorage:
     #
-    def __init__(self):
-        self._storage = {}
+    def __init__(self, maxsize=1024):
+        from .utils import ClassCache
+        self._storage = ClassCache(make_dataclass, maxsize)
     #
     def clear_storage(self):
         self._storage.clear()
     #
+    def storage_info(self):
+        return self._storage.info()
+    #
     def make_dataclass(self, name, fields, defaults=None, **kw):
-        if type(fields) is str:
-            fields = fields.replace(',', ' ').split()
-            fields = ' '.join(fn.strip() for fn in fields)
-        else:
-            fields = ' '.join(fields)
-        key = (name, fields)
-        cls = self._storage.get(key, None)
-        if cls is None:
-            cls = make_dataclass(name, fields, defaults, **kw)
-            self._storage[key] = cls
-        return cls
+        return self._storage(name, fields, defaults, **kw)
     make_class = make_dataclass
 
 def join_dataclasses(name, classes, *, readonly=False, use_dict=False, gc=False,
@@ -26,8 +26,11 @@ import sys as _sys
 _PY310 = _sys.version_info[:2] >= (3, 10)
 _PY311 = _sys.version_info[:2] >= (3, 11)
 
-import typing
 def _is_classvar(a_type):
+    # typing.ClassVar can't be used in annotations if typing is not imported yet
+    typing = _sys.modules.get('typing')
+    if typing is None:
+        return False
     return (a_type is typing.ClassVar
             or (type(a_type) is typing._GenericAlias
                 and a_type.__origin__ is typing.ClassVar))
@@ -46,9 +49,31 @@ _ds_ro_cache = {}
 
 MATCH = object()
 
+_protected_attrs = {'__fields__', '__defaults__', '__annotations__', '__fields_index__',
+                    '__native_kinds__', '__freelist__'}
+
 class Field(dict):
     pass
 
+_native_type_kinds = {int:'q', float:'d', 'int':'q', 'float':'d'}
+_native_zeros = {'q':0, 'd':0.0}
+
+def _native_kinds(fields, fields_dict):
+    from ._dataobject import Factory
+    kinds = []
+    for fn in fields:
+        fd = fields_dict[fn]
+        kind = fd.get('kind', None)
+        if kind is None:
+            kind = fd['kind'] = _native_type_kinds.get(fd.get('type', None), 'O')
+        if kind != 'O' and 'default' in fd:
+            val = fd['default']
+            if type(val) is not Factory and \
+               not isinstance(val, (int, float) if kind == 'd' else int):
+                raise TypeError(f"invalid default value {val!r} of the native field '{fn}'")
+        kinds.append(kind)
+    return ''.join(kinds).encode('ascii')
+
 class datatype(type):
     """
     Metatype for creating classes based on a dataobject.
@@ -57,7 +82,8 @@ class datatype(type):
                 gc=False, fast_new=True, readonly=False, iterable=False,
                 deep_dealloc=False, sequence=False, mapping=False,
                 use_dict=False, use_weakref=False, hashable=False,
-                immutable_type=False, copy_default=False, match=None):
+                immutable_type=False, copy_default=False, match=None,
+                native=False, freelist=0, arena=0, cache_hash=False):
 
         from recordclass.utils import check_name, collect_info_from_bases
         from recordclass._dataobject import dataobject, datastruct
@@ -89,6 +115,14 @@ class datatype(type):
             options['use_weakref'] = use_weakref
         if copy_default:
             options['copy_default'] = copy_default
+        if native:
+            options['native'] = native
+        if freelist:
+            options['freelist'] = freelist
+        if arena:
+            options['arena'] = arena
+        if cache_hash:
+            options['cache_hash'] = cache_hash
 
         if _PY311 and immutable_type:
             options['immutable_type'] = immutable_type
@@ -169,6 +203,8 @@ class datatype(type):
             hashable = True
         if hashable:
             options['hashable'] = hashable
+        if cache_hash and not readonly:
+            raise TypeError("cache_hash=True can be used only with readonly=True")
 
         if not _PY311 and immutable_type:
             import warnings
@@ -237,6 +273,7 @@ class datatype(type):
                 copy_default = options.get('copy_default', False)
                 gc = options.get('gc', False)
                 iterable = options.get('iterable', False)
+                native = options.get('native', False)
                 defaults_dict = {fn:fd['default'] for fn,fd in fields_dict.items() if 'default' in fd}
                 annotations = {fn:fd['type'] for fn,fd in fields_dict.items() if 'type' in fd}
 
@@ -263,9 +300,22 @@ class datatype(type):
         else:
             pass
 
+        if has_fields and native:
+            native_kinds = _native_kinds(fields, fields_dict)
+            if native_kinds.strip(b'O'):
+                ns['__native_kinds__'] = native_kinds
+            else:
+                native = False
+                del options['native']
+        elif '__native_kinds__' in ns:
+            native = options['native'] = True
+
         if has_fields:
             options['fields_dict'] = fields_dict
             default_vals = tuple([fields_dict[fn].get('default',None) for fn in fields])
+            if native:
+                default_vals = tuple([_native_zeros.get(kind, val) if fn not in defaults_dict else val
+                                      for fn, kind, val in zip(fields, native_kinds.decode(), default_vals)])
             ns['__fields__'] = fields
             ns['__defaults__'] = defaults_dict
             ns['__default_vals__'] = default_vals
@@ -293,6 +343,10 @@ class datatype(type):
             for i, name in enumerate(fields):
                 fd = fields_dict[name]
                 fd_readonly = fd.get('readonly', False)
+                kind = fd.get('kind', 'O')
+                if kind != 'O':
+                    ns[name] = dataobjectproperty(i, fd_readonly, kind)
+                    continue
                 if fd_readonly:
                     ds = _ds_ro_cache.get(i, None)
                 else:
@@ -310,7 +364,10 @@ class datatype(type):
             for i, name in enumerate(fields):
                 fd = fields_dict[name]
                 fd_readonly = fd.get('readonly', False)
-                if fd_readonly:
+                kind = fd.get('kind', 'O')
+                if kind != 'O':
+                    ds = dataobjectproperty(i, fd_readonly, kind)
+                elif fd_readonly:
                     ds = member_new(cls, name, i, 1)
                 else:
                     ds = member_new(cls, name, i, 0)
@@ -320,6 +377,8 @@ class datatype(type):
                           hashable=hashable, iterable=iterable, use_dict=use_dict,
                           use_weakref=use_weakref, gc=gc, deep_dealloc=deep_dealloc,
                           immutable_type=immutable_type, copy_default=copy_default,
+                          native=native, freelist=freelist, arena=arena,
+                          cache_hash=cache_hash,
                          )
 
         return cls
@@ -327,7 +386,8 @@ class datatype(type):
     def __configure__(cls,  gc=False, fast_new=True, readonly=False, iterable=False,
                             deep_dealloc=False, sequence=False, mapping=False,
                             use_dict=False, use_weakref=False, hashable=False,
-                            mapping_only=False, immutable_type=False, copy_default=False):
+                            mapping_only=False, immutable_type=False, copy_default=False,
+                            native=False, freelist=0, arena=0, cache_hash=False):
 
         import recordclass._dataobject as _dataobject
         from .utils import _have_pyinit, _have_pynew
@@ -369,10 +429,17 @@ class datatype(type):
             _dataobject._datatype_enable_gc(cls)
         if deep_dealloc:
             _dataobject._datatype_deep_dealloc(cls)
+        if native:
+            _dataobject._datatype_native(cls)
+            _dataobject._datatype_buffer(cls, bool(readonly))
         if not copy_default and not is_pyinit and not is_pynew:
             _dataobject._datatype_vectorcall(cls)
         if copy_default and not is_pyinit and not is_pynew:
             _dataobject._datatype_copy_default(cls)
+        if cache_hash:
+            _dataobject._datatype_cache_hash(cls)
+        if freelist or arena:
+            _dataobject._datatype_freelist(cls, freelist, arena)
         if _PY311 and immutable_type:
             _dataobject._datatype_immutable(cls)
         _dataobject._pytype_modified(cls)
@@ -381,12 +448,16 @@ class datatype(type):
         from ._dataobject import dataobjectproperty
         if name in cls.__dict__:
             o = getattr(cls, name)
-            if type(o) is dataobjectproperty or name in {'__fields__', '__defaults__', '__annotations__'}:
+            if type(o) is dataobjectproperty or name in _protected_attrs or name == '__freelist_size__':
                 raise AttributeError(f"Attribute {name} of the class {cls.__name__} can't be deleted")
         type.__delattr__(cls, name)
 
     def __setattr__(cls, name, ob):
-        if name in {'__fields__', '__defaults__', '__annotations__'}:
+        if name == '__freelist_size__':
+            from ._dataobject import _datatype_freelist
+            _datatype_freelist(cls, ob)
+            return
+        if name in _protected_attrs:
             raise AttributeError(f"Attribute {name} of the class {cls.__name__} can't be modified")
         type.__setattr__(cls, name, ob)
 
@@ -40,7 +40,7 @@ def make_dictclass(typename, keys, defaults=None, *, bases=None, namespace=None,
     from .datatype import datatype
     import sys as _sys
 
-    keys, annotations, defaults = process_fields(keys, defaults, False, ())
+    keys, annotations, defaults, _ = process_fields(keys, defaults, False, ())
     typename = check_name(typename)
 
     if namespace is None:
@@ -119,21 +119,15 @@ def make_dictclass(typename, keys, defaults=None, *, bases=None, namespace=None,
 
 class DictclassStorage:
     #
-    def __init__(self):
-        self._storage = {}
+    def __init__(self, maxsize=1024):
+        from .utils import ClassCache
+        self._storage = ClassCache(make_dictclass, maxsize)
     #
     def clear_storage(self):
         self._storage.clear()
     #
+    def storage_info(self):
+        return self._storage.info()
+    #
     def make_dictclass(self, name, keys, defaults=None, **kw):
-        if type(keys) is str:
-            keys = keys.replace(',', ' ').split()
-            keys = ' '.join(fn.strip() for fn in keys)
-        else:
-            keys = ' '.join(keys)
-        key = (name, keys)
-        cls = self._storage.get(key, None)
-        if cls is None:
-            cls = make_dictclass(name, keys, defaults, **kw)
-            self._storage[key] = cls
-        return cls
+        return self._storage(name, keys, defaults, **kw)
@@ -0,0 +1,115 @@
+# The MIT License (MIT)
+
+# Copyright (c) «2026» «Shibzukhov Zaur, szport at gmail dot com»
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software - recordclass library - and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom
+# the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""Flyweight pool of instances of readonly dataobject-based classes.
+
+>>> class Pair(dataobject, readonly=True, use_weakref=True):
+...     base: str
+...     quote: str
+>>> pool = InternPool(Pair)
+>>> pool('EUR', 'USD') is pool('EUR', 'USD')
+True
+"""
+
+from weakref import ref as _ref
+
+from ._dataobject import dataobject
+
+__all__ = 'InternPool',
+
+class InternPool:
+    """Weak-valued pool of canonical instances of the readonly class.
+
+    Equal instances are replaced by the one instance that is kept in the pool
+    while it is referenced elsewhere. The instances are compared by the hash
+    and `==` of the class, so the class should be readonly and should support
+    weak references (`readonly=True, use_weakref=True`).
+    """
+    __slots__ = 'cls', 'hits', 'misses', '_pool', '_remove'
+
+    def __init__(self, cls):
+        if not isinstance(cls, type) or not issubclass(cls, dataobject):
+            raise TypeError("%r is not a subclass of dataobject" % cls)
+        options = cls.__options__
+        if not options.get('readonly', False):
+            raise TypeError("class %r should be readonly" % cls.__name__)
+        if not cls.__weakrefoffset__:
+            raise TypeError("class %r should support weak references (use_weakref=True)" % cls.__name__)
+
+        self.cls = cls
+        self.hits = 0
+        self.misses = 0
+        self._pool = pool = {}
+
+        def remove(wr, _pool=pool):
+            # the hash of the dead reference is cached and it is equal only to itself
+            _pool.pop(wr, None)
+        self._remove = remove
+
+    def _intern(self, ob):
+        wr = self._pool.get(_ref(ob))
+        if wr is not None:
+            canonical = wr()
+            if canonical is not None:
+                self.hits += 1
+                return canonical
+        wr = _ref(ob, self._remove)
+        self._pool[wr] = wr
+        self.misses += 1
+        return ob
+
+    def intern(self, ob):
+        "Return the canonical instance which is equal to the given one"
+        if type(ob) is not self.cls:
+            raise TypeError("expected an instance of %r" % self.cls.__name__)
+        return self._intern(ob)
+
+    def __call__(self, *args, **kw):
+        "Create the instance (as `cls(*args, **kw)`) and return the canonical one"
+        return self._intern(self.cls(*args, **kw))
+
+    def __len__(self):
+        return len(self._pool)
+
+    def __contains__(self, ob):
+        if type(ob) is not self.cls:
+            return False
+        wr = self._pool.get(_ref(ob))
+        return wr is not None and wr() is not None
+
+    def __iter__(self):
+        for wr in list(self._pool):
+            ob = wr()
+            if ob is not None:
+                yield ob
+
+    def clear(self):
+        "Remove all instances from the pool"
+        self._pool.clear()
+
+    def info(self):
+        "Return the dict with the size of the pool and the counters of hits and misses"
+        return {'size': len(self._pool), 'hits': self.hits, 'misses': self.misses}
+
+    def __repr__(self):
+        return "InternPool(%s, <%s instances>)" % (self.cls.__qualname__, len(self._pool))
@@ -0,0 +1,215 @@
+# The MIT License (MIT)
+
+# Copyright (c) «2026» «Shibzukhov Zaur, szport at gmail dot com»
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software - recordclass library - and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom
+# the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""Deep memory accounting of graphs of dataobject-based instances.
+
+>>> class Point(dataobject):
+...     x: int
+...     y: int
+>>> report = memory_report([Point(1, 2), Point(3, 4)])
+>>> report.types[Point]
+[2, 64]
+>>> report.fields[Point, 'x']
+56
+"""
+
+from sys import getsizeof as _getsizeof
+from types import ModuleType, FunctionType, BuiltinFunctionType, MethodType
+
+from ._dataobject import dataobject, datastruct, astuple, _instance_dict
+from ._litelist import litelist, litearray
+from ._litetuple import litetuple, mutabletuple
+from .utils import headgc_size, ref_size
+
+__all__ = 'memory_report', 'MemoryReport'
+
+_Py_TPFLAGS_HAVE_GC = 1 << 14
+_NATIVE_OBJECT = ord('O')
+
+_atomic_types = {int, float, complex, str, bytes, bool, type(None)}
+_singletons = {id(None), id(True), id(False), id(Ellipsis), id(NotImplemented)}
+_sequence_types = (list, tuple, set, frozenset, litelist, litetuple, mutabletuple)
+
+try:
+    from ._linkedlist import linkedlist as _linkedlist, chunkedlist as _chunkedlist
+    # the size of chunkedlist includes its chunks
+    _sequence_types += (_chunkedlist,)
+except ImportError:
+    _linkedlist = None
+
+# classes, modules and functions are not the part of the data
+_skipped_types = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+class MemoryReport:
+    """Result of `memory_report(root)`.
+
+    * `total` -- total size in bytes of the objects reachable from the root;
+    * `count` -- number of these objects;
+    * `shared` -- number of objects reached more than once;
+    * `types` -- dict `{type: [count, size]}`;
+    * `fields` -- dict `{(cls, field_name): size}` with the size of the objects
+      which were reached first through the field of instances of the class
+      (objects behind nested instances are counted by the fields of their classes);
+    * `savings` -- dict `{(cls, option): size}` with the estimation of memory
+      which can be saved by switching the option of the class
+      (`gc=False`, `use_dict=False`, `use_weakref=False`) and by calling
+      `shrink_to_fit()` of litelists and litearrays.
+    """
+    __slots__ = 'total', 'count', 'shared', 'types', 'fields', 'savings'
+
+    def __init__(self):
+        self.total = 0
+        self.count = 0
+        self.shared = 0
+        self.types = {}
+        self.fields = {}
+        self.savings = {}
+
+    def _add(self, tp, size, count=1):
+        self.total += size
+        self.count += count
+        info = self.types.get(tp)
+        if info is None:
+            self.types[tp] = [count, size]
+        else:
+            info[0] += count
+            info[1] += size
+
+    def _add_saving(self, cls, option, size):
+        key = cls, option
+        self.savings[key] = self.savings.get(key, 0) + size
+
+    def __repr__(self):
+        return "<MemoryReport: %s objects, %s bytes>" % (self.count, self.total)
+
+    def __str__(self):
+        lines = ["total: %s bytes in %s objects (%s shared)" % (self.total, self.count, self.shared)]
+        lines.append("by type:")
+        for tp, (count, size) in sorted(self.types.items(), key=lambda item: -item[1][1]):
+            lines.append("  %-32s %12s %14s" % (tp.__qualname__, count, size))
+        if self.fields:
+            lines.append("by field:")
+            for (cls, name), size in sorted(self.fields.items(), key=lambda item: -item[1]):
+                lines.append("  %-32s %27s" % (cls.__qualname__ + '.' + name, size))
+        if self.savings:
+            lines.append("possible savings:")
+            for (cls, option), size in sorted(self.savings.items(), key=lambda item: -item[1]):
+                lines.append("  %-32s %27s" % (cls.__qualname__ + ': ' + option, size))
+        return "\n".join(lines)
+
+def _dataobject_children(ob, cls, report, push):
+    if cls.__flags__ & _Py_TPFLAGS_HAVE_GC:
+        report._add_saving(cls, 'gc=False', headgc_size)
+    if cls.__weakrefoffset__:
+        report._add_saving(cls, 'use_weakref=False', ref_size)
+    if cls.__dictoffset__:
+        d = _instance_dict(ob)
+        if d is None:
+            report._add_saving(cls, 'use_dict=False', ref_size)
+        else:
+            # attributes from __dict__ would be stored in the fields
+            report._add_saving(cls, 'use_dict=False',
+                               _getsizeof(d) + ref_size - len(d) * ref_size)
+            push(d, (cls, '__dict__'))
+
+    fields = cls.__fields__
+    kinds = getattr(cls, '__native_kinds__', None)
+    values = astuple(ob)
+    if type(fields) is tuple:
+        names = fields
+    else:
+        names = ['[%s]' % i for i in range(len(values))]
+    # the stack is LIFO: fields are pushed in the reversed order,
+    # so the objects are reached first through the first fields
+    for i in range(len(values)-1, -1, -1):
+        # values of native fields are stored unboxed
+        if kinds is None or kinds[i] == _NATIVE_OBJECT:
+            push(values[i], (cls, names[i]))
+
+def memory_report(root):
+    """Walk the graph of objects reachable from the root and return `MemoryReport`.
+
+    The walker follows fields of dataobject-based instances (except unboxed
+    native fields), items of `litelist`, `litetuple`, `mutabletuple`, `linkedlist`,
+    `chunkedlist`, `list`, `tuple`, `set`, `frozenset` and keys and values of `dict`.
+    Other objects are counted by `sys.getsizeof` but not traversed. Classes, modules,
+    functions and singletons (`None`, `True`, `False`) are not counted. Every
+    object is counted once even if it is referenced from several places.
+    """
+    report = MemoryReport()
+    fields = report.fields
+    # objects are kept alive while walking, so their ids are not reused
+    seen = {}
+    stack = [(root, None)]
+
+    def push(ob, owner):
+        stack.append((ob, owner))
+
+    while stack:
+        ob, owner = stack.pop()
+        oid = id(ob)
+        if oid in _singletons:
+            continue
+        if oid in seen:
+            if seen[oid][1] == 1:
+                report.shared += 1
+            seen[oid][1] += 1
+            continue
+        seen[oid] = [ob, 1]
+        if isinstance(ob, _skipped_types):
+            continue
+
+        tp = type(ob)
+        size = _getsizeof(ob)
+
+        if tp in _atomic_types:
+            pass
+        elif isinstance(ob, litearray):
+            if ob.capacity > len(ob):
+                report._add_saving(tp, 'shrink_to_fit()', (ob.capacity - len(ob)) * ob.itemsize)
+        elif isinstance(ob, (dataobject, datastruct)):
+            _dataobject_children(ob, tp, report, push)
+        elif isinstance(ob, _sequence_types):
+            if isinstance(ob, litelist) and ob.capacity > len(ob):
+                report._add_saving(tp, 'shrink_to_fit()', (ob.capacity - len(ob)) * ref_size)
+            stack.extend([(val, owner) for val in reversed(list(ob))])
+        elif isinstance(ob, dict):
+            for key, val in reversed(list(ob.items())):
+                push(val, owner)
+                push(key, owner)
+        elif _linkedlist is not None and isinstance(ob, _linkedlist):
+            items = list(ob)
+            n = len(items)
+            stack.extend([(val, owner) for val in reversed(items)])
+            if n:
+                node = ob.start
+                node_size = n * _getsizeof(node)
+                report._add(type(node), node_size, n)
+                if owner is not None:
+                    fields[owner] = fields.get(owner, 0) + node_size
+
+        report._add(tp, size)
+        if owner is not None:
+            fields[owner] = fields.get(owner, 0) + size
+
+    return report
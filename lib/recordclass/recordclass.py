@@ -26,41 +26,13 @@ from .datatype import datatype
 from ._dataobject import dataobject
 
 def _add_namedtuple_api(typename, readonly):
-    from ._dataobject import astuple, asdict
+    # _make, _replace and _asdict are implemented in C:
+    # _replace of the readonly class copies the fields and patches them by index
+    from ._dataobject import _nt_make, _nt_replace, _nt_replace_readonly, _nt_asdict
 
-    def _make(_cls, iterable):
-        ob = _cls(*iterable)
-        return ob
-
-    _make.__doc__ = f'Make a new {typename} object from a sequence or iterable'
-
-    if readonly:
-        def _replace(_self, **kwds):
-            result = _self._make(map(kwds.pop, _self.__fields__, _self))
-            if kwds:
-                kwnames = tuple(kwds)
-                raise AttributeError(f'Got unexpected field names: {kwnames}')
-            return result
-    else:
-        def _replace(_self, **kwds):
-            for name, val in kwds.items():
-                setattr(_self, name, val)
-            return _self
-
-    _replace.__doc__ = f'Return a new {typename} object replacing specified fields with new values'
-
-    def _asdict(self):
-        'Return a new dict which maps field names to their values.'
-        return asdict(self)
-
-    for method in (_make, _replace, _asdict,):
-        method.__qualname__ = typename + "." + method.__name__
-
-    _make = classmethod(_make)
-
-    ns = { '_make': _make,
-           '_replace': _replace,
-           '_asdict': _asdict
+    ns = { '_make': _nt_make,
+           '_replace': _nt_replace_readonly if readonly else _nt_replace,
+           '_asdict': _nt_asdict
          }
     return ns
 
@@ -114,22 +86,16 @@ def recordclass(typename, fields, defaults=None, *,
 
 class RecordclassStorage:
     #
-    def __init__(self):
-        self._storage = {}
+    def __init__(self, maxsize=1024):
+        from .utils import ClassCache
+        self._storage = ClassCache(recordclass, maxsize)
     #
     def clear_storage(self):
         self._storage.clear()
     #
+    def storage_info(self):
+        return self._storage.info()
+    #
     def recordclass(self, name, fields, defaults=None, **kw):
-        if type(fields) is str:
-            fields = fields.replace(',', ' ').split()
-            fields = ' '.join(fn.strip() for fn in fields)
-        else:
-            fields = ' '.join(fields)
-        key = (name, fields)
-        cls = self._storage.get(key, None)
-        if cls is None:
-            cls = recordclass(name, fields, defaults, **kw)
-            self._storage[key] = cls
-        return cls
+        return self._storage(name, fields, defaults, **kw)
 
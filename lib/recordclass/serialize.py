@@ -0,0 +1,310 @@
+# The MIT License (MIT)
+
+# Copyright (c) «2026» «Shibzukhov Zaur, szport at gmail dot com»
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software - recordclass library - and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom
+# the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+"""Compact serialization of the graphs of dataobject-based instances.
+
+Lists (and litelists) of instances of the same class are stored as a batch:
+the class and its fields are written once and the instances as rows of values.
+Instances which are referenced elsewhere in the graph and instances of the classes
+with their own pickling methods are not batched. All other objects are stored by
+the pickle machinery, so shared references are preserved. Instances with cyclic references are created first and then filled
+with the values of the fields. As with pickle, only trusted data should be loaded.
+
+>>> class Point(dataobject):
+...     x: int
+...     y: int
+>>> data = dumps([Point(1, 2), Point(3, 4)])
+>>> loads(data)
+[Point(x=1, y=2), Point(x=3, y=4)]
+"""
+
+import pickle as _pickle
+import copyreg as _copyreg
+from io import BytesIO as _BytesIO
+from collections import Counter as _Counter
+from itertools import chain as _chain
+from gc import get_referents as _get_referents
+from types import FunctionType, BuiltinFunctionType, ModuleType
+
+from ._dataobject import dataobject, astuple, astuple_many, make
+from ._dataobject import _native_pack, _native_unpack
+from ._litelist import litelist
+
+__all__ = 'dumps', 'loads', 'dump', 'load', 'RecordBatch'
+
+MAGIC = b'RCB\x01'
+
+_atomic_types = {int, float, complex, str, bytes, bool, type(None)}
+
+# objects which are pickled by reference
+_global_types = (type, FunctionType, BuiltinFunctionType, ModuleType)
+
+_pickle_methods = '__reduce__', '__reduce_ex__', '__getstate__', '__setstate__'
+
+def _default_pickling(cls):
+    # the class uses the pickling methods of dataobject
+    if cls in _copyreg.dispatch_table:
+        return False
+    for name in _pickle_methods:
+        if getattr(cls, name, None) is not getattr(dataobject, name, None):
+            return False
+    return True
+
+def _plain_class(cls):
+    # instances of the class can be stored by the values of the fields
+    return issubclass(cls, dataobject) and type(cls.__fields__) is tuple \
+           and not cls.__options__.get('use_dict', False) \
+           and _default_pickling(cls)
+
+class _RecordRows:
+    #
+    __slots__ = 'cls', 'rows', 'container'
+    #
+    def __init__(self, cls, rows, container):
+        self.cls = cls
+        self.rows = rows
+        self.container = container
+    #
+    def __reduce__(self):
+        cls = self.cls
+        return _load_rows, (cls, cls.__fields__, self.rows, self.container)
+
+def _load_rows(cls, fields, rows, container):
+    if cls.__fields__ != fields:
+        raise TypeError("fields of %r have been changed" % cls.__name__)
+    lst = cls.from_rows(rows)
+    if container is list:
+        return lst
+    return container(lst)
+
+def _new_instance(cls):
+    # an instance without calling of __new__/__init__ of the class
+    return make(cls, ())
+
+def _reduce_dataobject(ob):
+    # the state is set after the instance is memoized, so cycles are allowed
+    return _new_instance, (type(ob),), astuple(ob)
+
+class _DispatchTable(dict):
+    #
+    def __missing__(self, cls):
+        reduce = _copyreg.dispatch_table.get(cls, None)
+        if reduce is None:
+            if _plain_class(cls):
+                reduce = _reduce_dataobject
+            else:
+                raise KeyError(cls)
+        self[cls] = reduce
+        return reduce
+
+def _scan(ob):
+    # Count the references to the objects of the graph. Objects which are
+    # reachable through the fields of the instances or through other objects
+    # are pickled as is, they are collected in `hidden` and are not packed.
+    # The values of the instances of the lists are collected in `batches`.
+    refs = _Counter()
+    hidden = set()
+    batches = {}
+    stack = [(ob, False)]
+    pop, push, extend = stack.pop, stack.append, stack.extend
+    while stack:
+        ob, is_hidden = pop()
+        tp = type(ob)
+        if tp in _atomic_types or isinstance(ob, _global_types):
+            continue
+        oid = id(ob)
+        n = refs[oid]
+        refs[oid] = n + 1
+        if is_hidden:
+            if oid in hidden:
+                continue
+            hidden.add(oid)
+        elif n:
+            continue
+
+        if tp is list or tp is litelist:
+            cls = _batch_class(ob)
+            if cls is not None:
+                refs.update(map(id, ob))
+                rows = batches[oid] = astuple_many(ob)
+                values = _chain.from_iterable(rows)
+                if not set(map(type, values)) <= _atomic_types:
+                    values = _chain.from_iterable(rows)
+                    extend([(v, True) for v in values if type(v) not in _atomic_types])
+                continue
+            if set(map(type, ob)) <= _atomic_types:
+                continue
+            extend([(v, is_hidden or tp is litelist) for v in ob])
+        elif tp is tuple:
+            extend([(v, is_hidden) for v in ob])
+        elif tp is dict:
+            extend([(v, True) for v in ob])
+            extend([(v, is_hidden) for v in ob.values()])
+        elif isinstance(ob, dataobject):
+            extend([(v, True) for v in astuple(ob)])
+            if tp.__options__.get('use_dict', False):
+                push((ob.__dict__, True))
+        else:
+            extend([(v, True) for v in _get_referents(ob)])
+    return refs, hidden, batches
+
+def _batch_class(lst):
+    # the class of the instances if the list can be stored as a batch
+    if not lst:
+        return None
+    types = set(map(type, lst))
+    if len(types) != 1:
+        return None
+    cls = types.pop()
+    if not _plain_class(cls):
+        return None
+    return cls
+
+def _pack(ob, memo, refs, hidden, batches):
+    tp = type(ob)
+    if tp in _atomic_types:
+        return ob
+
+    oid = id(ob)
+    if oid in hidden:
+        return ob
+    packed = memo.get(oid)
+    if packed is not None:
+        return packed[1]
+
+    if tp is list or tp is litelist:
+        cls = _batch_class(ob)
+        # instances that are referenced elsewhere keep their identity
+        # only if they are pickled one by one
+        if cls is not None and max(map(refs.__getitem__, map(id, ob))) == 1:
+            packed = _RecordRows(cls, batches[oid], tp)
+            memo[oid] = ob, packed
+            return packed
+        if set(map(type, ob)) <= _atomic_types:
+            memo[oid] = ob, ob
+            return ob
+        if tp is list:
+            packed = []
+            memo[oid] = ob, packed
+            packed.extend([_pack(v, memo, refs, hidden, batches) for v in ob])
+            return packed
+        return ob
+    elif tp is tuple:
+        packed = tuple([_pack(v, memo, refs, hidden, batches) for v in ob])
+        memo[oid] = ob, packed
+        return packed
+    elif tp is dict:
+        packed = {}
+        memo[oid] = ob, packed
+        for key, val in ob.items():
+            packed[key] = _pack(val, memo, refs, hidden, batches)
+        return packed
+    return ob
+
+def _dumps(ob, protocol):
+    refs, hidden, batches = _scan(ob)
+    packed = _pack(ob, {}, refs, hidden, batches)
+    try:
+        return _pickle.dumps(packed, protocol)
+    except RecursionError:
+        # instances with cyclic references: they are created before
+        # the values of the fields are set
+        file = _BytesIO()
+        pickler = _pickle.Pickler(file, protocol)
+        pickler.dispatch_table = _DispatchTable()
+        pickler.dump(packed)
+        return file.getvalue()
+
+def dumps(ob, protocol=_pickle.HIGHEST_PROTOCOL):
+    "Return the serialized representation of the object as a bytes object"
+    return MAGIC + _dumps(ob, protocol)
+
+def loads(data):
+    "Return the object reconstructed from the serialized representation"
+    data = memoryview(data)
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError("invalid header of the serialized data")
+    return _pickle.loads(data[len(MAGIC):])
+
+def dump(ob, file, protocol=_pickle.HIGHEST_PROTOCOL):
+    "Write the serialized representation of the object to the binary file"
+    file.write(MAGIC + _dumps(ob, protocol))
+
+def load(file):
+    "Read the serialized representation of the object from the binary file"
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("invalid header of the serialized data")
+    return _pickle.load(file)
+
+class RecordBatch(list):
+    """List of instances of the same dataobject-based class which is pickled
+    as the class and one block of values of the fields.
+
+    Values of the classes with only native int/float fields are packed into one
+    contiguous buffer, which is passed as `pickle.PickleBuffer` with protocol 5
+    (out-of-band if the pickler has `buffer_callback`). For other classes the
+    values are pickled as rows.
+
+    >>> batch = RecordBatch(Point, [Point(1, 2), Point(3, 4)])
+    >>> pickle.loads(pickle.dumps(batch))
+    RecordBatch(Point, [Point(x=1, y=2), Point(x=3, y=4)])
+    """
+    __slots__ = 'cls',
+
+    def __init__(self, cls, records=()):
+        if not isinstance(cls, type) or not issubclass(cls, dataobject):
+            raise TypeError("%r is not a subclass of dataobject" % cls)
+        if type(cls.__fields__) is not tuple:
+            raise TypeError("class %r has no named fields" % cls.__name__)
+        if cls.__options__.get('use_dict', False):
+            raise TypeError("class %r with __dict__ is not supported" % cls.__name__)
+        list.__init__(self, records)
+        self.cls = cls
+
+    def __reduce_ex__(self, protocol):
+        cls = self.cls
+        if self and set(map(type, self)) != {cls}:
+            raise TypeError("expected instances of %r" % cls.__name__)
+        kinds = cls.__dict__.get('__native_kinds__', None)
+        if kinds is not None and b'O' not in kinds:
+            data = _native_pack(cls, self)
+            if protocol >= 5:
+                data = _pickle.PickleBuffer(data)
+            return _load_native_batch, (cls, cls.__fields__, kinds, data)
+        return _load_batch, (cls, cls.__fields__, astuple_many(self))
+
+    def __repr__(self):
+        return "RecordBatch(%s, %s)" % (self.cls.__qualname__, list.__repr__(self))
+
+def _load_native_batch(cls, fields, kinds, data):
+    if cls.__fields__ != fields or cls.__dict__.get('__native_kinds__', None) != kinds:
+        raise TypeError("fields of %r have been changed" % cls.__name__)
+    batch = RecordBatch(cls)
+    list.extend(batch, _native_unpack(cls, data))
+    return batch
+
+def _load_batch(cls, fields, rows):
+    if cls.__fields__ != fields:
+        raise TypeError("fields of %r have been changed" % cls.__name__)
+    batch = RecordBatch(cls)
+    list.extend(batch, cls.from_rows(rows))
+    return batch
@@ -0,0 +1,184 @@
+# The MIT License (MIT)
+
+# Copyright (c) «2026» «Shibzukhov Zaur, szport at gmail dot com»
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software - recordclass library - and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom
+# the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+from array import array as _array
+
+from ._dataobject import dataobject, astuple
+
+__all__ = 'RecordTable',
+
+_typecodes = {int:'q', float:'d', 'int':'q', 'float':'d'}
+_pytypes = {'q':int, 'd':float}
+
+def _make_column(tp):
+    typecode = _typecodes.get(tp)
+    if typecode is None:
+        return []
+    return _array(typecode)
+
+def _column_append(columns, i, val):
+    col = columns[i]
+    if type(col) is not list:
+        if type(val) is _pytypes[col.typecode]:
+            try:
+                col.append(val)
+                return
+            except OverflowError:
+                pass
+        # the value doesn't fit into the typed column: fall back to the list
+        col = columns[i] = col.tolist()
+    col.append(val)
+
+def _column_set(columns, i, index, val):
+    col = columns[i]
+    if type(col) is not list:
+        if type(val) is _pytypes[col.typecode]:
+            try:
+                col[index] = val
+                return
+            except OverflowError:
+                pass
+        col = columns[i] = col.tolist()
+    col[index] = val
+
+class RecordTable:
+    """Columnar (struct-of-arrays) container for instances of a dataobject-based class.
+
+    Values of every field are kept in a separate column: `array.array` for fields
+    annotated as `int` or `float` and `list` for others. Instances of the class are
+    materialized only on row access.
+
+    >>> class Point(dataobject):
+    ...     x: int
+    ...     y: int
+    >>> table = RecordTable(Point, [Point(1,2), Point(3,4)])
+    >>> table[1]
+    Point(x=3, y=4)
+    >>> table.column('x')
+    array('q', [1, 3])
+    """
+    __slots__ = 'cls', 'fields', '_columns', '_index'
+
+    def __init__(self, cls, records=None):
+        if not isinstance(cls, type) or not issubclass(cls, dataobject):
+            raise TypeError("%r is not a subclass of dataobject" % cls)
+        fields = cls.__fields__
+        if type(fields) is not tuple:
+            raise TypeError("class %r has no named fields" % cls.__name__)
+        if getattr(cls, '__options__', {}).get('use_dict', False):
+            raise TypeError("class %r with __dict__ is not supported" % cls.__name__)
+
+        annotations = cls.__annotations__
+        self.cls = cls
+        self.fields = fields
+        self._columns = [_make_column(annotations.get(fn)) for fn in fields]
+        self._index = {fn:i for i, fn in enumerate(fields)}
+        if records is not None:
+            self.extend(records)
+
+    def _append_values(self, values):
+        columns = self._columns
+        for i, val in enumerate(values):
+            _column_append(columns, i, val)
+
+    def append(self, ob):
+        "Append the instance as a new row"
+        if type(ob) is not self.cls:
+            raise TypeError("expected an instance of %r" % self.cls.__name__)
+        self._append_values(astuple(ob))
+
+    def extend(self, records):
+        "Append instances from the iterable as new rows"
+        for ob in records:
+            self.append(ob)
+
+    def add(self, *args, **kw):
+        "Append a new row from the values of the fields (like `cls(*args, **kw)`)"
+        if kw or len(args) != len(self.fields):
+            # let the class process defaults and keyword arguments
+            args = astuple(self.cls(*args, **kw))
+        self._append_values(args)
+
+    def column(self, name):
+        """Return the storage of the column with the given field name:
+        `array.array` for `int`/`float` fields and `list` for others.
+        The column should not be resized directly."""
+        return self._columns[self._index[name]]
+
+    def row(self, index):
+        "Return values of the row as a tuple"
+        return tuple([col[index] for col in self._columns])
+
+    def clear(self):
+        "Remove all rows"
+        for col in self._columns:
+            del col[:]
+
+    def __len__(self):
+        columns = self._columns
+        if columns:
+            return len(columns[0])
+        return 0
+
+    def __getitem__(self, index):
+        if type(index) is slice:
+            table = RecordTable.__new__(RecordTable)
+            table.cls = self.cls
+            table.fields = self.fields
+            table._index = self._index
+            table._columns = [col[index] for col in self._columns]
+            return table
+        return self.cls(*[col[index] for col in self._columns])
+
+    def __setitem__(self, index, ob):
+        if type(ob) is not self.cls:
+            raise TypeError("expected an instance of %r" % self.cls.__name__)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("index out of range")
+        columns = self._columns
+        for i, val in enumerate(astuple(ob)):
+            _column_set(columns, i, index, val)
+
+    def __delitem__(self, index):
+        for col in self._columns:
+            del col[index]
+
+    def __iter__(self):
+        return map(self.cls, *self._columns)
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + sum(col.__sizeof__() for col in self._columns)
+
+    def __reduce__(self):
+        return _rebuild_table, (self.cls, self.fields, self._columns)
+
+    def __repr__(self):
+        return "RecordTable(%s, <%s rows>)" % (self.cls.__qualname__, len(self))
+
+def _rebuild_table(cls, fields, columns):
+    if cls.__fields__ != fields:
+        raise TypeError("fields of %r have been changed" % cls.__name__)
+    table = RecordTable(cls)
+    table._columns = columns
+    return table
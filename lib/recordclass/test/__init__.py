@@ -4,7 +4,14 @@ from recordclass.test.test_recordclass import *
 from recordclass.test.test_arrayclass import *
 from recordclass.test.test_dataobject import *
 from recordclass.test.test_litelist import *
+from recordclass.test.test_litearray import *
+from recordclass.test.test_linkedlist import *
 from recordclass.test.test_litetuple import *
+from recordclass.test.test_table import *
+from recordclass.test.test_serialize import *
+from recordclass.test.test_intern import *
+from recordclass.test.test_memory import *
+from recordclass.test.test_lru_cache import *
 
 import sys
 _PY310 = sys.version_info[:2] >= (3, 10)
@@ -3,6 +3,7 @@ import sys
 import gc
 import weakref
 import pickle, copy
+import struct
 
 from recordclass import make_arrayclass, datatype
 # from recordclass.utils import headgc_size, ref_size, pyobject_size, pyvarobject_size, pyssize
@@ -186,6 +187,30 @@ class arrayobjectTest(unittest.TestCase):
                 q = loads(tmp)
                 self.assertEqual(p, q)
 
+    def test_itemtype_buffer(self):
+        V = make_arrayclass("V", 3, itemtype=float)
+        v = V(1, 2)
+        self.assertEqual(v, V(1.0, 2.0, 0.0))
+        self.assertEqual(sys.getsizeof(v), sys.getsizeof(make_arrayclass("A", 3)(1, 2, 3)))
+        m = memoryview(v)
+        self.assertEqual((m.format, m.itemsize, m.shape, m.strides), ('d', 8, (3,), (8,)))
+        self.assertEqual(m.tolist(), [1.0, 2.0, 0.0])
+        m[2] = 3.5
+        self.assertEqual(v[2], 3.5)
+        self.assertEqual(m.tobytes(), struct.pack('3d', 1, 2, 3.5))
+        m.release()
+        I = make_arrayclass("I", 2, itemtype=int, readonly=True)
+        m = memoryview(I(-1, 2**40))
+        self.assertTrue(m.readonly)
+        self.assertEqual(m.format, 'q')
+        self.assertEqual(m.tolist(), [-1, 2**40])
+        with self.assertRaises(TypeError):
+            V(1, 'a')
+        with self.assertRaises(TypeError):
+            make_arrayclass("S", 3, itemtype=str)
+        with self.assertRaises(TypeError):
+            memoryview(make_arrayclass("A", 3)(1, 2, 3))
+
 def main():
     suite = unittest.TestSuite()
     suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(arrayobjectTest))
@@ -3,11 +3,14 @@ import pickle, copy
 import keyword
 import re
 import sys
+import struct
 import gc
 import weakref
+import types
 
-from recordclass import make_dataclass, make_arrayclass, dataobject, make, clone, update
+from recordclass import recordclass, make_dataclass, make_arrayclass, dataobject, make, clone, update
 from recordclass import datatype, asdict, astuple, join_dataclasses
+from recordclass import asdict_many, astuple_many, from_dicts, freelist_info, sort_records, Factory
 
 from recordclass.utils import headgc_size, ref_size, pyobject_size, pyvarobject_size, pyssize
 
@@ -47,6 +50,36 @@ class DataobjectTest(unittest.TestCase):
         B = ds.make_dataclass('A', ['x', 'y'])
         self.assertEqual(A, B)
 
+    def test_caching_schema(self):
+        from recordclass.dataclass import DataclassStorage
+        ds = DataclassStorage(maxsize=3)
+        A = ds.make_dataclass('A', 'x, y')
+        self.assertIs(ds.make_dataclass('A', ('x', 'y')), A)
+        self.assertIsNot(ds.make_dataclass('A', 'x y', readonly=True), A)
+        self.assertIsNot(ds.make_dataclass('A', 'x y', (0,)), A)
+        self.assertIsNot(ds.make_dataclass('A', 'x y', (0.0,)), ds.make_dataclass('A', 'x y', (0,)))
+        self.assertIsNot(ds.make_dataclass('A', {'x':int, 'y':int}), A)
+        self.assertEqual(ds.storage_info(), {'size': 3, 'maxsize': 3, 'hits': 2, 'misses': 5})
+        self.assertIsNot(ds.make_dataclass('A', 'x y'), A)
+        B = ds.make_dataclass('B', 'x y', ([],))
+        self.assertIsNot(ds.make_dataclass('B', 'x y', ([],)), B)
+        self.assertEqual(ds.storage_info()['misses'], 8)
+        ds.clear_storage()
+        self.assertEqual(ds.storage_info(), {'size': 0, 'maxsize': 3, 'hits': 0, 'misses': 0})
+
+    def test_class_cache_threads(self):
+        from recordclass.utils import ClassCache
+        from concurrent.futures import ThreadPoolExecutor
+        cache = ClassCache(make_dataclass, maxsize=None)
+        def make(i):
+            return cache('A%s' % (i % 10), 'x y z')
+        with ThreadPoolExecutor(4) as executor:
+            classes = list(executor.map(make, range(1000)))
+        self.assertEqual(len(set(classes)), 10)
+        self.assertEqual(len(cache), 10)
+        info = cache.info()
+        self.assertEqual(info['hits'] + info['misses'], 1000)
+
     def test_dataclass_asdict(self):
         A = make_dataclass("A", {'x':int, 'y':int})
         a = A(x=1,y=2)
@@ -915,6 +948,615 @@ class DataobjectTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             a['y'] = 200
 
+    def test_from_rows(self):
+        from recordclass import Factory
+        class A(dataobject):
+            x: int
+            y: int = 2
+            z: list = Factory(list)
+        lst = A.from_rows([(1,), [3, 4], (5, 6, [7])])
+        self.assertEqual(lst, [A(1), A(3, 4), A(5, 6, [7])])
+        self.assertIsNot(lst[0].z, lst[1].z)
+        self.assertEqual(A.from_rows(iter([])), [])
+        self.assertEqual(A.from_rows((i,) for i in range(3)), [A(0), A(1), A(2)])
+        with self.assertRaises(TypeError):
+            A.from_rows([(1, 2, 3, 4)])
+        with self.assertRaises(TypeError):
+            A.from_rows([1])
+        class Hint:
+            def __iter__(self):
+                return iter([(1,)])
+            def __length_hint__(self):
+                return 2**40
+        self.assertEqual(A.from_rows(Hint()), [A(1)])
+
+    def test_from_rows_copy_default(self):
+        class A(dataobject, copy_default=True):
+            x: int
+            y: list = []
+        a, b = A.from_rows([(1,), (2,)])
+        self.assertEqual(a, A(1, []))
+        self.assertIsNot(a.y, b.y)
+
+    def test_from_rows_pyinit(self):
+        class A(dataobject):
+            x: int
+            def __init__(self, x):
+                self.x = 2 * x
+        self.assertEqual(A.from_rows([(1,), (2,)]), [A(1), A(2)])
+        self.assertEqual(A.from_rows([(1,)])[0].x, 2)
+
+    def test_asdict_astuple_many(self):
+        class A(dataobject):
+            x: int
+            y: int
+        class B(dataobject):
+            z: int
+        lst = [A(1, 2), A(3, 4), B(5)]
+        self.assertEqual(asdict_many(lst), [{'x':1, 'y':2}, {'x':3, 'y':4}, {'z':5}])
+        self.assertEqual(astuple_many(lst), [(1, 2), (3, 4), (5,)])
+        self.assertEqual(asdict_many([]), [])
+        with self.assertRaises(TypeError):
+            asdict_many([A(1, 2), (1, 2)])
+        with self.assertRaises(TypeError):
+            astuple_many([(1, 2)])
+
+    def test_from_dicts(self):
+        from recordclass import Factory
+        class A(dataobject):
+            x: int
+            y: int = 2
+            z: list = Factory(list)
+        lst = from_dicts(A, [{'x':1}, {'y':4, 'x':3}, {'z':[7]}])
+        self.assertEqual(lst, [A(1), A(3, 4), A(None, 2, [7])])
+        self.assertIsNot(lst[0].z, lst[1].z)
+        self.assertEqual(from_dicts(A, asdict_many(lst)), lst)
+        with self.assertRaises(TypeError):
+            from_dicts(A, [{'w':1}])
+        with self.assertRaises(TypeError):
+            from_dicts(A, [(1, 2)])
+        with self.assertRaises(TypeError):
+            from_dicts(tuple, [])
+
+    def test_from_dicts_use_dict(self):
+        class A(dataobject, use_dict=True):
+            x: int
+        a, = from_dicts(A, [{'x':1, 'w':2}])
+        self.assertEqual(a.x, 1)
+        self.assertEqual(a.w, 2)
+        class Key:
+            calls = 0
+            def __hash__(self):
+                return hash('x')
+            def __eq__(self, other):
+                Key.calls += 1
+                if Key.calls > 1:
+                    raise RuntimeError
+                return False
+        d = {'x':1, Key():2}
+        Key.calls = 0
+        with self.assertRaises(RuntimeError):
+            from_dicts(A, [d])
+        class Hint:
+            def __iter__(self):
+                return iter([{'x':1}])
+            def __length_hint__(self):
+                return 2**61
+        a, = from_dicts(A, Hint())
+        self.assertEqual(a.x, 1)
+
+    def test_fields_index(self):
+        class A(dataobject):
+            x: int
+            y: int
+        self.assertEqual(A.__fields_index__, {'x':0, 'y':1})
+        with self.assertRaises(AttributeError):
+            A.__fields_index__ = {}
+        with self.assertRaises(TypeError):
+            A.__fields_index__['x'] = 10**6
+        class B(dataobject, native=True):
+            x: int
+        # the table set bypassing datatype.__setattr__ is checked on use
+        for cls in (A, B):
+            type.__setattr__(cls, '__fields_index__', types.MappingProxyType({'x':10**6}))
+            with self.assertRaises(IndexError):
+                from_dicts(cls, [{'x': 1}])
+            with self.assertRaises(IndexError):
+                cls(x=1)
+            type.__setattr__(cls, '__fields_index__', {'x':0})
+            with self.assertRaises(TypeError):
+                cls(x=1)
+        R = recordclass("R", "x y", readonly=True)
+        r = R(1, 2)
+        type.__setattr__(R, '__fields_index__', types.MappingProxyType({'x':10**6}))
+        with self.assertRaises(IndexError):
+            r._replace(x=1)
+
+    def test_native(self):
+        class A(dataobject, native=True):
+            x: int
+            y: float
+            s: str = 'a'
+        class B(dataobject):
+            x: int
+            y: float
+            s: str = 'a'
+        self.assertEqual(A.__native_kinds__, b'qdO')
+        self.assertEqual(A.__default_vals__, (0, 0.0, 'a'))
+        a = A(1, 2)
+        self.assertEqual(repr(a), "A(x=1, y=2.0, s='a')")
+        self.assertIs(type(a.y), float)
+        self.assertEqual(sys.getsizeof(a), sys.getsizeof(B(1, 2)))
+        self.assertEqual(A(y=1.5), A(0, 1.5, 'a'))
+        self.assertEqual(A(1, 2, s='b').s, 'b')
+        self.assertEqual(astuple(a), (1, 2.0, 'a'))
+        self.assertEqual(asdict(a), {'x':1, 'y':2.0, 's':'a'})
+        self.assertEqual(A.x.kind, 'q')
+        self.assertEqual(A.y.kind, 'd')
+        a.x = -5
+        a.y = 3
+        self.assertEqual(astuple(a), (-5, 3.0, 'a'))
+        with self.assertRaises(TypeError):
+            a.x = 1.5
+        with self.assertRaises(TypeError):
+            a.y = None
+        with self.assertRaises(OverflowError):
+            a.x = 2**70
+        with self.assertRaises(TypeError):
+            A(1, 2, 'a', 4)
+
+    def test_native_protocols(self):
+        class A(dataobject, native=True, sequence=True):
+            x: int
+            y: float
+        a = A(1, 2.5)
+        self.assertEqual(a[0], 1)
+        self.assertEqual(list(a), [1, 2.5])
+        a[1] = 3.5
+        self.assertEqual(a.y, 3.5)
+        class H(dataobject, native=True, readonly=True):
+            x: int
+            y: float
+        self.assertEqual(hash(H(1, 3.5)), hash(H(1, 3.5)))
+        self.assertEqual(a, A(1, 3.5))
+        self.assertLess(a, A(2, 0))
+        self.assertEqual(copy.copy(a), a)
+        self.assertEqual(clone(a, x=3), A(3, 3.5))
+        update(a, x=7)
+        self.assertEqual(a.x, 7)
+        self.assertEqual(make(A, (1, 2)), A(1, 2.0))
+        self.assertEqual(A.from_rows([(1, 2), (3, 4)]), [A(1, 2), A(3, 4)])
+        self.assertEqual(from_dicts(A, [{'x':1, 'y':2}]), [A(1, 2)])
+
+    def test_native_inheritance(self):
+        class A(dataobject, native=True):
+            x: int
+        class B(A):
+            y: float = 1
+            s: object = None
+        self.assertEqual(B.__native_kinds__, b'qdO')
+        self.assertEqual(B(2), B(2, 1.0, None))
+        class C(dataobject):
+            x: int
+        class D(C, native=True):
+            y: int
+        self.assertEqual(D.__native_kinds__, b'Oq')
+        self.assertEqual(D(None, 1).x, None)
+
+    def test_native_invalid(self):
+        with self.assertRaises(TypeError):
+            class A(dataobject, native=True, gc=True):
+                x: int
+        with self.assertRaises(TypeError):
+            class A(dataobject, native=True, deep_dealloc=True):
+                x: int
+        with self.assertRaises(TypeError):
+            class A(dataobject, native=True):
+                x: int = 'a'
+        class A(dataobject, native=True):
+            x: str
+        self.assertNotIn('__native_kinds__', A.__dict__)
+
+    def test_freelist(self):
+        class A(dataobject, freelist=10):
+            x: int
+            y: int
+        self.assertEqual(A.__freelist_size__, 10)
+        lst = [A(i, i) for i in range(20)]
+        info = freelist_info(A)
+        self.assertEqual((info['size'], info['hits'], info['misses']), (0, 0, 20))
+        del lst
+        self.assertEqual(freelist_info(A)['size'], 10)
+        lst = [A(i, -i) for i in range(5)]
+        info = freelist_info(A)
+        self.assertEqual((info['size'], info['hits']), (5, 5))
+        self.assertEqual(lst[4], A(4, -4))
+        A.__freelist_size__ = 2
+        self.assertEqual(A.__freelist_size__, 2)
+        self.assertEqual(freelist_info(A)['size'], 2)
+        with self.assertRaises(AttributeError):
+            del A.__freelist_size__
+        with self.assertRaises(AttributeError):
+            A.__freelist__ = None
+        class B(A):
+            z: int = 0
+        with self.assertRaises(TypeError):
+            freelist_info(B)
+        B.__freelist_size__ = 3
+        self.assertEqual(B(1, 2).z, 0)
+        self.assertEqual(freelist_info(B)['size'], 1)
+
+    def test_arena(self):
+        class A(dataobject, arena=16, use_weakref=True):
+            x: int
+            y: object = None
+        lst = [A(i) for i in range(40)]
+        self.assertEqual(freelist_info(A)['slabs'], 3)
+        wr = weakref.ref(lst[0])
+        self.assertIs(wr(), lst[0])
+        del lst
+        self.assertIs(wr(), None)
+        self.assertEqual(freelist_info(A)['size'], 40)
+        lst = [A(i, [i]) for i in range(40)]
+        info = freelist_info(A)
+        self.assertEqual((info['size'], info['hits'], info['slabs']), (0, 40, 3))
+        self.assertEqual(lst[-1], A(39, [39]))
+        with self.assertRaises(TypeError):
+            A.__freelist_size__ = 10
+
+    def test_freelist_invalid(self):
+        with self.assertRaises(TypeError):
+            class A(dataobject, freelist=10, gc=True):
+                x: int
+        with self.assertRaises(ValueError):
+            class A(dataobject, freelist=-1):
+                x: int
+
+    def test_native_buffer(self):
+        class A(dataobject, native=True):
+            x: int
+            y: float
+        m = memoryview(A(1, 2.5))
+        self.assertEqual((m.ndim, m.format, m.nbytes), (0, 'qd', 16))
+        self.assertEqual(struct.unpack(m.format, m), (1, 2.5))
+        class B(A):
+            s: str = ''
+        with self.assertRaises(TypeError):
+            memoryview(B(1, 2.5))
+
+    def test_deep_dealloc(self):
+        from recordclass import litelist, litetuple, mutabletuple
+        from recordclass._linkedlist import linkedlist
+        class Node(dataobject, deep_dealloc=True, use_weakref=True):
+            val: object
+            next: object = None
+        def make_linkedlist(ob):
+            lst = linkedlist()
+            lst.append(ob)
+            lst.append(None)
+            return lst
+        for wrap in (lambda ob: ob, lambda ob: litelist([ob]),
+                     lambda ob: litetuple(ob, None), lambda ob: mutabletuple(ob),
+                     make_linkedlist):
+            last = Node(0)
+            wr = weakref.ref(last)
+            head = last
+            for i in range(200000):
+                head = Node(i, wrap(head))
+            del last
+            self.assertIsNot(wr(), None)
+            del head
+            self.assertIs(wr(), None)
+
+    def test_deep_dealloc_finalizer(self):
+        from recordclass import litelist
+        class Node(dataobject, deep_dealloc=True):
+            val: object
+            next: object = None
+        seen = []
+        resurrected = []
+        class Leaf(dataobject):
+            x: object
+            def __del__(self):
+                seen.append(self.x)
+        class Phoenix(dataobject):
+            x: object
+            def __del__(self):
+                resurrected.append(self)
+        head = Node(Leaf(1), Node(Leaf(2), litelist([Leaf(3)])))
+        del head
+        self.assertEqual(sorted(seen), [1, 2, 3])
+        head = Node(Phoenix(litelist([1, 2])), None)
+        del head
+        self.assertEqual(len(resurrected), 1)
+        self.assertEqual(resurrected[0].x[0], 1)
+        with self.assertRaises(TypeError):
+            class Bad(dataobject, deep_dealloc=True):
+                x: object
+                def __del__(self):
+                    pass
+
+    def test_deep_dealloc_shared(self):
+        class Node(dataobject, deep_dealloc=True):
+            val: object
+            next: object = None
+        shared = Node(-1)
+        head = None
+        for i in range(1000):
+            head = Node(shared, head)
+        middle = head.next.next
+        del head
+        n = 0
+        node = middle
+        while node is not None:
+            self.assertIs(node.val, shared)
+            node = node.next
+            n += 1
+        self.assertEqual(n, 998)
+        del middle
+        self.assertEqual(sys.getrefcount(shared), 2)
+
+    def test_cache_hash(self):
+        class Key:
+            n_hash = 0
+            def __hash__(self):
+                Key.n_hash += 1
+                return 17
+        class A(dataobject, readonly=True, cache_hash=True):
+            x: int
+            y: object
+        class B(dataobject, readonly=True):
+            x: int
+            y: object
+        key = Key()
+        a = A(1, key)
+        self.assertEqual(Key.n_hash, 0)
+        self.assertEqual(hash(a), hash(B(1, key)))
+        self.assertEqual(Key.n_hash, 2)
+        for i in range(3):
+            self.assertEqual(hash(a), hash(B(1, key)))
+        self.assertEqual(Key.n_hash, 5)
+        self.assertEqual(sys.getsizeof(a), sys.getsizeof(B(1, key)) + 8)
+        self.assertEqual(hash(A(2, 3)), hash(B(2, 3)))
+        self.assertEqual(len({A(1, 2), A(1, 2), A(2, 1)}), 2)
+
+    def test_cache_hash_subclass(self):
+        class A(dataobject, readonly=True, cache_hash=True, freelist=5):
+            x: int
+        class B(A, readonly=True):
+            y: int
+        class W(dataobject, readonly=True, cache_hash=True, use_weakref=True):
+            x: int
+        w = W(1)
+        self.assertIsNotNone(weakref.ref(w)())
+        self.assertEqual(hash(w), hash(A(1)))
+        a = A(1)
+        self.assertEqual(hash(a), hash(A(1)))
+        self.assertEqual(hash(B(1, 2)), hash(B(1, 2)))
+        with self.assertRaises(TypeError):
+            class C(dataobject, cache_hash=True):
+                x: int
+
+    def test_sortkey(self):
+        class A(dataobject):
+            x: int
+            y: str
+            z: object = None
+        key = A.sortkey('y', 'x')
+        self.assertEqual(repr(key), "A.sortkey('y', 'x')")
+        self.assertEqual(key(A(1, 'a')), ('a', 1))
+        self.assertEqual(A.sortkey('x')(A(1, 'a')), 1)
+        self.assertEqual(A.sortkey(-1)(A(1, 'a', 2)), 2)
+        lst = [A(2, 'b'), A(1, 'b'), A(3, 'a')]
+        self.assertEqual(sorted(lst, key=key), [A(3, 'a'), A(1, 'b'), A(2, 'b')])
+        self.assertEqual(max(lst, key=A.sortkey('x')), A(3, 'a'))
+        with self.assertRaises(AttributeError):
+            A.sortkey('t')
+        with self.assertRaises(IndexError):
+            A.sortkey(3)
+        with self.assertRaises(TypeError):
+            A.sortkey()
+        with self.assertRaises(TypeError):
+            key((1, 'a'))
+        with self.assertRaises(TypeError):
+            key(A(1, 'a'), A(2, 'b'))
+
+    def test_sortkey_native(self):
+        class A(dataobject, native=True):
+            x: int
+            y: float
+            s: str = ''
+        key = A.sortkey('y', 'x', 's')
+        self.assertEqual(key(A(1, 2.5, 'a')), (2.5, 1, 'a'))
+        self.assertEqual(sorted([A(1, 2.0), A(2, 1.0)], key=A.sortkey('y')), [A(2, 1.0), A(1, 2.0)])
+
+    def test_sort_records(self):
+        class A(dataobject):
+            x: object
+            y: object
+            i: int = 0
+        import random
+        rnd = random.Random(1)
+        for vals in ([1, 2, 3], [1.5, -1.0, 2.5], [1, 2.5, 2**70], ['a', 'b', 'aa']):
+            lst = [A(rnd.choice(vals), rnd.choice(vals), i) for i in range(1000)]
+            for fields in (('x',), ('x', 'y'), ['y', 'x'], 'y'):
+                for reverse in (False, True):
+                    lst1 = list(lst)
+                    lst2 = list(lst)
+                    if type(fields) is str:
+                        key = lambda ob: getattr(ob, fields)
+                    else:
+                        key = lambda ob: tuple(getattr(ob, fn) for fn in fields)
+                    lst1.sort(key=key, reverse=reverse)
+                    sort_records(lst2, fields, reverse=reverse)
+                    self.assertEqual([ob.i for ob in lst1], [ob.i for ob in lst2])
+        lst = []
+        sort_records(lst, 'x')
+        self.assertEqual(lst, [])
+
+    def test_sort_records_native(self):
+        class A(dataobject, native=True):
+            x: int
+            y: float
+            i: int = 0
+        class B(A):
+            z: int = 0
+        lst = [A(i % 7, -(i % 5) * 0.5, i) for i in range(200)] + [B(1, 1.0, 200)]
+        lst1 = sorted(lst, key=lambda ob: (ob.y, ob.x), reverse=True)
+        sort_records(lst, ('y', 'x'), reverse=True)
+        self.assertEqual([ob.i for ob in lst1], [ob.i for ob in lst])
+
+    def test_sort_records_invalid(self):
+        class A(dataobject):
+            x: object
+        class B(dataobject):
+            x: object
+        lst = [A(3), A(None), A(1)]
+        with self.assertRaises(TypeError):
+            sort_records(lst, 'x')
+        self.assertEqual(lst, [A(3), A(None), A(1)])
+        with self.assertRaises(TypeError):
+            sort_records([A(1), B(2)], 'x')
+        with self.assertRaises(TypeError):
+            sort_records((A(1), A(2)), 'x')
+        with self.assertRaises(TypeError):
+            sort_records([1, 2], 'x')
+        with self.assertRaises(AttributeError):
+            sort_records([A(1)], 'y')
+        class Key:
+            def __init__(self, v):
+                self.v = v
+            def __eq__(self, other):
+                return self.v == other.v
+            def __lt__(self, other):
+                lst.append(A(0))
+                return self.v < other.v
+        lst = [A(Key(i)) for i in range(10, 0, -1)]
+        with self.assertRaises(ValueError):
+            sort_records(lst, 'x')
+        self.assertEqual(len(lst), 10)
+
+    def test_lazy_import(self):
+        import subprocess, os
+        code = ("import sys, recordclass\n"
+                "class A(recordclass.dataobject):\n"
+                "    x: int\n"
+                "    y: float = 0\n"
+                "assert A(1).y == 0\n"
+                "print(' '.join(m for m in ('typing', 'pickle', 'recordclass.dataclass',\n"
+                "                           'recordclass.adapter', 'recordclass.serialize')\n"
+                "               if m in sys.modules))\n"
+                "print(recordclass.make_dataclass.__module__)\n")
+        proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                              env=os.environ, check=True)
+        self.assertEqual(proc.stdout.splitlines(), ['', 'recordclass.dataclass'])
+        import recordclass
+        self.assertIn('InternPool', dir(recordclass))
+        with self.assertRaises(AttributeError):
+            recordclass.no_such_name
+
+    def test_wide_kwargs(self):
+        names = ['f%d' % i for i in range(150)]
+        W = make_dataclass("W", names, defaults=(0,)*150, mapping=True)
+        kw = {fn:i for i, fn in enumerate(names) if i % 7 == 0}
+        # keys which are not interned
+        kw2 = {''.join(['f', str(i)]):-i for i in (1, 149)}
+        a = W(**kw)
+        for i, fn in enumerate(names):
+            self.assertEqual(a[fn], kw.get(fn, 0))
+        b = W(**kw2)
+        self.assertEqual((b.f1, b.f149), (-1, -149))
+        b = W(*range(10), **kw2)
+        self.assertEqual((b.f9, b.f1, b.f149), (9, -1, -149))
+        b = clone(a, **kw2)
+        self.assertEqual((b.f0, b.f1, b.f149), (0, -1, -149))
+        update(a, **kw2)
+        self.assertEqual((a.f1, a.f147, a.f149), (-1, 147, -149))
+        with self.assertRaises(TypeError):
+            W(f150=1)
+        with self.assertRaises(TypeError):
+            clone(a, f150=1)
+        with self.assertRaises(TypeError):
+            W(**{'f1':1, 1:2})
+
+    def test_wide_kwargs_native_and_dict(self):
+        names = ['f%d' % i for i in range(100)]
+        W = make_dataclass("W", [(fn, int) for fn in names], defaults=(0,)*100)
+        a = W(f99=99, f0=-1)
+        self.assertEqual((a.f0, a.f1, a.f99), (-1, 0, 99))
+        D = make_dataclass("D", names, defaults=(0,)*100, use_dict=True)
+        a = D(f50=50, g=1)
+        self.assertEqual((a.f50, a.g), (50, 1))
+        a = D(**{'f98':98, 'h':2})
+        self.assertEqual((a.f98, a.h), (98, 2))
+
+    def test_kwnames_cache(self):
+        class A(dataobject):
+            x: int
+            y: int
+            z: int = 0
+            t: list = Factory(list)
+        for i in range(3):
+            self.assertEqual(A(x=1, y=2), A(1, 2, 0, []))
+            self.assertEqual(A(y=2, x=1, t=[1], z=3), A(1, 2, 3, [1]))
+            self.assertEqual(A(1, t=[], z=3, y=2), A(1, 2, 3, []))
+            self.assertEqual(A(1, 2, x=3), A(3, 2, 0, []))
+            self.assertIsNot(A(x=1, y=2).t, A(x=1, y=2).t)
+        # more kwnames tuples than entries of the cache
+        names = ('x', 'y', 'z', 't')
+        for i in range(3):
+            for n in range(1, 5):
+                for k in range(4):
+                    kw = {fn:j for j, fn in enumerate(names[k:] + names[:k]) if j < n}
+                    a = eval("A(%s)" % ", ".join("%s=%r" % item for item in kw.items()))
+                    self.assertEqual(a, A(**kw))
+                    for fn, v in kw.items():
+                        self.assertEqual(getattr(a, fn), v)
+        with self.assertRaises(TypeError):
+            A(x=1, y=2, w=3)
+        with self.assertRaises(TypeError):
+            A(1, 2, 3, 4, 5)
+
+    def test_kwnames_cache_native_and_dict(self):
+        class A(dataobject, native=True):
+            x: int
+            y: float = 0.5
+            z: object = None
+        for i in range(3):
+            a = A(y=2.5, x=1)
+            self.assertEqual((a.x, a.y, a.z), (1, 2.5, None))
+            a = A(z='a', x=2)
+            self.assertEqual((a.x, a.y, a.z), (2, 0.5, 'a'))
+            with self.assertRaises(TypeError):
+                A(x=1.5, y=2.5)
+        class B(dataobject, use_dict=True):
+            x: int
+            y: int = 0
+        class C(B):
+            z: int = 1
+        for i in range(3):
+            b = B(y=2, x=1, w=3)
+            self.assertEqual((b.x, b.y, b.w), (1, 2, 3))
+            c = C(z=3, x=1)
+            self.assertEqual((c.x, c.y, c.z), (1, 0, 3))
+            b = B(y=2, x=1)
+            self.assertEqual((b.x, b.y), (1, 2))
+
+
+    def test_kwnames_cache_private(self):
+        A = make_dataclass("A", ['f%d' % i for i in range(100)], defaults=(0,)*100)
+        B = make_dataclass("B", ['x', 'y'])
+        self.assertNotIn('__kwnames_cache__', A.__dict__)
+        self.assertEqual(B(y=2, x=1), B(1, 2))
+        a = A(f99=1, f98=2)
+        self.assertEqual((a.f98, a.f99), (2, 1))
+        # the table of the caches grows with the number of classes
+        classes = [make_dataclass("C", ['x', 'y']) for i in range(300)]
+        for i, C in enumerate(classes):
+            self.assertEqual(C(y=i, x=1), C(1, i))
+        self.assertEqual(B(y=2, x=1), B(1, 2))
+        self.assertEqual(A(f99=3).f99, 3)
+
 def main():
     suite = unittest.TestSuite()
     suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(DataobjectTest))
@@ -0,0 +1,76 @@
+import unittest
+import gc
+
+from recordclass import dataobject, InternPool
+
+class Pair(dataobject, readonly=True, use_weakref=True):
+    base: str
+    quote: str
+
+class Cell(dataobject, readonly=True, use_weakref=True, native=True, cache_hash=True):
+    x: int
+    y: int
+
+class InternPoolTest(unittest.TestCase):
+
+    def test_call(self):
+        pool = InternPool(Pair)
+        a = pool('EUR', 'USD')
+        b = pool('EUR', quote='USD')
+        c = pool('USD', 'EUR')
+        self.assertIs(a, b)
+        self.assertIsNot(a, c)
+        self.assertEqual(a, Pair('EUR', 'USD'))
+        self.assertEqual(len(pool), 2)
+        self.assertEqual(pool.info(), {'size': 2, 'hits': 1, 'misses': 2})
+        self.assertIn(Pair('USD', 'EUR'), pool)
+        self.assertNotIn(Pair('USD', 'GBP'), pool)
+        self.assertNotIn(('EUR', 'USD'), pool)
+        self.assertEqual(sorted(pool, key=Pair.sortkey('base')), [a, c])
+
+    def test_intern(self):
+        pool = InternPool(Cell)
+        a = Cell(1, 2)
+        self.assertIs(pool.intern(a), a)
+        self.assertIs(pool.intern(Cell(1, 2)), a)
+        self.assertIs(pool(1, 2), a)
+        self.assertIs(pool.intern(a), a)
+        with self.assertRaises(TypeError):
+            pool.intern(Pair('EUR', 'USD'))
+
+    def test_weak(self):
+        pool = InternPool(Pair)
+        a = pool('EUR', 'USD')
+        lst = [pool('GBP', str(i)) for i in range(100)]
+        self.assertEqual(len(pool), 101)
+        del lst
+        gc.collect()
+        self.assertEqual(len(pool), 1)
+        self.assertIs(pool('EUR', 'USD'), a)
+        del a
+        self.assertEqual(len(pool), 0)
+        b = pool('EUR', 'USD')
+        self.assertEqual(pool.info(), {'size': 1, 'hits': 1, 'misses': 102})
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+        self.assertIsNot(pool('EUR', 'USD'), b)
+
+    def test_invalid(self):
+        class A(dataobject, use_weakref=True):
+            x: int
+        class B(dataobject, readonly=True):
+            x: int
+        with self.assertRaises(TypeError):
+            InternPool(A)
+        with self.assertRaises(TypeError):
+            InternPool(B)
+        with self.assertRaises(TypeError):
+            InternPool(tuple)
+        pool = InternPool(Pair)
+        with self.assertRaises(TypeError):
+            pool('EUR', [])
+
+def main():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(InternPoolTest))
+    return suite
@@ -0,0 +1,124 @@
+import unittest
+from recordclass._linkedlist import linkedlist, chunkedlist
+
+import collections
+import gc
+import pickle
+import sys
+
+class linkedlistTest(unittest.TestCase):
+
+    def test_append_extend(self):
+        lst = linkedlist()
+        lst.extend([1, 2])
+        lst.append(3)
+        lst.extend([4])
+        self.assertEqual(list(lst), [1, 2, 3, 4])
+
+    def test_pop(self):
+        lst = linkedlist()
+        lst.extend('ab')
+        self.assertEqual(lst.pop(), 'a')
+        self.assertEqual(lst.pop(), 'b')
+        with self.assertRaises(TypeError):
+            lst.pop()
+
+class chunkedlistTest(unittest.TestCase):
+
+    def test_append_pop(self):
+        lst = chunkedlist()
+        self.assertEqual(len(lst), 0)
+        for i in range(1000):
+            lst.append(i)
+        self.assertEqual(len(lst), 1000)
+        self.assertEqual(list(lst), list(range(1000)))
+        for i in range(999, -1, -1):
+            self.assertEqual(lst.pop(), i)
+        self.assertEqual(len(lst), 0)
+        with self.assertRaises(IndexError):
+            lst.pop()
+        with self.assertRaises(IndexError):
+            lst.popleft()
+
+    def test_queue(self):
+        lst = chunkedlist()
+        dq = collections.deque()
+        for i in range(5000):
+            lst.append(i)
+            dq.append(i)
+            if i % 3 == 0:
+                self.assertEqual(lst.popleft(), dq.popleft())
+            if i % 7 == 0:
+                lst.appendleft(-i)
+                dq.appendleft(-i)
+            if i % 11 == 0:
+                self.assertEqual(lst.pop(), dq.pop())
+        self.assertEqual(len(lst), len(dq))
+        self.assertEqual(list(lst), list(dq))
+        while dq:
+            self.assertEqual(lst.popleft(), dq.popleft())
+        self.assertEqual(len(lst), 0)
+
+    def test_appendleft(self):
+        lst = chunkedlist()
+        for i in range(200):
+            lst.appendleft(i)
+        self.assertEqual(list(lst), list(range(199, -1, -1)))
+        self.assertEqual(lst.pop(), 0)
+        self.assertEqual(lst.popleft(), 199)
+
+    def test_getitem(self):
+        lst = chunkedlist(range(300))
+        lst.appendleft(-1)
+        self.assertEqual(lst[0], -1)
+        self.assertEqual(lst[1], 0)
+        self.assertEqual(lst[200], 199)
+        self.assertEqual(lst[-1], 299)
+        with self.assertRaises(IndexError):
+            lst[301]
+        with self.assertRaises(IndexError):
+            lst[-302]
+
+    def test_refcount(self):
+        ob = object()
+        rc = sys.getrefcount(ob)
+        lst = chunkedlist([ob] * 100)
+        self.assertEqual(sys.getrefcount(ob), rc + 100)
+        lst.pop()
+        lst.popleft()
+        self.assertEqual(sys.getrefcount(ob), rc + 98)
+        lst.clear()
+        self.assertEqual(len(lst), 0)
+        self.assertEqual(sys.getrefcount(ob), rc)
+        lst.extend([ob] * 100)
+        del lst
+        self.assertEqual(sys.getrefcount(ob), rc)
+
+    def test_iter_mutated(self):
+        lst = chunkedlist([1, 2, 3])
+        it = iter(lst)
+        self.assertEqual(next(it), 1)
+        lst.append(4)
+        with self.assertRaises(RuntimeError):
+            next(it)
+        with self.assertRaises(RuntimeError):
+            next(it)
+
+    def test_sizeof(self):
+        n = 10000
+        lst = chunkedlist([None] * n)
+        self.assertLess(sys.getsizeof(lst), 10 * n)
+        self.assertLess(sys.getsizeof(lst), sys.getsizeof(collections.deque([None] * n)) + 1024)
+        self.assertFalse(gc.is_tracked(lst))
+
+    def test_pickle(self):
+        lst = chunkedlist(range(100))
+        lst2 = pickle.loads(pickle.dumps(lst))
+        self.assertEqual(list(lst2), list(range(100)))
+        self.assertEqual(repr(chunkedlist([1])), "chunkedlist([1])")
+
+def main():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(linkedlistTest))
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(chunkedlistTest))
+    return suite
@@ -0,0 +1,225 @@
+import unittest
+from recordclass import litearray, litelist
+
+import array
+import copy
+import pickle
+import sys
+
+class litearrayTest(unittest.TestCase):
+
+    def test_create(self):
+        for tc in 'qidf':
+            a = litearray(tc, [1, 2, 3])
+            self.assertEqual(a.typecode, tc)
+            self.assertEqual(a.itemsize, array.array(tc).itemsize)
+            self.assertEqual(len(a), 3)
+            self.assertEqual(list(a), [1, 2, 3])
+            self.assertEqual(a.capacity, 3)
+        self.assertEqual(len(litearray('q')), 0)
+        self.assertEqual(repr(litearray('q')), "litearray('q')")
+        self.assertEqual(repr(litearray('d', [1.5])), "litearray('d', [1.5])")
+        self.assertEqual(litearray('q', (i for i in range(5))).tolist(), [0, 1, 2, 3, 4])
+        with self.assertRaises(ValueError):
+            litearray('x')
+        with self.assertRaises(TypeError):
+            litearray('qq')
+
+    def test_values(self):
+        with self.assertRaises(TypeError):
+            litearray('q', [1.5])
+        with self.assertRaises(OverflowError):
+            litearray('q', [2**63])
+        with self.assertRaises(OverflowError):
+            litearray('i', [2**31])
+        self.assertEqual(litearray('i', [-2**31])[0], -2**31)
+        self.assertEqual(litearray('q', [True])[0], 1)
+        self.assertEqual(litearray('f', [0.1])[0], array.array('f', [0.1])[0])
+        with self.assertRaises(TypeError):
+            litearray('d', ['a'])
+
+    def test_getitem(self):
+        a = litearray('q', range(10))
+        self.assertEqual(a[0], 0)
+        self.assertEqual(a[-1], 9)
+        with self.assertRaises(IndexError):
+            a[10]
+        self.assertEqual(type(a[2:5]), litearray)
+        self.assertEqual(a[2:5], litearray('q', [2, 3, 4]))
+        self.assertEqual(a[::3].tolist(), [0, 3, 6, 9])
+        self.assertEqual(a[::-1].tolist(), list(range(9, -1, -1)))
+        self.assertEqual(a[5:2].tolist(), [])
+
+    def test_setitem(self):
+        a = litearray('q', range(5))
+        a[0] = 10
+        a[-1] = 40
+        self.assertEqual(a.tolist(), [10, 1, 2, 3, 40])
+        a[1:3] = [11, 12]
+        a[::2] = litearray('q', [0, 0, 0])
+        self.assertEqual(a.tolist(), [0, 11, 0, 3, 0])
+        with self.assertRaises(ValueError):
+            a[1:3] = [1, 2, 3]
+        with self.assertRaises(TypeError):
+            a[1:3] = [1, None]
+        self.assertEqual(a.tolist(), [0, 11, 0, 3, 0])
+        with self.assertRaises(IndexError):
+            a[5] = 1
+
+    def test_delitem(self):
+        a = litearray('q', range(10))
+        del a[0]
+        del a[-1]
+        self.assertEqual(a.tolist(), list(range(1, 9)))
+        del a[2:4]
+        self.assertEqual(a.tolist(), [1, 2, 5, 6, 7, 8])
+        del a[::2]
+        self.assertEqual(a.tolist(), [2, 6, 8])
+        a = litearray('d', range(10))
+        del a[::-3]
+        self.assertEqual(a.tolist(), [1.0, 2.0, 4.0, 5.0, 7.0, 8.0])
+
+    def test_append_extend(self):
+        a = litearray('q')
+        for i in range(100):
+            a.append(i)
+        self.assertEqual(a.tolist(), list(range(100)))
+        self.assertGreaterEqual(a.capacity, 100)
+        a.extend(a)
+        self.assertEqual(a.tolist(), 2 * list(range(100)))
+        a = litearray('q', [1])
+        a += [2, 3]
+        a.extend(array.array('l', [4]))
+        a.extend(litearray('i', [5]))
+        self.assertEqual(a.tolist(), [1, 2, 3, 4, 5])
+        with self.assertRaises(TypeError):
+            a.extend(litearray('d', [6.0]))
+        with self.assertRaises(TypeError):
+            a.extend([6, 'a'])
+        self.assertEqual(a.tolist(), [1, 2, 3, 4, 5])
+
+    def test_insert_pop(self):
+        a = litearray('d', [1, 2])
+        a.insert(0, 0)
+        a.insert(100, 3)
+        a.insert(-1, 2.5)
+        self.assertEqual(a.tolist(), [0.0, 1.0, 2.0, 2.5, 3.0])
+        self.assertEqual(a.pop(), 3.0)
+        self.assertEqual(a.pop(0), 0.0)
+        self.assertEqual(a.tolist(), [1.0, 2.0, 2.5])
+        with self.assertRaises(IndexError):
+            a.pop(3)
+        a.clear()
+        self.assertEqual(len(a), 0)
+        self.assertEqual(a.capacity, 0)
+        with self.assertRaises(IndexError):
+            a.pop()
+
+    def test_capacity(self):
+        a = litearray('q')
+        a.reserve(100)
+        self.assertEqual(a.capacity, 100)
+        a.append(1)
+        self.assertEqual(sys.getsizeof(a), sys.getsizeof(litearray('q')) + 100 * 8)
+        a.shrink_to_fit()
+        self.assertEqual(a.capacity, 1)
+        self.assertLess(sys.getsizeof(litearray('q', range(1000))),
+                        sys.getsizeof(litelist(range(1000))) + sum(map(sys.getsizeof, range(1000))))
+
+    def test_buffer(self):
+        a = litearray('q', [1, 2, 3])
+        m = memoryview(a)
+        self.assertEqual(m.format, 'q')
+        self.assertEqual(m.shape, (3,))
+        self.assertEqual(m.tolist(), [1, 2, 3])
+        m[0] = 10
+        self.assertEqual(a[0], 10)
+        with self.assertRaises(BufferError):
+            a.append(4)
+        with self.assertRaises(BufferError):
+            del a[0]
+        m.release()
+        a.append(4)
+        self.assertEqual(memoryview(a).tolist(), [10, 2, 3, 4])
+        self.assertEqual(bytes(litearray('i', [1])), array.array('i', [1]).tobytes())
+        self.assertEqual(memoryview(litearray('d')).tolist(), [])
+
+    def test_bytes(self):
+        a = litearray('d', [1.5, 2.5])
+        b = litearray('d')
+        b.frombytes(a.tobytes())
+        self.assertEqual(a, b)
+        with self.assertRaises(ValueError):
+            b.frombytes(b'abc')
+
+    def test_compare(self):
+        self.assertEqual(litearray('q', [1, 2]), litearray('d', [1, 2]))
+        self.assertNotEqual(litearray('q', [1, 2]), litearray('q', [1]))
+        self.assertLess(litearray('q', [1, 2]), litearray('q', [1, 3]))
+        self.assertLess(litearray('q', [1]), litearray('q', [1, 0]))
+        with self.assertRaises(TypeError):
+            hash(litearray('q'))
+
+    def test_copy_pickle(self):
+        for tc in 'qidf':
+            a = litearray(tc, [1, 2, 3])
+            self.assertEqual(copy.copy(a), a)
+            self.assertIsNot(copy.copy(a), a)
+            for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+                b = pickle.loads(pickle.dumps(a, proto))
+                self.assertEqual(b, a)
+                self.assertEqual(b.typecode, tc)
+
+    def test_subclass(self):
+        class A(litearray):
+            pass
+        a = A('q', [1, 2])
+        a.x = 1
+        self.assertEqual(type(a[:1]), A)
+        self.assertEqual(a.tolist(), [1, 2])
+
+
+    def test_mutation_by_conversion(self):
+        # __index__ of the value changes the litearray or the source list
+        a = litearray('q', range(10))
+        class E:
+            def __init__(self, action):
+                self.action = action
+            def __index__(self):
+                self.action()
+                return 7
+        a.extend([1, E(a.clear), 3] * 100)
+        self.assertEqual(len(a), 300)
+        self.assertEqual(a[:3].tolist(), [1, 7, 3])
+        a = litearray('q', range(10))
+        with self.assertRaises(ValueError):
+            a[0:3] = [E(a.clear), 1, 2]
+        self.assertEqual(len(a), 0)
+        a = litearray('q', range(10))
+        a[0:3] = [E(lambda: a.extend([0]*1000)), 1, 2]
+        self.assertEqual(len(a), 1010)
+        self.assertEqual(a[:4].tolist(), [7, 1, 2, 3])
+        lst = [1, 2, 3]
+        lst.append(E(lst.clear))
+        lst.extend(range(1000))
+        a = litearray('q')
+        a.extend(lst)
+        self.assertEqual(len(a), 1004)
+        self.assertEqual(lst, [])
+        a = litearray('q', [1, 2])
+        with self.assertRaises(IndexError):
+            a[1] = E(a.clear)
+        a = litearray('q', [1, 2])
+        a.append(E(a.clear))
+        self.assertEqual(a.tolist(), [7])
+        a = litearray('q', [1, 2])
+        a.insert(5, E(a.clear))
+        self.assertEqual(a.tolist(), [7])
+        a = litearray('q', [1, 2])
+        with self.assertRaises(IndexError):
+            a.pop(E(a.clear))
+
+def main():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(litearrayTest))
+    return suite
@@ -1,5 +1,6 @@
 import unittest
-from recordclass import litelist, litelist_fromargs
+from recordclass import litelist, litelist_fromargs, litelist_growth
+from recordclass.utils import ref_size
 
 import gc
 import pickle
@@ -173,6 +174,215 @@ class litelistTest(unittest.TestCase):
         for i in range(10000):
             ll.append(i)
 
+    def test_capacity(self):
+        a = litelist([1,2,3])
+        self.assertEqual(a.capacity, 3)
+        a.append(4)
+        self.assertGreater(a.capacity, 4)
+        a.shrink_to_fit()
+        self.assertEqual(a.capacity, 4)
+        self.assertEqual(a, litelist([1,2,3,4]))
+        self.assertEqual(sys.getsizeof(a), sys.getsizeof(litelist([1,2,3,4])))
+
+    def test_reserve(self):
+        a = litelist([1])
+        a.reserve(1000)
+        self.assertEqual(a.capacity, 1000)
+        self.assertEqual(a.__sizeof__(), litelist([]).__sizeof__() + 1000*ref_size)
+        for i in range(999):
+            a.append(i)
+        self.assertEqual(a.capacity, 1000)
+        self.assertEqual(len(a), 1000)
+        a.reserve(10)
+        self.assertEqual(a.capacity, 1000)
+        with self.assertRaises(ValueError):
+            a.reserve(-1)
+        with self.assertRaises(TypeError):
+            a.reserve(None)
+        while len(a) > 10:
+            del a[-1]
+        self.assertEqual(a.capacity, 1000)
+        a.shrink_to_fit()
+        self.assertEqual(a.capacity, 10)
+        self.assertEqual(list(a), [1] + list(range(9)))
+
+    def test_shrink_to_fit_empty(self):
+        a = litelist([1,2])
+        a.remove(1)
+        a.remove(2)
+        a.shrink_to_fit()
+        self.assertEqual(a.capacity, 0)
+        self.assertEqual(len(a), 0)
+        a.append(3)
+        a.extend([4,5])
+        self.assertEqual(a, litelist([3,4,5]))
+
+    def test_growth(self):
+        prev = litelist_growth(0)
+        try:
+            a = litelist([])
+            a.extend(range(100))
+            self.assertEqual(a.capacity, 206)
+            litelist_growth(3)
+            a = litelist([])
+            a.extend(range(100))
+            self.assertEqual(a.capacity, 118)
+            with self.assertRaises(ValueError):
+                litelist_growth(-1)
+        finally:
+            litelist_growth(prev)
+
+    def test_insert_pop(self):
+        a = litelist([1,2,3])
+        a.insert(0, 0)
+        a.insert(-1, 2.5)
+        a.insert(100, 4)
+        a.insert(-100, -1)
+        self.assertEqual(list(a), [-1, 0, 1, 2, 2.5, 3, 4])
+        self.assertEqual(a.pop(), 4)
+        self.assertEqual(a.pop(0), -1)
+        self.assertEqual(a.pop(-2), 2.5)
+        self.assertEqual(list(a), [0, 1, 2, 3])
+        with self.assertRaises(IndexError):
+            a.pop(4)
+        with self.assertRaises(IndexError):
+            litelist([]).pop()
+        with self.assertRaises(TypeError):
+            a.insert(1)
+
+    def test_pop_refcount(self):
+        o = object()
+        c = sys.getrefcount(o)
+        a = litelist([o, o])
+        a.pop()
+        self.assertEqual(sys.getrefcount(o), c+1)
+        a.insert(0, o)
+        self.assertEqual(sys.getrefcount(o), c+2)
+        a.clear()
+        self.assertEqual(sys.getrefcount(o), c)
+
+    def test_clear(self):
+        a = litelist([1,2,3])
+        a.clear()
+        self.assertEqual(len(a), 0)
+        self.assertEqual(a.capacity, 0)
+        a.append(1)
+        self.assertEqual(list(a), [1])
+
+    def test_index_count(self):
+        a = litelist([1,2,3,2,1])
+        self.assertEqual(a.index(2), 1)
+        self.assertEqual(a.index(2, 2), 3)
+        self.assertEqual(a.index(1, -2), 4)
+        with self.assertRaises(ValueError):
+            a.index(3, 0, 2)
+        with self.assertRaises(ValueError):
+            a.index(5)
+        self.assertEqual(a.count(1), 2)
+        self.assertEqual(a.count(3), 1)
+        self.assertEqual(a.count(5), 0)
+
+    def test_reverse(self):
+        for n in range(5):
+            a = litelist(range(n))
+            a.reverse()
+            self.assertEqual(list(a), list(range(n))[::-1])
+        a = litelist.fromiter([1])
+        a.clear()
+        a.reverse()
+        self.assertEqual(len(a), 0)
+
+    def test_sort(self):
+        import random
+        data = [random.random() for i in range(1000)]
+        a = litelist(data)
+        a.sort()
+        self.assertEqual(list(a), sorted(data))
+        a.sort(reverse=True)
+        self.assertEqual(list(a), sorted(data, reverse=True))
+        pairs = [(i % 10, i) for i in range(100)]
+        a = litelist(pairs)
+        a.sort(key=lambda p: p[0])
+        self.assertEqual(list(a), sorted(pairs, key=lambda p: p[0]))
+        with self.assertRaises(TypeError):
+            a.sort(1)
+        a = litelist([1, 'a'])
+        with self.assertRaises(TypeError):
+            a.sort()
+        self.assertEqual(sorted(a, key=str), sorted([1, 'a'], key=str))
+
+    def test_sort_modified(self):
+        a = litelist([3,2,1])
+        def key(x):
+            a.append(x)
+            return x
+        with self.assertRaises(ValueError):
+            a.sort(key=key)
+        self.assertEqual(sorted(a), [1,2,3])
+
+    def test_iadd(self):
+        a = litelist([1])
+        b = a
+        a += [2, 3]
+        a += litelist([4])
+        self.assertIs(a, b)
+        self.assertEqual(list(a), [1,2,3,4])
+
+    def test_delslice(self):
+        a = litelist(range(10))
+        del a[2:5]
+        self.assertEqual(list(a), [0,1,5,6,7,8,9])
+        del a[-2:]
+        self.assertEqual(list(a), [0,1,5,6,7])
+        del a[:]
+        self.assertEqual(len(a), 0)
+        a = litelist([1,2])
+        with self.assertRaises(ValueError):
+            a[0:1] = [1,2,3]
+
+    def test_extended_slice(self):
+        for sl in (slice(None, None, 2), slice(None, None, -1), slice(1, None, 3),
+                   slice(-2, None, -2), slice(5, 1, -3), slice(None, None, 10)):
+            lst = list(range(6))
+            a = litelist(lst)
+            self.assertEqual(list(a[sl]), lst[sl])
+            del a[sl]
+            del lst[sl]
+            self.assertEqual(list(a), lst)
+            lst = list(range(6))
+            a = litelist(lst)
+            values = [-i for i in range(len(lst[sl]))]
+            a[sl] = values
+            lst[sl] = values
+            self.assertEqual(list(a), lst)
+        a = litelist(range(6))
+        with self.assertRaises(ValueError):
+            a[::2] = [1, 2]
+        self.assertEqual(list(a), list(range(6)))
+
+    def test_fromiter(self):
+        a = litelist.fromiter(range(100))
+        self.assertEqual(type(a), litelist)
+        self.assertEqual(list(a), list(range(100)))
+        self.assertEqual(a.capacity, 100)
+        a = litelist.fromiter(str(i) for i in range(10))
+        self.assertEqual(list(a), [str(i) for i in range(10)])
+        def gen():
+            yield 1
+            raise RuntimeError
+        with self.assertRaises(RuntimeError):
+            litelist.fromiter(gen())
+        class Hint:
+            def __init__(self, hint):
+                self.hint = hint
+            def __iter__(self):
+                return iter(range(3))
+            def __length_hint__(self):
+                return self.hint
+        for hint in (2**40, 2**61, sys.maxsize):
+            a = litelist.fromiter(Hint(hint))
+            self.assertEqual(list(a), [0, 1, 2])
+            self.assertLessEqual(a.capacity, 1 << 16)
 
 def main():
     suite = unittest.TestSuite()
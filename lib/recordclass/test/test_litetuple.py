@@ -1,5 +1,6 @@
 import unittest
 from recordclass import litetuple, mutabletuple
+from recordclass import litetuple_freelist, litetuple_freelist_info, litetuple_intern_clear
 
 import gc
 import pickle
@@ -217,6 +218,91 @@ class litetupleTest(unittest.TestCase):
 #         with self.assertRaises(TypeError):
 #             [3,] + T(1,2)
 
+    def test_freelist(self):
+        for tp in (litetuple, mutabletuple):
+            t = tp(1, 2, 3)
+            info = litetuple_freelist_info(tp)
+            del t
+            self.assertEqual(litetuple_freelist_info(tp)['size'], info['size'] + 1)
+            t = tp(4, 5, 6)
+            info2 = litetuple_freelist_info(tp)
+            self.assertEqual(info2['hits'], info['hits'] + 1)
+            self.assertEqual(info2['size'], info['size'])
+            self.assertEqual(t, tp(4, 5, 6))
+            self.assertEqual(type(t), tp)
+        with self.assertRaises(TypeError):
+            litetuple_freelist_info(tuple)
+
+    def test_freelist_subclass(self):
+        class T(litetuple):
+            pass
+        info = litetuple_freelist_info(litetuple)
+        t = T(1, 2)
+        del t
+        self.assertEqual(litetuple_freelist_info(litetuple), info)
+        self.assertEqual(T(1, 2), litetuple(1, 2))
+
+    def test_freelist_maxsize(self):
+        prev = litetuple_freelist(0)
+        try:
+            self.assertEqual(litetuple_freelist_info(litetuple)['size'], 0)
+            t = litetuple(1, 2)
+            del t
+            self.assertEqual(litetuple_freelist_info(litetuple)['size'], 0)
+            with self.assertRaises(ValueError):
+                litetuple_freelist(-1)
+        finally:
+            self.assertEqual(litetuple_freelist(prev), 0)
+
+    def test_intern(self):
+        a = litetuple(1, 'a', (2, 3))
+        b = litetuple(1, 'a', (2, 3))
+        self.assertIsNot(a, b)
+        self.assertIs(a.intern(), a)
+        self.assertIs(b.intern(), a)
+        with self.assertRaises(TypeError):
+            litetuple(1, []).intern()
+        self.assertFalse(hasattr(mutabletuple(1, 2), 'intern'))
+        class T(litetuple):
+            pass
+        with self.assertRaises(TypeError):
+            T(1, 2).intern()
+        litetuple_intern_clear()
+        self.assertIs(b.intern(), b)
+        self.assertIs(litetuple(1, 'a', (2, 3)).intern(), b)
+        del a, b
+        self.assertEqual(litetuple_intern_clear(unused=True), 1)
+        self.assertEqual(litetuple_intern_clear(), 0)
+
+    def test_freeze(self):
+        t = mutabletuple(1, [], 'a')
+        items = list(t)
+        f = t.freeze()
+        self.assertIs(f, t)
+        self.assertEqual(type(t), litetuple)
+        self.assertEqual(f, litetuple(*items))
+        self.assertEqual(hash(litetuple(1, 2).__copy__()), hash(mutabletuple(1, 2).freeze()))
+        with self.assertRaises(TypeError):
+            f[0] = 2
+        self.assertFalse(hasattr(f, 'freeze'))
+        class T(mutabletuple):
+            pass
+        with self.assertRaises(TypeError):
+            T(1, 2).freeze()
+
+    def test_with_capacity(self):
+        t = mutabletuple.with_capacity(3)
+        self.assertEqual(type(t), mutabletuple)
+        self.assertEqual(t, mutabletuple(None, None, None))
+        for i, v in enumerate('abc'):
+            t[i] = v
+        key = t.freeze()
+        self.assertEqual({key: 1}[litetuple('a', 'b', 'c')], 1)
+        self.assertEqual(mutabletuple.with_capacity(0), mutabletuple())
+        with self.assertRaises(ValueError):
+            mutabletuple.with_capacity(-1)
+        self.assertFalse(hasattr(litetuple, 'with_capacity'))
+
 def main():
     suite = unittest.TestSuite()
     suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(litetupleTest))
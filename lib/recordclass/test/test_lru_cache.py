@@ -0,0 +1,138 @@
+import unittest
+import gc
+import threading
+import weakref
+
+from recordclass import litetuple
+from recordclass.tools import lru_cache, CacheInfo
+
+class Result:
+    pass
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_hits_misses(self):
+        @lru_cache(maxsize=10)
+        def f(x, y):
+            return x + y
+        self.assertEqual(f(1, 2), 3)
+        self.assertEqual(f(1, 2), 3)
+        self.assertEqual(f(2, 2), 4)
+        self.assertEqual(f.cache_info(), CacheInfo(1, 2, 10, 2))
+        f.cache_clear()
+        self.assertEqual(f.cache_info(), CacheInfo(0, 0, 10, 0))
+        self.assertEqual(f(1, 2), 3)
+        self.assertEqual(f.cache_info(), CacheInfo(0, 1, 10, 1))
+
+    def test_eviction(self):
+        calls = []
+        @lru_cache(maxsize=3)
+        def f(x):
+            calls.append(x)
+            return x
+        for x in [1, 2, 3, 1, 4, 1, 2]:
+            f(x)
+        # 2 is evicted by 4 as the least recently used, 3 is evicted by 2
+        self.assertEqual(calls, [1, 2, 3, 4, 2])
+        self.assertEqual(f.cache_info(), CacheInfo(2, 5, 3, 3))
+        for i in range(100):
+            self.assertEqual(f(i % 7), i % 7)
+        self.assertEqual(f.cache_info().currsize, 3)
+
+    def test_unbounded(self):
+        @lru_cache(maxsize=None)
+        def f(x):
+            return -x
+        for i in range(100):
+            f(i)
+            f(i)
+        self.assertEqual(f.cache_info(), CacheInfo(100, 100, None, 100))
+
+    def test_no_cache(self):
+        @lru_cache(maxsize=0)
+        def f(x):
+            return -x
+        f(1)
+        f(1)
+        self.assertEqual(f.cache_info(), CacheInfo(0, 2, 0, 0))
+
+    def test_typed(self):
+        @lru_cache(typed=True)
+        def f(x):
+            return type(x)
+        self.assertIs(f(1), int)
+        self.assertIs(f(1.0), float)
+        self.assertIs(f(x=1.0), float)
+        self.assertIs(f(x=1), int)
+        self.assertEqual(f.cache_info().currsize, 4)
+        @lru_cache()
+        def g(x, y):
+            return type(x)
+        self.assertIs(g(1, 2), int)
+        self.assertIs(g(1.0, 2.0), int)
+
+    def test_kwds(self):
+        @lru_cache(maxsize=None)
+        def f(*args, **kwds):
+            return args, kwds
+        self.assertEqual(f(1, a=2), ((1,), {'a':2}))
+        self.assertEqual(f(1, 'a', 2), ((1, 'a', 2), {}))
+        self.assertEqual(f(a=1, b=2), ((), {'a':1, 'b':2}))
+        self.assertEqual(f.cache_info().misses, 3)
+        f(a=1, b=2)
+        self.assertEqual(f.cache_info().hits, 1)
+
+    def test_decorator(self):
+        @lru_cache
+        def f(x):
+            "doc"
+            return x
+        self.assertEqual(f(1), 1)
+        self.assertEqual(f.__name__, 'f')
+        self.assertEqual(f.__doc__, 'doc')
+        self.assertEqual(f.__wrapped__(2), 2)
+        self.assertEqual(f.cache_parameters(), {'maxsize':128, 'typed':False})
+        with self.assertRaises(TypeError):
+            lru_cache('10')
+        with self.assertRaises(TypeError):
+            f([])
+
+    def test_untracked(self):
+        @lru_cache(maxsize=10)
+        def f(x, y):
+            return None
+        f(1, 2)
+        keys = [ob for ob in gc.get_objects() if type(ob) is litetuple]
+        self.assertEqual(keys, [])
+
+    def test_finalize(self):
+        @lru_cache(maxsize=10)
+        def f(x):
+            return Result()
+        r = weakref.ref(f(1))
+        f(2)
+        self.assertIsNotNone(r())
+        del f
+        gc.collect()
+        self.assertIsNone(r())
+
+    def test_threads(self):
+        @lru_cache(maxsize=50)
+        def f(x):
+            return x * x
+        def run():
+            for i in range(2000):
+                self.assertEqual(f(i % 100), (i % 100)**2)
+        threads = [threading.Thread(target=run) for i in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        info = f.cache_info()
+        self.assertEqual(info.hits + info.misses, 8000)
+        self.assertEqual(info.currsize, 50)
+
+def main():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(LRUCacheTest))
+    return suite
@@ -0,0 +1,126 @@
+import unittest
+import sys
+
+from recordclass import dataobject, litelist, litearray, litetuple, mutabletuple, memory_report
+from recordclass._linkedlist import linkedlist, chunkedlist
+from recordclass._dataobject import _instance_dict
+from recordclass.utils import headgc_size, ref_size
+
+class Point(dataobject):
+    x: int
+    y: int
+
+class Node(dataobject, gc=True, use_dict=True, use_weakref=True):
+    name: str
+    children: object
+
+class NPoint(dataobject, native=True):
+    x: int
+    y: float
+    label: object = None
+
+class MemoryReportTest(unittest.TestCase):
+
+    def test_points(self):
+        points = [Point(1000+i, 2000+i) for i in range(10)]
+        r = memory_report(points)
+        size = sys.getsizeof(Point(0, 0))
+        self.assertEqual(r.types[Point], [10, 10*size])
+        self.assertEqual(r.types[list], [1, sys.getsizeof(points)])
+        self.assertEqual(r.types[int][0], 20)
+        self.assertEqual(r.count, 31)
+        self.assertEqual(r.total, sys.getsizeof(points) + 10*size + r.types[int][1])
+        self.assertEqual(r.fields[Point, 'x'], sum(sys.getsizeof(p.x) for p in points))
+        self.assertEqual(r.savings, {})
+        self.assertEqual(r.shared, 0)
+
+    def test_shared(self):
+        s = ''.join(['shared'] * 10)
+        p = Point(s, s)
+        r = memory_report(litetuple(p, p, mutabletuple(p)))
+        self.assertEqual(r.types[Point], [1, sys.getsizeof(p)])
+        self.assertEqual(r.types[str], [1, sys.getsizeof(s)])
+        self.assertEqual(r.shared, 2)
+        self.assertEqual(r.fields[Point, 'x'], sys.getsizeof(s))
+        self.assertNotIn((Point, 'y'), r.fields)
+
+    def test_cycle(self):
+        a = Node('a', None)
+        b = Node('b', litelist([a]))
+        a.children = litelist([b])
+        r = memory_report(a)
+        self.assertEqual(r.types[Node][0], 2)
+        self.assertEqual(r.types[litelist][0], 2)
+
+    def test_savings(self):
+        nodes = [Node('n', None) for i in range(3)]
+        nodes[0].extra = 1
+        r = memory_report(nodes)
+        self.assertEqual(r.savings[Node, 'gc=False'], 3*headgc_size)
+        self.assertEqual(r.savings[Node, 'use_weakref=False'], 3*ref_size)
+        d = nodes[0].__dict__
+        self.assertEqual(r.savings[Node, 'use_dict=False'], 3*ref_size + sys.getsizeof(d) - ref_size)
+        self.assertEqual(r.fields[Node, '__dict__'], sys.getsizeof(d) + sys.getsizeof('extra') + sys.getsizeof(1))
+        # __dict__ isn't created by the walker
+        r = memory_report(Node('m', None))
+        self.assertNotIn(dict, r.types)
+
+    def test_native_and_linkedlist(self):
+        lst = linkedlist()
+        lst.append(NPoint(1, 2.0, 'a'))
+        lst.append(NPoint(3, 4.0))
+        r = memory_report(lst)
+        self.assertEqual(r.types[NPoint][0], 2)
+        self.assertNotIn(int, r.types)
+        self.assertNotIn(float, r.types)
+        self.assertEqual(r.types[str], [1, sys.getsizeof('a')])
+        self.assertEqual(r.types[type(lst.start)][0], 2)
+        self.assertEqual(r.fields, {(NPoint, 'label'): sys.getsizeof('a')})
+
+    def test_instance_dict(self):
+        ob = Node('a', None)
+        self.assertIs(_instance_dict(ob), None)
+        ob.x = 1
+        self.assertEqual(_instance_dict(ob), {'x': 1})
+        self.assertIs(_instance_dict(Point(1, 2)), None)
+        class T(tuple):
+            pass
+        class A:
+            pass
+        for op in (T((1, 2)), A(), 1):
+            with self.assertRaises(TypeError):
+                _instance_dict(op)
+
+    def test_skipped(self):
+        r = memory_report([Point, len, sys, Point(1, 2)])
+        self.assertEqual(set(r.types), {list, Point, int})
+        self.assertIn('Point', str(r))
+        self.assertIn('list', str(r))
+
+    def test_litelist_slack(self):
+        lst = litelist([])
+        lst.reserve(100)
+        lst.append(1)
+        r = memory_report(lst)
+        self.assertEqual(r.types[litelist], [1, sys.getsizeof(lst)])
+        self.assertEqual(r.savings[litelist, 'shrink_to_fit()'], 99*ref_size)
+        lst.shrink_to_fit()
+        self.assertEqual(memory_report(lst).savings, {})
+
+    def test_litearray(self):
+        a = litearray('d', [1.0, 2.0])
+        a.reserve(10)
+        r = memory_report([a])
+        self.assertEqual(r.types[litearray], [1, sys.getsizeof(a)])
+        self.assertEqual(r.savings[litearray, 'shrink_to_fit()'], 8*8)
+
+    def test_chunkedlist(self):
+        lst = chunkedlist([Point(i, i) for i in range(100)])
+        r = memory_report(lst)
+        self.assertEqual(r.types[chunkedlist], [1, sys.getsizeof(lst)])
+        self.assertEqual(r.types[Point][0], 100)
+
+def main():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(MemoryReportTest))
+    return suite
@@ -335,7 +335,51 @@ class RecordClassTest(unittest.TestCase):
         A = rs.recordclass('A', ('x', 'y'))
         B = rs.recordclass('A', ['x', 'y'])
         self.assertEqual(A, B)
-
+        C = rs.recordclass('A', ['x', 'y'], readonly=True)
+        self.assertIsNot(A, C)
+        self.assertEqual(rs.storage_info()['hits'], 1)
+
+    def test_replace_readonly(self):
+        P = recordclass('P', 'x y z', readonly=True)
+        p = P(1, 2, 3)
+        p2 = p._replace(y=-2, x=-1)
+        self.assertEqual(p2, P(-1, -2, 3))
+        self.assertEqual(p, P(1, 2, 3))
+        self.assertIsNot(p._replace(), p)
+        self.assertEqual(p._replace(), p)
+        with self.assertRaises(AttributeError) as cm:
+            p._replace(x=0, a=1, b=2)
+        self.assertIn("('a', 'b')", str(cm.exception))
+        with self.assertRaises(TypeError):
+            p._replace(1)
+        names = ['f%s' % i for i in range(20)]
+        B = recordclass('B', names, readonly=True)
+        b = B(*range(20))
+        self.assertEqual(tuple(b._replace(**{fn: -1 for fn in names[::2]})),
+                         tuple(-1 if i % 2 == 0 else i for i in range(20)))
+
+    def test_replace_mutable(self):
+        P = recordclass('P', 'x y', use_dict=True)
+        p = P(1, 2)
+        self.assertIs(p._replace(x=3, a=4), p)
+        self.assertEqual(p, P(3, 2))
+        self.assertEqual(p.a, 4)
+
+    def test_namedtuple_api_init(self):
+        P = recordclass('P', 'x y', readonly=True)
+        class Q(P, readonly=True):
+            def __init__(self, x, y):
+                if x > y:
+                    raise ValueError('x > y')
+        q = Q(1, 2)
+        self.assertEqual(q._replace(x=0), Q(0, 2))
+        with self.assertRaises(ValueError):
+            q._replace(x=3)
+        self.assertEqual(Q._make(x for x in (1, 3)), Q(1, 3))
+        self.assertEqual(type(Q._make([1, 3])), Q)
+        self.assertEqual(q._asdict(), {'x':1, 'y':2})
+        with self.assertRaises(TypeError):
+            Q._make(1)
 
 def main():
     suite = unittest.TestSuite()
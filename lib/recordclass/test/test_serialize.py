@@ -0,0 +1,160 @@
+import unittest
+import io
+import pickle
+
+from recordclass import dataobject, litelist, litetuple
+from recordclass import dumps, loads, dump, load, RecordBatch
+
+class Point(dataobject):
+    x: int
+    y: int
+
+class Node(dataobject):
+    value: object
+    next: object = None
+
+class Item(dataobject, use_dict=True):
+    name: str
+
+class Vec(dataobject, native=True):
+    x: float
+    y: float
+    n: int = 0
+
+class Custom(dataobject):
+    x: int
+    y: int = 0
+
+    def __reduce__(self):
+        return Custom, (self.x, 100)
+
+class CustomEx(dataobject):
+    x: int
+
+    def __reduce_ex__(self, protocol):
+        return CustomEx, (self.x + 1,)
+
+class SerializeTest(unittest.TestCase):
+
+    def test_batch(self):
+        lst = [Point(i, -i) for i in range(100)]
+        data = dumps(lst)
+        self.assertEqual(data[:4], b'RCB\x01')
+        lst2 = loads(data)
+        self.assertEqual(lst2, lst)
+        self.assertIs(type(lst2[0]), Point)
+
+    def test_containers(self):
+        ob = {'points': [Point(1, 2), Point(3, 4)],
+              'nodes': litelist([Node(1), Node(2)]),
+              't': litetuple(1, 'a'),
+              'mixed': (Point(5, 6), [1, 2.0, 'a'], None)}
+        ob2 = loads(dumps(ob))
+        self.assertEqual(ob2, ob)
+        self.assertIs(type(ob2['nodes']), litelist)
+        self.assertIs(type(ob2['t']), litetuple)
+
+    def test_shared_references(self):
+        p = Point(1, 2)
+        lst = [p, p, Point(3, 4)]
+        lst2 = loads(dumps(lst))
+        self.assertIs(lst2[0], lst2[1])
+        shared = [Point(0, 0), Point(1, 1)]
+        ob2 = loads(dumps({'a': shared, 'b': shared}))
+        self.assertIs(ob2['a'], ob2['b'])
+        other = [shared[0]]
+        ob2 = loads(dumps([shared, other]))
+        self.assertIs(ob2[0][0], ob2[1][0])
+
+    def test_cycles(self):
+        a = Node(1)
+        b = Node(2, a)
+        a.next = b
+        a2 = loads(dumps(a))
+        self.assertIs(a2.next.next, a2)
+        lst = [Point(1, 2)]
+        lst.append(lst)
+        lst2 = loads(dumps(lst))
+        self.assertIs(lst2[1], lst2)
+
+    def test_custom_reduce(self):
+        lst = [Custom(1), Custom(2)]
+        self.assertEqual(loads(dumps(lst)), [Custom(1, 100), Custom(2, 100)])
+        a = Node(None)
+        a.next = Node(Custom(3), a)
+        a2 = loads(dumps(a))
+        self.assertIs(a2.next.next, a2)
+        self.assertEqual(a2.next.value, Custom(3, 100))
+        lst2 = loads(dumps([CustomEx(1), CustomEx(2)]))
+        self.assertEqual(lst2, [CustomEx(2), CustomEx(3)])
+
+    def test_references_from_fields(self):
+        points = [Point(1, 2), Point(3, 4)]
+        ob2 = loads(dumps([points, Node(points[0])]))
+        self.assertIs(ob2[1].value, ob2[0][0])
+        ob2 = loads(dumps([points, Node(points)]))
+        self.assertIs(ob2[1].value, ob2[0])
+        d = {'points': points}
+        ob2 = loads(dumps([d, Node(d)]))
+        self.assertIs(ob2[1].value, ob2[0])
+        self.assertIs(ob2[1].value['points'][1], ob2[0]['points'][1])
+        nodes = [Node(1), Node(2)]
+        nodes[1].next = nodes
+        nodes2 = loads(dumps(nodes))
+        self.assertIs(nodes2[1].next, nodes2)
+        self.assertEqual(nodes2[0].value, 1)
+
+    def test_use_dict(self):
+        ob = Item('a')
+        ob.extra = 1
+        ob2 = loads(dumps([ob]))[0]
+        self.assertEqual(ob2.extra, 1)
+
+    def test_file(self):
+        lst = [Point(i, i) for i in range(10)]
+        f = io.BytesIO()
+        dump(lst, f)
+        f.seek(0)
+        self.assertEqual(load(f), lst)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            loads(b'abc')
+
+class RecordBatchTest(unittest.TestCase):
+
+    def test_rows(self):
+        batch = RecordBatch(Point, [Point(1, 2), Point(3, 4)])
+        batch.append(Point(5, 6))
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            batch2 = pickle.loads(pickle.dumps(batch, proto))
+            self.assertIs(type(batch2), RecordBatch)
+            self.assertIs(batch2.cls, Point)
+            self.assertEqual(batch2, batch)
+
+    def test_native(self):
+        batch = RecordBatch(Vec, [Vec(i, -i, i) for i in range(100)])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertEqual(pickle.loads(pickle.dumps(batch, proto)), batch)
+        buffers = []
+        data = pickle.dumps(batch, 5, buffer_callback=buffers.append)
+        self.assertEqual(len(buffers), 1)
+        self.assertEqual(buffers[0].raw().nbytes, 100 * 24)
+        self.assertLess(len(data), 200)
+        self.assertEqual(pickle.loads(data, buffers=buffers), batch)
+        self.assertEqual(pickle.loads(pickle.dumps(RecordBatch(Vec), 5)), [])
+
+    def test_invalid(self):
+        with self.assertRaises(TypeError):
+            RecordBatch(tuple)
+        with self.assertRaises(TypeError):
+            RecordBatch(Item)
+        batch = RecordBatch(Point, [Point(1, 2), Node(1)])
+        with self.assertRaises(TypeError):
+            pickle.dumps(batch)
+
+def main():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(SerializeTest))
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(RecordBatchTest))
+    return suite
@@ -0,0 +1,96 @@
+import unittest
+import pickle
+from array import array
+
+from recordclass import dataobject, RecordTable, make_arrayclass
+
+class Point(dataobject):
+    x: int
+    y: int
+
+class Item(dataobject):
+    name: str
+    price: float
+    count: int = 1
+
+class RecordTableTest(unittest.TestCase):
+
+    def test_create(self):
+        t = RecordTable(Point)
+        self.assertEqual(len(t), 0)
+        self.assertEqual(t.fields, ('x', 'y'))
+        self.assertEqual(type(t.column('x')), array)
+        self.assertEqual(t.column('x').typecode, 'q')
+
+    def test_create_invalid(self):
+        with self.assertRaises(TypeError):
+            RecordTable(tuple)
+        with self.assertRaises(TypeError):
+            RecordTable(make_arrayclass("A", 2))
+
+    def test_append_getitem(self):
+        t = RecordTable(Point)
+        t.append(Point(1, 2))
+        t.append(Point(3, 4))
+        self.assertEqual(len(t), 2)
+        self.assertEqual(t[0], Point(1, 2))
+        self.assertEqual(t[-1], Point(3, 4))
+        self.assertEqual(t.row(1), (3, 4))
+        with self.assertRaises(IndexError):
+            t[2]
+        with self.assertRaises(TypeError):
+            t.append((1, 2))
+
+    def test_add_defaults(self):
+        t = RecordTable(Item)
+        t.add('a', 1.5)
+        t.add('b', price=2.0, count=3)
+        self.assertEqual(list(t), [Item('a', 1.5, 1), Item('b', 2.0, 3)])
+        self.assertEqual(t.column('name'), ['a', 'b'])
+        self.assertEqual(t.column('price'), array('d', [1.5, 2.0]))
+        self.assertEqual(t.column('count'), array('q', [1, 3]))
+
+    def test_column_fallback(self):
+        t = RecordTable(Point, [Point(1, 2)])
+        t.append(Point(None, 2**70))
+        self.assertEqual(type(t.column('x')), list)
+        self.assertEqual(type(t.column('y')), list)
+        self.assertEqual(list(t), [Point(1, 2), Point(None, 2**70)])
+        t = RecordTable(Point, [Point(1, 2)])
+        t.append(Point(True, 2))
+        self.assertIs(t[1].x, True)
+
+    def test_setitem_delitem(self):
+        t = RecordTable(Point, [Point(1, 2), Point(3, 4), Point(5, 6)])
+        t[1] = Point(7, 8)
+        self.assertEqual(t[1], Point(7, 8))
+        t[0] = Point(1.5, 2)
+        self.assertEqual(t[0], Point(1.5, 2))
+        del t[0]
+        self.assertEqual(list(t), [Point(7, 8), Point(5, 6)])
+        with self.assertRaises(IndexError):
+            t[5] = Point(1, 1)
+
+    def test_slice(self):
+        t = RecordTable(Point, [Point(i, -i) for i in range(10)])
+        t2 = t[2:5]
+        self.assertEqual(type(t2), RecordTable)
+        self.assertEqual(list(t2), [Point(2, -2), Point(3, -3), Point(4, -4)])
+        t2.clear()
+        self.assertEqual(len(t2), 0)
+        self.assertEqual(len(t), 10)
+
+    def test_sizeof(self):
+        t = RecordTable(Point, [Point(i, i) for i in range(1000)])
+        self.assertLess(t.__sizeof__(), 1000 * Point(0, 0).__sizeof__())
+
+    def test_pickle(self):
+        t = RecordTable(Item, [Item('a', 1.0), Item('b', 2.0, 2)])
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            t2 = pickle.loads(pickle.dumps(t, proto))
+            self.assertEqual(list(t), list(t2))
+
+def main():
+    suite = unittest.TestSuite()
+    suite.addTest(unittest.defaultTestLoader.loadTestsFromTestCase(RecordTableTest))
+    return suite
@@ -1 +1,2 @@
 #
+from recordclass.tools.lrucache import lru_cache, CacheInfo
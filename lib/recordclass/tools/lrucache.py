@@ -0,0 +1,236 @@
+# The MIT License (MIT)
+
+# Copyright (c) «2026» «Shibzukhov Zaur, szport at gmail dot com»
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software - recordclass library - and associated documentation files
+# (the "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish, distribute,
+# sublicense, and/or sell copies of the Software, and to permit persons to whom
+# the Software is furnished to do so, subject to the following conditions:
+
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
+# THE SOFTWARE.
+
+
+"""Memoization decorator with the least recently used (LRU) eviction.
+
+It's compatible with `functools.lru_cache`, but the cache is more compact:
+keys of the arguments are `litetuple` instances and the entries of the recency
+list are dataobject-based instances. Both aren't tracked by the cyclic garbage
+collector, so the large cache neither adds the GC header to every key and entry
+nor prolongs the full collections.
+
+>>> @lru_cache(maxsize=1000)
+... def fib(n):
+...     return n if n < 2 else fib(n-1) + fib(n-2)
+>>> fib(100)
+354224848179261915075
+>>> fib.cache_info()
+CacheInfo(hits=98, misses=101, maxsize=1000, currsize=101)
+"""
+
+from collections import namedtuple as _namedtuple
+from functools import update_wrapper as _update_wrapper
+from threading import RLock as _RLock
+from weakref import finalize as _finalize
+
+from recordclass import dataobject, litetuple
+
+__all__ = 'lru_cache', 'CacheInfo'
+
+CacheInfo = _namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+class _Link(dataobject, fast_new=True):
+    prev: object
+    next: object
+    key: object
+    result: object
+
+# the separator of positional and keyword arguments in the key
+_kwd_mark = object()
+
+def _make_key(args, kwds, typed, fasttypes={int, str}):
+    # the wrapper creates the key of positional arguments of untyped calls inline
+    key = args
+    if kwds:
+        key += (_kwd_mark,)
+        for item in kwds.items():
+            key += item
+    if typed:
+        key += tuple([type(v) for v in args])
+        if kwds:
+            key += tuple([type(v) for v in kwds.values()])
+    elif len(key) == 1 and type(key[0]) in fasttypes:
+        return key[0]
+    return litetuple(*key)
+
+def _unlink(root):
+    # links are not tracked by the garbage collector, so the cycle
+    # of the recency list should be broken explicitly
+    link = root.next
+    while link is not root:
+        link_next = link.next
+        link.prev = link.next = None
+        link = link_next
+    root.prev = root.next = None
+
+def lru_cache(maxsize=128, typed=False):
+    """Decorator to wrap a function with the memoizing callable that saves
+    up to the `maxsize` most recent calls.
+
+    If `maxsize` is set to None, the cache can grow without bound.
+    If `typed` is True, arguments of different types will be cached separately,
+    for example `f(3)` and `f(3.0)`. Arguments to the cached function must be hashable.
+
+    The wrapper has the same interface as the wrapper of `functools.lru_cache`:
+    `f.cache_info()`, `f.cache_clear()`, `f.cache_parameters()` and `f.__wrapped__`.
+    """
+    if isinstance(maxsize, int):
+        if maxsize < 0:
+            maxsize = 0
+    elif callable(maxsize) and isinstance(typed, bool):
+        # used as @lru_cache without arguments
+        user_function, maxsize = maxsize, 128
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed)
+        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
+        return _update_wrapper(wrapper, user_function)
+    elif maxsize is not None:
+        raise TypeError('Expected first argument to be an integer, a callable, or None')
+
+    def decorating_function(user_function):
+        wrapper = _lru_cache_wrapper(user_function, maxsize, typed)
+        wrapper.cache_parameters = lambda : {'maxsize': maxsize, 'typed': typed}
+        return _update_wrapper(wrapper, user_function)
+
+    return decorating_function
+
+def _lru_cache_wrapper(user_function, maxsize, typed):
+    sentinel = object()          # unique object used to signal cache misses
+    make_key = _make_key
+    fasttypes = {int, str}
+    Link = _Link
+
+    cache = {}
+    hits = misses = 0
+    full = False
+    cache_get = cache.get
+    cache_len = cache.__len__
+    lock = _RLock()              # because linkedlist updates aren't threadsafe
+    root = Link(None, None, None, None)   # root of the circular doubly linked list
+    root.prev = root.next = root
+
+    if maxsize == 0:
+
+        def wrapper(*args, **kwds):
+            # no caching -- just a statistics update
+            nonlocal misses
+            misses += 1
+            return user_function(*args, **kwds)
+
+    elif maxsize is None:
+
+        def wrapper(*args, **kwds):
+            # simple caching without ordering or size limit
+            nonlocal hits, misses
+            if kwds or typed:
+                key = make_key(args, kwds, typed)
+            elif len(args) == 1 and type(args[0]) in fasttypes:
+                key = args[0]
+            else:
+                key = litetuple(*args)
+            result = cache_get(key, sentinel)
+            if result is not sentinel:
+                hits += 1
+                return result
+            misses += 1
+            result = user_function(*args, **kwds)
+            cache[key] = result
+            return result
+
+    else:
+
+        def wrapper(*args, **kwds):
+            # size limited caching that tracks accesses by recency
+            nonlocal root, hits, misses, full
+            if kwds or typed:
+                key = make_key(args, kwds, typed)
+            elif len(args) == 1 and type(args[0]) in fasttypes:
+                key = args[0]
+            else:
+                key = litetuple(*args)
+            with lock:
+                link = cache_get(key)
+                if link is not None:
+                    # move the link to the front of the circular queue
+                    link_prev = link.prev
+                    link_next = link.next
+                    link_prev.next = link_next
+                    link_next.prev = link_prev
+                    last = root.prev
+                    last.next = root.prev = link
+                    link.prev = last
+                    link.next = root
+                    hits += 1
+                    return link.result
+                misses += 1
+            result = user_function(*args, **kwds)
+            with lock:
+                if key in cache:
+                    # the same key was added by the other thread while the lock
+                    # was released: the link is already at the front
+                    pass
+                elif full:
+                    # use the old root to store the new key and result
+                    oldroot = root
+                    oldroot.key = key
+                    oldroot.result = result
+                    # empty the oldest link and make it the new root
+                    root = oldroot.next
+                    oldkey = root.key
+                    root.key = root.result = None
+                    del cache[oldkey]
+                    cache[key] = oldroot
+                else:
+                    # put the result in a new link at the front of the queue
+                    last = root.prev
+                    link = Link(last, root, key, result)
+                    last.next = root.prev = cache[key] = link
+                    full = (cache_len() >= maxsize)
+            return result
+
+    def cache_info():
+        """Report cache statistics"""
+        with lock:
+            return CacheInfo(hits, misses, maxsize, cache_len())
+
+    def cache_clear():
+        """Clear the cache and cache statistics"""
+        nonlocal hits, misses, full
+        with lock:
+            _unlink(root)
+            root.prev = root.next = root
+            cache.clear()
+            hits = misses = 0
+            full = False
+
+    def get_root():
+        # the root is replaced on eviction
+        return root
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    _finalize(wrapper, _finalize_links, get_root, lock).atexit = False
+    return wrapper
+
+def _finalize_links(get_root, lock):
+    with lock:
+        _unlink(get_root())
@@ -27,7 +27,11 @@ from recordclass import dataobject, datastruct
 from .datatype import Field
 
 _intern = _sys.intern
-from typing import _type_check
+
+def _type_check(tp, msg):
+    # typing is imported only when the types of fields are checked
+    from typing import _type_check
+    return _type_check(tp, msg)
 
 ### sizes
 
@@ -141,6 +145,7 @@ def collect_info_from_bases(bases, fields, fields_dict, options):
     copy_default = options.get('copy_default', False)
     gc = options.get('gc', False)
     iterable = options.get('iterable', False)
+    native = options.get('native', False)
     # others = {}
     for base in bases:
         if base is dataobject:
@@ -161,6 +166,9 @@ def collect_info_from_bases(bases, fields, fields_dict, options):
             iterable = iterable or base.__options__.get('iterable', False)
             if iterable:
                 options['iterable'] = True
+            native = native or base.__options__.get('native', False)
+            if native:
+                options['native'] = True
         else:
             continue
 
@@ -171,6 +179,7 @@ def collect_info_from_bases(bases, fields, fields_dict, options):
         base_options = getattr(base, '__options__', {})
         base_fields_dict = base_options['fields_dict']
         n = number_of_dataitems(base)
+        base_kinds = base.__dict__.get('__native_kinds__', None)
         if type(fs) is tuple and len(fs) == n:
             for i, fn in enumerate(fs):
                 if fn in fields:
@@ -183,6 +192,10 @@ def collect_info_from_bases(bases, fields, fields_dict, options):
                         f['default'] = base_defaults[fn]
                     if fn in base_annotations:
                         f['type'] = base_annotations[fn]
+                    if base_kinds is not None:
+                        f['kind'] = chr(base_kinds[i])
+                    else:
+                        f['kind'] = 'O'
                     _fields.append(fn)
         else:
             raise TypeError("invalid fields in base class %r" % base)
@@ -218,3 +231,96 @@ def _have_pynew(bases):
             return True
 
     return False
+
+def _schema_fields(fields):
+    if isinstance(fields, str):
+        return tuple(fields.replace(',', ' ').split())
+    if isinstance(fields, dict):
+        return tuple(fields.items())
+    return tuple(fields)
+
+def _schema_defaults(defaults):
+    # the types are the part of the key: defaults 1, 1.0 and True are different
+    if not defaults:
+        return ()
+    if isinstance(defaults, dict):
+        return tuple(defaults), tuple(map(type, defaults.values())), tuple(defaults.values())
+    return tuple(map(type, defaults)), tuple(defaults)
+
+def schema_key(name, fields, defaults=None, options=None):
+    """Normalized key of the class schema: name, fields (with annotations),
+    defaults and options. Raise TypeError if the schema is not hashable."""
+    key = (name, _schema_fields(fields), _schema_defaults(defaults),
+           frozenset(options.items()) if options else ())
+    hash(key)
+    return key
+
+class ClassCache:
+    """Thread-safe cache of classes created by the factory function
+    `factory(name, fields, defaults, **options)` with LRU eviction.
+
+    The classes are keyed by the full normalized schema: the name, the fields
+    with annotations, the defaults and the options. Classes for schemas
+    which are not hashable (e.g. with a list as a default value) are created
+    without caching.
+
+    >>> cache = ClassCache(make_dataclass, maxsize=2)
+    >>> cache('Point', 'x y') is cache('Point', ['x', 'y'])
+    True
+    """
+    __slots__ = 'factory', 'maxsize', 'hits', 'misses', '_cache', '_lock'
+
+    def __init__(self, factory, maxsize=1024):
+        from collections import OrderedDict
+        from threading import Lock
+
+        self.factory = factory
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = Lock()
+
+    def __call__(self, name, fields, defaults=None, **options):
+        try:
+            key = schema_key(name, fields, defaults, options)
+        except TypeError:
+            with self._lock:
+                self.misses += 1
+            return self.factory(name, fields, defaults, **options)
+
+        cache = self._cache
+        with self._lock:
+            cls = cache.get(key)
+            if cls is not None:
+                cache.move_to_end(key)
+                self.hits += 1
+                return cls
+            self.misses += 1
+
+        # the class is created outside of the lock
+        cls = self.factory(name, fields, defaults, **options)
+
+        with self._lock:
+            cls = cache.setdefault(key, cls)
+            cache.move_to_end(key)
+            maxsize = self.maxsize
+            if maxsize is not None:
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+        return cls
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        "Remove all classes from the cache and reset the counters"
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        "Return the dict with the size of the cache and the counters of hits and misses"
+        return {'size': len(self._cache), 'maxsize': self.maxsize,
+                'hits': self.hits, 'misses': self.misses}